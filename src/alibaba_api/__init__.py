@@ -3,6 +3,8 @@ Alibaba API Client - Python library for Alibaba.com Open Platform API v2.
 
 This library provides:
 - AlibabaClient with high-level methods for orders, products, shipping, and auth
+- AsyncAlibabaClient with the same methods as coroutines
+- Composable middleware around every signed request
 - HMAC-SHA256 request signing
 - Exception handling for API errors
 
@@ -22,37 +24,158 @@ Example:
 
         # Low-level generic API call
         response = client.get("/path/to/endpoint", {"param": "value"})
+
+Names are imported on first use (PEP 562 ``__getattr__``), so
+``from alibaba_api import calculate_signature`` does not pay for httpx or
+pydantic, which only load with ``AlibabaClient`` or the models.
 """
 
-from alibaba_api.auth import AuthMethods
-from alibaba_api.client import AlibabaClient
-from alibaba_api.config import Config, get_error_message
-from alibaba_api.exceptions import (
-    AlibabaAPIError,
-    AlibabaAuthError,
-    AlibabaError,
-    AlibabaNetworkError,
-    AlibabaSignatureError,
-    AlibabaValidationError,
-)
-from alibaba_api.orders import OrderMethods
-from alibaba_api.products import ProductMethods
-from alibaba_api.shipping import ShippingMethods
-from alibaba_api.signing import build_signed_params, calculate_signature
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from alibaba_api.async_client import AsyncAlibabaClient
+    from alibaba_api.auth import AuthMethods
+    from alibaba_api.client import AlibabaClient
+    from alibaba_api.config import Config, HTTPBackend, ResponseMode, get_error_message
+    from alibaba_api.connections import DNSCache, WarmupReport
+    from alibaba_api.deadline import Deadline
+    from alibaba_api.exceptions import (
+        AlibabaAPIError,
+        AlibabaAuthError,
+        AlibabaDeadlineError,
+        AlibabaError,
+        AlibabaNetworkError,
+        AlibabaSignatureError,
+        AlibabaValidationError,
+    )
+    from alibaba_api.hooks import RequestEvent, RequestHooks, RequestTimings
+    from alibaba_api.idset import ProductIdSet, SceneIndex
+    from alibaba_api.metrics import MetricsRegistry
+    from alibaba_api.middleware import Call, MiddlewareStack
+    from alibaba_api.negcache import NegativeCache
+    from alibaba_api.orders import OrderMethods
+    from alibaba_api.policy import ErrorPolicies, ErrorPolicy
+    from alibaba_api.products import ProductMethods
+    from alibaba_api.sansio import (
+        ApiRequest,
+        PreparedRequest,
+        adrive,
+        drive,
+        parse_response,
+        prepare_request,
+    )
+    from alibaba_api.shipping import ShippingMethods
+    from alibaba_api.signing import build_signed_params, calculate_signature
+    from alibaba_api.slowlog import SlowCall, SlowCallLog
+
+# Public name -> submodule defining it, imported on first attribute access
+_LAZY_IMPORTS: dict[str, str] = {
+    "AsyncAlibabaClient": "alibaba_api.async_client",
+    "AuthMethods": "alibaba_api.auth",
+    "AlibabaClient": "alibaba_api.client",
+    "Config": "alibaba_api.config",
+    "ResponseMode": "alibaba_api.config",
+    "HTTPBackend": "alibaba_api.config",
+    "get_error_message": "alibaba_api.config",
+    "Deadline": "alibaba_api.deadline",
+    "AlibabaAPIError": "alibaba_api.exceptions",
+    "AlibabaAuthError": "alibaba_api.exceptions",
+    "AlibabaDeadlineError": "alibaba_api.exceptions",
+    "AlibabaError": "alibaba_api.exceptions",
+    "AlibabaNetworkError": "alibaba_api.exceptions",
+    "AlibabaSignatureError": "alibaba_api.exceptions",
+    "AlibabaValidationError": "alibaba_api.exceptions",
+    "RequestEvent": "alibaba_api.hooks",
+    "RequestHooks": "alibaba_api.hooks",
+    "RequestTimings": "alibaba_api.hooks",
+    "ProductIdSet": "alibaba_api.idset",
+    "SceneIndex": "alibaba_api.idset",
+    "MetricsRegistry": "alibaba_api.metrics",
+    "DNSCache": "alibaba_api.connections",
+    "WarmupReport": "alibaba_api.connections",
+    "Call": "alibaba_api.middleware",
+    "MiddlewareStack": "alibaba_api.middleware",
+    "NegativeCache": "alibaba_api.negcache",
+    "OrderMethods": "alibaba_api.orders",
+    "ErrorPolicies": "alibaba_api.policy",
+    "ErrorPolicy": "alibaba_api.policy",
+    "ProductMethods": "alibaba_api.products",
+    "ApiRequest": "alibaba_api.sansio",
+    "PreparedRequest": "alibaba_api.sansio",
+    "adrive": "alibaba_api.sansio",
+    "drive": "alibaba_api.sansio",
+    "parse_response": "alibaba_api.sansio",
+    "prepare_request": "alibaba_api.sansio",
+    "ShippingMethods": "alibaba_api.shipping",
+    "build_signed_params": "alibaba_api.signing",
+    "calculate_signature": "alibaba_api.signing",
+    "SlowCall": "alibaba_api.slowlog",
+    "SlowCallLog": "alibaba_api.slowlog",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     # Client
     "AlibabaClient",
+    "AsyncAlibabaClient",
     # Config
     "Config",
+    "ResponseMode",
+    "HTTPBackend",
     "get_error_message",
+    "Deadline",
     # Exceptions
     "AlibabaError",
     "AlibabaAPIError",
     "AlibabaAuthError",
+    "AlibabaDeadlineError",
     "AlibabaNetworkError",
     "AlibabaSignatureError",
     "AlibabaValidationError",
+    # Error policies
+    "ErrorPolicies",
+    "ErrorPolicy",
+    # Hooks
+    "RequestEvent",
+    "RequestHooks",
+    "RequestTimings",
+    # Product ID sets
+    "ProductIdSet",
+    "SceneIndex",
+    # Metrics
+    "MetricsRegistry",
+    # Middleware
+    "Call",
+    "MiddlewareStack",
+    # Negative cache
+    "NegativeCache",
+    # Connections
+    "DNSCache",
+    "WarmupReport",
+    # Sans-IO core
+    "ApiRequest",
+    "PreparedRequest",
+    "prepare_request",
+    "parse_response",
+    "drive",
+    "adrive",
+    # Slow-call log
+    "SlowCall",
+    "SlowCallLog",
     # Signing
     "calculate_signature",
     "build_signed_params",
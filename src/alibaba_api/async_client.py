@@ -0,0 +1,327 @@
+"""
+Async API client for Alibaba Open Platform API.
+
+``AsyncAlibabaClient`` shares configuration, signing, error policies,
+hooks, deadlines and response parsing with ``AlibabaClient``, and sends
+requests through an ``httpx.AsyncClient``. Its high-level methods drive the
+same sans-IO operations as the sync client's (``alibaba_api.sansio``).
+Middleware are async callables ``(call, call_next)`` that await
+``call_next(call)``; see ``alibaba_api.middleware``.
+
+Example:
+    async with AsyncAlibabaClient(config) as client:
+        product = await client.get_product("1601206892606")
+        response = await client.get(
+            "/eco/buyer/product/description",
+            {"query_req": json.dumps({"product_id": "123"})},
+        )
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Literal
+
+import httpx
+
+from alibaba_api.auth import AsyncAuthMethods
+from alibaba_api.client import _BaseClient
+from alibaba_api.config import Config
+from alibaba_api.connections import DNSCache, HandshakeTrace, WarmupReport
+from alibaba_api.deadline import Deadline
+from alibaba_api.exceptions import AlibabaError
+from alibaba_api.metrics import MetricsRegistry
+from alibaba_api.middleware import Call
+from alibaba_api.negcache import NegativeCache
+from alibaba_api.orders import AsyncOrderMethods
+from alibaba_api.policy import ErrorPolicies
+from alibaba_api.products import AsyncProductMethods
+from alibaba_api.sansio import ApiRequest, Operation, T, adrive
+from alibaba_api.shipping import AsyncShippingMethods
+from alibaba_api.slowlog import SlowCallLog
+
+if TYPE_CHECKING:
+    from alibaba_api.backends import AsyncHttpxBackend
+
+
+class AsyncAlibabaClient(
+    _BaseClient, AsyncOrderMethods, AsyncProductMethods, AsyncShippingMethods, AsyncAuthMethods
+):
+    """
+    Async client for Alibaba.com Open Platform API v2.
+
+    Offers the high-level methods of ``AlibabaClient`` as coroutines, and
+    the low-level ``request``, ``get`` and ``post``, with the same retries,
+    deadlines, hooks, negative cache and slow-call log.
+
+    Example:
+        from alibaba_api.standin import StandinServer
+
+        server = StandinServer(app_key="test", app_secret="secret")
+        client = AsyncAlibabaClient(config, transport=server.async_transport())
+        product, freight = await asyncio.gather(
+            client.get_product(product_id),
+            client.calculate_freight(product_id, 10, "US"),
+        )
+        await client.aclose()
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+        metrics: MetricsRegistry | None = None,
+        slow_calls: SlowCallLog | None = None,
+        error_policies: ErrorPolicies | None = None,
+        negative_cache: NegativeCache | None = None,
+        middleware: Iterable[Any] = (),
+        dns_cache: DNSCache | None = None,
+    ) -> None:
+        """
+        Initialize the API client.
+
+        Args:
+            config: Configuration instance with credentials
+            transport: Optional async httpx transport, e.g.
+                ``StandinServer.async_transport()``
+            metrics: Optional registry to record per-endpoint metrics into
+            slow_calls: Ring buffer of slow and sampled calls
+            error_policies: How to react to each error code
+            negative_cache: Cache of permanent product failures. May be shared
+                with other clients, sync or async
+            middleware: Async middleware wrapping every signed request,
+                outermost first; see ``add_middleware``
+            dns_cache: Cache of resolved API host addresses, used when no
+                ``transport`` is given
+        """
+        super().__init__(
+            config,
+            metrics=metrics,
+            slow_calls=slow_calls,
+            error_policies=error_policies,
+            negative_cache=negative_cache,
+            middleware=middleware,
+            dns_cache=dns_cache,
+        )
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+        self._http_backend: AsyncHttpxBackend | None = None
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """The httpx client, created on first request."""
+        # Only touched from the event loop, so no lock is needed
+        if self._http is None:
+            transport = self._transport
+            if transport is None:
+                transport = self._network_transport(
+                    httpx.AsyncHTTPTransport(limits=self._pool_limits())
+                )
+            self._http = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                transport=transport,
+                headers=self._http_headers(),
+            )
+        return self._http
+
+    @property
+    def _backend(self) -> "AsyncHttpxBackend":
+        """Sends requests through ``_client``, created on first request."""
+        if self._http_backend is None:
+            # Imported here, as by AlibabaClient: the module pulls in http.client
+            from alibaba_api.backends import AsyncHttpxBackend
+
+            self._http_backend = AsyncHttpxBackend(self._client, self.config.timeout)
+        return self._http_backend
+
+    async def warmup(self, connections: int = 4, *, timeout: float | None = None) -> WarmupReport:
+        """
+        Open pooled connections to ``config.base_url`` before traffic arrives.
+
+        The async counterpart of ``AlibabaClient.warmup``; the host is
+        resolved on the loop's executor only if it is not cached yet.
+
+        Args:
+            connections: Connections to open
+            timeout: Seconds to wait for each connection. Default: ``config.timeout``
+
+        Returns:
+            DNS, connect and TLS timings for the connections opened
+        """
+        report, url = self._start_warmup(connections)
+        started = time.perf_counter()
+        http = self._client
+        wait = self.config.timeout if timeout is None else timeout
+        connected = asyncio.Event()
+        pending = connections
+
+        async def open_one() -> None:
+            nonlocal pending
+            trace = HandshakeTrace(report)
+            try:
+                async with http.stream(
+                    "GET", url, timeout=wait, extensions={"trace": trace.atrace}
+                ) as response:
+                    pending -= 1
+                    if not pending:
+                        connected.set()
+                    # asyncio.TimeoutError is not the builtin TimeoutError before 3.11
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(connected.wait(), wait)
+                    await response.aread()
+            except httpx.HTTPError as e:
+                report.errors.append(f"{type(e).__name__}: {e}")
+                connected.set()
+
+        await asyncio.gather(*(open_one() for _ in range(connections)))
+        return self._finish_warmup(report, started)
+
+    async def run(self, operation: Operation[T]) -> T:
+        """
+        Drive a sans-IO operation, awaiting ``request`` for each request it yields.
+
+        See ``AlibabaClient.run``.
+        """
+        return await adrive(operation, self._perform)
+
+    async def _perform(self, request: ApiRequest) -> dict[str, Any]:
+        return await self.request(
+            request.api_path,
+            request.params,
+            method=request.method,
+            timeout=request.timeout,
+            deadline=request.deadline,
+        )
+
+    async def request(
+        self,
+        api_path: str,
+        params: dict[str, str] | None = None,
+        method: Literal["GET", "POST"] = "GET",
+        *,
+        access_token: str | None = None,
+        timeout: float | None = None,
+        deadline: Deadline | float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Make a signed request to the Alibaba API.
+
+        Behaves as ``AlibabaClient.request``: the same retries and deadline
+        handling, with each attempt passing through ``self.middleware``.
+
+        Args:
+            api_path: The API endpoint path (e.g., "/auth/token/create")
+            params: Business parameters for the API
+            method: HTTP method (GET or POST)
+            access_token: Override access token for this request
+            timeout: Timeout in seconds for each attempt
+            deadline: ``Deadline`` or budget in seconds for every attempt
+
+        Returns:
+            Parsed JSON response from the API
+
+        Raises:
+            AlibabaValidationError: If parameters are invalid
+            AlibabaDeadlineError: If the deadline runs out
+            AlibabaNetworkError: For network/HTTP errors
+            AlibabaAPIError: For API error responses
+        """
+        params, timeout, deadline = self._request_args(api_path, params, timeout, deadline)
+        attempt = 1
+        while True:
+            try:
+                attempt_timeout = self._attempt_timeout(api_path, timeout, deadline)
+                if self.middleware:
+                    call = Call(api_path, method, params, access_token, attempt_timeout, attempt)
+                    return await self.middleware.handler(call)  # type: ignore[no-any-return]
+                return await self._attempt(
+                    api_path, params, method, access_token, attempt, attempt_timeout
+                )
+            except AlibabaError as e:
+                delay = self._retry_delay(e, api_path, method, attempt, deadline)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _handle_call(self, call: Call) -> dict[str, Any]:
+        return await self._attempt(
+            call.api_path,
+            call.params,
+            call.method,
+            call.access_token,
+            call.attempt,
+            call.timeout,
+            call.annotations,
+        )
+
+    async def _attempt(
+        self,
+        api_path: str,
+        params: dict[str, str],
+        method: str,
+        access_token: str | None,
+        attempt: int = 1,
+        timeout: float | None = None,
+        annotations: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Sign, send and parse one request attempt."""
+        pending = self._begin_attempt(api_path, params, method, access_token, attempt, annotations)
+        try:
+            response = await self._backend.send(
+                method.upper(), pending.url, pending.signed_params, timeout
+            )
+        except AlibabaError as e:
+            self._send_failed(pending, e)
+            raise
+        return self._finish_attempt(pending, response)
+
+    async def get(
+        self,
+        api_path: str,
+        params: dict[str, str] | None = None,
+        *,
+        access_token: str | None = None,
+        timeout: float | None = None,
+        deadline: Deadline | float | None = None,
+    ) -> dict[str, Any]:
+        """Make a GET request to the Alibaba API. See ``request``."""
+        return await self.request(
+            api_path,
+            params,
+            "GET",
+            access_token=access_token,
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def post(
+        self,
+        api_path: str,
+        params: dict[str, str] | None = None,
+        *,
+        access_token: str | None = None,
+        timeout: float | None = None,
+        deadline: Deadline | float | None = None,
+    ) -> dict[str, Any]:
+        """Make a POST request to the Alibaba API. See ``request``."""
+        return await self.request(
+            api_path,
+            params,
+            "POST",
+            access_token=access_token,
+            timeout=timeout,
+            deadline=deadline,
+        )
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncAlibabaClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
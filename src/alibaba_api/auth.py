@@ -2,8 +2,71 @@
 
 from typing import Any
 
+from alibaba_api.sansio import ApiRequest, AsyncHost, Operation, OperationHost, SyncHost
 
-class AuthMethods:
+
+class AuthOperations(OperationHost):
+    """
+    Sans-IO authentication operations, shared by the sync and async mixins.
+
+    Each ``*_op`` method returns a generator that yields ``ApiRequest``
+    descriptions and returns the high-level method's result; see
+    ``alibaba_api.sansio``.
+    """
+
+    def create_token_op(self, code: str) -> Operation[dict[str, Any]]:
+        """Operation for ``create_token``."""
+        response = yield ApiRequest("/auth/token/create", {"code": code})
+
+        return {
+            "access_token": response.get("access_token"),
+            "refresh_token": response.get("refresh_token"),
+            "expires_in": response.get("expires_in"),
+            "refresh_expires_in": response.get("refresh_expires_in"),
+            "user_info": response.get("user_info", {}),
+            "account_platform": response.get("account_platform"),
+            "_raw": response,
+        }
+
+    def refresh_token_op(self, refresh_token: str | None = None) -> Operation[dict[str, Any]]:
+        """Operation for ``refresh_token``."""
+        token = refresh_token or self.config.refresh_token
+        if not token:
+            raise ValueError(
+                "No refresh token available. "
+                "Provide refresh_token parameter or set ALIBABA_REFRESH_TOKEN."
+            )
+
+        response = yield ApiRequest("/auth/token/refresh", {"refresh_token": token})
+
+        return {
+            "access_token": response.get("access_token"),
+            "refresh_token": response.get("refresh_token"),
+            "expires_in": response.get("expires_in"),
+            "refresh_expires_in": response.get("refresh_expires_in"),
+            "_raw": response,
+        }
+
+    @property
+    def auth_status(self) -> dict[str, Any]:
+        """
+        Get current authentication status.
+
+        Returns:
+            Dict with environment, app_key (masked), has_access_token, has_refresh_token
+
+        Example:
+            status = client.auth_status
+        """
+        return {
+            "environment": "sandbox" if self.config.use_sandbox else "production",
+            "app_key": (self.config.app_key[:8] + "..." if self.config.app_key else None),
+            "has_access_token": bool(self.config.access_token),
+            "has_refresh_token": bool(self.config.refresh_token),
+        }
+
+
+class AuthMethods(AuthOperations, SyncHost):
     """
     Authentication-related API methods.
 
@@ -11,13 +74,6 @@ class AuthMethods:
     including creating tokens from authorization codes and refreshing tokens.
     """
 
-    def _auth_request(
-        self,
-        api_path: str,
-        params: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
-        return self.get(api_path, params)
-
     def create_token(
         self,
         code: str,
@@ -38,17 +94,7 @@ class AuthMethods:
         Example:
             tokens = client.create_token(code="3_500102_JxZ05Ux3cnnSSUm6dCxYg6Q26")
         """
-        response = self._auth_request("/auth/token/create", {"code": code})
-
-        return {
-            "access_token": response.get("access_token"),
-            "refresh_token": response.get("refresh_token"),
-            "expires_in": response.get("expires_in"),
-            "refresh_expires_in": response.get("refresh_expires_in"),
-            "user_info": response.get("user_info", {}),
-            "account_platform": response.get("account_platform"),
-            "_raw": response,
-        }
+        return self.run(self.create_token_op(code))
 
     def refresh_token(
         self,
@@ -69,37 +115,16 @@ class AuthMethods:
             # or with specific token:
             tokens = client.refresh_token(refresh_token="your_token")
         """
-        token = refresh_token or self.config.refresh_token
-        if not token:
-            raise ValueError(
-                "No refresh token available. "
-                "Provide refresh_token parameter or set ALIBABA_REFRESH_TOKEN."
-            )
+        return self.run(self.refresh_token_op(refresh_token))
 
-        response = self._auth_request("/auth/token/refresh", {"refresh_token": token})
 
-        return {
-            "access_token": response.get("access_token"),
-            "refresh_token": response.get("refresh_token"),
-            "expires_in": response.get("expires_in"),
-            "refresh_expires_in": response.get("refresh_expires_in"),
-            "_raw": response,
-        }
+class AsyncAuthMethods(AuthOperations, AsyncHost):
+    """Async authentication methods for ``AsyncAlibabaClient``; see ``AuthMethods``."""
 
-    @property
-    def auth_status(self) -> dict[str, Any]:
-        """
-        Get current authentication status.
+    async def create_token(self, code: str) -> dict[str, Any]:
+        """Exchange OAuth authorization code for access token. See ``AuthMethods.create_token``."""
+        return await self.run(self.create_token_op(code))
 
-        Returns:
-            Dict with environment, app_key (masked), has_access_token, has_refresh_token
-
-        Example:
-            status = client.auth_status
-        """
-        return {
-            "environment": "sandbox" if self.config.use_sandbox else "production",
-            "app_key": (self.config.app_key[:8] + "..." if self.config.app_key else None),
-            "has_access_token": bool(self.config.access_token),
-            "has_refresh_token": bool(self.config.refresh_token),
-        }
+    async def refresh_token(self, refresh_token: str | None = None) -> dict[str, Any]:
+        """Refresh access token using refresh token. See ``AuthMethods.refresh_token``."""
+        return await self.run(self.refresh_token_op(refresh_token))
@@ -0,0 +1,437 @@
+"""
+HTTP backends: the library ``AlibabaClient`` sends signed requests with.
+
+A backend takes a method, URL, parameters and timeout, and returns a
+response with ``status_code``, ``headers``, ``content``, ``json()`` and
+``text``. Two are built in, chosen with ``Config.http_backend``:
+
+- ``"httpx"`` (default): an ``httpx.Client``. Needed for custom transports
+  (``StandinServer.transport()``, cassettes), which are httpx transports, so
+  a client given ``transport=`` always uses it.
+- ``"stdlib"``: ``http.client`` connections kept alive in a small pool per
+  origin. It skips httpx's request and response models, header
+  normalisation and transport layers, which dominate the per-request cost at
+  high request rates; it decodes gzip and deflate only. It resolves through
+  the client's ``DNSCache`` and its ``warmup`` opens connections without
+  sending requests.
+
+``AsyncAlibabaClient`` always uses httpx, through ``AsyncHttpxBackend``.
+
+Example:
+    config = Config(app_key="...", app_secret="...", http_backend="stdlib")
+    client = AlibabaClient(config)
+"""
+
+import contextlib
+import http.client
+import json
+import select
+import socket
+import ssl
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+
+from alibaba_api.connections import DNSCache, HandshakeTrace, WarmupReport, needs_resolving
+from alibaba_api.exceptions import AlibabaNetworkError
+
+
+class Response(Protocol):
+    """What the client reads from a backend's response."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def headers(self) -> Any: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def num_bytes_downloaded(self) -> int: ...
+
+    @property
+    def text(self) -> str: ...
+
+    def json(self) -> Any: ...
+
+
+class Backend(Protocol):
+    """Sends one request; see the module docstring."""
+
+    def send(
+        self, method: str, url: str, params: dict[str, str], timeout: float | None
+    ) -> Response:
+        """
+        Send ``params`` as the query string (GET) or form body (POST).
+
+        Args:
+            method: "GET" or "POST"
+            url: Full request URL without a query string
+            params: Signed parameters
+            timeout: Seconds, or None for the backend's default
+
+        Raises:
+            AlibabaNetworkError: If no response is received
+        """
+        ...
+
+    def warmup(self, url: str, report: WarmupReport, timeout: float) -> None:
+        """Open ``report.requested`` pooled connections to ``url``'s origin."""
+        ...
+
+    def close(self) -> None: ...
+
+
+# httpx errors meaning no response was received
+_HTTPX_ERRORS = (httpx.TimeoutException, httpx.NetworkError)
+
+
+def _httpx_error(error: Exception, timeout: float) -> AlibabaNetworkError:
+    """``AlibabaNetworkError`` for one of ``_HTTPX_ERRORS`` after waiting ``timeout`` seconds."""
+    if isinstance(error, httpx.TimeoutException):
+        return AlibabaNetworkError(f"Request timed out after {timeout}s")
+    return AlibabaNetworkError(f"Network error: {error}")
+
+
+class HttpxBackend:
+    """Backend on an ``httpx.Client``."""
+
+    def __init__(self, client: httpx.Client, default_timeout: float) -> None:
+        self.client = client
+        self._default_timeout = default_timeout
+
+    def send(
+        self, method: str, url: str, params: dict[str, str], timeout: float | None
+    ) -> httpx.Response:
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        try:
+            if method == "GET":
+                return self.client.get(url, params=params, timeout=request_timeout)
+            return self.client.post(url, data=params, timeout=request_timeout)
+        except _HTTPX_ERRORS as e:
+            raise _httpx_error(e, self._default_timeout if timeout is None else timeout) from e
+
+    def warmup(self, url: str, report: WarmupReport, timeout: float) -> None:
+        # httpx opens a connection only to send a request: send one GET per
+        # connection and hold every response open until all are connected,
+        # so none of them reuses another's connection
+        http = self.client
+        connected = threading.Barrier(report.requested)
+
+        def open_one() -> None:
+            trace = HandshakeTrace(report)
+            try:
+                with http.stream(
+                    "GET", url, timeout=timeout, extensions={"trace": trace}
+                ) as response:
+                    with contextlib.suppress(threading.BrokenBarrierError):
+                        connected.wait(timeout)
+                    response.read()
+            except httpx.HTTPError as e:
+                report.errors.append(f"{type(e).__name__}: {e}")
+                connected.abort()
+
+        _in_threads(open_one, report.requested)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncHttpxBackend:
+    """``HttpxBackend`` for ``AsyncAlibabaClient``: awaits an ``httpx.AsyncClient``."""
+
+    def __init__(self, client: httpx.AsyncClient, default_timeout: float) -> None:
+        self.client = client
+        self._default_timeout = default_timeout
+
+    async def send(
+        self, method: str, url: str, params: dict[str, str], timeout: float | None
+    ) -> httpx.Response:
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        try:
+            if method == "GET":
+                return await self.client.get(url, params=params, timeout=request_timeout)
+            return await self.client.post(url, data=params, timeout=request_timeout)
+        except _HTTPX_ERRORS as e:
+            raise _httpx_error(e, self._default_timeout if timeout is None else timeout) from e
+
+
+@dataclass(slots=True)
+class RawResponse:
+    """Response read by ``StdlibBackend``; headers are keyed in lower case."""
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    num_bytes_downloaded: int
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+# Connection errors on a kept-alive connection that the server may have
+# closed while it sat in the pool
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class _Connection(http.client.HTTPConnection):
+    """``HTTPConnection`` dialling a cached address, timing connect and TLS."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: float,
+        *,
+        dns_cache: DNSCache | None,
+        ssl_context: ssl.SSLContext | None,
+    ) -> None:
+        super().__init__(host, port, timeout=timeout)
+        self.dns_cache = dns_cache
+        self.ssl_context = ssl_context
+        self.idle_since = 0.0
+        self.connect_seconds = 0.0
+        self.tls_seconds: float | None = None
+
+    def connect(self) -> None:
+        address = self.host
+        if self.dns_cache is not None and needs_resolving(self.host):
+            address = self.dns_cache.resolve(self.host, self.port)
+        started = time.perf_counter()
+        try:
+            self.sock = socket.create_connection((address, self.port), self.timeout)
+        except OSError:
+            if self.dns_cache is not None:
+                self.dns_cache.forget(self.host, self.port)
+            raise
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connect_seconds = time.perf_counter() - started
+        if self.ssl_context is not None:
+            started = time.perf_counter()
+            self.sock = self.ssl_context.wrap_socket(self.sock, server_hostname=self.host)
+            self.tls_seconds = time.perf_counter() - started
+
+    def reusable(self, expiry: float) -> bool:
+        """Whether the idle connection is still fresh and the server has not closed it."""
+        sock = self.sock
+        if sock is None or time.monotonic() - self.idle_since > expiry:
+            return False
+        readable, _, _ = select.select([sock], [], [], 0)
+        if not readable:
+            return True
+        if not isinstance(sock, ssl.SSLSocket):
+            # EOF or stray bytes: either way, unusable
+            return False
+        # TLS 1.3 session tickets arrive after the handshake and leave the
+        # socket readable without any application data
+        sock.setblocking(False)
+        try:
+            sock.recv(1)
+        except ssl.SSLWantReadError:
+            return True
+        except OSError:
+            return False
+        return False
+
+
+class StdlibBackend:
+    """
+    Backend on ``http.client`` with a keep-alive pool per origin.
+
+    Each request borrows an idle connection (most recently used first) or
+    opens a new one, and returns it to the pool after reading the body. At
+    most ``pool_connections`` idle connections are kept per origin, each for
+    ``keepalive_expiry`` seconds. Thread-safe: a connection is used by one
+    request at a time.
+
+    Args:
+        headers: Headers sent with every request
+        timeout: Default timeout in seconds
+        pool_connections: Idle connections kept per origin
+        keepalive_expiry: Seconds an idle connection is kept
+        dns_cache: Resolve hosts through this cache; None uses the system resolver
+        ssl_context: Context for HTTPS. Default: ``ssl.create_default_context()``
+    """
+
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        *,
+        timeout: float = 30.0,
+        pool_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        dns_cache: DNSCache | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self.headers = {"Accept-Encoding": "gzip, deflate", **(headers or {})}
+        self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.dns_cache = dns_cache
+        self._ssl_context = ssl_context
+        self._idle: dict[tuple[str, str, int], list[_Connection]] = {}
+        self._origins: dict[str, tuple[tuple[str, str, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def _origin(self, url: str) -> tuple[tuple[str, str, int], str]:
+        """``((scheme, host, port), path)`` for ``url``, cached since URLs repeat."""
+        cached = self._origins.get(url)
+        if cached is None:
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise AlibabaNetworkError(f"Unsupported URL: {url}")
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            cached = ((parts.scheme, parts.hostname, port), parts.path or "/")
+            self._origins[url] = cached
+        return cached
+
+    def _new_connection(self, origin: tuple[str, str, int], timeout: float) -> _Connection:
+        scheme, host, port = origin
+        context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            context = self._ssl_context
+        return _Connection(host, port, timeout, dns_cache=self.dns_cache, ssl_context=context)
+
+    def _acquire(self, origin: tuple[str, str, int], timeout: float) -> tuple[_Connection, bool]:
+        """An idle connection to ``origin``, or a new one; and whether it was reused."""
+        with self._lock:
+            idle = self._idle.get(origin)
+            while idle:
+                connection = idle.pop()
+                if connection.reusable(self.keepalive_expiry):
+                    return connection, True
+                connection.close()
+        return self._new_connection(origin, timeout), False
+
+    def _release(self, origin: tuple[str, str, int], connection: _Connection) -> None:
+        connection.idle_since = time.monotonic()
+        with self._lock:
+            idle = self._idle.setdefault(origin, [])
+            if len(idle) < self.pool_connections:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def send(
+        self, method: str, url: str, params: dict[str, str], timeout: float | None
+    ) -> RawResponse:
+        origin, path = self._origin(url)
+        seconds = self.timeout if timeout is None else timeout
+        query = urlencode(params)
+        if method == "GET":
+            target, body, headers = f"{path}?{query}", None, self.headers
+        else:
+            target, body = path, query.encode()
+            headers = {**self.headers, "Content-Type": "application/x-www-form-urlencoded"}
+
+        connection, reused = self._acquire(origin, seconds)
+        try:
+            try:
+                response, raw = _exchange(connection, method, target, body, headers, seconds)
+            except _STALE_ERRORS:
+                # The server closed the pooled connection as it was taken;
+                # only a GET is safe to send again
+                if not reused or method != "GET":
+                    raise
+                connection.close()
+                connection = self._new_connection(origin, seconds)
+                response, raw = _exchange(connection, method, target, body, headers, seconds)
+        except TimeoutError as e:
+            connection.close()
+            raise AlibabaNetworkError(f"Request timed out after {seconds}s") from e
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise AlibabaNetworkError(f"Network error: {e}") from e
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(origin, connection)
+        headers = {name.lower(): value for name, value in response.getheaders()}
+        return RawResponse(response.status, headers, _decode(raw, headers), len(raw))
+
+    def warmup(self, url: str, report: WarmupReport, timeout: float) -> None:
+        # http.client connects without sending a request, so just connect,
+        # topping the pool up to the requested size
+        origin, _ = self._origin(url)
+        now = time.monotonic()
+        with self._lock:
+            fresh = sum(
+                now - c.idle_since <= self.keepalive_expiry for c in self._idle.get(origin, ())
+            )
+        opened: list[_Connection] = []
+
+        def open_one() -> None:
+            connection = self._new_connection(origin, timeout)
+            try:
+                connection.connect()
+            except OSError as e:
+                report.errors.append(f"{type(e).__name__}: {e}")
+                connection.close()
+                return
+            report.connect.append(connection.connect_seconds)
+            if connection.tls_seconds is not None:
+                report.tls.append(connection.tls_seconds)
+            opened.append(connection)
+
+        _in_threads(open_one, max(report.requested - fresh, 0))
+        for connection in opened:
+            self._release(origin, connection)
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for connection in idle:
+                connection.close()
+
+
+def _exchange(
+    connection: _Connection,
+    method: str,
+    target: str,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """Send one request on ``connection`` and read the whole response body."""
+    connection.timeout = timeout
+    if connection.sock is not None:
+        connection.sock.settimeout(timeout)
+    connection.request(method, target, body, headers)
+    response = connection.getresponse()
+    return response, response.read()
+
+
+def _decode(raw: bytes, headers: dict[str, str]) -> bytes:
+    encoding = headers.get("content-encoding", "").strip().lower()
+    try:
+        if encoding == "gzip":
+            return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            return zlib.decompress(raw)
+    except zlib.error as e:
+        raise AlibabaNetworkError(f"Could not decode {encoding} response: {e}") from e
+    return raw
+
+
+def _in_threads(fn: Callable[[], None], count: int) -> None:
+    threads = [threading.Thread(target=fn) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
@@ -0,0 +1,310 @@
+"""
+Record and replay API exchanges for deterministic offline runs.
+
+``RecordingTransport`` wraps a real transport and captures every exchange
+made through it into a ``Cassette``; ``ReplayTransport`` serves a cassette
+back without a network. Both work with ``AlibabaClient`` and
+``AsyncAlibabaClient``.
+
+Cassettes are JSON Lines files, one exchange per line, gzip-compressed when
+the file name ends in ``.gz``. Only business parameters are stored: the
+signature, timestamp, app key and access token are dropped from requests,
+and token fields (``access_token``, ``refresh_token``, ...) are scrubbed
+from the remaining parameters and from response bodies, as is the OAuth
+authorization ``code`` parameter.
+
+Replay matches on method, URL path (the base URL's path plus the API path)
+and the canonical business parameters, so fresh timestamps and signatures
+still hit. JSON-valued parameters such as ``query_req`` match whatever
+their key order. Several recordings of the same
+request are served in turn, then from the start again. Latency can be
+replayed as recorded (``latency_scale=1.0``), scaled, or dropped
+(``latency_scale=0``) to profile parsing and application code alone.
+
+Example:
+    cassette = Cassette()
+    with AlibabaClient(config, transport=RecordingTransport(cassette)) as client:
+        client.get_product("1601206892606")
+    cassette.save("products.jsonl.gz")
+
+    replay = ReplayTransport(Cassette.load("products.jsonl.gz"), latency_scale=0)
+    with AlibabaClient(config, transport=replay) as client:
+        client.get_product("1601206892606")
+"""
+
+import asyncio
+import contextlib
+import gzip
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl
+
+import httpx
+
+# Request parameters added by signing; never part of the match key or the file
+SYSTEM_PARAMS = frozenset({"app_key", "sign_method", "timestamp", "sign", "access_token"})
+
+# Fields replaced with SCRUBBED in request parameters and response bodies
+SCRUBBED_FIELDS = frozenset({"access_token", "refresh_token", "sign", "app_secret"})
+# Request parameters also scrubbed: the OAuth ``code`` sent for a token. In
+# response bodies ``code`` is the status field and is kept.
+SCRUBBED_PARAMS = SCRUBBED_FIELDS | {"code"}
+SCRUBBED = "<scrubbed>"
+
+# Response headers worth keeping; encodings no longer apply to the decoded body
+KEPT_HEADERS = ("content-type", "x-request-id")
+
+
+class CassetteMissError(LookupError):
+    """A replayed request has no recording in the cassette."""
+
+
+@dataclass(slots=True)
+class Interaction:
+    """One recorded request and its response."""
+
+    method: str
+    path: str
+    params: dict[str, str]
+    status_code: int
+    body: str
+    headers: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+def canonical_params(params: dict[str, str]) -> str:
+    """
+    Match key for business parameters.
+
+    System parameters are ignored, scrubbed fields match any value, keys are
+    sorted, and JSON object or array values are re-encoded with sorted keys.
+    """
+    items = []
+    for key in sorted(params):
+        if key in SYSTEM_PARAMS:
+            continue
+        value = SCRUBBED if key in SCRUBBED_PARAMS else params[key]
+        if value[:1] in ("{", "["):
+            with contextlib.suppress(ValueError):
+                value = json.dumps(json.loads(value), sort_keys=True, separators=(",", ":"))
+        items.append((key, value))
+    return json.dumps(items, separators=(",", ":"))
+
+
+def _scrub(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: SCRUBBED if key in SCRUBBED_FIELDS else _scrub(item) for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_scrub(item) for item in value]
+    return value
+
+
+def _request_params(request: httpx.Request) -> dict[str, str]:
+    params = dict(request.url.params)
+    body = request.read()
+    if body:
+        params.update(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
+    return params
+
+
+class Cassette:
+    """
+    Ordered recordings of API exchanges, indexed for replay.
+
+    Thread-safe: recording and replay may happen from several threads.
+
+    Args:
+        interactions: Initial recordings, in order
+    """
+
+    def __init__(self, interactions: Iterable[Interaction] = ()) -> None:
+        self.interactions: list[Interaction] = []
+        self._index: dict[tuple[str, str, str], list[Interaction]] = {}
+        self._served: dict[tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+        for interaction in interactions:
+            self.add(interaction)
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def __iter__(self) -> Iterator[Interaction]:
+        return iter(self.interactions)
+
+    def add(self, interaction: Interaction) -> None:
+        """Append a recording."""
+        key = (interaction.method, interaction.path, canonical_params(interaction.params))
+        with self._lock:
+            self.interactions.append(interaction)
+            self._index.setdefault(key, []).append(interaction)
+
+    def record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> None:
+        """
+        Append the exchange of ``request`` and a read ``response``, scrubbed.
+
+        Args:
+            request: Request as sent, with system parameters and signature
+            response: Response whose body has been read
+            elapsed: Seconds from sending the request to reading the body
+        """
+        params = {
+            key: SCRUBBED if key in SCRUBBED_PARAMS else value
+            for key, value in _request_params(request).items()
+            if key not in SYSTEM_PARAMS
+        }
+        body = response.text
+        with contextlib.suppress(ValueError):
+            body = json.dumps(_scrub(json.loads(body)), ensure_ascii=False, separators=(",", ":"))
+        headers = {
+            name: response.headers[name] for name in KEPT_HEADERS if name in response.headers
+        }
+        self.add(
+            Interaction(
+                request.method,
+                request.url.path,
+                params,
+                response.status_code,
+                body,
+                headers,
+                round(elapsed, 6),
+            )
+        )
+
+    def find(self, method: str, path: str, params: dict[str, str]) -> Interaction:
+        """
+        Next recording for a request, cycling through repeated recordings.
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        key = (method, path, canonical_params(params))
+        with self._lock:
+            recordings = self._index.get(key)
+            if not recordings:
+                raise CassetteMissError(f"No recording for {method} {path} {key[2]}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        return recordings[served % len(recordings)]
+
+    def rewind(self) -> None:
+        """Serve every request's recordings from the first one again."""
+        with self._lock:
+            self._served.clear()
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Read a cassette written by ``save``."""
+        path = Path(path)
+        opener: Any = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            return cls(Interaction(**json.loads(line)) for line in file if line.strip())
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette as JSON Lines, gzip-compressed if ``path`` ends in ``.gz``."""
+        path = Path(path)
+        opener: Any = gzip.open if path.suffix == ".gz" else open
+        with self._lock:
+            interactions = list(self.interactions)
+        with opener(path, "wt", encoding="utf-8") as file:
+            for interaction in interactions:
+                file.write(json.dumps(asdict(interaction), ensure_ascii=False) + "\n")
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport that records every exchange through ``inner`` into a cassette.
+
+    Args:
+        cassette: Where to record
+        inner: Transport making the real requests. Defaults to httpx's
+            network transport (sync or async, as used)
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        inner: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.cassette = cassette
+        self._inner: Any = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._inner is None:
+            self._inner = httpx.HTTPTransport()
+        started = time.perf_counter()
+        response: httpx.Response = self._inner.handle_request(request)
+        response.read()
+        self.cassette.record(request, response, time.perf_counter() - started)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._inner is None:
+            self._inner = httpx.AsyncHTTPTransport()
+        started = time.perf_counter()
+        response: httpx.Response = await self._inner.handle_async_request(request)
+        await response.aread()
+        self.cassette.record(request, response, time.perf_counter() - started)
+        return response
+
+    def close(self) -> None:
+        if isinstance(self._inner, httpx.BaseTransport):
+            self._inner.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self._inner, httpx.AsyncBaseTransport):
+            await self._inner.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport that answers from a cassette without a network.
+
+    Args:
+        cassette: Recordings to serve
+        latency_scale: Multiplier for recorded latency: 1.0 replays it as
+            recorded, 0 answers at once. Latency beyond the request's read
+            timeout waits for the timeout and raises ``httpx.ReadTimeout``
+    """
+
+    def __init__(self, cassette: Cassette, *, latency_scale: float = 1.0) -> None:
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    def _replay(self, request: httpx.Request) -> tuple[Interaction, float, bool]:
+        interaction = self.cassette.find(request.method, request.url.path, _request_params(request))
+        delay = interaction.elapsed * self.latency_scale
+        read_timeout = request.extensions.get("timeout", {}).get("read")
+        if read_timeout is not None and delay > read_timeout:
+            return interaction, read_timeout, True
+        return interaction, delay, False
+
+    def _response(self, request: httpx.Request, interaction: Interaction) -> httpx.Response:
+        return httpx.Response(
+            interaction.status_code,
+            headers=interaction.headers,
+            content=interaction.body.encode("utf-8"),
+            request=request,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        interaction, delay, timed_out = self._replay(request)
+        if delay:
+            time.sleep(delay)
+        if timed_out:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return self._response(request, interaction)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interaction, delay, timed_out = self._replay(request)
+        if delay:
+            await asyncio.sleep(delay)
+        if timed_out:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return self._response(request, interaction)
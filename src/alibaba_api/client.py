@@ -3,29 +3,472 @@ Base API client for Alibaba Open Platform API.
 
 This module provides the AlibabaClient class which handles:
 - Request signing via HMAC-SHA256
-- HTTP communication via httpx
+- HTTP communication via httpx or http.client (``alibaba_api.backends``)
 - Response parsing and error handling
+- High-level methods written once as sans-IO operations (``alibaba_api.sansio``)
+- Request lifecycle hooks with per-phase timing
+- Composable middleware around each signed request (``alibaba_api.middleware``)
+- Optional per-endpoint metrics
+- An always-on ring buffer of slow and sampled calls
+- Opt-in typed responses (see ``Config.response_mode``)
+- Error classification and retries driven by ``alibaba_api.policy``
+- Per-endpoint timeouts and per-call deadlines (``alibaba_api.deadline``)
+- Compressed responses where httpx can decode them (``alibaba_api.compression``)
+- Cached DNS and connection warm-up (``alibaba_api.connections``)
+- A negative cache of offline and restricted products (``alibaba_api.negcache``)
 - High-level methods for orders, products, shipping, and auth
 """
 
-from typing import Any, Literal
+import abc
+import dataclasses
+import threading
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
 
 from alibaba_api.auth import AuthMethods
-from alibaba_api.config import Config, get_error_message
+from alibaba_api.compression import accept_encoding
+from alibaba_api.config import Config
+from alibaba_api.connections import (
+    DNSCache,
+    ResolvingTransport,
+    WarmupReport,
+    needs_resolving,
+    warmup_url,
+)
+from alibaba_api.deadline import Deadline
 from alibaba_api.exceptions import (
-    AlibabaAPIError,
+    AlibabaDeadlineError,
+    AlibabaError,
     AlibabaNetworkError,
     AlibabaValidationError,
 )
+from alibaba_api.hooks import Hook, HookPhase, RequestEvent, RequestHooks
+from alibaba_api.metrics import MetricsRegistry
+from alibaba_api.middleware import Call, MiddlewareStack
+from alibaba_api.negcache import NegativeCache
 from alibaba_api.orders import OrderMethods
+from alibaba_api.policy import ErrorPolicies
 from alibaba_api.products import ProductMethods
+from alibaba_api.sansio import (
+    ApiRequest,
+    Operation,
+    T,
+    api_result,
+    drive,
+    http_error,
+    sign_params,
+)
 from alibaba_api.shipping import ShippingMethods
-from alibaba_api.signing import build_signed_params
+from alibaba_api.slowlog import SlowCallLog
+from alibaba_api.typed import convert
+
+if TYPE_CHECKING:
+    from alibaba_api.backends import Backend, Response
+
+
+@dataclasses.dataclass(slots=True)
+class _Attempt:
+    """One signed request attempt on its way out; see ``_BaseClient._begin_attempt``."""
 
+    api_path: str
+    method: str
+    params: dict[str, str]
+    signed_params: dict[str, str]
+    url: str
+    started: float
+    sent: float
+    event: RequestEvent | None = None
 
-class AlibabaClient(OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
+
+class _BaseClient(abc.ABC):
+    """
+    What the sync and async clients share: configuration, error policies,
+    hooks, middleware, signing, timeouts, retries and response parsing.
+    Subclasses add the HTTP client, and send and sleep in the request loop.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        metrics: MetricsRegistry | None = None,
+        slow_calls: SlowCallLog | None = None,
+        error_policies: ErrorPolicies | None = None,
+        negative_cache: NegativeCache | None = None,
+        middleware: Iterable[Any] = (),
+        dns_cache: DNSCache | None = None,
+    ) -> None:
+        self.config = config
+        self.negative_cache = (
+            negative_cache
+            if negative_cache is not None
+            else NegativeCache(config.offline_ttl, config.restricted_ttl)
+        )
+        self.dns_cache = dns_cache if dns_cache is not None else DNSCache(config.dns_ttl)
+        self._transport: Any = None
+        self.error_policies = error_policies if error_policies is not None else ErrorPolicies()
+        self.hooks = RequestHooks()
+        self.middleware = MiddlewareStack(self._handle_call, middleware)
+        self.slow_calls = slow_calls if slow_calls is not None else SlowCallLog()
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.install(self)
+
+    @abc.abstractmethod
+    def _handle_call(self, call: Call) -> Any:
+        """Innermost middleware handler: sign and send one request."""
+
+    def add_hook(self, phase: HookPhase, hook: Hook) -> Hook:
+        """
+        Register a request lifecycle hook.
+
+        Args:
+            phase: One of "before_sign", "before_send", "after_response", "on_error"
+            hook: Callable receiving a ``RequestEvent``
+
+        Returns:
+            The hook, so it can be passed to ``remove_hook`` later
+
+        Example:
+            client.add_hook("after_response", lambda e: print(e.api_path, e.timings))
+        """
+        return self.hooks.add(phase, hook)
+
+    def remove_hook(self, phase: HookPhase, hook: Hook) -> None:
+        """Unregister a hook previously added with ``add_hook``."""
+        self.hooks.remove(phase, hook)
+
+    def add_middleware(self, middleware: Any, *, first: bool = False) -> Any:
+        """
+        Wrap every signed request in ``middleware``.
+
+        Args:
+            middleware: Callable ``(call, call_next) -> response``; async for
+                ``AsyncAlibabaClient``. See ``alibaba_api.middleware``
+            first: Add it outermost instead of innermost
+
+        Returns:
+            The middleware, so it can be passed to ``remove_middleware`` later
+        """
+        return self.middleware.add(middleware, first=first)
+
+    def remove_middleware(self, middleware: Any) -> None:
+        """Remove middleware previously added with ``add_middleware``."""
+        self.middleware.remove(middleware)
+
+    def _to_model(self, tp: Any, data: Any) -> Any:
+        """Convert a high-level method's result according to ``config.response_mode``."""
+        mode = self.config.response_mode
+        if mode == "dict":
+            return data
+        return convert(tp, data, mode)
+
+    def _check_negative_cache(
+        self, api_path: str, product_id: str | int, country: str | None = None
+    ) -> None:
+        """Raise the cached error if ``product_id`` (to ``country``) is known to fail."""
+        error = self.negative_cache.check(product_id, country)
+        if error is not None:
+            if self.metrics is not None:
+                self.metrics.record_cache_hit(api_path)
+            raise error.with_traceback(None)
+
+    def _remember_failure(
+        self, error: AlibabaError, product_id: str | int, country: str | None = None
+    ) -> None:
+        """Cache ``error`` when its policy scope covers later calls for the product."""
+        scope = self.error_policies.for_error(error).scope
+        self.negative_cache.record(error, scope, product_id, country)
+
+    def _build_url(self, api_path: str) -> str:
+        return f"{self.config.base_url}{api_path}"
+
+    def _http_headers(self) -> dict[str, str]:
+        """Headers sent with every request by the httpx client."""
+        return {"Accept-Encoding": accept_encoding(self.config.compression)}
+
+    def _network_transport(self, inner: Any) -> Any:
+        """
+        Transport for the httpx client when none was given: ``inner`` (httpx's
+        network transport with the configured pool), resolving through
+        ``dns_cache`` unless ``config.dns_ttl`` is 0.
+        """
+        if self.config.dns_ttl > 0:
+            return ResolvingTransport(self.dns_cache, inner)
+        return inner
+
+    def _pool_limits(self) -> httpx.Limits:
+        config = self.config
+        return httpx.Limits(
+            max_connections=max(100, config.pool_connections),
+            max_keepalive_connections=config.pool_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+
+    def _start_warmup(self, connections: int) -> tuple[WarmupReport, str]:
+        """Validate a warm-up, resolve the API host, and return the report and URL."""
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        report = WarmupReport(connections)
+        url = warmup_url(self.config.base_url)
+        host = httpx.URL(url).host
+        if self._transport is None and self.config.dns_ttl > 0 and needs_resolving(host):
+            port = httpx.URL(url).port or (443 if url.startswith("https") else 80)
+            before = self.dns_cache.lookup_seconds
+            try:
+                self.dns_cache.resolve(host, port)
+            except OSError as e:
+                raise AlibabaNetworkError(f"DNS lookup for {host} failed: {e}") from e
+            report.dns = self.dns_cache.lookup_seconds - before
+        return report, url
+
+    @staticmethod
+    def _finish_warmup(report: WarmupReport, started: float) -> WarmupReport:
+        report.elapsed = time.perf_counter() - started
+        if len(report.errors) == report.requested:
+            raise AlibabaNetworkError(f"Warm-up failed: {report.errors[0]}")
+        return report
+
+    def _parse_response(self, response: "Response") -> dict[str, Any]:
+        """
+        Parse API response and handle errors.
+
+        Args:
+            response: HTTP response from the backend or httpx
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            AlibabaNetworkError: For HTTP errors
+            AlibabaAPIError: For API error responses
+        """
+        try:
+            data: dict[str, Any] | str = response.json()
+        except ValueError:
+            data = response.text
+
+        if response.status_code >= 400:
+            raise http_error(
+                response.status_code, data, response.text, response.headers.get("x-request-id")
+            )
+        return api_result(data)
+
+    def update_tokens(self, access_token: str, refresh_token: str | None = None) -> None:
+        """
+        Switch to new OAuth tokens, e.g. after ``refresh_token()``.
+
+        Safe while other threads send requests: ``self.config`` is replaced
+        by an updated copy in one assignment, so each request is signed with
+        either the old tokens or the new ones. The ``Config`` the client was
+        created with, which may be shared, is left unchanged.
+
+        Args:
+            access_token: Token to sign requests with
+            refresh_token: New refresh token, if one was issued
+        """
+        config = self.config
+        self.config = dataclasses.replace(
+            config,
+            access_token=access_token,
+            refresh_token=config.refresh_token if refresh_token is None else refresh_token,
+        )
+
+    def _sign(
+        self,
+        api_path: str,
+        params: dict[str, str],
+        access_token: str | None,
+    ) -> dict[str, str]:
+        # One read of self.config, so a concurrent update_tokens cannot mix configs
+        return sign_params(self.config, api_path, params, access_token)
+
+    def _request_args(
+        self,
+        api_path: str,
+        params: dict[str, str] | None,
+        timeout: float | None,
+        deadline: Deadline | float | None,
+    ) -> tuple[dict[str, str], float | None, Deadline | None]:
+        """Validate ``request``'s arguments and fill in their defaults."""
+        if not api_path.startswith("/"):
+            raise AlibabaValidationError(f"api_path must start with '/', got: {api_path}")
+        if timeout is None:
+            timeout = self.config.endpoint_timeouts.get(api_path)
+        return {} if params is None else params, timeout, Deadline.coerce(deadline)
+
+    def _attempt_timeout(
+        self, api_path: str, timeout: float | None, deadline: Deadline | None
+    ) -> float | None:
+        """Timeout for the next attempt: the usual one, capped at the time remaining."""
+        if deadline is None:
+            return timeout
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise AlibabaDeadlineError(f"Deadline of {deadline.budget}s exceeded before {api_path}")
+        return min(timeout if timeout is not None else self.config.timeout, remaining)
+
+    def _sub_timeout(self, api_path: str, deadline: Deadline | None, parts: int) -> float | None:
+        """Timeout for the next of ``parts`` sub-requests of a composite call."""
+        if deadline is None:
+            return None
+        usual = self.config.endpoint_timeouts.get(api_path, self.config.timeout)
+        return min(usual, deadline.share(parts))
+
+    def _retry_delay(
+        self,
+        error: AlibabaError,
+        api_path: str,
+        method: str,
+        attempt: int,
+        deadline: Deadline | None,
+    ) -> float | None:
+        """
+        Classify an attempt's ``error`` and return the delay before retrying it.
+
+        Returns:
+            Seconds to sleep, or None to raise ``error``
+
+        Raises:
+            AlibabaDeadlineError: If no response arrived and ``deadline`` has run out
+        """
+        if (
+            deadline is not None
+            and isinstance(error, AlibabaNetworkError)
+            and not isinstance(error, AlibabaDeadlineError)
+            and error.status_code is None
+            and deadline.expired
+        ):
+            expired = AlibabaDeadlineError(
+                f"Deadline of {deadline.budget}s exceeded during {api_path}"
+            )
+            expired.error_class = self.error_policies.for_error(expired).error_class
+            raise expired from error
+        error.error_class = self.error_policies.for_error(error).error_class
+        if (
+            error.error_class != "retryable"
+            or method.upper() != "GET"
+            or attempt > self.config.max_retries
+        ):
+            return None
+        delay: float = self.config.retry_backoff * 2 ** (attempt - 1)
+        # Waiting past the deadline would only delay the deadline error
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+        return delay
+
+    def _begin_attempt(
+        self,
+        api_path: str,
+        params: dict[str, str],
+        method: str,
+        access_token: str | None,
+        attempt: int = 1,
+        annotations: dict[str, Any] | None = None,
+    ) -> _Attempt:
+        """
+        Sign one request attempt, reporting to the hooks if any are registered.
+
+        The subclass sends the result's ``signed_params`` to its ``url`` and
+        passes the response to ``_finish_attempt``, or the error to
+        ``_send_failed``.
+        """
+        clock = time.perf_counter
+        event = None
+        started = clock()
+        try:
+            if self.hooks:
+                event = RequestEvent("before_sign", api_path, method.upper(), dict(params), attempt)
+                if annotations is not None:
+                    event.annotations = annotations
+                self.hooks.emit("before_sign", event)
+                params = event.params
+                started = clock()
+                signed_params = self._sign(api_path, params, access_token)
+                event.timings.sign = clock() - started
+                self.hooks.emit("before_send", event)
+            else:
+                signed_params = self._sign(api_path, params, access_token)
+        except AlibabaError as e:
+            self._attempt_failed(
+                _Attempt(api_path, method, params, {}, "", started, started, event), e
+            )
+            raise
+        url = self._build_url(api_path)
+        return _Attempt(api_path, method, params, signed_params, url, started, clock(), event)
+
+    def _finish_attempt(self, attempt: _Attempt, response: "Response") -> dict[str, Any]:
+        """Parse the response to ``attempt``, reporting it to the hooks and slow-call log."""
+        event = attempt.event
+        if event is None:
+            try:
+                data = self._parse_response(response)
+            except AlibabaError as e:
+                self._attempt_failed(attempt, e, response)
+                raise
+            self._observe(attempt, response, data)
+            return data
+
+        clock = time.perf_counter
+        timings = event.timings
+        timings.network = clock() - attempt.sent
+        event.status_code = response.status_code
+        event.response_size = len(response.content)
+        event.wire_size = response.num_bytes_downloaded or event.response_size
+        started = clock()
+        try:
+            data = self._parse_response(response)
+        except AlibabaError as e:
+            timings.parse = clock() - started
+            self._attempt_failed(attempt, e, response)
+            raise
+        timings.parse = clock() - started
+        event.request_id = data.get("request_id") or response.headers.get("x-request-id")
+        self.hooks.emit("after_response", event)
+        self._observe(attempt, response, data)
+        return data
+
+    def _send_failed(self, attempt: _Attempt, error: AlibabaError) -> None:
+        """Report ``error``, raised while sending ``attempt``, to the hooks and slow-call log."""
+        if attempt.event is not None:
+            attempt.event.timings.network = time.perf_counter() - attempt.sent
+        self._attempt_failed(attempt, error)
+
+    def _attempt_failed(
+        self, attempt: _Attempt, error: AlibabaError, response: "Response | None" = None
+    ) -> None:
+        event = attempt.event
+        if event is not None:
+            event.error = error
+            event.error_code = error.code
+            event.error_sub_code = getattr(error, "sub_code", None)
+            event.request_id = error.request_id
+            self.hooks.emit("on_error", event)
+        self._observe(attempt, response, error=error)
+
+    def _observe(
+        self,
+        attempt: _Attempt,
+        response: "Response | None",
+        data: dict[str, Any] | None = None,
+        error: AlibabaError | None = None,
+    ) -> None:
+        event = attempt.event
+        if event is None:
+            latency = time.perf_counter() - attempt.started
+            params = attempt.params
+        else:
+            latency = event.timings.total
+            params = event.params
+        self.slow_calls.observe(
+            attempt.api_path, attempt.method, params, latency, response, data, error
+        )
+
+
+class AlibabaClient(_BaseClient, OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
     """
     Client for Alibaba.com Open Platform API v2.
 
@@ -47,75 +490,173 @@ class AlibabaClient(OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
             "/eco/buyer/product/description",
             {"query_req": json.dumps({"product_id": "123"})}
         )
+
+    Thread safety:
+        One client may be shared by any number of threads. Requests keep
+        their state on the stack; the HTTP client is created once under a
+        lock and httpx's connection pool is thread-safe. The negative cache
+        and metrics registry lock internally, the slow-call log appends to
+        an atomic ``deque``, and hooks and middleware may be added or
+        removed while requests run. Switch tokens with ``update_tokens``
+        rather than assigning to ``config`` fields one by one. Hooks and
+        middleware run on the requesting thread and must be thread-safe
+        themselves. This holds without relying on the GIL, on free-threaded
+        CPython builds too.
     """
 
     def __init__(
         self,
         config: Config,
+        *,
+        transport: httpx.BaseTransport | None = None,
+        metrics: MetricsRegistry | None = None,
+        slow_calls: SlowCallLog | None = None,
+        error_policies: ErrorPolicies | None = None,
+        negative_cache: NegativeCache | None = None,
+        middleware: Iterable[Any] = (),
+        dns_cache: DNSCache | None = None,
     ) -> None:
         """
         Initialize the API client.
 
         Args:
             config: Configuration instance with credentials
+            transport: Optional httpx transport, e.g. an in-process stand-in
+                server from ``alibaba_api.standin``
+            metrics: Optional registry to record per-endpoint counters and
+                latency histograms into. May be shared between clients
+            slow_calls: Ring buffer of slow and sampled calls. Defaults to a
+                ``SlowCallLog()`` keeping calls slower than one second and 1%
+                of the rest
+            error_policies: How to react to each error code. Defaults to
+                ``ErrorPolicies()`` with the built-in table
+            negative_cache: Cache of permanent product failures. Defaults to a
+                ``NegativeCache`` with ``config.offline_ttl`` and
+                ``config.restricted_ttl``. May be shared between clients
+            middleware: Middleware wrapping every signed request, outermost
+                first; see ``add_middleware``
+            dns_cache: Cache of resolved API host addresses, used when no
+                ``transport`` is given. Defaults to a ``DNSCache`` with
+                ``config.dns_ttl``. May be shared between clients
         """
-        self.config = config
-        self._client = httpx.Client(timeout=config.timeout)
+        super().__init__(
+            config,
+            metrics=metrics,
+            slow_calls=slow_calls,
+            error_policies=error_policies,
+            negative_cache=negative_cache,
+            middleware=middleware,
+            dns_cache=dns_cache,
+        )
+        self._transport = transport
+        self._http: httpx.Client | None = None
+        self._http_backend: Backend | None = None
+        self._http_lock = threading.Lock()
 
-    def _build_url(self, api_path: str) -> str:
-        return f"{self.config.base_url}{api_path}"
+    @property
+    def _client(self) -> httpx.Client:
+        """
+        The httpx client, created on first request.
 
-    def _parse_response(self, response: httpx.Response) -> dict[str, Any]:
+        Building one loads certificates and an SSL context, which costs more
+        than importing the package; short-lived jobs that never send a
+        request skip it.
         """
-        Parse API response and handle errors.
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                if self._http is None:
+                    transport = self._transport
+                    if transport is None:
+                        transport = self._network_transport(
+                            httpx.HTTPTransport(limits=self._pool_limits())
+                        )
+                    self._http = httpx.Client(
+                        timeout=self.config.timeout,
+                        transport=transport,
+                        headers=self._http_headers(),
+                    )
+                http = self._http
+        return http
+
+    @property
+    def _backend(self) -> "Backend":
+        """The HTTP backend (``config.http_backend``), created on first request."""
+        backend = self._http_backend
+        if backend is None:
+            # Imported here: the stdlib backend pulls in http.client
+            from alibaba_api.backends import HttpxBackend, StdlibBackend
+
+            created: Backend
+            if self._transport is None and self.config.http_backend == "stdlib":
+                config = self.config
+                created = StdlibBackend(
+                    {"Accept-Encoding": "gzip" if config.compression else "identity"},
+                    timeout=config.timeout,
+                    pool_connections=config.pool_connections,
+                    keepalive_expiry=config.keepalive_expiry,
+                    dns_cache=self.dns_cache if config.dns_ttl > 0 else None,
+                )
+            else:
+                created = HttpxBackend(self._client, self.config.timeout)
+            with self._http_lock:
+                if self._http_backend is None:
+                    self._http_backend = created
+                backend = self._http_backend
+        return backend
+
+    def warmup(self, connections: int = 4, *, timeout: float | None = None) -> WarmupReport:
+        """
+        Open pooled connections to ``config.base_url`` before traffic arrives.
+
+        Resolves the API host into ``dns_cache``, then sends ``connections``
+        concurrent GETs to the API root and holds every response open until
+        all are connected, so each opens its own connection instead of
+        reusing the first. The connections then stay in the pool for
+        ``config.keepalive_expiry`` seconds; at most
+        ``config.pool_connections`` are kept.
 
         Args:
-            response: HTTP response from httpx
+            connections: Connections to open
+            timeout: Seconds to wait for each connection. Default: ``config.timeout``
 
         Returns:
-            Parsed JSON response
+            DNS, connect and TLS timings for the connections opened
 
         Raises:
-            AlibabaNetworkError: For HTTP errors
-            AlibabaAPIError: For API error responses
+            ValueError: If ``connections`` is less than 1
+            AlibabaNetworkError: If the host does not resolve or no connection opens
         """
-        try:
-            data: dict[str, Any] | str = response.json()
-        except ValueError:
-            data = response.text
+        report, url = self._start_warmup(connections)
+        started = time.perf_counter()
+        self._backend.warmup(url, report, self.config.timeout if timeout is None else timeout)
+        return self._finish_warmup(report, started)
 
-        if response.status_code >= 400:
-            request_id = response.headers.get("x-request-id")
-            message = (
-                data.get("message", response.text) if isinstance(data, dict) else response.text
-            )
-            raise AlibabaNetworkError(
-                message,
-                status_code=response.status_code,
-                request_id=request_id,
-            )
-
-        if not isinstance(data, dict):
-            return {"data": data}
-
-        # Check for API errors (code != "0")
-        code = str(data.get("code", ""))
-        if code != "0":
-            request_id = data.get("request_id")
-            message = data.get("message", "")
-            sub_code = data.get("sub_code")
+    def run(self, operation: Operation[T]) -> T:
+        """
+        Drive a sans-IO operation, sending each request it yields with ``request``.
 
-            if not message:
-                message = get_error_message(sub_code or code)
+        Every high-level method is ``run`` over its ``*_op`` operation, e.g.
+        ``client.run(client.get_product_op(product_id))`` is
+        ``client.get_product(product_id)``.
 
-            raise AlibabaAPIError(
-                code=code,
-                message=message,
-                request_id=request_id,
-                sub_code=sub_code,
-            )
+        Args:
+            operation: Generator yielding ``ApiRequest`` descriptions; see
+                ``alibaba_api.sansio``
 
-        return data
+        Returns:
+            The operation's result
+        """
+        return drive(operation, self._perform)
+
+    def _perform(self, request: ApiRequest) -> dict[str, Any]:
+        return self.request(
+            request.api_path,
+            request.params,
+            method=request.method,
+            timeout=request.timeout,
+            deadline=request.deadline,
+        )
 
     def request(
         self,
@@ -124,53 +665,85 @@ class AlibabaClient(OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
         method: Literal["GET", "POST"] = "GET",
         *,
         access_token: str | None = None,
+        timeout: float | None = None,
+        deadline: Deadline | float | None = None,
     ) -> dict[str, Any]:
         """
         Make a signed request to the Alibaba API.
 
+        Errors carry ``error_class`` from ``self.error_policies``. Retryable
+        GET requests are retried up to ``config.max_retries`` times. Each
+        attempt passes through ``self.middleware``.
+
         Args:
             api_path: The API endpoint path (e.g., "/auth/token/create")
             params: Business parameters for the API
             method: HTTP method (GET or POST)
             access_token: Override access token for this request
+            timeout: Timeout in seconds for each attempt. Default:
+                ``config.endpoint_timeouts[api_path]``, else ``config.timeout``
+            deadline: ``Deadline`` or budget in seconds for every attempt,
+                including retries; each attempt's timeout is capped at the
+                time remaining
 
         Returns:
             Parsed JSON response from the API
 
         Raises:
             AlibabaValidationError: If parameters are invalid
+            AlibabaDeadlineError: If the deadline runs out
             AlibabaNetworkError: For network/HTTP errors
             AlibabaAPIError: For API error responses
         """
-        if params is None:
-            params = {}
-
-        if not api_path.startswith("/"):
-            raise AlibabaValidationError(f"api_path must start with '/', got: {api_path}")
-
-        token = access_token or self.config.access_token
-
-        signed_params = build_signed_params(
-            api_path=api_path,
-            params=params,
-            app_key=self.config.app_key,
-            app_secret=self.config.app_secret,
-            access_token=token,
+        params, timeout, deadline = self._request_args(api_path, params, timeout, deadline)
+        attempt = 1
+        while True:
+            try:
+                attempt_timeout = self._attempt_timeout(api_path, timeout, deadline)
+                if self.middleware:
+                    call = Call(api_path, method, params, access_token, attempt_timeout, attempt)
+                    return self.middleware.handler(call)  # type: ignore[no-any-return]
+                return self._attempt(
+                    api_path, params, method, access_token, attempt, attempt_timeout
+                )
+            except AlibabaError as e:
+                delay = self._retry_delay(e, api_path, method, attempt, deadline)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _handle_call(self, call: Call) -> dict[str, Any]:
+        return self._attempt(
+            call.api_path,
+            call.params,
+            call.method,
+            call.access_token,
+            call.attempt,
+            call.timeout,
+            call.annotations,
         )
 
-        url = self._build_url(api_path)
-
+    def _attempt(
+        self,
+        api_path: str,
+        params: dict[str, str],
+        method: str,
+        access_token: str | None,
+        attempt: int = 1,
+        timeout: float | None = None,
+        annotations: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Sign, send and parse one request attempt."""
+        pending = self._begin_attempt(api_path, params, method, access_token, attempt, annotations)
         try:
-            if method.upper() == "GET":
-                response = self._client.get(url, params=signed_params)
-            else:
-                response = self._client.post(url, data=signed_params)
-        except httpx.TimeoutException as e:
-            raise AlibabaNetworkError(f"Request timed out after {self.config.timeout}s") from e
-        except httpx.NetworkError as e:
-            raise AlibabaNetworkError(f"Network error: {e}") from e
-
-        return self._parse_response(response)
+            response = self._backend.send(
+                method.upper(), pending.url, pending.signed_params, timeout
+            )
+        except AlibabaError as e:
+            self._send_failed(pending, e)
+            raise
+        return self._finish_attempt(pending, response)
 
     def get(
         self,
@@ -178,6 +751,8 @@ class AlibabaClient(OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
         params: dict[str, str] | None = None,
         *,
         access_token: str | None = None,
+        timeout: float | None = None,
+        deadline: Deadline | float | None = None,
     ) -> dict[str, Any]:
         """
         Make a GET request to the Alibaba API.
@@ -186,11 +761,20 @@ class AlibabaClient(OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
             api_path: The API endpoint path
             params: Query parameters
             access_token: Override access token for this request
+            timeout: Timeout in seconds, see ``request``
+            deadline: Deadline or budget in seconds, see ``request``
 
         Returns:
             Parsed JSON response
         """
-        return self.request(api_path, params, "GET", access_token=access_token)
+        return self.request(
+            api_path,
+            params,
+            "GET",
+            access_token=access_token,
+            timeout=timeout,
+            deadline=deadline,
+        )
 
     def post(
         self,
@@ -198,6 +782,8 @@ class AlibabaClient(OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
         params: dict[str, str] | None = None,
         *,
         access_token: str | None = None,
+        timeout: float | None = None,
+        deadline: Deadline | float | None = None,
     ) -> dict[str, Any]:
         """
         Make a POST request to the Alibaba API.
@@ -206,14 +792,26 @@ class AlibabaClient(OrderMethods, ProductMethods, ShippingMethods, AuthMethods):
             api_path: The API endpoint path
             params: Form data parameters
             access_token: Override access token for this request
+            timeout: Timeout in seconds, see ``request``
+            deadline: Deadline or budget in seconds, see ``request``
 
         Returns:
             Parsed JSON response
         """
-        return self.request(api_path, params, "POST", access_token=access_token)
+        return self.request(
+            api_path,
+            params,
+            "POST",
+            access_token=access_token,
+            timeout=timeout,
+            deadline=deadline,
+        )
 
     def close(self) -> None:
-        self._client.close()
+        if self._http_backend is not None:
+            self._http_backend.close()
+        elif self._http is not None:
+            self._http.close()
 
     def __enter__(self) -> "AlibabaClient":
         return self
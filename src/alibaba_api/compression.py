@@ -0,0 +1,108 @@
+"""
+Response compression: which encodings to ask for, and encoders for the stand-in.
+
+httpx decodes gzip out of the box, brotli when ``brotli`` or ``brotlicffi``
+is installed and, from httpx 0.27.1, zstd when ``zstandard`` is installed
+(``pip install alibaba-api[compression]``). ``accept_encoding`` lists the
+encodings this interpreter can decode, most compact first, so the client
+never asks for one it could not read.
+
+Decoding is incremental: httpx feeds each chunk read off the socket through
+a streaming decoder, so a large compressed body is never buffered whole
+before it is decompressed.
+
+Example:
+    accept_encoding()                        # "zstd, br, gzip" with both extras
+    choose_encoding("gzip, br;q=0", ("br", "gzip"))  # "gzip"
+"""
+
+import functools
+import gzip
+import importlib.util
+from collections.abc import Sequence
+
+# Encodings in order of preference, most compact first
+ENCODINGS: tuple[str, ...] = ("zstd", "br", "gzip")
+
+# Modules httpx imports to decode each encoding; gzip needs none
+_DECODER_MODULES: dict[str, tuple[str, ...]] = {
+    "zstd": ("zstandard",),
+    "br": ("brotli", "brotlicffi"),
+    "gzip": (),
+}
+
+
+@functools.cache
+def available_encodings() -> tuple[str, ...]:
+    """Encodings from ``ENCODINGS`` that httpx can decode in this interpreter."""
+    return tuple(
+        encoding
+        for encoding, modules in _DECODER_MODULES.items()
+        if not modules or any(importlib.util.find_spec(module) for module in modules)
+    )
+
+
+def accept_encoding(enabled: bool = True) -> str:
+    """
+    ``Accept-Encoding`` header value for API requests.
+
+    Args:
+        enabled: Ask for compressed responses; False asks for ``identity``
+    """
+    return ", ".join(available_encodings()) if enabled else "identity"
+
+
+def choose_encoding(accept: str | None, offered: Sequence[str]) -> str | None:
+    """
+    Pick the first of ``offered`` that an ``Accept-Encoding`` header allows.
+
+    Encodings with ``q=0`` are refused; ``*`` allows any encoding not named.
+
+    Args:
+        accept: Header value, or None if the request sent none
+        offered: Encodings the server can produce, in its order of preference
+
+    Returns:
+        The encoding to use, or None to send the body uncompressed
+    """
+    if not accept:
+        return None
+    weights: dict[str, float] = {}
+    for item in accept.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    default = weights.get("*", 0.0)
+    for encoding in offered:
+        if weights.get(encoding, default) > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Encode ``data`` with ``encoding`` ("gzip", "br" or "zstd").
+
+    Raises:
+        ValueError: If the encoding is unknown
+        ImportError: If its optional module is not installed
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if encoding == "br":
+        try:
+            import brotli
+        except ImportError:
+            import brotlicffi as brotli
+        return brotli.compress(data)  # type: ignore[no-any-return]
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)  # type: ignore[no-any-return]
+    raise ValueError(f"Unknown content encoding: {encoding}")
@@ -1,7 +1,15 @@
 """Configuration management for Alibaba API client."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Literal, cast
+
+# How high-level methods return data: plain dicts, validated pydantic models,
+# or models built without validation (see alibaba_api.typed)
+ResponseMode = Literal["dict", "validated", "trusted"]
+
+# HTTP library AlibabaClient sends requests with (see alibaba_api.backends)
+HTTPBackend = Literal["httpx", "stdlib"]
 
 
 @dataclass
@@ -14,9 +22,34 @@ class Config:
     refresh_token: str | None = None
     use_sandbox: bool = False
     timeout: int = 30
+    # Per-request timeout overrides in seconds, keyed by API path
+    endpoint_timeouts: dict[str, float] = field(default_factory=dict)
+    base_url_override: str | None = None
+    response_mode: ResponseMode = "dict"
+    # Retries for retryable GET errors (see alibaba_api.policy); the delay
+    # doubles from retry_backoff seconds on each attempt
+    max_retries: int = 0
+    retry_backoff: float = 0.2
+    # Seconds to short-circuit calls for offline products (130106) and for
+    # products that cannot ship to a country (120019, 4015); 0 disables
+    offline_ttl: float = 300.0
+    restricted_ttl: float = 3600.0
+    # Ask for compressed responses in every encoding httpx can decode here
+    # (see alibaba_api.compression); False requests identity bodies
+    compression: bool = True
+    # Seconds to reuse resolved API host addresses (see alibaba_api.connections);
+    # 0 resolves on every new connection
+    dns_ttl: float = 60.0
+    # Idle connections kept in the pool, and for how many seconds. Raise both
+    # to keep connections opened by ``warmup`` until traffic arrives
+    pool_connections: int = 20
+    keepalive_expiry: float = 5.0
+    # "stdlib" sends over pooled http.client connections, with less overhead
+    # per request than httpx; ignored when a transport is given
+    http_backend: HTTPBackend = "httpx"
 
     @classmethod
-    def from_env(cls, **overrides: str | bool | None) -> "Config":
+    def from_env(cls, **overrides: Any) -> "Config":
         """
         Create configuration from environment variables with optional overrides.
 
@@ -27,6 +60,19 @@ class Config:
             ALIBABA_REFRESH_TOKEN: OAuth refresh token (optional)
             ALIBABA_USE_SANDBOX: Use sandbox environment (optional, "true" to enable)
             ALIBABA_TIMEOUT: Request timeout in seconds (optional, default 30)
+            ALIBABA_BASE_URL: Override the API base URL, e.g. a local stand-in (optional)
+            ALIBABA_RESPONSE_MODE: "dict", "validated" or "trusted" (optional, default "dict")
+            ALIBABA_MAX_RETRIES: Retries for retryable GET errors (optional, default 0)
+            ALIBABA_OFFLINE_TTL: Seconds to cache offline products (optional, default 300)
+            ALIBABA_RESTRICTED_TTL: Seconds to cache restricted destinations
+                (optional, default 3600)
+            ALIBABA_COMPRESSION: Ask for compressed responses (optional, "false"
+                to disable)
+            ALIBABA_DNS_TTL: Seconds to cache API host addresses (optional, default 60)
+            ALIBABA_HTTP_BACKEND: "httpx" or "stdlib" (optional, default "httpx")
+            ALIBABA_POOL_CONNECTIONS: Idle connections to keep per client (optional,
+                default 20)
+            ALIBABA_KEEPALIVE_EXPIRY: Seconds to keep idle connections (optional, default 5)
 
         Args:
             **overrides: Keyword arguments to override environment variables
@@ -56,6 +102,12 @@ class Config:
         else:
             use_sandbox = bool(use_sandbox_raw)
 
+        compression_raw = overrides.get("compression", os.getenv("ALIBABA_COMPRESSION", ""))
+        if isinstance(compression_raw, str):
+            compression = compression_raw.lower() not in ("0", "false", "no")
+        else:
+            compression = bool(compression_raw)
+
         return cls(
             app_key=app_key,
             app_secret=app_secret,
@@ -63,10 +115,37 @@ class Config:
             refresh_token=overrides.get("refresh_token", os.getenv("ALIBABA_REFRESH_TOKEN")),
             use_sandbox=use_sandbox,
             timeout=int(overrides.get("timeout", os.getenv("ALIBABA_TIMEOUT", "30"))),
+            base_url_override=overrides.get("base_url_override", os.getenv("ALIBABA_BASE_URL"))
+            or None,
+            response_mode=cast(
+                ResponseMode,
+                overrides.get("response_mode", os.getenv("ALIBABA_RESPONSE_MODE", "dict")),
+            ),
+            max_retries=int(overrides.get("max_retries", os.getenv("ALIBABA_MAX_RETRIES", "0"))),
+            offline_ttl=float(
+                overrides.get("offline_ttl", os.getenv("ALIBABA_OFFLINE_TTL", "300"))
+            ),
+            restricted_ttl=float(
+                overrides.get("restricted_ttl", os.getenv("ALIBABA_RESTRICTED_TTL", "3600"))
+            ),
+            compression=compression,
+            dns_ttl=float(overrides.get("dns_ttl", os.getenv("ALIBABA_DNS_TTL", "60"))),
+            http_backend=cast(
+                HTTPBackend,
+                overrides.get("http_backend", os.getenv("ALIBABA_HTTP_BACKEND", "httpx")),
+            ),
+            pool_connections=int(
+                overrides.get("pool_connections", os.getenv("ALIBABA_POOL_CONNECTIONS", "20"))
+            ),
+            keepalive_expiry=float(
+                overrides.get("keepalive_expiry", os.getenv("ALIBABA_KEEPALIVE_EXPIRY", "5"))
+            ),
         )
 
     @property
     def base_url(self) -> str:
+        if self.base_url_override:
+            return self.base_url_override.rstrip("/")
         if self.use_sandbox:
             return "https://openapi-api-sandbox.alibaba.com/rest"
         return "https://openapi-api.alibaba.com/rest"
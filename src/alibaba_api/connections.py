@@ -0,0 +1,298 @@
+"""
+DNS caching and connection warm-up.
+
+A fresh worker pays for a DNS lookup, a TCP connect and a TLS handshake on
+its first calls, and for every new pooled connection opened while traffic
+ramps up. Two pieces take that cost out of the request path:
+
+- ``DNSCache`` remembers resolved addresses for ``Config.dns_ttl`` seconds.
+  Clients without a custom transport route requests through a
+  ``ResolvingTransport``, which connects to the cached address while
+  keeping the hostname for the ``Host`` header, TLS SNI and certificate
+  checks. Connection pools are keyed by address, so once the TTL lapses a
+  changed record gets fresh connections and the old ones idle out.
+- ``AlibabaClient.warmup(connections=N)`` (and the async equivalent) opens
+  N pooled connections to ``Config.base_url`` at once and returns a
+  ``WarmupReport`` with the time spent resolving, connecting and in TLS.
+
+Example:
+    client = AlibabaClient(config)
+    report = client.warmup(connections=8)
+    print(report.format())
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+Resolver = Callable[[str, int], list[Any]]
+
+
+class DNSCache:
+    """
+    Thread-safe TTL cache of resolved host addresses.
+
+    Args:
+        ttl: Seconds to reuse an answer; 0 resolves on every lookup
+        resolver: ``getaddrinfo``-style callable ``(host, port)`` returning
+            ``(family, type, proto, canonname, sockaddr)`` tuples. Defaults to
+            ``socket.getaddrinfo`` for TCP
+    """
+
+    def __init__(self, ttl: float = 60.0, *, resolver: Resolver | None = None) -> None:
+        self.ttl = ttl
+        self._resolver = resolver or _getaddrinfo
+        self._entries: dict[tuple[str, int], tuple[float, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.lookup_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cached(self, host: str, port: int) -> str | None:
+        """The cached address for ``host``, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+        return None
+
+    def store(self, host: str, port: int, infos: list[Any], seconds: float) -> str:
+        """Remember the first address from a ``getaddrinfo`` answer and return it."""
+        if not infos:
+            raise OSError(f"No addresses for {host}")
+        address: str = infos[0][4][0]
+        with self._lock:
+            self.misses += 1
+            self.lookup_seconds += seconds
+            if self.ttl > 0:
+                self._entries[(host, port)] = (time.monotonic() + self.ttl, address)
+        return address
+
+    def resolve(self, host: str, port: int) -> str:
+        """
+        Address to connect to for ``host``, from the cache or a fresh lookup.
+
+        Raises:
+            OSError: If resolution fails
+        """
+        address = self.cached(host, port)
+        if address is None:
+            started = time.perf_counter()
+            infos = self._resolver(host, port)
+            address = self.store(host, port, infos, time.perf_counter() - started)
+        return address
+
+    async def aresolve(self, host: str, port: int) -> str:
+        """Like ``resolve``, resolving on the event loop's executor."""
+        # Imported here so sync-only programs do not pay for asyncio at import
+        import asyncio
+
+        address = self.cached(host, port)
+        if address is None:
+            started = time.perf_counter()
+            infos = await asyncio.get_running_loop().run_in_executor(
+                None, self._resolver, host, port
+            )
+            address = self.store(host, port, infos, time.perf_counter() - started)
+        return address
+
+    def forget(self, host: str, port: int) -> None:
+        """Drop ``host``'s entry, e.g. after its address refused a connection."""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit and miss counts and total seconds spent resolving."""
+        with self._lock:
+            return {
+                "hosts": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "lookup_seconds": self.lookup_seconds,
+            }
+
+
+def _getaddrinfo(host: str, port: int) -> list[Any]:
+    return socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+
+
+def needs_resolving(host: str) -> bool:
+    """Whether ``host`` is a name to resolve rather than an IP address."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return True
+    return False
+
+
+def _port(url: httpx.URL) -> int:
+    return url.port or (443 if url.scheme == "https" else 80)
+
+
+def _route(request: httpx.Request, address: str) -> None:
+    # Connect to ``address``; the Host header was set from the original URL
+    request.extensions = {**request.extensions, "sni_hostname": request.url.host}
+    request.url = request.url.copy_with(host=address)
+
+
+class ResolvingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport that connects to addresses from a ``DNSCache``.
+
+    The request URL's host is swapped for the cached address while the
+    request is sent; the ``Host`` header and the ``sni_hostname`` extension
+    keep the original name, so virtual hosting and certificate verification
+    are unchanged. A failed connect drops the cached entry so the next
+    attempt resolves again.
+
+    Args:
+        dns_cache: Where addresses are cached
+        inner: Transport making the requests. Defaults to httpx's network
+            transport (sync or async, as used)
+    """
+
+    def __init__(
+        self,
+        dns_cache: DNSCache,
+        inner: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.dns_cache = dns_cache
+        self._inner: Any = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._inner is None:
+            self._inner = httpx.HTTPTransport()
+        url = request.url
+        if not needs_resolving(url.host):
+            response: httpx.Response = self._inner.handle_request(request)
+            return response
+        port = _port(url)
+        try:
+            address = self.dns_cache.resolve(url.host, port)
+        except OSError as e:
+            raise httpx.ConnectError(f"DNS lookup for {url.host} failed: {e}") from e
+        _route(request, address)
+        try:
+            response = self._inner.handle_request(request)
+        except httpx.ConnectError:
+            self.dns_cache.forget(url.host, port)
+            raise
+        finally:
+            request.url = url
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._inner is None:
+            self._inner = httpx.AsyncHTTPTransport()
+        url = request.url
+        if not needs_resolving(url.host):
+            response: httpx.Response = await self._inner.handle_async_request(request)
+            return response
+        port = _port(url)
+        try:
+            address = await self.dns_cache.aresolve(url.host, port)
+        except OSError as e:
+            raise httpx.ConnectError(f"DNS lookup for {url.host} failed: {e}") from e
+        _route(request, address)
+        try:
+            response = await self._inner.handle_async_request(request)
+        except httpx.ConnectError:
+            self.dns_cache.forget(url.host, port)
+            raise
+        finally:
+            request.url = url
+        return response
+
+    def close(self) -> None:
+        if isinstance(self._inner, httpx.BaseTransport):
+            self._inner.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self._inner, httpx.AsyncBaseTransport):
+            await self._inner.aclose()
+
+
+@dataclass(slots=True)
+class WarmupReport:
+    """
+    What ``warmup`` did, with handshake timings in seconds.
+
+    ``connect`` and ``tls`` hold one entry per connection opened; pooled
+    connections that were already open are reused and add nothing.
+    ``dns`` is 0 when the address was already cached.
+    """
+
+    requested: int
+    elapsed: float = 0.0
+    dns: float = 0.0
+    connect: list[float] = field(default_factory=list)
+    tls: list[float] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def opened(self) -> int:
+        """New connections opened."""
+        return len(self.connect)
+
+    def format(self) -> str:
+        """One-line summary."""
+        parts = [f"warmed {self.requested} connections in {self.elapsed * 1000:.1f}ms"]
+        parts.append(f"opened {self.opened}")
+        parts.append(f"dns {self.dns * 1000:.1f}ms")
+        for name, values in (("connect", self.connect), ("tls", self.tls)):
+            if values:
+                parts.append(
+                    f"{name} avg {sum(values) / len(values) * 1000:.1f}ms"
+                    f" max {max(values) * 1000:.1f}ms"
+                )
+        if self.errors:
+            parts.append(f"{len(self.errors)} failed")
+        return ", ".join(parts)
+
+
+class HandshakeTrace:
+    """
+    httpcore ``trace`` callback timing one request's connect and TLS phases.
+
+    Pass the instance as the ``trace`` extension of a sync request, or its
+    ``atrace`` method for an async one.
+    """
+
+    _PHASES = {"connection.connect_tcp": "connect", "connection.start_tls": "tls"}
+
+    def __init__(self, report: WarmupReport) -> None:
+        self._report = report
+        self._started: dict[str, float] = {}
+
+    def __call__(self, name: str, info: dict[str, Any]) -> None:
+        event, _, stage = name.rpartition(".")
+        phase = self._PHASES.get(event)
+        if phase is None:
+            return
+        if stage == "started":
+            self._started[phase] = time.perf_counter()
+        elif stage == "complete" and phase in self._started:
+            getattr(self._report, phase).append(time.perf_counter() - self._started.pop(phase))
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self(name, info)
+
+
+def warmup_url(base_url: str) -> str:
+    """URL requested to open each connection: the API root, answered by the gateway."""
+    return base_url.rstrip("/") + "/"
@@ -0,0 +1,553 @@
+"""
+Checkpointed, resumable crawl of the product catalog.
+
+``CatalogCrawler`` walks every product source page by page (``list_products``
+for each scene ID, ``get_local_products`` for each local-warehouse country
+and ``get_crossborder_products``), then fetches ``get_product`` once for
+each unique product ID, writing products to a JSON Lines file as they
+arrive. Sources are walked concurrently, one thread each, while a bounded
+pool of workers fetches product details; at most ``concurrency`` requests
+are in flight at a time.
+
+Progress goes to an append-only checkpoint journal (JSON Lines): each
+listing page with the IDs it added, each exhausted source, and each product
+written, with the output file's length after it. Running the crawler again
+with the same checkpoint resumes where it stopped: finished pages are not
+fetched again, IDs already seen are not fetched twice, and the output is
+cut back to the last product the journal recorded, so a crash mid-write
+leaves no partial or duplicate lines. With a new checkpoint the output
+starts empty. A product the API refuses (offline, restricted, ...) is
+recorded as failed and not retried; one lost to a network error, a rate
+limit or another error its policy does not class as permanent stays
+pending for the next run.
+
+Example:
+    with AlibabaClient(Config.from_env(pool_connections=16)) as client:
+        crawler = CatalogCrawler(client, "catalog.ckpt", "catalog.jsonl", concurrency=16)
+        report = crawler.run()
+    print(report.format())
+
+Or from the command line, against a stand-in it starts itself or any base URL:
+
+    python -m alibaba_api.crawler --standin --checkpoint catalog.ckpt --output catalog.jsonl
+    python -m alibaba_api.crawler --base-url http://host/rest --scene 906124611 \\
+        --checkpoint catalog.ckpt --output catalog.jsonl --concurrency 16
+"""
+
+import dataclasses
+import json
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaError
+from alibaba_api.policy import error_key
+
+# Scene IDs documented for ``list_products``
+SCENE_IDS: tuple[str, ...] = (
+    "906124611",
+    "906168847",
+    "907135637",
+    "907732810",
+    "907180667",
+    "907180664",
+)
+
+# Countries with local-warehouse listings (``get_local_products``)
+LOCAL_COUNTRIES: tuple[str, ...] = ("US", "MX")
+
+SourceKind = Literal["scene", "local", "crossborder"]
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    """
+    One paged listing of product IDs.
+
+    ``key`` is the scene ID for ``"scene"``, the country for ``"local"``, and
+    empty for ``"crossborder"``.
+    """
+
+    kind: SourceKind
+    key: str = ""
+
+    @property
+    def name(self) -> str:
+        """Stable name used in the checkpoint, e.g. ``"scene:906124611"``."""
+        return f"{self.kind}:{self.key}" if self.key else self.kind
+
+    def fetch(self, client: AlibabaClient, page: int, page_size: int) -> list[Any]:
+        """Product IDs on one page of this listing."""
+        if self.kind == "scene":
+            listing = client.list_products(self.key, page, page_size)
+        elif self.kind == "local":
+            listing = client.get_local_products(self.key, page, page_size)
+        else:
+            listing = client.get_crossborder_products(page, page_size)
+        return list(listing["product_ids"])
+
+
+def default_sources(
+    scene_ids: Iterable[str] = SCENE_IDS, countries: Iterable[str] = LOCAL_COUNTRIES
+) -> list[Source]:
+    """Every scene listing, every local-warehouse listing, and the cross-border listing."""
+    return [
+        *(Source("scene", scene_id) for scene_id in scene_ids),
+        *(Source("local", country) for country in countries),
+        Source("crossborder"),
+    ]
+
+
+@dataclass(slots=True)
+class CheckpointState:
+    """
+    Progress recovered from a checkpoint journal.
+
+    ``seen`` holds every product ID listed so far and ``done`` those written
+    or given up on; the rest are still to fetch. ``output_length`` is how
+    much of the output file the journal vouches for.
+    """
+
+    next_page: dict[str, int] = field(default_factory=dict)
+    finished: set[str] = field(default_factory=set)
+    seen: set[int] = field(default_factory=set)
+    done: set[int] = field(default_factory=set)
+    output_length: int = 0
+    resumed: bool = False
+
+    @property
+    def pending(self) -> list[int]:
+        """IDs listed but not yet fetched, in ascending order."""
+        return sorted(self.seen - self.done)
+
+
+class CrawlCheckpoint:
+    """
+    Append-only JSON Lines journal of a crawl's progress.
+
+    Each record is written and flushed on its own, so a process that dies
+    loses at most the record it was writing; a torn last line is dropped
+    on load. Pass ``fsync=True`` to survive an OS crash too, at the cost of
+    one fsync per record.
+
+    Args:
+        path: Journal file; created if missing
+        fsync: fsync after every record
+    """
+
+    def __init__(self, path: str | Path, *, fsync: bool = False) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self._file: IO[bytes] | None = None
+
+    def load(self) -> CheckpointState:
+        """
+        Read the journal and open it for appending.
+
+        Returns:
+            The progress recorded so far; empty if the journal does not exist
+
+        Raises:
+            ValueError: If a complete line is not a valid record
+        """
+        state = CheckpointState()
+        good = 0
+        if self.path.exists():
+            lines = self.path.read_bytes().splitlines(keepends=True)
+            for number, line in enumerate(lines, 1):
+                if not line.endswith(b"\n"):
+                    break  # torn final write
+                if line.strip():
+                    try:
+                        _apply(state, json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        raise ValueError(
+                            f"Corrupt checkpoint {self.path} at line {number}"
+                        ) from None
+                good += len(line)
+            state.resumed = good > 0
+
+        self.close()
+        self._file = open(self.path, "ab")  # noqa: SIM115
+        self._file.truncate(good)
+        return state
+
+    def record_page(self, source: str, page: int, new_ids: Sequence[int]) -> None:
+        """Record a finished listing page and the product IDs it added."""
+        self._write({"t": "page", "source": source, "page": page, "new": list(new_ids)})
+
+    def record_finished(self, source: str) -> None:
+        """Record that ``source`` has no more pages."""
+        self._write({"t": "finished", "source": source})
+
+    def record_product(self, product_id: int, output_length: int, error: str | None = None) -> None:
+        """Record a product written (output now ``output_length`` bytes) or given up on."""
+        record: dict[str, Any] = {"t": "product", "id": product_id, "length": output_length}
+        if error is not None:
+            record["error"] = error
+        self._write(record)
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            raise RuntimeError("CrawlCheckpoint.load() must be called before recording")
+        self._file.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _apply(state: CheckpointState, record: dict[str, Any]) -> None:
+    kind = record.get("t")
+    if kind == "page":
+        state.next_page[record["source"]] = record["page"] + 1
+        state.seen.update(record["new"])
+    elif kind == "finished":
+        state.finished.add(record["source"])
+    elif kind == "product":
+        state.done.add(record["id"])
+        state.output_length = max(state.output_length, record["length"])
+
+
+@dataclass(slots=True)
+class CrawlReport:
+    """
+    Result of one crawler run.
+
+    Counts cover this run only, except ``unique``, which counts every
+    product ID listed across all runs sharing the checkpoint. ``failed``
+    counts products the API refused, by ``error_key``; ``pending`` is how
+    many listed products are still to fetch; ``source_errors`` maps each
+    source that stopped on an error to the error.
+    """
+
+    sources: int
+    resumed: bool
+    elapsed: float = 0.0
+    pages: int = 0
+    listed: int = 0
+    duplicates: int = 0
+    unique: int = 0
+    written: int = 0
+    failed: Counter[str] = field(default_factory=Counter)
+    pending: int = 0
+    source_errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every source is exhausted and every listed product fetched."""
+        return not self.pending and not self.source_errors
+
+    def summary(self) -> dict[str, Any]:
+        """The report as plain data, e.g. for JSON output."""
+        return {
+            "sources": self.sources,
+            "resumed": self.resumed,
+            "elapsed": self.elapsed,
+            "pages": self.pages,
+            "listed": self.listed,
+            "duplicates": self.duplicates,
+            "unique": self.unique,
+            "written": self.written,
+            "failed": dict(self.failed),
+            "pending": self.pending,
+            "source_errors": self.source_errors,
+            "complete": self.complete,
+        }
+
+    def format(self) -> str:
+        """One line per fact, for the terminal."""
+        failed = ", ".join(f"{code}: {n}" for code, n in self.failed.most_common())
+        lines = [
+            f"{'resumed' if self.resumed else 'started'} crawl of {self.sources} sources "
+            f"in {self.elapsed:.1f}s: {'complete' if self.complete else 'incomplete'}",
+            f"pages {self.pages}, IDs listed {self.listed} ({self.duplicates} duplicates), "
+            f"unique {self.unique}",
+            f"products written {self.written}, failed {sum(self.failed.values())}"
+            f"{f' ({failed})' if failed else ''}, pending {self.pending}",
+        ]
+        lines.extend(
+            f"source {name} stopped: {error}" for name, error in self.source_errors.items()
+        )
+        return "\n".join(lines)
+
+
+class CatalogCrawler:
+    """
+    Crawl product sources into a JSON Lines file, resumably.
+
+    Args:
+        client: Client to crawl with; shared by all threads
+        checkpoint: Journal file recording progress; reused to resume
+        output: JSON Lines file of products, one per line
+        sources: Listings to walk. Default: ``default_sources()``
+        concurrency: Most requests in flight at once, and product workers
+        page_size: Product IDs per listing page (the API allows up to 100)
+        country: Country passed to ``get_product``
+        fsync: fsync the checkpoint after every record
+    """
+
+    def __init__(
+        self,
+        client: AlibabaClient,
+        checkpoint: str | Path,
+        output: str | Path,
+        *,
+        sources: Sequence[Source] | None = None,
+        concurrency: int = 8,
+        page_size: int = 100,
+        country: str = "US",
+        fsync: bool = False,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not 1 <= page_size <= 100:
+            raise ValueError(f"page_size must be between 1 and 100, got: {page_size}")
+        self.client = client
+        self.checkpoint = CrawlCheckpoint(checkpoint, fsync=fsync)
+        self.output = Path(output)
+        self.sources = list(sources) if sources is not None else default_sources()
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.country = country
+        self._lock = threading.Lock()
+        self._requests = threading.BoundedSemaphore(concurrency)
+        self._stop = threading.Event()
+        self._failure: BaseException | None = None
+        self._state = CheckpointState()
+
+    def run(self) -> CrawlReport:
+        """
+        Crawl until every source is exhausted and every listed product fetched.
+
+        Returns:
+            What this run did
+
+        Raises:
+            ValueError: If resuming and the output is shorter than the
+                checkpoint records, e.g. because it was replaced
+            Exception: Anything other than an ``AlibabaError`` raised while
+                crawling, after the threads have stopped; progress up to it
+                is in the checkpoint
+        """
+        started = time.perf_counter()
+        state = self._state = self.checkpoint.load()
+        self._stop.clear()
+        self._failure = None
+        report = CrawlReport(len(self.sources), state.resumed)
+        products: queue.Queue[int | None] = queue.Queue(maxsize=self.concurrency * 4)
+
+        with open(self.output, "ab") as output:
+            if state.resumed and output.seek(0, os.SEEK_END) < state.output_length:
+                self.checkpoint.close()
+                raise ValueError(
+                    f"{self.output} is shorter than {self.checkpoint.path} records; "
+                    "cannot resume from it"
+                )
+            output.truncate(state.output_length if state.resumed else 0)
+            output.seek(0, os.SEEK_END)
+            # Taken before the walkers start adding to ``seen``
+            backlog = state.pending
+            workers = [
+                self._thread(self._fetch_products, products, output, report)
+                for _ in range(self.concurrency)
+            ]
+            walkers = [
+                self._thread(self._walk, source, products, report)
+                for source in self.sources
+                if source.name not in state.finished
+            ]
+            for product_id in backlog:
+                self._put(products, product_id)
+            for thread in walkers:
+                thread.join()
+            for _ in workers:
+                self._put(products, None)
+            for thread in workers:
+                thread.join()
+        self.checkpoint.close()
+
+        if self._failure is not None:
+            raise self._failure
+        report.unique = len(state.seen)
+        report.pending = len(state.seen) - len(state.done)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _thread(self, target: Callable[..., None], *args: Any) -> threading.Thread:
+        def guarded() -> None:
+            try:
+                target(*args)
+            except BaseException as e:
+                with self._lock:
+                    if self._failure is None:
+                        self._failure = e
+                self._stop.set()
+
+        thread = threading.Thread(target=guarded, daemon=True)
+        thread.start()
+        return thread
+
+    def _put(self, products: "queue.Queue[int | None]", item: int | None) -> None:
+        """Queue ``item``, waiting for room unless the crawl is stopping."""
+        while not self._stop.is_set():
+            try:
+                products.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _walk(
+        self, source: Source, products: "queue.Queue[int | None]", report: CrawlReport
+    ) -> None:
+        """Page through ``source``, queueing IDs not seen before."""
+        state = self._state
+        page = state.next_page.get(source.name, 0)
+        while not self._stop.is_set():
+            try:
+                with self._requests:
+                    listed = source.fetch(self.client, page, self.page_size)
+            except AlibabaError as e:
+                with self._lock:
+                    report.source_errors[source.name] = f"{error_key(e)}: {e}"
+                return
+
+            ids = [int(product_id) for product_id in listed]
+            with self._lock:
+                new = [
+                    product_id for product_id in dict.fromkeys(ids) if product_id not in state.seen
+                ]
+                state.seen.update(new)
+                self.checkpoint.record_page(source.name, page, new)
+                report.pages += 1
+                report.listed += len(ids)
+                report.duplicates += len(ids) - len(new)
+                if len(ids) < self.page_size:
+                    self.checkpoint.record_finished(source.name)
+            for product_id in new:
+                self._put(products, product_id)
+            if len(ids) < self.page_size:
+                return
+            page += 1
+
+    def _fetch_products(
+        self, products: "queue.Queue[int | None]", output: IO[bytes], report: CrawlReport
+    ) -> None:
+        """Fetch queued products and write them out until told to stop."""
+        while not self._stop.is_set():
+            try:
+                product_id = products.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if product_id is None:
+                return
+            try:
+                with self._requests:
+                    product = self.client.get_product(product_id, self.country)
+            except AlibabaAPIError as e:
+                if self.client.error_policies.for_error(e).error_class != "permanent":
+                    continue  # transient, rate limited or unauthorised: left pending
+                with self._lock:
+                    self.checkpoint.record_product(product_id, output.tell(), error_key(e))
+                    self._state.done.add(product_id)
+                    report.failed[error_key(e)] += 1
+                continue
+            except AlibabaError:
+                continue  # network trouble: left pending for the next run
+
+            line = json.dumps(_plain(product), separators=(",", ":")).encode() + b"\n"
+            with self._lock:
+                output.write(line)
+                output.flush()
+                self.checkpoint.record_product(product_id, output.tell())
+                self._state.done.add(product_id)
+                report.written += 1
+
+
+def _plain(product: Any) -> Any:
+    """A product as JSON-ready data, whatever the client's response mode."""
+    dump = getattr(product, "model_dump", None)
+    return dump(mode="json") if dump is not None else product
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run or resume a catalog crawl from the command line and print the report."""
+    import argparse
+
+    from alibaba_api.config import Config
+    from alibaba_api.standin import StandinServer
+
+    parser = argparse.ArgumentParser(description="Checkpointed, resumable catalog crawler")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="API base URL, e.g. http://127.0.0.1:8080/rest")
+    target.add_argument("--standin", action="store_true", help="start a local stand-in")
+    parser.add_argument("--checkpoint", required=True, help="checkpoint journal file")
+    parser.add_argument("--output", required=True, help="JSON Lines file of products")
+    parser.add_argument("--scene", action="append", dest="scenes", help="default: all scenes")
+    parser.add_argument(
+        "--local-country", action="append", dest="countries", help="default: US and MX"
+    )
+    parser.add_argument("--no-crossborder", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--country", default="US", help="country for get_product")
+    parser.add_argument("--fsync", action="store_true", help="fsync every checkpoint record")
+    parser.add_argument("--catalog-size", type=int, default=1000, help="with --standin")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    sources = default_sources(args.scenes or SCENE_IDS, args.countries or LOCAL_COUNTRIES)
+    if args.no_crossborder:
+        sources = [source for source in sources if source.kind != "crossborder"]
+
+    server = None
+    if args.standin:
+        standin = StandinServer(
+            "crawler_app_key", "crawler_app_secret", catalog_size=args.catalog_size
+        )
+        server = standin.serve(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        config = Config(
+            app_key="crawler_app_key",
+            app_secret="crawler_app_secret",
+            access_token="crawler_access_token",
+            base_url_override=f"http://127.0.0.1:{server.server_address[1]}/rest",
+            pool_connections=args.concurrency,
+        )
+    else:
+        config = dataclasses.replace(
+            Config.from_env(base_url_override=args.base_url), pool_connections=args.concurrency
+        )
+
+    try:
+        with AlibabaClient(config) as client:
+            report = CatalogCrawler(
+                client,
+                args.checkpoint,
+                args.output,
+                sources=sources,
+                concurrency=args.concurrency,
+                page_size=args.page_size,
+                country=args.country,
+                fsync=args.fsync,
+            ).run()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    print(json.dumps(report.summary(), indent=2) if args.json else report.format())
+
+
+if __name__ == "__main__":
+    main()
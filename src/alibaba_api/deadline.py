@@ -0,0 +1,63 @@
+"""
+Time budgets for calls made of several requests.
+
+``Config.timeout`` bounds one HTTP request, and ``Config.endpoint_timeouts``
+overrides it per API path. A ``Deadline`` bounds a whole call: ``request``,
+``get`` and ``post`` and the composite methods ``calculate_freight`` and
+``search_products`` accept ``deadline=`` in seconds.
+
+Every request made under a deadline, retries included, is capped at the
+time remaining. Once it runs out, ``AlibabaClient.request`` raises
+``AlibabaDeadlineError`` without sending. ``calculate_freight`` gives each
+dispatch location it may try an equal share of what is left, so a slow
+first location cannot use up the budget of the fallbacks; time a location
+does not use stays in the budget for the rest. ``search_products`` returns
+the products loaded so far, flagged ``deadline_exceeded``.
+
+Example:
+    config = Config(app_key="...", app_secret="...", endpoint_timeouts={
+        "/shipping/freight/calculate": 5.0,
+        "/buynow/order/create": 60.0,
+    })
+    client = AlibabaClient(config)
+    quote = client.calculate_freight("1600124642247", 10, "US", deadline=3.0)
+"""
+
+import time
+
+
+class Deadline:
+    """
+    A point in monotonic time by which a call must finish.
+
+    Args:
+        seconds: Budget from now
+    """
+
+    __slots__ = ("budget", "expires_at")
+
+    def __init__(self, seconds: float) -> None:
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def coerce(cls, deadline: "Deadline | float | None") -> "Deadline | None":
+        """Accept a ``Deadline``, a budget in seconds, or None for no deadline."""
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def share(self, parts: int) -> float:
+        """Even share of the remaining time for the next of ``parts`` sub-requests."""
+        return self.remaining() / max(parts, 1)
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget}, remaining={self.remaining():.3f})"
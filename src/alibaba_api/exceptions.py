@@ -2,7 +2,15 @@
 
 
 class AlibabaError(Exception):
-    """Base exception for all Alibaba API errors."""
+    """
+    Base exception for all Alibaba API errors.
+
+    ``error_class`` is set by ``AlibabaClient`` from its error policies
+    ("retryable", "permanent", "fallback_dispatch", "auth" or "quota"; see
+    ``alibaba_api.policy``) and is None on errors raised elsewhere.
+    """
+
+    error_class: str | None = None
 
     def __init__(
         self,
@@ -61,3 +69,7 @@ class AlibabaNetworkError(AlibabaError):
     ) -> None:
         self.status_code = status_code
         super().__init__(message, request_id=request_id)
+
+
+class AlibabaDeadlineError(AlibabaNetworkError):
+    """Exception raised when a call's deadline runs out (see ``alibaba_api.deadline``)."""
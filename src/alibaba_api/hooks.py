@@ -0,0 +1,119 @@
+"""
+Request lifecycle hooks for AlibabaClient.
+
+Hooks are plain callables registered for a phase of ``AlibabaClient.request``:
+
+- ``before_sign``: business params are known; hooks may add or change params
+- ``before_send``: the request is signed; ``timings.sign`` is set
+- ``after_response``: the response parsed successfully
+- ``on_error``: the call raised an ``AlibabaError``
+
+Every hook receives the same ``RequestEvent`` for a given attempt, updated as
+the request progresses. When no hooks are registered the client skips all
+event bookkeeping.
+
+Example:
+    def log_slow(event: RequestEvent) -> None:
+        if event.timings.total > 1.0:
+            print(event.api_path, event.request_id, event.timings)
+
+    client.add_hook("after_response", log_slow)
+"""
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+HookPhase = Literal["before_sign", "before_send", "after_response", "on_error"]
+
+HOOK_PHASES: tuple[HookPhase, ...] = ("before_sign", "before_send", "after_response", "on_error")
+
+
+@dataclass
+class RequestTimings:
+    """Time spent in each phase of a request, in seconds."""
+
+    sign: float = 0.0
+    network: float = 0.0
+    parse: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.sign + self.network + self.parse
+
+
+@dataclass
+class RequestEvent:
+    """State of one request attempt, passed to every hook."""
+
+    phase: HookPhase
+    api_path: str
+    method: str
+    params: dict[str, str]
+    attempt: int = 1
+    timings: RequestTimings = field(default_factory=RequestTimings)
+    status_code: int | None = None
+    # Body bytes after decompression, and as received before it
+    response_size: int | None = None
+    wire_size: int | None = None
+    request_id: str | None = None
+    error: Exception | None = None
+    error_code: str | None = None
+    error_sub_code: str | None = None
+    # Values recorded by middleware on the ``Call`` (see alibaba_api.middleware)
+    annotations: dict[str, Any] = field(default_factory=dict)
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+class RequestHooks:
+    """
+    Registry of hooks by phase.
+
+    The registry is falsy while empty, which lets the client take its
+    uninstrumented path with a single truth test. Hooks are kept in tuples
+    that are replaced, never changed, under a lock, so ``emit`` reads them
+    without one and hooks may be added or removed while requests run.
+    """
+
+    def __init__(self) -> None:
+        self._hooks: dict[HookPhase, tuple[Hook, ...]] = dict.fromkeys(HOOK_PHASES, ())
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def add(self, phase: HookPhase, hook: Hook) -> Hook:
+        """
+        Register ``hook`` for ``phase``.
+
+        Returns:
+            The hook, unchanged
+
+        Raises:
+            ValueError: If ``phase`` is not a known hook phase
+        """
+        if phase not in self._hooks:
+            raise ValueError(f"Unknown hook phase: {phase}. Expected one of {HOOK_PHASES}")
+        with self._lock:
+            self._hooks[phase] = (*self._hooks[phase], hook)
+            self._count += 1
+        return hook
+
+    def remove(self, phase: HookPhase, hook: Hook) -> None:
+        """Unregister a hook. Unknown hooks are ignored."""
+        with self._lock:
+            hooks = self._hooks.get(phase, ())
+            if hook in hooks:
+                index = hooks.index(hook)
+                self._hooks[phase] = hooks[:index] + hooks[index + 1 :]
+                self._count -= 1
+
+    def emit(self, phase: HookPhase, event: RequestEvent) -> None:
+        """Run every hook registered for ``phase`` with ``event``."""
+        event.phase = phase
+        for hook in self._hooks[phase]:
+            hook(event)
@@ -0,0 +1,325 @@
+"""
+Compact sets of product IDs and a scene membership index.
+
+``/eco/buyer/product/check`` and the other listings return product IDs as
+lists of ints or numeric strings. Held as ``set[str]``, each ID costs a
+string object plus a hash-table slot, about 100 bytes; at millions of IDs
+per scene that dominates a crawler's memory. ``ProductIdSet`` keeps them in
+a sorted ``array('Q')`` instead, 8 bytes each, with membership by binary
+search and union, intersection and difference by merging, so the IDs of
+two crawl runs can be compared without expanding either into a set.
+
+``SceneIndex`` maps each scene (or any other listing name) to its
+``ProductIdSet`` and answers the reverse question, which scenes list a
+product. Both save to a small binary file that loads back with one read.
+
+Example:
+    index = SceneIndex()
+    for scene_id in scene_ids:
+        index[scene_id] = crawl_listing(client, scene_id)
+    index.save("scenes.idx")
+
+    previous = SceneIndex.load("scenes-yesterday.idx")
+    added = index.ids() - previous.ids()
+    index.scenes_of(product_id)
+"""
+
+import bisect
+import io
+import operator
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import groupby, islice
+from os import PathLike
+from typing import BinaryIO
+
+ProductId = int | str
+
+_MAX_ID = 2**64 - 1
+# Past every ID: ends a merge when an array runs out
+_END = _MAX_ID + 1
+_SET_MAGIC = b"PIDSET1\n"
+_INDEX_MAGIC = b"SCNIDX1\n"
+_COUNT = struct.Struct("<Q")
+_NAME = struct.Struct("<H")
+
+
+def _to_int(product_id: object) -> int:
+    """Return ``product_id`` as an int, raising ValueError if it can't be one."""
+    if isinstance(product_id, bool) or not isinstance(product_id, int | str):
+        raise ValueError(f"Product ID must be an int or a numeric string, not {product_id!r}")
+    value = int(product_id)
+    if not 0 <= value <= _MAX_ID:
+        raise ValueError(f"Product ID out of range: {product_id!r}")
+    return value
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated ID file")
+    return data
+
+
+class ProductIdSet:
+    """
+    An immutable, sorted set of product IDs stored as unsigned 64-bit ints.
+
+    Accepts ints and numeric strings alike; IDs always come back as ints.
+    Membership is a binary search, and the set operations merge the two
+    sorted arrays in one pass without building intermediate Python sets.
+    """
+
+    __slots__ = ("_ids",)
+
+    _ids: "array[int]"
+
+    def __init__(self, ids: Iterable[ProductId] = ()) -> None:
+        if isinstance(ids, ProductIdSet):
+            self._ids = ids._ids
+            return
+        # A sorted list of ints peaks at about half the memory of a set of them
+        values = sorted(map(_to_int, ids))
+        if any(map(operator.eq, values, islice(values, 1, None))):
+            values = [value for value, _ in groupby(values)]
+        self._ids = array("Q", values)
+
+    @classmethod
+    def _wrap(cls, ids: "array[int]") -> "ProductIdSet":
+        """Build a set from an array already sorted and free of duplicates."""
+        result = cls.__new__(cls)
+        result._ids = ids
+        return result
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __contains__(self, product_id: object) -> bool:
+        if type(product_id) is int:
+            value = product_id
+        else:
+            try:
+                value = _to_int(product_id)
+            except ValueError:
+                return False
+        ids = self._ids
+        position = bisect.bisect_left(ids, value)
+        return position < len(ids) and ids[position] == value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ProductIdSet):
+            return NotImplemented
+        return self._ids == other._ids
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ProductIdSet(<{len(self)} ids>)"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the ID array."""
+        return len(self._ids) * self._ids.itemsize
+
+    def union(self, other: Iterable[ProductId]) -> "ProductIdSet":
+        """Return the IDs in either set."""
+        a, b = self._ids, ProductIdSet(other)._ids
+        if not b:
+            return self._wrap(a)
+        if not a:
+            return self._wrap(b)
+        merged = array("Q")
+        append = merged.append
+        iter_a, iter_b = iter(a), iter(b)
+        x, y = next(iter_a, _END), next(iter_b, _END)
+        while True:
+            if x < y:
+                append(x)
+                x = next(iter_a, _END)
+            elif y < x:
+                append(y)
+                y = next(iter_b, _END)
+            elif x != _END:
+                append(x)
+                x, y = next(iter_a, _END), next(iter_b, _END)
+            else:
+                return self._wrap(merged)
+
+    def intersection(self, other: Iterable[ProductId]) -> "ProductIdSet":
+        """Return the IDs in both sets."""
+        return self._wrap(self._select(ProductIdSet(other)._ids, keep=True))
+
+    def difference(self, other: Iterable[ProductId]) -> "ProductIdSet":
+        """Return the IDs in this set but not in ``other``."""
+        return self._wrap(self._select(ProductIdSet(other)._ids, keep=False))
+
+    def _select(self, other: "array[int]", *, keep: bool) -> "array[int]":
+        """IDs of this set that are (``keep``) or aren't in the sorted array ``other``."""
+        ids = self._ids
+        if not other or not ids:
+            return ids if not keep else array("Q")
+        selected = array("Q")
+        append = selected.append
+        iter_other = iter(other)
+        y = next(iter_other, _END)
+        for x in ids:
+            while y < x:
+                y = next(iter_other, _END)
+            if (y == x) is keep:
+                append(x)
+        return selected
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def to_bytes(self) -> bytes:
+        """Serialise the set: a header, the count, then the IDs little-endian."""
+        with io.BytesIO() as file:
+            file.write(_SET_MAGIC)
+            self._write(file)
+            return file.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ProductIdSet":
+        """Load a set written by ``to_bytes``; raises ValueError if ``data`` isn't one."""
+        with io.BytesIO(data) as file:
+            result = cls._read(file)
+            if file.read(1):
+                raise ValueError("Trailing data after ID set")
+        return result
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the set to ``path``."""
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "ProductIdSet":
+        """Read a set written by ``save``."""
+        with open(path, "rb") as file:
+            result = cls._read(file)
+            if file.read(1):
+                raise ValueError("Trailing data after ID set")
+        return result
+
+    def _write(self, file: BinaryIO) -> None:
+        ids = self._ids
+        if sys.byteorder == "big":
+            ids = array("Q", ids)
+            ids.byteswap()
+        file.write(_COUNT.pack(len(ids)))
+        ids.tofile(file)
+
+    @classmethod
+    def _read(cls, file: BinaryIO, *, magic: bool = True) -> "ProductIdSet":
+        if magic and file.read(len(_SET_MAGIC)) != _SET_MAGIC:
+            raise ValueError("Not a product ID set")
+        (count,) = _COUNT.unpack(_read_exact(file, _COUNT.size))
+        ids = array("Q")
+        try:
+            ids.fromfile(file, count)
+        except (EOFError, ValueError):
+            # EOFError on missing items, ValueError on a partial last one
+            raise ValueError("Truncated ID file") from None
+        if sys.byteorder == "big":
+            ids.byteswap()
+        return cls._wrap(ids)
+
+
+class SceneIndex:
+    """
+    Product IDs listed by each scene, with lookups in both directions.
+
+    ``index[scene]`` is the scene's ``ProductIdSet``; ``scenes_of(pid)``
+    lists the scenes containing a product, one binary search per scene.
+    Assigning a scene replaces its IDs, ``add`` merges more into them.
+    """
+
+    __slots__ = ("_scenes",)
+
+    def __init__(self, scenes: Mapping[str, Iterable[ProductId]] | None = None) -> None:
+        self._scenes: dict[str, ProductIdSet] = {}
+        for scene, ids in (scenes or {}).items():
+            self[scene] = ids
+
+    def __len__(self) -> int:
+        return len(self._scenes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._scenes)
+
+    def __contains__(self, scene: object) -> bool:
+        return scene in self._scenes
+
+    def __getitem__(self, scene: str) -> ProductIdSet:
+        return self._scenes[scene]
+
+    def __setitem__(self, scene: str, ids: Iterable[ProductId]) -> None:
+        if len(scene.encode()) > 0xFFFF:
+            raise ValueError("Scene name too long")
+        self._scenes[scene] = ProductIdSet(ids)
+
+    def __delitem__(self, scene: str) -> None:
+        del self._scenes[scene]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SceneIndex):
+            return NotImplemented
+        return self._scenes == other._scenes
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SceneIndex(<{len(self)} scenes>)"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the scenes' ID arrays."""
+        return sum(ids.nbytes for ids in self._scenes.values())
+
+    def add(self, scene: str, ids: Iterable[ProductId]) -> None:
+        """Merge ``ids`` into ``scene``, creating it if needed."""
+        current = self._scenes.get(scene)
+        self[scene] = ids if current is None else current | ids
+
+    def scenes_of(self, product_id: ProductId) -> list[str]:
+        """Return the scenes listing ``product_id``, in insertion order."""
+        return [scene for scene, ids in self._scenes.items() if product_id in ids]
+
+    def ids(self) -> ProductIdSet:
+        """Return the IDs listed by any scene."""
+        result = ProductIdSet()
+        for ids in self._scenes.values():
+            result |= ids
+        return result
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Write the index to ``path``."""
+        with open(path, "wb") as file:
+            file.write(_INDEX_MAGIC + _COUNT.pack(len(self._scenes)))
+            for scene, ids in self._scenes.items():
+                name = scene.encode()
+                file.write(_NAME.pack(len(name)) + name)
+                ids._write(file)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "SceneIndex":
+        """Read an index written by ``save``; raises ValueError if the file isn't one."""
+        index = cls()
+        with open(path, "rb") as file:
+            if file.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                raise ValueError("Not a scene index")
+            (count,) = _COUNT.unpack(_read_exact(file, _COUNT.size))
+            for _ in range(count):
+                (length,) = _NAME.unpack(_read_exact(file, _NAME.size))
+                scene = _read_exact(file, length).decode()
+                index._scenes[scene] = ProductIdSet._read(file, magic=False)
+            if file.read(1):
+                raise ValueError("Trailing data after scene index")
+        return index
@@ -0,0 +1,541 @@
+"""
+Closed-loop load generator for the checkout flow.
+
+Each virtual user runs the flow ``get_product`` → ``calculate_freight`` →
+``create_order`` → ``pay_orders`` back to back, starting the next flow as
+soon as the last one ends (optionally after a think time), until the run's
+duration or flow budget is used up. Users are threads sharing one
+``AlibabaClient`` (``mode="sync"``) or tasks sharing one
+``AsyncAlibabaClient`` on an event loop (``mode="async"``). Raising the user
+count until throughput stops growing shows where a worker saturates.
+
+The report gives completed flows per second, latency percentiles per step,
+errors per step by code, and pool-wait time: how long requests waited for a
+free connection in httpx's pool before being sent. Pool wait is measured
+with httpcore's trace events, so it is only reported for network
+transports, not in-process ones such as ``StandinServer.transport()``.
+
+A step that raises ``AlibabaError`` ends its flow, which counts as failed.
+
+Example:
+    from alibaba_api.loadgen import LoadGenerator
+    from alibaba_api.standin import StandinServer
+
+    server = StandinServer("test", "secret", catalog_size=1000).serve(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = Config(app_key="test", app_secret="secret", access_token="token",
+                    base_url_override=f"http://127.0.0.1:{server.server_address[1]}/rest")
+    report = LoadGenerator(config, product_ids, users=16, duration=30).run()
+    print(report.format())
+
+Or from the command line, against a stand-in it starts itself or any base URL:
+
+    python -m alibaba_api.loadgen --standin --users 16 --duration 30
+    python -m alibaba_api.loadgen --base-url http://host/rest --product-id 1600... \\
+        --users 8 --mode async
+"""
+
+import asyncio
+import dataclasses
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import httpx
+
+from alibaba_api.async_client import AsyncAlibabaClient
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaError
+from alibaba_api.policy import error_key
+
+LoadMode = Literal["sync", "async"]
+
+STEPS = ("get_product", "calculate_freight", "create_order", "pay_orders")
+
+# Shipping address used for every order placed by the load generator
+ADDRESS = {
+    "address": "1 Load Test Way",
+    "city": "New York",
+    "province": "New York",
+    "country": "United States",
+    "country_code": "US",
+    "zip": "10012",
+    "contact_person": "Load Generator",
+    "telephone": {"country": "+1", "number": "5555550100"},
+}
+
+# Errors that fail one flow: API errors, and products or freight quotes
+# without the SKUs, ladder prices or fields an order needs
+_FLOW_ERRORS = (AlibabaError, KeyError, IndexError)
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of sorted ``ordered``; 0 when empty."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))]
+
+
+@dataclass(slots=True)
+class _Samples:
+    """What one virtual user observed; merged into the report at the end."""
+
+    completed: int = 0
+    failed: int = 0
+    latencies: dict[str, list[float]] = field(default_factory=lambda: {s: [] for s in STEPS})
+    errors: dict[str, Counter[str]] = field(default_factory=lambda: {s: Counter() for s in STEPS})
+
+
+@dataclass(slots=True)
+class LoadReport:
+    """
+    Result of a load run.
+
+    ``latencies`` holds every successful step's latency in seconds, and
+    ``errors`` the error counts per step by ``error_key``. ``pool_waits``
+    holds one sample per request sent over a pooled connection.
+    """
+
+    mode: LoadMode
+    users: int
+    elapsed: float
+    completed: int = 0
+    failed: int = 0
+    latencies: dict[str, list[float]] = field(default_factory=lambda: {s: [] for s in STEPS})
+    errors: dict[str, Counter[str]] = field(default_factory=lambda: {s: Counter() for s in STEPS})
+    pool_waits: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Completed flows per second."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def percentiles(self, step: str) -> dict[str, float]:
+        """p50/p95/p99/max latency of ``step`` in seconds."""
+        return _summarise(self.latencies[step])
+
+    def pool_wait(self) -> dict[str, float] | None:
+        """p50/p95/p99/max pool wait in seconds, or None if it was not measured."""
+        return _summarise(self.pool_waits) if self.pool_waits else None
+
+    def summary(self) -> dict[str, Any]:
+        """
+        The report as plain data, e.g. for JSON output.
+
+        Returns:
+            Dict with mode, users, elapsed, completed and failed flows,
+            throughput, per-step counts, percentiles and errors, and pool_wait
+        """
+        return {
+            "mode": self.mode,
+            "users": self.users,
+            "elapsed": self.elapsed,
+            "completed": self.completed,
+            "failed": self.failed,
+            "throughput": self.throughput,
+            "steps": {
+                step: {
+                    "count": len(self.latencies[step]),
+                    **self.percentiles(step),
+                    "errors": dict(self.errors[step]),
+                }
+                for step in STEPS
+            },
+            "pool_wait": self.pool_wait(),
+        }
+
+    def format(self) -> str:
+        """Human-readable table of the report."""
+        lines = [
+            f"{self.users} {self.mode} users, {self.elapsed:.1f}s: "
+            f"{self.completed} flows completed, {self.failed} failed, "
+            f"{self.throughput:.1f} flows/s",
+            "",
+            f"{'step':<20} {'ok':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+            "  errors",
+        ]
+        for step in STEPS:
+            stats = self.percentiles(step)
+            errors = ", ".join(f"{code}: {n}" for code, n in self.errors[step].most_common())
+            lines.append(
+                f"{step:<20} {len(self.latencies[step]):>7} {stats['p50'] * 1e3:>9.1f} "
+                f"{stats['p95'] * 1e3:>9.1f} {stats['p99'] * 1e3:>9.1f} "
+                f"{stats['max'] * 1e3:>9.1f}  {errors or '-'}"
+            )
+        wait = self.pool_wait()
+        if wait is not None:
+            lines.append(
+                f"{'pool wait':<20} {len(self.pool_waits):>7} {wait['p50'] * 1e3:>9.1f} "
+                f"{wait['p95'] * 1e3:>9.1f} {wait['p99'] * 1e3:>9.1f} {wait['max'] * 1e3:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def _merge(self, samples: _Samples) -> None:
+        self.completed += samples.completed
+        self.failed += samples.failed
+        for step in STEPS:
+            self.latencies[step].extend(samples.latencies[step])
+            self.errors[step].update(samples.errors[step])
+
+
+def _summarise(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "p50": _percentile(ordered, 0.50),
+        "p95": _percentile(ordered, 0.95),
+        "p99": _percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
+class _PoolTimer(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Wraps a transport to time how long each request waits for a connection."""
+
+    def __init__(self, inner: Any, waits: list[float]) -> None:
+        self._inner = inner
+        self._waits = waits
+
+    def _traced(self, request: httpx.Request, started: float, *, is_async: bool) -> None:
+        # httpcore's first trace event for a request marks the end of its pool wait
+        seen = False
+
+        def mark() -> None:
+            nonlocal seen
+            if not seen:
+                seen = True
+                self._waits.append(time.perf_counter() - started)
+
+        if is_async:
+
+            async def trace(name: str, info: dict[str, Any]) -> None:
+                mark()
+
+            request.extensions = {**request.extensions, "trace": trace}
+        else:
+            request.extensions = {**request.extensions, "trace": lambda name, info: mark()}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._traced(request, time.perf_counter(), is_async=False)
+        response: httpx.Response = self._inner.handle_request(request)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._traced(request, time.perf_counter(), is_async=True)
+        response: httpx.Response = await self._inner.handle_async_request(request)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class LoadGenerator:
+    """
+    Runs checkout flows from N closed-loop virtual users.
+
+    Args:
+        config: Credentials and base URL of the API (or stand-in) under load.
+            Responses are read as dicts whatever ``config.response_mode`` says
+        product_ids: Products to order; each flow picks one at random
+        users: Number of virtual users
+        mode: "sync" for threads sharing an ``AlibabaClient``, "async" for
+            tasks sharing an ``AsyncAlibabaClient``
+        duration: Seconds to run for
+        max_flows: Stop after this many flows in total, if sooner
+        think_time: Seconds each user pauses between flows
+        destination_country: Where orders ship to
+        connections: Size of httpx's connection pool. Default: httpx's own.
+            In sync mode keep it at least ``users``: httpcore 1.0 can fail
+            requests on a pool shared by more threads than it has connections
+        transport: Transport to use instead of a network one; an
+            ``httpx.BaseTransport`` for sync mode, an async one for async mode
+        seed: Seed for product choice, for repeatable runs
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        product_ids: Sequence[str | int],
+        *,
+        users: int = 8,
+        mode: LoadMode = "sync",
+        duration: float = 10.0,
+        max_flows: int | None = None,
+        think_time: float = 0.0,
+        destination_country: str = "US",
+        connections: int | None = None,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        seed: int | None = None,
+    ) -> None:
+        if not product_ids:
+            raise ValueError("product_ids must not be empty")
+        if mode not in ("sync", "async"):
+            raise ValueError(f"mode must be 'sync' or 'async', got: {mode}")
+        self.config = dataclasses.replace(config, response_mode="dict")
+        self.product_ids = [str(product_id) for product_id in product_ids]
+        self.users = users
+        self.mode = mode
+        self.duration = duration
+        self.max_flows = max_flows
+        self.think_time = think_time
+        self.destination_country = destination_country
+        self.connections = connections
+        self.transport = transport
+        self.seed = seed
+        self._flow_numbers = itertools.count()
+        self._lock = threading.Lock()
+
+    def run(self) -> LoadReport:
+        """Run the load and return its report."""
+        self._flow_numbers = itertools.count()
+        if self.mode == "async":
+            return asyncio.run(self._run_async())
+        return self._run_sync()
+
+    def _limits(self) -> httpx.Limits:
+        if self.connections is None:
+            return httpx.Limits()
+        return httpx.Limits(
+            max_connections=self.connections, max_keepalive_connections=self.connections
+        )
+
+    def _next_flow(self, stop_at: float) -> int | None:
+        """Number of the next flow to start, or None when the run is over."""
+        if time.monotonic() >= stop_at:
+            return None
+        with self._lock:
+            number = next(self._flow_numbers)
+        if self.max_flows is not None and number >= self.max_flows:
+            return None
+        return number
+
+    # ------------------------------------------------------------------
+    # Sync users
+    # ------------------------------------------------------------------
+
+    def _run_sync(self) -> LoadReport:
+        waits: list[float] = []
+        inner = self.transport or httpx.HTTPTransport(limits=self._limits())
+        client = AlibabaClient(self.config, transport=_PoolTimer(inner, waits))
+        samples = [_Samples() for _ in range(self.users)]
+        started = time.monotonic()
+        stop_at = started + self.duration
+        threads = [
+            threading.Thread(target=self._sync_user, args=(client, user, samples[user], stop_at))
+            for user in range(self.users)
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            client.close()
+        return self._report(samples, time.monotonic() - started, waits)
+
+    def _sync_user(
+        self, client: AlibabaClient, user: int, samples: _Samples, stop_at: float
+    ) -> None:
+        rng = random.Random(None if self.seed is None else self.seed + user)
+        while (number := self._next_flow(stop_at)) is not None:
+            self._sync_flow(client, rng.choice(self.product_ids), number, samples)
+            if self.think_time:
+                time.sleep(self.think_time)
+
+    def _sync_flow(
+        self, client: AlibabaClient, product_id: str, number: int, samples: _Samples
+    ) -> None:
+        clock = time.perf_counter
+        step = "get_product"
+        try:
+            started = clock()
+            product = client.get_product(product_id, self.destination_country)
+            samples.latencies[step].append(clock() - started)
+            item = _order_item(product)
+
+            step = "calculate_freight"
+            started = clock()
+            freight = client.calculate_freight(
+                product_id, int(item["quantity"]), self.destination_country
+            )
+            samples.latencies[step].append(clock() - started)
+
+            step = "create_order"
+            started = clock()
+            order = client.create_order(
+                f"LOAD-{number:08d}",
+                [item],
+                _logistics(freight["dispatch_location"], freight["options"]),
+            )
+            samples.latencies[step].append(clock() - started)
+
+            step = "pay_orders"
+            started = clock()
+            client.pay_orders([order["trade_id"]])
+            samples.latencies[step].append(clock() - started)
+        except _FLOW_ERRORS as e:
+            samples.errors[step][error_key(e)] += 1
+            samples.failed += 1
+            return
+        samples.completed += 1
+
+    # ------------------------------------------------------------------
+    # Async users
+    # ------------------------------------------------------------------
+
+    async def _run_async(self) -> LoadReport:
+        waits: list[float] = []
+        inner = self.transport or httpx.AsyncHTTPTransport(limits=self._limits())
+        samples = [_Samples() for _ in range(self.users)]
+        async with AsyncAlibabaClient(self.config, transport=_PoolTimer(inner, waits)) as client:
+            started = time.monotonic()
+            stop_at = started + self.duration
+            await asyncio.gather(
+                *(
+                    self._async_user(client, user, samples[user], stop_at)
+                    for user in range(self.users)
+                )
+            )
+            elapsed = time.monotonic() - started
+        return self._report(samples, elapsed, waits)
+
+    async def _async_user(
+        self, client: AsyncAlibabaClient, user: int, samples: _Samples, stop_at: float
+    ) -> None:
+        rng = random.Random(None if self.seed is None else self.seed + user)
+        while (number := self._next_flow(stop_at)) is not None:
+            await self._async_flow(client, rng.choice(self.product_ids), number, samples)
+            # Yield even with no think time so one user cannot starve the others
+            await asyncio.sleep(self.think_time)
+
+    async def _async_flow(
+        self, client: AsyncAlibabaClient, product_id: str, number: int, samples: _Samples
+    ) -> None:
+        clock = time.perf_counter
+        step = "get_product"
+        try:
+            started = clock()
+            product = await client.get_product(product_id, self.destination_country)
+            samples.latencies[step].append(clock() - started)
+            item = _order_item(product)
+
+            step = "calculate_freight"
+            started = clock()
+            freight = await client.calculate_freight(
+                product_id, int(item["quantity"]), self.destination_country
+            )
+            samples.latencies[step].append(clock() - started)
+
+            step = "create_order"
+            started = clock()
+            order = await client.create_order(
+                f"LOAD-{number:08d}",
+                [item],
+                _logistics(freight["dispatch_location"], freight["options"]),
+            )
+            samples.latencies[step].append(clock() - started)
+
+            step = "pay_orders"
+            started = clock()
+            await client.pay_orders([order["trade_id"]])
+            samples.latencies[step].append(clock() - started)
+        except _FLOW_ERRORS as e:
+            samples.errors[step][error_key(e)] += 1
+            samples.failed += 1
+            return
+        samples.completed += 1
+
+    def _report(self, samples: list[_Samples], elapsed: float, waits: list[float]) -> LoadReport:
+        report = LoadReport(self.mode, self.users, elapsed, pool_waits=waits)
+        for user_samples in samples:
+            report._merge(user_samples)
+        return report
+
+
+def _order_item(product: Any) -> dict[str, Any]:
+    """Order line for the first SKU of a product dict at its minimum quantity."""
+    sku = product["skus"][0]
+    return {
+        "product_id": str(product["product_id"]),
+        "sku_id": str(sku["sku_id"]),
+        "quantity": str(sku["ladder_price"][0]["min_quantity"]),
+    }
+
+
+def _logistics(location: str, options: list[dict[str, Any]]) -> dict[str, Any]:
+    logistics: dict[str, Any] = {"shipment_address": ADDRESS, "dispatch_location": location}
+    if options:
+        logistics["carrier_code"] = options[0]["vendor_code"]
+    return logistics
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run a load test from the command line and print the report."""
+    import argparse
+
+    from alibaba_api.standin import StandinServer
+
+    parser = argparse.ArgumentParser(description="Closed-loop checkout load generator")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="API base URL, e.g. http://127.0.0.1:8080/rest")
+    target.add_argument("--standin", action="store_true", help="start a local stand-in")
+    parser.add_argument("--product-id", action="append", default=[], dest="product_ids")
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--max-flows", type=int)
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds")
+    parser.add_argument("--connections", type=int, help="connection pool size")
+    parser.add_argument("--catalog-size", type=int, default=1000, help="with --standin")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.standin:
+        standin = StandinServer(
+            "loadgen_app_key", "loadgen_app_secret", catalog_size=args.catalog_size
+        )
+        server = standin.serve(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        config = Config(
+            app_key="loadgen_app_key",
+            app_secret="loadgen_app_secret",
+            access_token="loadgen_access_token",
+            base_url_override=f"http://127.0.0.1:{server.server_address[1]}/rest",
+        )
+        product_ids: list[str | int] = [*args.product_ids] or [*standin.product_ids()]
+    else:
+        config = Config.from_env(base_url_override=args.base_url)
+        product_ids = args.product_ids
+        if not product_ids:
+            parser.error("--product-id is required with --base-url")
+
+    try:
+        report = LoadGenerator(
+            config,
+            product_ids,
+            users=args.users,
+            mode=args.mode,
+            duration=args.duration,
+            max_flows=args.max_flows,
+            think_time=args.think_time,
+            connections=args.connections,
+        ).run()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    print(json.dumps(report.summary(), indent=2) if args.json else report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+Per-endpoint request metrics with Prometheus text exposition.
+
+``MetricsRegistry`` keeps, for each API path:
+- request counts by HTTP status
+- ``AlibabaAPIError`` counts by code and sub_code
+- cache hits and retries
+- response bytes as received and after decompression
+- a fixed-bucket latency histogram, plus total seconds spent signing,
+  on the network and parsing
+
+Memory is bounded: histograms have fixed buckets, and the number of tracked
+endpoints and error codes is capped, with overflow folded into ``"other"``.
+
+Example:
+    metrics = MetricsRegistry()
+    client = AlibabaClient(config, metrics=metrics)
+    ...
+    print(metrics.render_prometheus())
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from alibaba_api.hooks import RequestEvent
+
+if TYPE_CHECKING:
+    from alibaba_api.client import _BaseClient
+
+# Upper bounds in seconds, spanning in-process calls to slow cross-region requests.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+OVERFLOW_LABEL = "other"
+NO_STATUS = "none"
+
+
+class LatencyHistogram:
+    """Cumulative-style histogram over fixed upper bounds."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """``(le, count)`` pairs as exposed by Prometheus, ending with ``+Inf``."""
+        pairs = []
+        running = 0
+        for bound, count in zip((*self.bounds, None), self.counts, strict=True):
+            running += count
+            pairs.append(("+Inf" if bound is None else _format_float(bound), running))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by linear interpolation within its bucket.
+
+        Values in the ``+Inf`` bucket are reported as the largest finite bound.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        running = 0
+        lower = 0.0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            if count and running + count >= rank:
+                return lower + (bound - lower) * (rank - running) / count
+            running += count
+            lower = bound
+        return self.bounds[-1] if self.bounds else 0.0
+
+
+class EndpointMetrics:
+    """Counters and latency for a single API path."""
+
+    __slots__ = (
+        "statuses",
+        "errors",
+        "cache_hits",
+        "retries",
+        "latency",
+        "phases",
+        "wire_bytes",
+        "decoded_bytes",
+    )
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.statuses: dict[str, int] = {}
+        self.errors: dict[tuple[str, str], int] = {}
+        self.cache_hits = 0
+        self.retries = 0
+        self.latency = LatencyHistogram(bounds)
+        self.phases = {"sign": 0.0, "network": 0.0, "parse": 0.0}
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of per-endpoint request metrics.
+
+    Args:
+        buckets: Latency histogram upper bounds, in seconds
+        max_endpoints: Endpoints tracked individually before folding into "other"
+        max_error_codes: Error code/sub_code pairs tracked per endpoint
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        *,
+        max_endpoints: int = 128,
+        max_error_codes: int = 64,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.max_endpoints = max_endpoints
+        self.max_error_codes = max_error_codes
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, api_path: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(api_path)
+        if metrics is None:
+            if len(self._endpoints) >= self.max_endpoints:
+                api_path = OVERFLOW_LABEL
+                metrics = self._endpoints.get(api_path)
+            if metrics is None:
+                metrics = self._endpoints[api_path] = EndpointMetrics(self.buckets)
+        return metrics
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def observe(self, event: RequestEvent) -> None:
+        """Record a finished request attempt. Registered as an after_response/on_error hook."""
+        status = str(event.status_code) if event.status_code is not None else NO_STATUS
+        timings = event.timings
+        with self._lock:
+            metrics = self._endpoint(event.api_path)
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.latency.observe(timings.total)
+            phases = metrics.phases
+            phases["sign"] += timings.sign
+            phases["network"] += timings.network
+            phases["parse"] += timings.parse
+            if event.response_size is not None:
+                metrics.decoded_bytes += event.response_size
+                metrics.wire_bytes += (
+                    event.wire_size if event.wire_size is not None else event.response_size
+                )
+            if event.error_code is not None:
+                key = (event.error_code, event.error_sub_code or "")
+                if key not in metrics.errors and len(metrics.errors) >= self.max_error_codes:
+                    key = (OVERFLOW_LABEL, "")
+                metrics.errors[key] = metrics.errors.get(key, 0) + 1
+
+    def _before_send(self, event: RequestEvent) -> None:
+        if event.attempt > 1:
+            self.record_retry(event.api_path)
+
+    def record_retry(self, api_path: str) -> None:
+        """Count a retried request attempt."""
+        with self._lock:
+            self._endpoint(api_path).retries += 1
+
+    def record_cache_hit(self, api_path: str) -> None:
+        """Count a call answered from a cache without a request."""
+        with self._lock:
+            self._endpoint(api_path).cache_hits += 1
+
+    def install(self, client: "_BaseClient") -> None:
+        """Register this registry's hooks on ``client``."""
+        client.add_hook("before_send", self._before_send)
+        client.add_hook("after_response", self.observe)
+        client.add_hook("on_error", self.observe)
+
+    def uninstall(self, client: "_BaseClient") -> None:
+        """Remove this registry's hooks from ``client``."""
+        client.remove_hook("before_send", self._before_send)
+        client.remove_hook("after_response", self.observe)
+        client.remove_hook("on_error", self.observe)
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Point-in-time copy of all metrics, keyed by API path.
+
+        Returns:
+            Dict of endpoint -> {requests, statuses, errors, cache_hits, retries,
+            latency (count, sum, p50, p95, p99, buckets), phase_seconds,
+            bytes (wire, decoded)}
+        """
+        with self._lock:
+            return {
+                api_path: {
+                    "requests": sum(m.statuses.values()),
+                    "statuses": dict(m.statuses),
+                    "errors": {
+                        f"{code}:{sub_code}" if sub_code else code: count
+                        for (code, sub_code), count in m.errors.items()
+                    },
+                    "cache_hits": m.cache_hits,
+                    "retries": m.retries,
+                    "latency": {
+                        "count": m.latency.count,
+                        "sum": m.latency.sum,
+                        "p50": m.latency.quantile(0.50),
+                        "p95": m.latency.quantile(0.95),
+                        "p99": m.latency.quantile(0.99),
+                        "buckets": dict(m.latency.cumulative()),
+                    },
+                    "phase_seconds": dict(m.phases),
+                    "bytes": {"wire": m.wire_bytes, "decoded": m.decoded_bytes},
+                }
+                for api_path, m in self._endpoints.items()
+            }
+
+    def transfer(self) -> list[dict[str, Any]]:
+        """
+        Response bytes by endpoint, largest share of the wire traffic first.
+
+        Returns:
+            One dict per endpoint with ``endpoint``, ``wire_bytes``,
+            ``decoded_bytes``, ``ratio`` (wire / decoded) and ``share`` of all
+            wire bytes
+        """
+        with self._lock:
+            rows = [
+                (api_path, m.wire_bytes, m.decoded_bytes)
+                for api_path, m in self._endpoints.items()
+                if m.decoded_bytes
+            ]
+        total = sum(wire for _, wire, _ in rows)
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return [
+            {
+                "endpoint": api_path,
+                "wire_bytes": wire,
+                "decoded_bytes": decoded,
+                "ratio": wire / decoded,
+                "share": wire / total if total else 0.0,
+            }
+            for api_path, wire, decoded in rows
+        ]
+
+    def render_prometheus(self, prefix: str = "alibaba_api") -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines: list[str] = []
+
+            def family(name: str, kind: str, help_text: str) -> str:
+                full = f"{prefix}_{name}"
+                lines.append(f"# HELP {full} {help_text}")
+                lines.append(f"# TYPE {full} {kind}")
+                return full
+
+            name = family(
+                "requests_total", "counter", "Request attempts by endpoint and HTTP status."
+            )
+            for api_path, m in endpoints:
+                for status, count in sorted(m.statuses.items()):
+                    lines.append(f"{name}{_labels(endpoint=api_path, status=status)} {count}")
+
+            name = family("api_errors_total", "counter", "AlibabaAPIError responses by code.")
+            for api_path, m in endpoints:
+                for (code, sub_code), count in sorted(m.errors.items()):
+                    labels = _labels(endpoint=api_path, code=code, sub_code=sub_code)
+                    lines.append(f"{name}{labels} {count}")
+
+            name = family("cache_hits_total", "counter", "Calls answered from a cache.")
+            for api_path, m in endpoints:
+                lines.append(f"{name}{_labels(endpoint=api_path)} {m.cache_hits}")
+
+            name = family("retries_total", "counter", "Retried request attempts.")
+            for api_path, m in endpoints:
+                lines.append(f"{name}{_labels(endpoint=api_path)} {m.retries}")
+
+            name = family("request_duration_seconds", "histogram", "Request latency by endpoint.")
+            for api_path, m in endpoints:
+                for le, count in m.latency.cumulative():
+                    lines.append(f"{name}_bucket{_labels(endpoint=api_path, le=le)} {count}")
+                lines.append(
+                    f"{name}_sum{_labels(endpoint=api_path)} {_format_float(m.latency.sum)}"
+                )
+                lines.append(f"{name}_count{_labels(endpoint=api_path)} {m.latency.count}")
+
+            name = family(
+                "request_phase_seconds_total",
+                "counter",
+                "Seconds spent signing, on the network and parsing, by endpoint.",
+            )
+            for api_path, m in endpoints:
+                for phase, seconds in m.phases.items():
+                    labels = _labels(endpoint=api_path, phase=phase)
+                    lines.append(f"{name}{labels} {_format_float(seconds)}")
+
+            name = family(
+                "response_bytes_total",
+                "counter",
+                "Response body bytes by endpoint, as received (wire) and decompressed.",
+            )
+            for api_path, m in endpoints:
+                lines.append(f"{name}{_labels(endpoint=api_path, stage='wire')} {m.wire_bytes}")
+                lines.append(
+                    f"{name}{_labels(endpoint=api_path, stage='decoded')} {m.decoded_bytes}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    body = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
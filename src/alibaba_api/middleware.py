@@ -0,0 +1,133 @@
+"""
+Composable middleware around the signed-request step.
+
+A middleware is a callable ``(call, call_next) -> response``. It sees the
+request as a ``Call`` before it is signed and can:
+
+- short-circuit: return a response without calling ``call_next`` (a cache hit)
+- retry: call ``call_next(call)`` again; every call is signed afresh, so each
+  attempt gets a new timestamp and signature
+- annotate: change ``call.params``, record values in ``call.annotations``
+  (hooks see them on ``RequestEvent.annotations``) or edit the response
+
+Middleware run in the order they were added, the first outermost, around
+one attempt of ``AlibabaClient.request``: inside the policy-driven retries
+and deadline checks, outside signing, hooks and the HTTP round-trip.
+``AsyncAlibabaClient`` takes async middleware of the same shape, awaiting
+``call_next``. With no middleware installed the client takes its usual path
+after a single truth test.
+
+Example:
+    def tag_region(call: Call, call_next: Handler) -> dict[str, Any]:
+        call.annotations["region"] = "us-east"
+        return call_next(call)
+
+    def retry_busy(call: Call, call_next: Handler) -> dict[str, Any]:
+        try:
+            return call_next(call)
+        except AlibabaAPIError as e:
+            if e.code != "isp.busy":
+                raise
+            call.attempt += 1
+            return call_next(call)
+
+    client.add_middleware(tag_region)
+    client.add_middleware(retry_busy)
+"""
+
+import threading
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class Call:
+    """
+    One request attempt as it passes through the middleware stack.
+
+    ``attempt`` starts at the client's attempt number; middleware that retry
+    may raise it so hooks and metrics see the retry.
+    """
+
+    api_path: str
+    method: str
+    params: dict[str, str]
+    access_token: str | None = None
+    timeout: float | None = None
+    attempt: int = 1
+    annotations: dict[str, Any] = field(default_factory=dict)
+
+
+Handler = Callable[[Call], dict[str, Any]]
+Middleware = Callable[[Call, Handler], dict[str, Any]]
+AsyncHandler = Callable[[Call], Awaitable[dict[str, Any]]]
+AsyncMiddleware = Callable[[Call, AsyncHandler], Awaitable[dict[str, Any]]]
+
+
+def _bind(middleware: Any, call_next: Any) -> Any:
+    def handle(call: Call) -> Any:
+        return middleware(call, call_next)
+
+    return handle
+
+
+class MiddlewareStack:
+    """
+    Ordered middleware composed around a terminal handler.
+
+    The chain is rebuilt when middleware are added or removed, not per call,
+    under a lock; calls read the composed ``handler`` without one, so
+    middleware may be added or removed while requests run. The stack is
+    falsy while empty, which lets the client skip it with a single truth
+    test. Works the same for sync and async middleware: the composed handler
+    returns whatever the outermost middleware returns.
+
+    Args:
+        handler: Sends one signed request; the innermost step
+        middleware: Initial middleware, outermost first
+    """
+
+    def __init__(self, handler: Any, middleware: Iterable[Any] = ()) -> None:
+        self._terminal = handler
+        self._middleware: tuple[Any, ...] = tuple(middleware)
+        self._lock = threading.Lock()
+        self.handler = self._compose()
+
+    def __bool__(self) -> bool:
+        return bool(self._middleware)
+
+    def __len__(self) -> int:
+        return len(self._middleware)
+
+    def __iter__(self) -> Any:
+        return iter(self._middleware)
+
+    def add(self, middleware: Any, *, first: bool = False) -> Any:
+        """
+        Add ``middleware`` innermost, or outermost with ``first=True``.
+
+        Returns:
+            The middleware, so it can be passed to ``remove`` later
+        """
+        with self._lock:
+            if first:
+                self._middleware = (middleware, *self._middleware)
+            else:
+                self._middleware = (*self._middleware, middleware)
+            self.handler = self._compose()
+        return middleware
+
+    def remove(self, middleware: Any) -> None:
+        """Remove ``middleware``. Unknown middleware are ignored."""
+        with self._lock:
+            if middleware in self._middleware:
+                index = self._middleware.index(middleware)
+                self._middleware = self._middleware[:index] + self._middleware[index + 1 :]
+                self.handler = self._compose()
+
+    def _compose(self) -> Any:
+        handler = self._terminal
+        for middleware in reversed(self._middleware):
+            handler = _bind(middleware, handler)
+        return handler
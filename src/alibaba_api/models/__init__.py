@@ -2,51 +2,136 @@
 Pydantic models for API response validation.
 
 All models use field aliases to map API response names (camelCase) to Python names (snake_case).
+Names load on first use, so importing one submodule (e.g. ``models.money``
+for ``alibaba_api.pricing``) does not import pydantic for the others.
 """
 
-from alibaba_api.models.auth import (
-    TokenResponse,
-    TokenResponseWrapper,
-    UserInfo,
-)
-from alibaba_api.models.order import (
-    Amount,
-    Carrier,
-    CreateOrderResponse,
-    FormattedDate,
-    LogisticsQueryResponse,
-    LogisticsQueryValue,
-    OrderDetails,
-    OrderListItem,
-    OrderListResponse,
-    OrderProduct,
-    Party,
-    PaymentRequestValue,
-    PaymentResponse,
-    ShipmentAddress,
-    ShippingOrder,
-    Telephone,
-    TrackingEvent,
-    TrackingInfo,
-    TrackingResponse,
-    Voucher,
-)
-from alibaba_api.models.product import (
-    InventoryByLocation,
-    InventoryItem,
-    LadderPrice,
-    ProductDescription,
-    ProductListResponse,
-    ProductListResult,
-    Sku,
-    SkuAttribute,
-    WholesaleTrade,
-)
-from alibaba_api.models.shipping import (
-    Fee,
-    FreightResponse,
-    ShippingOption,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from alibaba_api.models.auth import (
+        TokenResponse,
+        TokenResponseWrapper,
+        UserInfo,
+    )
+    from alibaba_api.models.compact import (
+        CompactLadderPrice,
+        CompactProduct,
+        CompactSku,
+        CompactSkuAttribute,
+        CompactWholesaleTrade,
+        StringPool,
+    )
+    from alibaba_api.models.money import (
+        CURRENCY_EXPONENTS,
+        Money,
+        MoneyVector,
+        currency_exponent,
+        parse_minor,
+    )
+    from alibaba_api.models.order import (
+        Amount,
+        Carrier,
+        CreateOrderResponse,
+        FormattedDate,
+        LogisticsQueryResponse,
+        LogisticsQueryValue,
+        OrderDetails,
+        OrderListItem,
+        OrderListResponse,
+        OrderProduct,
+        Party,
+        PaymentRequestValue,
+        PaymentResponse,
+        ShipmentAddress,
+        ShippingOrder,
+        Telephone,
+        TrackingEvent,
+        TrackingInfo,
+        TrackingResponse,
+        Voucher,
+    )
+    from alibaba_api.models.product import (
+        InventoryByLocation,
+        InventoryItem,
+        LadderPrice,
+        ProductDescription,
+        ProductListResponse,
+        ProductListResult,
+        Sku,
+        SkuAttribute,
+        WholesaleTrade,
+    )
+    from alibaba_api.models.shipping import (
+        Fee,
+        FreightResponse,
+        ShippingOption,
+    )
+
+# Public name -> submodule defining it, imported on first attribute access
+_LAZY_IMPORTS: dict[str, str] = {
+    "TokenResponse": "alibaba_api.models.auth",
+    "TokenResponseWrapper": "alibaba_api.models.auth",
+    "UserInfo": "alibaba_api.models.auth",
+    "CompactLadderPrice": "alibaba_api.models.compact",
+    "CompactProduct": "alibaba_api.models.compact",
+    "CompactSku": "alibaba_api.models.compact",
+    "CompactSkuAttribute": "alibaba_api.models.compact",
+    "CompactWholesaleTrade": "alibaba_api.models.compact",
+    "StringPool": "alibaba_api.models.compact",
+    "CURRENCY_EXPONENTS": "alibaba_api.models.money",
+    "Money": "alibaba_api.models.money",
+    "MoneyVector": "alibaba_api.models.money",
+    "currency_exponent": "alibaba_api.models.money",
+    "parse_minor": "alibaba_api.models.money",
+    "Amount": "alibaba_api.models.order",
+    "Carrier": "alibaba_api.models.order",
+    "CreateOrderResponse": "alibaba_api.models.order",
+    "FormattedDate": "alibaba_api.models.order",
+    "LogisticsQueryResponse": "alibaba_api.models.order",
+    "LogisticsQueryValue": "alibaba_api.models.order",
+    "OrderDetails": "alibaba_api.models.order",
+    "OrderListItem": "alibaba_api.models.order",
+    "OrderListResponse": "alibaba_api.models.order",
+    "OrderProduct": "alibaba_api.models.order",
+    "Party": "alibaba_api.models.order",
+    "PaymentRequestValue": "alibaba_api.models.order",
+    "PaymentResponse": "alibaba_api.models.order",
+    "ShipmentAddress": "alibaba_api.models.order",
+    "ShippingOrder": "alibaba_api.models.order",
+    "Telephone": "alibaba_api.models.order",
+    "TrackingEvent": "alibaba_api.models.order",
+    "TrackingInfo": "alibaba_api.models.order",
+    "TrackingResponse": "alibaba_api.models.order",
+    "Voucher": "alibaba_api.models.order",
+    "InventoryByLocation": "alibaba_api.models.product",
+    "InventoryItem": "alibaba_api.models.product",
+    "LadderPrice": "alibaba_api.models.product",
+    "ProductDescription": "alibaba_api.models.product",
+    "ProductListResponse": "alibaba_api.models.product",
+    "ProductListResult": "alibaba_api.models.product",
+    "Sku": "alibaba_api.models.product",
+    "SkuAttribute": "alibaba_api.models.product",
+    "WholesaleTrade": "alibaba_api.models.product",
+    "Fee": "alibaba_api.models.shipping",
+    "FreightResponse": "alibaba_api.models.shipping",
+    "ShippingOption": "alibaba_api.models.shipping",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     # Auth
@@ -63,6 +148,19 @@ __all__ = [
     "InventoryByLocation",
     "ProductListResult",
     "ProductListResponse",
+    # Compact product records
+    "StringPool",
+    "CompactLadderPrice",
+    "CompactSkuAttribute",
+    "CompactSku",
+    "CompactWholesaleTrade",
+    "CompactProduct",
+    # Money
+    "CURRENCY_EXPONENTS",
+    "Money",
+    "MoneyVector",
+    "currency_exponent",
+    "parse_minor",
     # Order
     "Amount",
     "Telephone",
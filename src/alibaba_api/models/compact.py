@@ -0,0 +1,262 @@
+"""
+Compact, read-only product records for large in-memory catalogs.
+
+A product description from ``get_product`` is a nested dict in which keys
+and many values (currency, unit, status, attribute names and values,
+ladder bounds) repeat across every SKU and product. The records here mirror
+``ProductDescription``, ``Sku``, ``SkuAttribute``, ``LadderPrice`` and
+``WholesaleTrade`` as named tuples, so keys are stored once per class, lists
+become tuples, and repeated values are shared through a ``StringPool``.
+
+Conversion is lossless: ``CompactProduct.from_dict(data).to_dict() == data``
+for any product description, including keys the records don't model (kept
+in ``extra``) and keys that were absent rather than null (tracked in
+``absent``).
+
+Example:
+    pool = StringPool()
+    catalog = {
+        pid: CompactProduct.from_dict(client.get_product(pid), pool)
+        for pid in product_ids
+    }
+    catalog[pid].skus[0].ladder_price[0].price
+"""
+
+from typing import Any, NamedTuple
+
+from alibaba_api.models.product import ProductDescription
+
+Extra = tuple[tuple[str, Any], ...]
+
+
+class StringPool:
+    """
+    Shares one copy of each repeated string.
+
+    Unlike ``sys.intern`` the pool is owned by the caller, so dropping a
+    catalog and its pool frees the strings too. ``dict.setdefault`` is
+    atomic, so one pool can be filled from several threads.
+    """
+
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __call__(self, value: Any) -> Any:
+        """Return the pooled copy of ``value`` if it is a string, else ``value``."""
+        if type(value) is not str:
+            return value
+        return self._strings.setdefault(value, value)
+
+
+class CompactLadderPrice(NamedTuple):
+    """Compact ``LadderPrice``."""
+
+    min_quantity: str | None
+    max_quantity: str | None
+    price: str | None
+    currency: str | None
+    absent: int = 0
+    extra: Extra = ()
+
+
+class CompactSkuAttribute(NamedTuple):
+    """Compact ``SkuAttribute``."""
+
+    attr_name_id: str | None
+    attr_name_desc: str | None
+    attr_value_id: str | None
+    attr_value_desc: str | None
+    attr_value_image: str | None
+    absent: int = 0
+    extra: Extra = ()
+
+
+class CompactSku(NamedTuple):
+    """Compact ``Sku``."""
+
+    sku_id: str | None
+    product_id: str | None
+    seller_sku_id: str | None
+    status: str | None
+    unit: str | None
+    image: str | None
+    sku_attr_list: tuple[CompactSkuAttribute, ...] | None
+    ladder_price: tuple[CompactLadderPrice, ...] | None
+    absent: int = 0
+    extra: Extra = ()
+
+
+class CompactWholesaleTrade(NamedTuple):
+    """Compact ``WholesaleTrade``."""
+
+    min_order_quantity: str | None
+    unit_type: str | None
+    handling_time: str | None
+    price: str | None
+    absent: int = 0
+    extra: Extra = ()
+
+
+class CompactProduct(NamedTuple):
+    """Compact ``ProductDescription``."""
+
+    product_id: str | None
+    title: str | None
+    description: str | None
+    detail_url: str | None
+    main_image: str | None
+    images: tuple[str, ...] | None
+    category_id: str | None
+    category: str | None
+    supplier: str | None
+    e_company_id: str | None
+    currency: str | None
+    min_order_quantity: str | None
+    status: str | None
+    mode_id: str | None
+    wholesale_trade: CompactWholesaleTrade | None
+    skus: tuple[CompactSku, ...] | None
+    absent: int = 0
+    extra: Extra = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], pool: StringPool | None = None) -> "CompactProduct":
+        """
+        Build a compact product from a ``get_product`` result.
+
+        Args:
+            data: Product description dict
+            pool: Pool for repeated strings; share one across a catalog. A
+                private pool is used if omitted
+
+        Returns:
+            CompactProduct
+        """
+        record: CompactProduct = _load(cls, data, pool if pool is not None else StringPool())
+        return record
+
+    @classmethod
+    def from_model(
+        cls, model: ProductDescription, pool: StringPool | None = None
+    ) -> "CompactProduct":
+        """Build a compact product from a ``ProductDescription`` (typed response mode)."""
+        return cls.from_dict(model.model_dump(by_alias=True, exclude_unset=True), pool)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Rebuild the original product description dict."""
+        return _dump(self)
+
+    def to_model(self) -> ProductDescription:
+        """Validate into a ``ProductDescription``."""
+        return ProductDescription.model_validate(self.to_dict())
+
+
+# Field kinds
+_PLAIN = 0  # stored as-is
+_POOLED = 1  # repeated string, shared through the pool
+_STRINGS = 2  # list of strings, stored as a tuple
+
+
+# Per record class: (attribute, JSON key, kind or nested record class, is_list)
+_SPECS: dict[type, tuple[tuple[str, str, Any, bool], ...]] = {
+    CompactLadderPrice: (
+        ("min_quantity", "min_quantity", _POOLED, False),
+        ("max_quantity", "max_quantity", _POOLED, False),
+        ("price", "price", _POOLED, False),
+        ("currency", "currency", _POOLED, False),
+    ),
+    CompactSkuAttribute: (
+        ("attr_name_id", "attr_name_id", _POOLED, False),
+        ("attr_name_desc", "attr_name_desc", _POOLED, False),
+        ("attr_value_id", "attr_value_id", _POOLED, False),
+        ("attr_value_desc", "attr_value_desc", _POOLED, False),
+        ("attr_value_image", "attr_value_image", _PLAIN, False),
+    ),
+    CompactSku: (
+        ("sku_id", "sku_id", _PLAIN, False),
+        ("product_id", "product_id", _POOLED, False),
+        ("seller_sku_id", "seller_sku_id", _PLAIN, False),
+        ("status", "status", _POOLED, False),
+        ("unit", "unit", _POOLED, False),
+        ("image", "image", _PLAIN, False),
+        ("sku_attr_list", "sku_attr_list", CompactSkuAttribute, True),
+        ("ladder_price", "ladder_price", CompactLadderPrice, True),
+    ),
+    CompactWholesaleTrade: (
+        ("min_order_quantity", "min_order_quantity", _POOLED, False),
+        ("unit_type", "unit_type", _POOLED, False),
+        ("handling_time", "handling_time", _POOLED, False),
+        ("price", "price", _POOLED, False),
+    ),
+    CompactProduct: (
+        ("product_id", "product_id", _POOLED, False),
+        ("title", "title", _PLAIN, False),
+        ("description", "description", _PLAIN, False),
+        ("detail_url", "detail_url", _PLAIN, False),
+        ("main_image", "main_image", _PLAIN, False),
+        ("images", "images", _STRINGS, False),
+        ("category_id", "category_id", _POOLED, False),
+        ("category", "category", _POOLED, False),
+        ("supplier", "supplier", _POOLED, False),
+        ("e_company_id", "eCompanyId", _POOLED, False),
+        ("currency", "currency", _POOLED, False),
+        ("min_order_quantity", "min_order_quantity", _POOLED, False),
+        ("status", "status", _POOLED, False),
+        ("mode_id", "mode_id", _POOLED, False),
+        ("wholesale_trade", "wholesale_trade", CompactWholesaleTrade, False),
+        ("skus", "skus", CompactSku, True),
+    ),
+}
+
+_KEYS: dict[type, frozenset[str]] = {
+    cls: frozenset(key for _, key, _, _ in spec) for cls, spec in _SPECS.items()
+}
+
+
+def _load(cls: Any, data: dict[str, Any], pool: StringPool) -> Any:
+    values: list[Any] = []
+    absent = 0
+    for bit, (_, key, kind, is_list) in enumerate(_SPECS[cls]):
+        if key not in data:
+            values.append(None)
+            absent |= 1 << bit
+            continue
+        value = data[key]
+        if kind is _POOLED:
+            value = pool(value)
+        elif kind is _STRINGS:
+            if type(value) is list:
+                value = tuple(value)
+        elif kind is not _PLAIN:
+            if is_list:
+                if type(value) is list and all(type(item) is dict for item in value):
+                    value = tuple(_load(kind, item, pool) for item in value)
+            elif type(value) is dict:
+                value = _load(kind, value, pool)
+        values.append(value)
+
+    known = _KEYS[cls]
+    extra = tuple((key, value) for key, value in data.items() if key not in known)
+    return cls(*values, absent, extra)
+
+
+def _dump(record: Any) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    absent = record.absent
+    for bit, ((_, key, kind, _), value) in enumerate(
+        zip(_SPECS[type(record)], record, strict=False)
+    ):
+        if absent >> bit & 1:
+            continue
+        if type(value) is tuple:  # list of strings or of records
+            value = list(value) if kind is _STRINGS else [_dump(item) for item in value]
+        elif isinstance(value, tuple):  # nested record
+            value = _dump(value)
+        data[key] = value
+    data.update(record.extra)
+    return data
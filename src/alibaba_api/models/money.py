@@ -0,0 +1,378 @@
+"""
+Fixed-point money for exact price arithmetic.
+
+The API sends prices and fees as decimal strings ("45.44"). ``Money`` parses
+them once into an integer count of minor units (cents for USD) tagged with
+the currency, so sums, differences, quantity multiples and comparisons are
+exact integer operations with no float drift.
+
+Example:
+    cost = Money.parse("41.80", "USD")
+    sell = Money.parse("59.99", "USD")
+    margin = sell - cost             # Money(1819, 'USD')
+    margin * 250                     # Money(454750, 'USD')
+    margin.ratio(sell)               # Fraction(1819, 5999)
+
+For batch jobs use ``MoneyVector``, which applies the same arithmetic to a
+whole column of amounts in one currency.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any
+
+# ISO 4217 currencies whose minor unit is not 1/100; everything else uses 2.
+CURRENCY_EXPONENTS: dict[str, int] = {
+    "BIF": 0,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "ISK": 0,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "PYG": 0,
+    "RWF": 0,
+    "UGX": 0,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+    "BHD": 3,
+    "IQD": 3,
+    "JOD": 3,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+}
+
+DEFAULT_EXPONENT = 2
+
+
+def currency_exponent(currency: str) -> int:
+    """Number of decimal places in one minor unit of ``currency``."""
+    return CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT)
+
+
+def parse_minor(text: str, exponent: int = DEFAULT_EXPONENT) -> int:
+    """
+    Parse a decimal string into an integer number of minor units.
+
+    Digits beyond ``exponent`` are rounded half to even.
+
+    Args:
+        text: Decimal amount, e.g. "45.44", "-3", "1,299.5"
+        exponent: Decimal places in one minor unit
+
+    Returns:
+        Amount in minor units, e.g. 4544
+
+    Raises:
+        ValueError: If ``text`` is not a decimal number
+    """
+    text = text.strip().replace(",", "")
+    negative = text.startswith("-")
+    if negative or text.startswith("+"):
+        text = text[1:]
+    whole, _, fraction = text.partition(".")
+    if not (whole or fraction) or not (whole + fraction).isdigit():
+        raise ValueError(f"Invalid amount: {text!r}")
+
+    kept, dropped = fraction[:exponent], fraction[exponent:]
+    minor = int((whole or "0") + kept.ljust(exponent, "0"))
+    if dropped.strip("0"):
+        half = "5".ljust(len(dropped), "0")
+        if dropped > half or (dropped == half and minor % 2):
+            minor += 1
+    return -minor if negative else minor
+
+
+class Money:
+    """
+    An exact amount in integer minor units of one currency.
+
+    Instances are immutable and hashable. Adding, subtracting or comparing
+    amounts in different currencies raises ``ValueError``.
+
+    Args:
+        minor: Amount in minor units (cents for USD)
+        currency: ISO 4217 currency code
+    """
+
+    __slots__ = ("minor", "currency")
+
+    minor: int
+    currency: str
+
+    def __init__(self, minor: int, currency: str) -> None:
+        object.__setattr__(self, "minor", minor)
+        object.__setattr__(self, "currency", currency)
+
+    @classmethod
+    def parse(cls, amount: str | int | float | Decimal, currency: str) -> "Money":
+        """
+        Parse an API amount such as ``"45.44"``.
+
+        Args:
+            amount: Decimal string; numbers are accepted and converted via ``str``
+            currency: ISO 4217 currency code
+
+        Returns:
+            Money
+
+        Raises:
+            ValueError: If ``amount`` is not a decimal number
+        """
+        return cls(parse_minor(str(amount), currency_exponent(currency)), currency)
+
+    @classmethod
+    def zero(cls, currency: str) -> "Money":
+        """A zero amount in ``currency``."""
+        return cls(0, currency)
+
+    @staticmethod
+    def sum(amounts: Iterable["Money"], currency: str) -> "Money":
+        """
+        Add up ``amounts``, which must all be in ``currency``.
+
+        Raises:
+            ValueError: On a currency mismatch
+        """
+        total = 0
+        for amount in amounts:
+            if amount.currency != currency:
+                raise ValueError(f"Cannot add {amount.currency} to {currency}")
+            total += amount.minor
+        return Money(total, currency)
+
+    @property
+    def exponent(self) -> int:
+        return currency_exponent(self.currency)
+
+    @property
+    def amount(self) -> str:
+        """The amount as the API formats it, e.g. ``"45.44"``."""
+        exponent = self.exponent
+        digits = str(abs(self.minor)).rjust(exponent + 1, "0")
+        sign = "-" if self.minor < 0 else ""
+        if not exponent:
+            return sign + digits
+        return f"{sign}{digits[:-exponent]}.{digits[-exponent:]}"
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.minor).scaleb(-self.exponent)
+
+    def scale(self, factor: int | Fraction | Decimal | str) -> "Money":
+        """
+        Multiply by a non-integer factor, e.g. a markup, rounding half to even.
+
+        Args:
+            factor: Multiplier; strings are parsed as ``Fraction``
+
+        Returns:
+            Money in the same currency
+        """
+        exact = Fraction(factor) * self.minor
+        return Money(round(exact), self.currency)
+
+    def ratio(self, other: "Money") -> Fraction:
+        """
+        Exact ratio ``self / other``, e.g. margin over sell price.
+
+        Raises:
+            ValueError: If the currencies differ or ``other`` is zero
+        """
+        self._check(other)
+        if not other.minor:
+            raise ValueError(f"Cannot take a ratio against zero {other.currency}")
+        return Fraction(self.minor, other.minor)
+
+    def _check(self, other: "Money") -> None:
+        if self.currency != other.currency:
+            raise ValueError(f"Currency mismatch: {self.currency} and {other.currency}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Money is immutable")
+
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.minor + other.minor, self.currency)
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.minor - other.minor, self.currency)
+
+    def __mul__(self, quantity: int) -> "Money":
+        if type(quantity) is not int:
+            return NotImplemented
+        return Money(self.minor * quantity, self.currency)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Money":
+        return Money(-self.minor, self.currency)
+
+    def __abs__(self) -> "Money":
+        return Money(abs(self.minor), self.currency)
+
+    def __bool__(self) -> bool:
+        return self.minor != 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.minor == other.minor and self.currency == other.currency
+
+    def __hash__(self) -> int:
+        return hash((self.minor, self.currency))
+
+    def __lt__(self, other: "Money") -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return self.minor < other.minor
+
+    def __le__(self, other: "Money") -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return self.minor <= other.minor
+
+    def __gt__(self, other: "Money") -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return self.minor > other.minor
+
+    def __ge__(self, other: "Money") -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return self.minor >= other.minor
+
+    def __repr__(self) -> str:
+        return f"Money({self.minor}, {self.currency!r})"
+
+    def __str__(self) -> str:
+        return f"{self.amount} {self.currency}"
+
+    def __reduce__(self) -> tuple[type["Money"], tuple[int, str]]:
+        return (Money, (self.minor, self.currency))
+
+
+class MoneyVector:
+    """
+    Many amounts in one currency, held as a list of integer minor units.
+
+    Each ``Money`` operation allocates an object, so in batch jobs a
+    ``Money`` is slower than C-backed ``Decimal``. ``MoneyVector`` keeps the
+    currency check per batch and does the per-item work as plain integer
+    arithmetic, which is exact and faster than either.
+
+    Example:
+        cost = MoneyVector.parse(cost_strings, "USD")
+        sell = MoneyVector.parse(sell_strings, "USD")
+        total_margin = ((sell - cost) * quantities).total()
+
+    Args:
+        minors: Amounts in minor units
+        currency: ISO 4217 currency code
+    """
+
+    __slots__ = ("minors", "currency")
+
+    def __init__(self, minors: list[int], currency: str) -> None:
+        self.minors = minors
+        self.currency = currency
+
+    @classmethod
+    def parse(cls, amounts: Iterable[str], currency: str) -> "MoneyVector":
+        """Parse API amount strings, all in ``currency``."""
+        exponent = currency_exponent(currency)
+        return cls([parse_minor(amount, exponent) for amount in amounts], currency)
+
+    @classmethod
+    def of(cls, amounts: Iterable[Money], currency: str) -> "MoneyVector":
+        """
+        Collect ``Money`` values, which must all be in ``currency``.
+
+        Raises:
+            ValueError: On a currency mismatch
+        """
+        minors = []
+        for amount in amounts:
+            if amount.currency != currency:
+                raise ValueError(f"Cannot add {amount.currency} to a {currency} vector")
+            minors.append(amount.minor)
+        return cls(minors, currency)
+
+    def __len__(self) -> int:
+        return len(self.minors)
+
+    def __getitem__(self, index: int) -> Money:
+        return Money(self.minors[index], self.currency)
+
+    def __iter__(self) -> Iterator[Money]:
+        currency = self.currency
+        return (Money(minor, currency) for minor in self.minors)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoneyVector):
+            return NotImplemented
+        return self.currency == other.currency and self.minors == other.minors
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _operand(self, other: "MoneyVector | Money") -> list[int]:
+        if other.currency != self.currency:
+            raise ValueError(f"Currency mismatch: {self.currency} and {other.currency}")
+        if isinstance(other, Money):
+            return [other.minor] * len(self.minors)
+        if len(other.minors) != len(self.minors):
+            raise ValueError(f"Length mismatch: {len(self.minors)} and {len(other.minors)}")
+        return other.minors
+
+    def __add__(self, other: "MoneyVector | Money") -> "MoneyVector":
+        operand = self._operand(other)
+        return MoneyVector(
+            [a + b for a, b in zip(self.minors, operand, strict=True)], self.currency
+        )
+
+    def __sub__(self, other: "MoneyVector | Money") -> "MoneyVector":
+        operand = self._operand(other)
+        return MoneyVector(
+            [a - b for a, b in zip(self.minors, operand, strict=True)], self.currency
+        )
+
+    def __mul__(self, quantities: int | Sequence[int]) -> "MoneyVector":
+        """Multiply by one integer, or elementwise by a sequence of integers."""
+        if type(quantities) is int:
+            factor = quantities
+            return MoneyVector([minor * factor for minor in self.minors], self.currency)
+        if isinstance(quantities, int) or len(quantities) != len(self.minors):
+            raise ValueError("Quantities must be an int or match the vector length")
+        return MoneyVector(
+            [minor * qty for minor, qty in zip(self.minors, quantities, strict=True)],
+            self.currency,
+        )
+
+    __rmul__ = __mul__
+
+    def total(self) -> Money:
+        return Money(sum(self.minors), self.currency)
+
+    def min(self) -> Money:
+        return Money(min(self.minors), self.currency)
+
+    def max(self) -> Money:
+        return Money(max(self.minors), self.currency)
+
+    def __repr__(self) -> str:
+        return f"MoneyVector({len(self.minors)} amounts, {self.currency!r})"
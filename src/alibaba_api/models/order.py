@@ -1,7 +1,11 @@
 """Pydantic models for order endpoints."""
 
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 
+from alibaba_api.models.money import Money
+
 
 class Amount(BaseModel):
     """Monetary amount."""
@@ -9,6 +13,11 @@ class Amount(BaseModel):
     amount: str = Field(alias="amount")
     currency: str = Field(alias="currency")
 
+    @cached_property
+    def money(self) -> Money:
+        """``amount`` as exact fixed-point money, parsed on first access."""
+        return Money.parse(self.amount, self.currency)
+
 
 class Telephone(BaseModel):
     """Telephone number."""
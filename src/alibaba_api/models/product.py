@@ -1,7 +1,11 @@
 """Pydantic models for product endpoints."""
 
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 
+from alibaba_api.models.money import Money
+
 
 class SkuAttribute(BaseModel):
     """SKU attribute (e.g., Color, Size)."""
@@ -16,11 +20,16 @@ class SkuAttribute(BaseModel):
 class LadderPrice(BaseModel):
     """Volume-based pricing tier."""
 
-    min_quantity: str = Field(alias="min_quantity")
-    max_quantity: str = Field(alias="max_quantity")
+    min_quantity: int = Field(alias="min_quantity")
+    max_quantity: int = Field(alias="max_quantity")
     price: str = Field(alias="price")
     currency: str = Field(alias="currency")
 
+    @cached_property
+    def unit_price(self) -> Money:
+        """``price`` as exact fixed-point money, parsed on first access."""
+        return Money.parse(self.price, self.currency)
+
 
 class Sku(BaseModel):
     """Product SKU/variant."""
@@ -38,7 +47,7 @@ class Sku(BaseModel):
 class WholesaleTrade(BaseModel):
     """Wholesale pricing information."""
 
-    min_order_quantity: str = Field(alias="min_order_quantity")
+    min_order_quantity: int = Field(alias="min_order_quantity")
     unit_type: str = Field(alias="unit_type")
     handling_time: str = Field(alias="handling_time")
     price: str = Field(alias="price")
@@ -58,12 +67,19 @@ class ProductDescription(BaseModel):
     supplier: str | None = Field(default=None, alias="supplier")
     e_company_id: str = Field(alias="eCompanyId")
     currency: str = Field(alias="currency")
-    min_order_quantity: str = Field(alias="min_order_quantity")
+    min_order_quantity: int = Field(alias="min_order_quantity")
     status: str = Field(alias="status")
     mode_id: str = Field(alias="mode_id")
     wholesale_trade: WholesaleTrade | None = Field(default=None, alias="wholesale_trade")
     skus: list[Sku] = Field(alias="skus", default_factory=list)
 
+    @cached_property
+    def wholesale_price(self) -> Money | None:
+        """``wholesale_trade.price`` in the product currency, parsed on first access."""
+        if self.wholesale_trade is None:
+            return None
+        return Money.parse(self.wholesale_trade.price, self.currency)
+
 
 class InventoryItem(BaseModel):
     """Inventory item for a SKU."""
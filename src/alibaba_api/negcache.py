@@ -0,0 +1,167 @@
+"""
+Negative cache of permanent, product-level API failures.
+
+Some errors say a request is bound to fail for a while, whatever is retried:
+130106 (product offline) applies to every call for the product, and 120019
+or 4015 (cannot ship to the country) to every freight quote for that
+(product, country) pair. ``NegativeCache`` remembers such errors, keyed by
+their policy ``scope`` (see ``alibaba_api.policy``), so matching calls raise
+the cached ``AlibabaAPIError`` without a round-trip until the entry expires.
+
+Every ``AlibabaClient`` owns one, with TTLs from ``Config.offline_ttl`` and
+``Config.restricted_ttl``; a TTL of 0 disables that scope. ``get_product``
+and ``calculate_freight`` consult it. Hits are counted on the cache
+(``stats()``) and, when the client has a ``MetricsRegistry``, as
+``cache_hits`` on the endpoint that was skipped.
+
+Example:
+    client = AlibabaClient(config, negative_cache=NegativeCache(product_ttl=600))
+    ...
+    client.negative_cache.stats()  # {"lookups": ..., "hits": {...}, "hit_rate": ...}
+"""
+
+import threading
+import time
+from typing import Any
+
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaError
+
+
+class NegativeCache:
+    """
+    Thread-safe TTL cache of failed (product) and (product, country) lookups.
+
+    Expired entries are dropped when looked up; beyond ``max_entries`` the
+    oldest entry is evicted first.
+
+    Args:
+        product_ttl: Seconds to remember "product" scope errors (offline)
+        destination_ttl: Seconds to remember "destination" scope errors
+            (restricted or unshippable)
+        max_entries: Upper bound on remembered entries
+    """
+
+    def __init__(
+        self,
+        product_ttl: float = 300.0,
+        destination_ttl: float = 3600.0,
+        *,
+        max_entries: int = 100_000,
+    ) -> None:
+        self.product_ttl = product_ttl
+        self.destination_ttl = destination_ttl
+        self.max_entries = max_entries
+        self.lookups = 0
+        self.hits = {"product": 0, "destination": 0}
+        self._entries: dict[tuple[str, str | None], tuple[float, AlibabaAPIError]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check(self, product_id: str | int, country: str | None = None) -> AlibabaAPIError | None:
+        """
+        Return the cached error for a call, or None if it should be made.
+
+        Args:
+            product_id: Product the call is for
+            country: Destination country, for calls that ship somewhere
+
+        Returns:
+            The error the product (or the product to ``country``) last failed with
+        """
+        product_key = (str(product_id), None)
+        with self._lock:
+            self.lookups += 1
+            if not self._entries:
+                return None
+            now = time.monotonic()
+            error = self._get(product_key, now)
+            if error is not None:
+                self.hits["product"] += 1
+                return error
+            if country is not None:
+                error = self._get((product_key[0], country), now)
+                if error is not None:
+                    self.hits["destination"] += 1
+                    return error
+        return None
+
+    def _get(self, key: tuple[str, str | None], now: float) -> AlibabaAPIError | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def record(
+        self,
+        error: AlibabaError,
+        scope: str | None,
+        product_id: str | int,
+        country: str | None = None,
+    ) -> bool:
+        """
+        Remember ``error`` if its scope outlives the call that raised it.
+
+        Args:
+            error: Error raised for the call
+            scope: The error policy's scope
+            product_id: Product the call was for
+            country: Destination country of the call, if any
+
+        Returns:
+            True if the error was cached
+        """
+        if not isinstance(error, AlibabaAPIError):
+            return False
+        key: tuple[str, str | None]
+        if scope == "product":
+            key, ttl = (str(product_id), None), self.product_ttl
+        elif scope == "destination" and country is not None:
+            key, ttl = (str(product_id), country), self.destination_ttl
+        else:
+            return False
+        if ttl <= 0:
+            return False
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_entries > 0:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, error)
+        return True
+
+    def invalidate(self, product_id: str | int) -> None:
+        """Forget every cached failure for ``product_id``."""
+        product_id = str(product_id)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == product_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Forget every cached failure and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.lookups = 0
+            self.hits = {"product": 0, "destination": 0}
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Counters for the cache.
+
+        Returns:
+            Dict with lookups, hits by scope, overall hit_rate and current entries
+        """
+        with self._lock:
+            hits = dict(self.hits)
+            lookups = self.lookups
+            entries = len(self._entries)
+        total = sum(hits.values())
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "hit_rate": total / lookups if lookups else 0.0,
+            "entries": entries,
+        }
@@ -0,0 +1,358 @@
+"""
+Cheapest (or fastest) way to fulfil an order of one product.
+
+``LandedCostOptimizer.plan`` gathers what is otherwise combined by hand:
+
+1. ``get_product`` and ``get_product_inventory``, fetched concurrently, give
+   each SKU's ladder price and its stock per ``shipping_from`` location.
+2. Every (SKU, dispatch location) candidate is pruned before any freight
+   call if the quantity is below the MOQ, the location has too little stock,
+   or an earlier quote failed with an error whose policy (see
+   ``alibaba_api.policy``) rules the route out: the product cannot ship to
+   the destination, or does not ship from that location.
+3. One ``calculate_freight`` quote per surviving location is fetched
+   concurrently (freight does not depend on the SKU) and cached for
+   ``quote_ttl`` seconds.
+4. Each (SKU, location, carrier) combination is priced and the plan is
+   ranked by total landed cost or by delivery time.
+
+Example:
+    optimizer = LandedCostOptimizer(client)
+    plan = optimizer.plan("1600124642247", quantity=200, destination_country="US")
+    best = plan.best
+    print(best.sku_id, best.dispatch_location, best.carrier, best.total)
+"""
+
+import re
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from alibaba_api.exceptions import AlibabaError
+from alibaba_api.models.money import Money
+from alibaba_api.pricing import LadderTable, field_value
+from alibaba_api.shipping import DISPATCH_LOCATIONS
+
+if TYPE_CHECKING:
+    from alibaba_api.client import AlibabaClient
+
+RankBy = Literal["cost", "delivery"]
+
+_DAYS = re.compile(r"\d+")
+
+
+def delivery_days(delivery_time: str | None) -> tuple[int, int] | None:
+    """Parse a delivery estimate such as ``"10~15"`` or ``"7"`` into (min, max) days."""
+    days = [int(n) for n in _DAYS.findall(delivery_time or "")]
+    if not days:
+        return None
+    return min(days), max(days)
+
+
+class _TTLCache:
+    """Small thread-safe mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self._data.pop(key, None)
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+@dataclass(slots=True)
+class FulfilmentOption:
+    """One way to fulfil the order: a SKU, where it ships from, and a carrier."""
+
+    sku_id: str
+    dispatch_location: str
+    carrier: str | None
+    vendor_name: str | None
+    shipping_type: str | None
+    delivery_time: str | None
+    quantity: int
+    unit_price: Money
+    goods: Money
+    freight: Money
+    total: Money
+    stock: int | None = None
+
+    @property
+    def delivery_days(self) -> tuple[int, int] | None:
+        return delivery_days(self.delivery_time)
+
+
+@dataclass(slots=True)
+class PrunedCandidate:
+    """
+    A (SKU, location) pair skipped without a freight call.
+
+    ``reason`` is "below_moq", "no_stock", "no_price", "restricted" (the
+    product cannot ship to the destination) or "no_route" (it does not ship
+    from the location).
+    """
+
+    sku_id: str
+    dispatch_location: str
+    reason: str
+
+
+@dataclass(slots=True)
+class LandedCostPlan:
+    """
+    Ranked fulfilment options for one order.
+
+    ``errors`` maps ``"inventory"`` or a dispatch location to the error that
+    call raised; the plan is built from whatever else succeeded.
+    """
+
+    product_id: str
+    quantity: int
+    destination_country: str
+    rank_by: RankBy
+    options: list[FulfilmentOption] = field(default_factory=list)
+    pruned: list[PrunedCandidate] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def best(self) -> FulfilmentOption | None:
+        return self.options[0] if self.options else None
+
+
+def _rank_key(rank_by: RankBy) -> Any:
+    never = float("inf")
+
+    def by_cost(option: FulfilmentOption) -> tuple[int, float]:
+        days = option.delivery_days
+        return option.total.minor, days[1] if days else never
+
+    def by_delivery(option: FulfilmentOption) -> tuple[float, float, int]:
+        days = option.delivery_days
+        return (
+            (days[1], days[0], option.total.minor) if days else (never, never, option.total.minor)
+        )
+
+    return by_cost if rank_by == "cost" else by_delivery
+
+
+class LandedCostOptimizer:
+    """
+    Plans the cheapest or fastest fulfilment across SKUs, locations and carriers.
+
+    One optimizer can be reused across plans: freight quotes are cached for
+    ``quote_ttl`` seconds, and route restrictions learned from freight errors
+    prune candidates in later plans for the same time.
+
+    Args:
+        client: Client used for the product, inventory and freight calls
+        max_workers: Maximum concurrent API calls per plan
+        quote_ttl: Seconds to keep freight quotes and learned restrictions
+    """
+
+    def __init__(
+        self, client: "AlibabaClient", *, max_workers: int = 8, quote_ttl: float = 300.0
+    ) -> None:
+        self.client = client
+        self.max_workers = max_workers
+        self.quotes = _TTLCache(quote_ttl)
+        self._restrictions = _TTLCache(quote_ttl)
+
+    def plan(
+        self,
+        product_id: str | int,
+        quantity: int,
+        destination_country: str,
+        *,
+        zip_code: str | None = None,
+        dispatch_locations: Iterable[str] = DISPATCH_LOCATIONS,
+        sku_ids: Iterable[str] | None = None,
+        rank_by: RankBy = "cost",
+    ) -> LandedCostPlan:
+        """
+        Build a ranked fulfilment plan.
+
+        Args:
+            product_id: Alibaba product ID
+            quantity: Units to order
+            destination_country: Destination country code (e.g., "US")
+            zip_code: Destination ZIP code
+            dispatch_locations: Locations to consider. Default: CN, US, MX
+            sku_ids: Only consider these SKUs. Default: every SKU
+            rank_by: "cost" (total landed cost, then delivery) or "delivery"
+                (latest estimated delivery day, then cost)
+
+        Returns:
+            LandedCostPlan with options best first
+
+        Raises:
+            AlibabaError: If the product itself cannot be fetched
+        """
+        product_id = str(product_id)
+        result = LandedCostPlan(product_id, quantity, destination_country, rank_by)
+        locations = list(dict.fromkeys(dispatch_locations))
+        wanted = set(sku_ids) if sku_ids is not None else None
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            product_future = pool.submit(self.client.get_product, product_id, destination_country)
+            inventory_future = pool.submit(self.client.get_product_inventory, product_id)
+            product = product_future.result()
+            try:
+                stock: dict[tuple[str, str], int] | None = self._stock(inventory_future.result())
+            except AlibabaError as e:
+                result.errors["inventory"] = e
+                stock = None
+
+            candidates: dict[str, list[tuple[str, Money, int | None]]] = {}
+            for sku in field_value(product, "skus") or ():
+                sku_id = str(field_value(sku, "sku_id"))
+                if wanted is not None and sku_id not in wanted:
+                    continue
+                unit_price = self._unit_price(sku, quantity)
+                if isinstance(unit_price, str):
+                    result.pruned.extend(
+                        PrunedCandidate(sku_id, location, unit_price) for location in locations
+                    )
+                    continue
+                for location in locations:
+                    available = stock.get((sku_id, location), 0) if stock is not None else None
+                    reason = self._prune_reason(
+                        product_id, destination_country, location, available, quantity
+                    )
+                    if reason is not None:
+                        result.pruned.append(PrunedCandidate(sku_id, location, reason))
+                        continue
+                    candidates.setdefault(location, []).append((sku_id, unit_price, available))
+
+            quotes: dict[str, Future[list[Any]]] = {
+                location: pool.submit(
+                    self._quote, product_id, quantity, destination_country, zip_code, location
+                )
+                for location in candidates
+            }
+            for location, future in quotes.items():
+                try:
+                    options = future.result()
+                except AlibabaError as e:
+                    result.errors[location] = e
+                    continue
+                for sku_id, unit_price, available in candidates[location]:
+                    result.options.extend(
+                        self._combine(sku_id, location, unit_price, available, quantity, options)
+                    )
+
+        result.options.sort(key=_rank_key(rank_by))
+        return result
+
+    @staticmethod
+    def _stock(inventory: Iterable[Any]) -> dict[tuple[str, str], int]:
+        stock: dict[tuple[str, str], int] = {}
+        for group in inventory:
+            location = field_value(group, "shipping_from")
+            for item in field_value(group, "inventory_list") or ():
+                key = (str(field_value(item, "sku_id")), location)
+                stock[key] = stock.get(key, 0) + int(field_value(item, "inventory_count") or 0)
+        return stock
+
+    @staticmethod
+    def _unit_price(sku: Any, quantity: int) -> Money | str:
+        """Ladder price for ``quantity``, or the reason the SKU cannot be priced."""
+        if not field_value(sku, "ladder_price"):
+            return "no_price"
+        ladder = LadderTable.from_sku(sku)
+        if quantity < ladder.moq:
+            return "below_moq"
+        return ladder.unit_price(quantity)
+
+    def _prune_reason(
+        self,
+        product_id: str,
+        destination: str,
+        location: str,
+        available: int | None,
+        quantity: int,
+    ) -> str | None:
+        if available is not None and available < quantity:
+            return "no_stock"
+        if self._restrictions.get((product_id, destination, None)) is not None:
+            return "restricted"
+        if self._restrictions.get((product_id, None, location)) is not None:
+            return "no_route"
+        return None
+
+    def _quote(
+        self,
+        product_id: str,
+        quantity: int,
+        destination: str,
+        zip_code: str | None,
+        location: str,
+    ) -> list[Any]:
+        key = (product_id, quantity, destination, zip_code, location)
+        options = self.quotes.get(key)
+        if options is not None:
+            return options  # type: ignore[no-any-return]
+        try:
+            response = self.client.calculate_freight(
+                product_id, quantity, destination, zip_code, location, fallback=False
+            )
+        except AlibabaError as e:
+            scope = self.client.error_policies.for_error(e).scope
+            if scope == "destination":
+                self._restrictions.put((product_id, destination, None), e.code)
+            elif scope == "dispatch_location":
+                self._restrictions.put((product_id, None, location), e.code)
+            raise
+        options = list(response["options"])
+        self.quotes.put(key, options)
+        return options
+
+    @staticmethod
+    def _combine(
+        sku_id: str,
+        location: str,
+        unit_price: Money,
+        available: int | None,
+        quantity: int,
+        options: Iterable[Any],
+    ) -> Iterable[FulfilmentOption]:
+        goods = unit_price * quantity
+        for option in options:
+            fee = field_value(option, "fee")
+            if fee is None or field_value(fee, "currency") != unit_price.currency:
+                continue
+            freight = Money.parse(field_value(fee, "amount"), unit_price.currency)
+            yield FulfilmentOption(
+                sku_id=sku_id,
+                dispatch_location=location,
+                carrier=field_value(option, "vendor_code"),
+                vendor_name=field_value(option, "vendor_name"),
+                shipping_type=field_value(option, "shipping_type"),
+                delivery_time=field_value(option, "delivery_time"),
+                quantity=quantity,
+                unit_price=unit_price,
+                goods=goods,
+                freight=freight,
+                total=goods + freight,
+                stock=available,
+            )
@@ -1,9 +1,144 @@
 """Order management API methods."""
 
+import json
 from typing import Any
 
+from alibaba_api.models.order import LogisticsQueryValue, OrderDetails, OrderListItem, TrackingInfo
+from alibaba_api.sansio import ApiRequest, AsyncHost, Operation, OperationHost, SyncHost
 
-class OrderMethods:
+
+class OrderOperations(OperationHost):
+    """
+    Sans-IO order operations, shared by the sync and async mixins.
+
+    Each ``*_op`` method returns a generator that yields ``ApiRequest``
+    descriptions and returns the high-level method's result; see
+    ``alibaba_api.sansio``.
+    """
+
+    # pylint: disable=too-many-arguments
+
+    def list_orders_op(
+        self,
+        role: str = "buyer",
+        status: str | None = None,
+        start_page: int = 0,
+        page_size: int = 20,
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``list_orders``."""
+        params = {
+            "role": role,
+            "start_page": str(start_page),
+            "page_size": str(page_size),
+        }
+        if status:
+            params["status"] = status
+
+        response = yield ApiRequest("/alibaba/order/list", params)
+        value = response.get("value", {})
+
+        return {
+            "total_count": value.get("total_count"),
+            "page": start_page,
+            "page_size": page_size,
+            "orders": self._to_model(list[OrderListItem], value.get("order_list", [])),
+            "_raw": response,
+        }
+
+    def get_order_op(self, trade_id: str, language: str = "en_US") -> Operation[Any]:
+        """Operation for ``get_order``."""
+        params = {"e_trade_id": trade_id, "language": language}
+        response = yield ApiRequest("/alibaba/order/get", params)
+
+        return self._to_model(OrderDetails, response.get("value", response))
+
+    def create_order_op(
+        self,
+        channel_refer_id: str,
+        product_list: list[dict[str, Any]],
+        logistics_detail: dict[str, Any],
+        remark: str | None = None,
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``create_order``."""
+        params = {
+            "channel_refer_id": channel_refer_id,
+            "product_list": json.dumps(product_list),
+            "logistics_detail": json.dumps(logistics_detail),
+        }
+        if remark:
+            params["remark"] = remark
+
+        response = yield ApiRequest("/buynow/order/create", params, "POST")
+        value = response.get("value", response)
+
+        return {
+            "trade_id": value.get("trade_id") or response.get("trade_id"),
+            "pay_url": value.get("pay_url") or response.get("pay_url"),
+            "_raw": response,
+        }
+
+    def pay_orders_op(
+        self,
+        order_id_list: list[str],
+        payment_method: str = "CREDIT_CARD",
+        user_ip: str = "127.0.0.1",
+        user_agent: str = "alibaba-api/1.0",
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``pay_orders``."""
+        payment_request = {
+            "order_id_list": order_id_list,
+            "payment_method": payment_method,
+            "user_ip": user_ip,
+            "user_agent": user_agent,
+            "accept_language": "en-US,en;q=0.9",
+            "screen_resolution": "1920*1080",
+            "is_pc": True,
+        }
+
+        params = {"param_order_pay_request": json.dumps(payment_request)}
+        response = yield ApiRequest("/alibaba/dropshipping/order/pay", params, "POST")
+
+        value = response.get("value", response)
+        return {
+            "status": value.get("status"),
+            "order_ids": order_id_list,
+            "reason_code": value.get("reason_code"),
+            "reason_message": value.get("reason_message"),
+            "pay_url": value.get("pay_url"),
+            "_raw": response,
+        }
+
+    def get_order_logistics_op(
+        self, trade_id: str, data_select: str = "logistic_order"
+    ) -> Operation[Any]:
+        """Operation for ``get_order_logistics``."""
+        params = {"trade_id": trade_id, "data_select": data_select}
+        response = yield ApiRequest("/order/logistics/query", params)
+
+        return self._to_model(LogisticsQueryValue, response.get("value", response))
+
+    def get_order_tracking_op(self, trade_id: str) -> Operation[dict[str, Any]]:
+        """Operation for ``get_order_tracking``."""
+        response = yield ApiRequest("/order/logistics/tracking/get", {"trade_id": trade_id})
+
+        return {
+            "trade_id": trade_id,
+            "tracking": self._to_model(list[TrackingInfo], response.get("tracking_list", [])),
+            "_raw": response,
+        }
+
+    def get_order_funds_op(
+        self, trade_id: str, data_select: str = "fund_transaction_fee"
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``get_order_funds``."""
+        params = {"e_trade_id": trade_id, "data_select": data_select}
+        response = yield ApiRequest("/alibaba/order/fund/query", params)
+
+        value: dict[str, Any] = response.get("value", response)
+        return value
+
+
+class OrderMethods(OrderOperations, SyncHost):
     """
     Order-related API methods.
 
@@ -11,16 +146,6 @@ class OrderMethods:
     including creating, listing, and paying for orders.
     """
 
-    def _order_request(
-        self,
-        api_path: str,
-        params: dict[str, str] | None = None,
-        method: str = "GET",
-    ) -> dict[str, Any]:
-        if method.upper() == "GET":
-            return self.get(api_path, params)
-        return self.post(api_path, params)
-
     # pylint: disable=too-many-arguments
 
     def list_orders(
@@ -40,35 +165,19 @@ class OrderMethods:
             page_size: Items per page (default: 20)
 
         Returns:
-            Dict with total_count, page, page_size, and orders list
+            Dict with total_count, page, page_size, and orders list. With a
+            typed ``response_mode`` the orders are ``OrderListItem`` models
 
         Example:
             orders = client.list_orders(role="buyer", status="paid")
         """
-        params = {
-            "role": role,
-            "start_page": str(start_page),
-            "page_size": str(page_size),
-        }
-        if status:
-            params["status"] = status
-
-        response = self._order_request("/alibaba/order/list", params)
-        value = response.get("value", {})
-
-        return {
-            "total_count": value.get("total_count"),
-            "page": start_page,
-            "page_size": page_size,
-            "orders": value.get("order_list", []),
-            "_raw": response,
-        }
+        return self.run(self.list_orders_op(role, status, start_page, page_size))
 
     def get_order(
         self,
         trade_id: str,
         language: str = "en_US",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | OrderDetails:
         """
         Get detailed order information.
 
@@ -77,15 +186,12 @@ class OrderMethods:
             language: Response language (default: "en_US")
 
         Returns:
-            Order details dict
+            Order details dict, or ``OrderDetails`` with a typed ``response_mode``
 
         Example:
             order = client.get_order(trade_id="234193410001028893")
         """
-        params = {"e_trade_id": trade_id, "language": language}
-        response = self._order_request("/alibaba/order/get", params)
-
-        return response.get("value", response)
+        return self.run(self.get_order_op(trade_id, language))
 
     def create_order(
         self,
@@ -125,24 +231,9 @@ class OrderMethods:
                 }
             )
         """
-        import json
-
-        params = {
-            "channel_refer_id": channel_refer_id,
-            "product_list": json.dumps(product_list),
-            "logistics_detail": json.dumps(logistics_detail),
-        }
-        if remark:
-            params["remark"] = remark
-
-        response = self._order_request("/buynow/order/create", params, method="POST")
-        value = response.get("value", response)
-
-        return {
-            "trade_id": value.get("trade_id") or response.get("trade_id"),
-            "pay_url": value.get("pay_url") or response.get("pay_url"),
-            "_raw": response,
-        }
+        return self.run(
+            self.create_order_op(channel_refer_id, product_list, logistics_detail, remark)
+        )
 
     def pay_orders(
         self,
@@ -170,36 +261,13 @@ class OrderMethods:
                 user_ip="192.168.1.1",
             )
         """
-        import json
-
-        payment_request = {
-            "order_id_list": order_id_list,
-            "payment_method": payment_method,
-            "user_ip": user_ip,
-            "user_agent": user_agent,
-            "accept_language": "en-US,en;q=0.9",
-            "screen_resolution": "1920*1080",
-            "is_pc": True,
-        }
-
-        params = {"param_order_pay_request": json.dumps(payment_request)}
-        response = self._order_request("/alibaba/dropshipping/order/pay", params, method="POST")
-
-        value = response.get("value", response)
-        return {
-            "status": value.get("status"),
-            "order_ids": order_id_list,
-            "reason_code": value.get("reason_code"),
-            "reason_message": value.get("reason_message"),
-            "pay_url": value.get("pay_url"),
-            "_raw": response,
-        }
+        return self.run(self.pay_orders_op(order_id_list, payment_method, user_ip, user_agent))
 
     def get_order_logistics(
         self,
         trade_id: str,
         data_select: str = "logistic_order",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | LogisticsQueryValue:
         """
         Get order logistics status and tracking number.
 
@@ -208,15 +276,13 @@ class OrderMethods:
             data_select: Data selection (default: "logistic_order")
 
         Returns:
-            Logistics information dict
+            Logistics information dict, or ``LogisticsQueryValue`` with a typed
+            ``response_mode``
 
         Example:
             logistics = client.get_order_logistics(trade_id="234193410001028893")
         """
-        params = {"trade_id": trade_id, "data_select": data_select}
-        response = self._order_request("/order/logistics/query", params)
-
-        return response.get("value", response)
+        return self.run(self.get_order_logistics_op(trade_id, data_select))
 
     def get_order_tracking(self, trade_id: str) -> dict[str, Any]:
         """
@@ -226,18 +292,13 @@ class OrderMethods:
             trade_id: Alibaba order ID
 
         Returns:
-            Dict with trade_id and tracking list
+            Dict with trade_id and tracking list. With a typed ``response_mode``
+            the tracking entries are ``TrackingInfo`` models
 
         Example:
             tracking = client.get_order_tracking(trade_id="234193410001028893")
         """
-        response = self._order_request("/order/logistics/tracking/get", {"trade_id": trade_id})
-
-        return {
-            "trade_id": trade_id,
-            "tracking": response.get("tracking_list", []),
-            "_raw": response,
-        }
+        return self.run(self.get_order_tracking_op(trade_id))
 
     def get_order_funds(
         self,
@@ -257,7 +318,64 @@ class OrderMethods:
         Example:
             funds = client.get_order_funds(trade_id="234193410001028893")
         """
-        params = {"e_trade_id": trade_id, "data_select": data_select}
-        response = self._order_request("/alibaba/order/fund/query", params)
+        return self.run(self.get_order_funds_op(trade_id, data_select))
+
 
-        return response.get("value", response)
+class AsyncOrderMethods(OrderOperations, AsyncHost):
+    """Async order methods for ``AsyncAlibabaClient``; see ``OrderMethods``."""
+
+    async def list_orders(
+        self,
+        role: str = "buyer",
+        status: str | None = None,
+        start_page: int = 0,
+        page_size: int = 20,
+    ) -> dict[str, Any]:
+        """List orders with optional filtering. See ``OrderMethods.list_orders``."""
+        return await self.run(self.list_orders_op(role, status, start_page, page_size))
+
+    async def get_order(
+        self, trade_id: str, language: str = "en_US"
+    ) -> dict[str, Any] | OrderDetails:
+        """Get detailed order information. See ``OrderMethods.get_order``."""
+        return await self.run(self.get_order_op(trade_id, language))
+
+    async def create_order(
+        self,
+        channel_refer_id: str,
+        product_list: list[dict[str, Any]],
+        logistics_detail: dict[str, Any],
+        remark: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a BuyNow dropshipping order. See ``OrderMethods.create_order``."""
+        return await self.run(
+            self.create_order_op(channel_refer_id, product_list, logistics_detail, remark)
+        )
+
+    async def pay_orders(
+        self,
+        order_id_list: list[str],
+        payment_method: str = "CREDIT_CARD",
+        user_ip: str = "127.0.0.1",
+        user_agent: str = "alibaba-api/1.0",
+    ) -> dict[str, Any]:
+        """Pay for one or more orders. See ``OrderMethods.pay_orders``."""
+        return await self.run(
+            self.pay_orders_op(order_id_list, payment_method, user_ip, user_agent)
+        )
+
+    async def get_order_logistics(
+        self, trade_id: str, data_select: str = "logistic_order"
+    ) -> dict[str, Any] | LogisticsQueryValue:
+        """Get order logistics status. See ``OrderMethods.get_order_logistics``."""
+        return await self.run(self.get_order_logistics_op(trade_id, data_select))
+
+    async def get_order_tracking(self, trade_id: str) -> dict[str, Any]:
+        """Get tracking events for an order. See ``OrderMethods.get_order_tracking``."""
+        return await self.run(self.get_order_tracking_op(trade_id))
+
+    async def get_order_funds(
+        self, trade_id: str, data_select: str = "fund_transaction_fee"
+    ) -> dict[str, Any]:
+        """Get payment and fund details. See ``OrderMethods.get_order_funds``."""
+        return await self.run(self.get_order_funds_op(trade_id, data_select))
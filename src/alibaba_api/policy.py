@@ -0,0 +1,166 @@
+"""
+What each API error code means for the caller.
+
+``config.ERROR_MESSAGES`` explains a code; ``ErrorPolicies`` says what to do
+about it. Every code maps to an ``ErrorPolicy`` with one of five classes:
+
+- ``"retryable"``: transient; the same request may succeed if repeated
+- ``"permanent"``: repeating the request cannot help
+- ``"fallback_dispatch"``: the product does not ship from the requested
+  dispatch location; retry from another one (``dispatch_locations`` lists
+  where to try, best first, when the code says)
+- ``"auth"``: credentials are missing, invalid or expired; every call made
+  with them will fail the same way
+- ``"quota"``: the app is being rate limited
+
+``scope`` says how far a permanent failure reaches, so callers can skip
+calls that are bound to fail: ``"product"`` (the product is offline, for
+any request), ``"destination"`` (the product cannot ship to that country,
+from any location) or ``"dispatch_location"``.
+
+``AlibabaClient`` classifies every ``AlibabaError`` it raises (see
+``AlibabaError.error_class``) and retries retryable GET requests up to
+``Config.max_retries`` times. ``calculate_freight`` and
+``calculate_freight_advanced`` use the policies to pick fallback dispatch
+locations, and ``search_products`` stops early on auth and quota errors.
+
+Example:
+    policies = ErrorPolicies()
+    policies.register("130999", ErrorPolicy("permanent", scope="product"))
+    client = AlibabaClient(config, error_policies=policies)
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from alibaba_api.exceptions import (
+    AlibabaAPIError,
+    AlibabaDeadlineError,
+    AlibabaError,
+    AlibabaNetworkError,
+)
+
+ErrorClass = Literal["retryable", "permanent", "fallback_dispatch", "auth", "quota"]
+ErrorScope = Literal["product", "destination", "dispatch_location"]
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorPolicy:
+    """How to react to one error code."""
+
+    error_class: ErrorClass
+    scope: ErrorScope | None = None
+    dispatch_locations: tuple[str, ...] = ()
+
+
+RETRYABLE = ErrorPolicy("retryable")
+PERMANENT = ErrorPolicy("permanent")
+AUTH = ErrorPolicy("auth")
+QUOTA = ErrorPolicy("quota")
+
+DEFAULT_POLICIES: dict[str, ErrorPolicy] = {
+    # Wrong dispatch location for this product
+    "10010": ErrorPolicy("fallback_dispatch", scope="dispatch_location"),
+    "10012": ErrorPolicy("fallback_dispatch", scope="dispatch_location"),
+    "130608": ErrorPolicy(
+        "fallback_dispatch", scope="dispatch_location", dispatch_locations=("MX",)
+    ),
+    # Product offline
+    "130106": ErrorPolicy("permanent", scope="product"),
+    # Product cannot ship to the destination country
+    "120019": ErrorPolicy("permanent", scope="destination"),
+    "4015": ErrorPolicy("permanent", scope="destination"),
+    # Credentials
+    "110001": AUTH,
+    "InvalidAppKey": AUTH,
+    "IncompleteSignature": AUTH,
+    "IllegalAccessToken": AUTH,
+    "MissingAccessToken": AUTH,
+    "IllegalRefreshToken": AUTH,
+    "InvalidCode": AUTH,
+    # Rate limiting
+    "ApiCallLimit": QUOTA,
+    # Transient server-side failures
+    "ServiceUnavailable": RETRYABLE,
+    "InternalError": RETRYABLE,
+}
+
+
+class ErrorPolicies:
+    """
+    Registry mapping error codes to ``ErrorPolicy``.
+
+    Codes not in the registry are permanent. Errors raised without an API
+    code are classified from the HTTP status: timeouts, connection failures
+    and 5xx are retryable, 429 is quota, 401/403 are auth, and other 4xx
+    are permanent. An expired deadline is permanent: the same call with the
+    same deadline cannot succeed.
+
+    Args:
+        policies: Code → policy; defaults to ``DEFAULT_POLICIES``
+    """
+
+    def __init__(self, policies: Mapping[str, ErrorPolicy] | None = None) -> None:
+        self._policies = dict(DEFAULT_POLICIES if policies is None else policies)
+
+    def register(self, code: str, policy: ErrorPolicy) -> None:
+        """Add or replace the policy for ``code``."""
+        self._policies[code] = policy
+
+    def classify(self, code: str | None, sub_code: str | None = None) -> ErrorPolicy:
+        """Policy for an API error code; ``sub_code`` wins when it is registered."""
+        if sub_code is not None and sub_code in self._policies:
+            return self._policies[sub_code]
+        return self._policies.get(code or "", PERMANENT)
+
+    def for_error(self, error: BaseException) -> ErrorPolicy:
+        """Policy for an exception raised by ``AlibabaClient``."""
+        if isinstance(error, AlibabaAPIError):
+            return self.classify(error.code, error.sub_code)
+        if isinstance(error, AlibabaDeadlineError):
+            return PERMANENT
+        if isinstance(error, AlibabaNetworkError):
+            status = error.status_code
+            if status is None or status >= 500:
+                return RETRYABLE
+            if status == 429:
+                return QUOTA
+            if status in (401, 403):
+                return AUTH
+            return PERMANENT
+        if isinstance(error, AlibabaError):
+            return self.classify(error.code)
+        return PERMANENT
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._policies
+
+    def __getitem__(self, code: str) -> ErrorPolicy:
+        return self._policies[code]
+
+
+def fallback_locations(
+    policy: ErrorPolicy, remaining: Sequence[str], tried: Iterable[str] = ()
+) -> list[str]:
+    """
+    Reorder the dispatch locations still to try after a freight error.
+
+    Locations the policy names come first, then ``remaining`` in order;
+    ``tried`` locations are dropped. Unless the error is
+    ``fallback_dispatch``, no other location can succeed and the result is empty.
+    """
+    if policy.error_class != "fallback_dispatch":
+        return []
+    skip = set(tried)
+    ordered = dict.fromkeys([*policy.dispatch_locations, *remaining])
+    return [location for location in ordered if location not in skip]
+
+
+def error_key(error: Exception) -> str:
+    """Label an error for reports: its API code, HTTP status or class name."""
+    if isinstance(error, AlibabaError) and error.code:
+        return error.code
+    if isinstance(error, AlibabaNetworkError) and error.status_code is not None:
+        return f"HTTP {error.status_code}"
+    return type(error).__name__
@@ -0,0 +1,494 @@
+"""
+Landed-cost evaluation over whole vectors of order quantities.
+
+A SKU's ladder tiers compile once into a ``LadderTable`` of integer minor
+units. ``landed_cost`` then prices every quantity of interest in one call:
+the tier lookup is a binary search and the totals are integer arithmetic,
+done with NumPy when it is installed (``pip install alibaba-api[numpy]``)
+and in pure Python otherwise. Both backends give identical results.
+
+Freight quotes from ``calculate_freight`` cover one quantity each. Quotes
+for the same carrier at a few quantities become a ``FreightRate`` that
+interpolates between them, so freight can be added to every point of the
+curve. With several carriers, each quantity uses the cheapest one.
+
+Example:
+    product = client.get_product("1600124642247")
+    sku = product["skus"][0]
+    quotes = {
+        qty: client.calculate_freight(product["product_id"], qty, "US")["options"]
+        for qty in (10, 500)
+    }
+    curve = landed_cost(
+        LadderTable.from_sku(sku), range(10, 1001), freight=freight_rates(quotes)
+    )
+    curve.break_evens()    # e.g. [BreakEven(quantity=83, order_quantity=100)]
+    curve.break_even(Money.parse("59.99", "USD"))
+"""
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import pairwise
+from typing import Any, Literal, NamedTuple
+
+from alibaba_api.models.money import Money, currency_exponent, parse_minor
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None  # type: ignore[assignment]
+
+HAS_NUMPY = np is not None
+
+Backend = Literal["auto", "numpy", "python"]
+
+
+def field_value(item: Any, name: str) -> Any:
+    """Read ``name`` from an API dict or a pydantic model."""
+    if isinstance(item, Mapping):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _div_round(numerator: Any, denominator: Any) -> Any:
+    """Integer division rounding half up; works on ints and int arrays alike."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+class LadderTable:
+    """
+    One SKU's ladder tiers as sorted integer columns.
+
+    A quantity is priced by the tier with the greatest ``min_quantity`` not
+    above it, so quantities past the last tier keep its price, as the API
+    does. Quantities below the first tier are below the MOQ and not orderable.
+
+    Args:
+        min_quantities: Lower bound of each tier, ascending
+        prices: Unit price of each tier in minor units
+        currency: ISO 4217 currency code
+    """
+
+    __slots__ = ("min_quantities", "prices", "currency", "_arrays")
+
+    def __init__(self, min_quantities: Sequence[int], prices: Sequence[int], currency: str) -> None:
+        if not min_quantities or len(min_quantities) != len(prices):
+            raise ValueError("A ladder needs one price per tier and at least one tier")
+        if any(low >= high for low, high in pairwise(min_quantities)):
+            raise ValueError("Tier minimum quantities must be strictly ascending")
+        self.min_quantities = tuple(min_quantities)
+        self.prices = tuple(prices)
+        self.currency = currency
+        self._arrays: Any = None
+
+    @classmethod
+    def from_tiers(cls, tiers: Iterable[Any]) -> "LadderTable":
+        """
+        Compile ``ladder_price`` tiers, as API dicts or ``LadderPrice`` models.
+
+        Raises:
+            ValueError: If there are no tiers or they mix currencies
+        """
+        rows = []
+        currencies = set()
+        for tier in tiers:
+            currency = field_value(tier, "currency")
+            currencies.add(currency)
+            price = parse_minor(str(field_value(tier, "price")), currency_exponent(currency))
+            rows.append((int(field_value(tier, "min_quantity")), price))
+        if len(currencies) != 1:
+            raise ValueError(f"Ladder tiers must share one currency, got {sorted(currencies)}")
+        rows.sort()
+        return cls([low for low, _ in rows], [price for _, price in rows], currencies.pop())
+
+    @classmethod
+    def from_sku(cls, sku: Any) -> "LadderTable":
+        """Compile the ladder of one SKU, as an API dict or ``Sku`` model."""
+        return cls.from_tiers(field_value(sku, "ladder_price") or ())
+
+    @classmethod
+    def from_product(cls, product: Any) -> dict[str, "LadderTable"]:
+        """Compile every priced SKU of a product, keyed by ``sku_id``."""
+        return {
+            str(field_value(sku, "sku_id")): cls.from_sku(sku)
+            for sku in field_value(product, "skus") or ()
+            if field_value(sku, "ladder_price")
+        }
+
+    @property
+    def moq(self) -> int:
+        """Smallest orderable quantity."""
+        return self.min_quantities[0]
+
+    def unit_price(self, quantity: int) -> Money:
+        """
+        Unit price for ``quantity``.
+
+        Raises:
+            ValueError: If ``quantity`` is below the MOQ
+        """
+        index = bisect_right(self.min_quantities, quantity) - 1
+        if index < 0:
+            raise ValueError(f"Quantity {quantity} is below the MOQ of {self.moq}")
+        return Money(self.prices[index], self.currency)
+
+    def numpy_arrays(self) -> Any:
+        """``(min_quantities, prices)`` as int64 arrays, built on first use."""
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self.min_quantities, dtype=np.int64),
+                np.array(self.prices, dtype=np.int64),
+            )
+        return self._arrays
+
+    def __repr__(self) -> str:
+        return f"LadderTable({len(self.prices)} tiers, moq={self.moq}, {self.currency!r})"
+
+
+class FreightRate:
+    """
+    Freight cost as a function of quantity, from quotes at sample quantities.
+
+    Between quoted quantities the fee is interpolated linearly; beyond them
+    the nearest segment is extended (never below zero). A single quote
+    gives a flat fee.
+
+    Args:
+        quotes: ``(quantity, fee in minor units)`` pairs
+        currency: ISO 4217 currency code
+        carrier: Label for the carrier, e.g. its ``vendor_code``
+    """
+
+    __slots__ = ("quantities", "fees", "currency", "carrier")
+
+    def __init__(
+        self, quotes: Iterable[tuple[int, int]], currency: str, carrier: str | None = None
+    ) -> None:
+        points = dict(sorted(quotes))
+        if not points:
+            raise ValueError("A freight rate needs at least one quote")
+        self.quantities = tuple(points)
+        self.fees = tuple(points.values())
+        self.currency = currency
+        self.carrier = carrier
+
+    @classmethod
+    def flat(cls, fee: Money, carrier: str | None = None) -> "FreightRate":
+        """The same fee for any quantity."""
+        return cls([(1, fee.minor)], fee.currency, carrier)
+
+    def fee(self, quantity: int) -> Money:
+        """Freight for ``quantity``."""
+        return Money(self._fee_minor(quantity), self.currency)
+
+    def _fee_minor(self, quantity: int) -> int:
+        xs, ys = self.quantities, self.fees
+        if len(xs) == 1:
+            return ys[0]
+        seg = min(max(bisect_right(xs, quantity) - 1, 0), len(xs) - 2)
+        x0, x1, y0 = xs[seg], xs[seg + 1], ys[seg]
+        fee: int = y0 + _div_round((ys[seg + 1] - y0) * (quantity - x0), x1 - x0)
+        return max(fee, 0)
+
+    def _fee_numpy(self, quantities: Any) -> Any:
+        ys = np.array(self.fees, dtype=np.int64)
+        if len(ys) == 1:
+            return np.full(len(quantities), ys[0], dtype=np.int64)
+        xs = np.array(self.quantities, dtype=np.int64)
+        seg = np.clip(np.searchsorted(xs, quantities, side="right") - 1, 0, len(xs) - 2)
+        x0, y0 = xs[seg], ys[seg]
+        fee = y0 + _div_round((ys[seg + 1] - y0) * (quantities - x0), xs[seg + 1] - x0)
+        return np.maximum(fee, 0)
+
+    def __repr__(self) -> str:
+        return f"FreightRate({self.carrier!r}, {len(self.fees)} quotes, {self.currency!r})"
+
+
+def freight_rates(quotes: Mapping[int, Iterable[Any]]) -> dict[str, FreightRate]:
+    """
+    Group freight options quoted at several quantities into per-carrier rates.
+
+    Args:
+        quotes: Quantity → the ``options`` that ``calculate_freight`` returned
+            for it, as dicts or ``ShippingOption`` models. Options without a fee
+            are skipped
+
+    Returns:
+        ``FreightRate`` per carrier, keyed by ``vendor_code`` (or
+        ``shipping_type`` when there is no vendor code)
+
+    Raises:
+        ValueError: If one carrier is quoted in more than one currency
+    """
+    points: dict[str, list[tuple[int, int]]] = {}
+    currencies: dict[str, str] = {}
+    for quantity, options in quotes.items():
+        for option in options:
+            fee = field_value(option, "fee")
+            if fee is None:
+                continue
+            carrier = field_value(option, "vendor_code") or field_value(option, "shipping_type")
+            currency = field_value(fee, "currency")
+            if currencies.setdefault(carrier, currency) != currency:
+                raise ValueError(
+                    f"Carrier {carrier} quoted in {currencies[carrier]} and {currency}"
+                )
+            amount = parse_minor(str(field_value(fee, "amount")), currency_exponent(currency))
+            points.setdefault(carrier, []).append((int(quantity), amount))
+    return {
+        carrier: FreightRate(pts, currencies[carrier], carrier) for carrier, pts in points.items()
+    }
+
+
+class BreakEven(NamedTuple):
+    """From ``quantity`` upward, ordering ``order_quantity`` costs no more in total."""
+
+    quantity: int
+    order_quantity: int
+
+
+class CostCurve:
+    """
+    Landed cost at each evaluated quantity.
+
+    Columns are int64 ``numpy.ndarray``s with the NumPy backend and lists
+    otherwise; amounts are in minor units of ``currency``. For quantities
+    below the MOQ, ``orderable`` is false and the columns use the first tier
+    price.
+
+    Attributes:
+        quantities: Evaluated quantities
+        unit_price: Ladder unit price per quantity
+        goods: ``unit_price * quantities``
+        freight: Freight per quantity (zero without freight)
+        total: ``goods + freight``
+        orderable: Whether each quantity meets the MOQ
+        carrier_index: Index into ``carriers`` of the carrier used, or None
+        carriers: Carrier labels, in the order they were given
+        currency: ISO 4217 currency code
+    """
+
+    __slots__ = (
+        "quantities",
+        "unit_price",
+        "goods",
+        "freight",
+        "total",
+        "orderable",
+        "carrier_index",
+        "carriers",
+        "currency",
+    )
+
+    def __init__(
+        self,
+        quantities: Any,
+        unit_price: Any,
+        freight: Any,
+        orderable: Any,
+        carrier_index: Any,
+        carriers: tuple[str | None, ...],
+        currency: str,
+    ) -> None:
+        self.quantities = quantities
+        self.unit_price = unit_price
+        self.freight = freight
+        self.orderable = orderable
+        self.carrier_index = carrier_index
+        self.carriers = carriers
+        self.currency = currency
+        if isinstance(quantities, list):
+            self.goods = [u * q for u, q in zip(unit_price, quantities, strict=True)]
+            self.total = [g + f for g, f in zip(self.goods, freight, strict=True)]
+        else:
+            self.goods = unit_price * quantities
+            self.total = self.goods + freight
+
+    def __len__(self) -> int:
+        return len(self.quantities)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """One evaluated quantity as ``Money`` values."""
+        currency = self.currency
+        carrier = None
+        if self.carrier_index is not None:
+            carrier = self.carriers[int(self.carrier_index[index])]
+        return {
+            "quantity": int(self.quantities[index]),
+            "orderable": bool(self.orderable[index]),
+            "unit_price": Money(int(self.unit_price[index]), currency),
+            "goods": Money(int(self.goods[index]), currency),
+            "freight": Money(int(self.freight[index]), currency),
+            "total": Money(int(self.total[index]), currency),
+            "carrier": carrier,
+        }
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        return (self.row(index) for index in range(len(self)))
+
+    def break_even(self, price: Money) -> int | None:
+        """
+        Smallest orderable quantity at which selling at ``price`` covers landed cost.
+
+        Raises:
+            ValueError: If ``price`` is in another currency
+        """
+        if price.currency != self.currency:
+            raise ValueError(f"Currency mismatch: {self.currency} and {price.currency}")
+        if isinstance(self.quantities, list):
+            for qty, total, ok in zip(self.quantities, self.total, self.orderable, strict=True):
+                if ok and price.minor * qty >= total:
+                    return int(qty)
+            return None
+        hits = np.flatnonzero(self.orderable & (price.minor * self.quantities >= self.total))
+        return int(self.quantities[hits[0]]) if len(hits) else None
+
+    def break_evens(self) -> list[BreakEven]:
+        """
+        Quantities from which a larger order costs no more in total.
+
+        Typically just below a cheaper ladder tier or freight step. Only
+        evaluated quantities are considered, so evaluate a contiguous
+        ``range`` for exact answers. Quantities must be ascending.
+
+        Returns:
+            One ``BreakEven`` per run of quantities that should be rounded up
+            to the same larger order
+        """
+        if isinstance(self.quantities, list):
+            pairs = [
+                (qty, total)
+                for qty, total, ok in zip(self.quantities, self.total, self.orderable, strict=True)
+                if ok
+            ]
+            order_for = []
+            best_qty, best_total = None, None
+            for qty, total in reversed(pairs):
+                if best_total is None or total < best_total:
+                    best_qty, best_total = qty, total
+                order_for.append(best_qty)
+            order_for.reverse()
+            quantities = [qty for qty, _ in pairs]
+        else:
+            mask = self.orderable
+            quantities_np = self.quantities[mask]
+            totals = self.total[mask][::-1]
+            if not len(totals):
+                return []
+            running = np.minimum.accumulate(totals)
+            improved = np.empty(len(totals), dtype=bool)
+            improved[0] = True
+            improved[1:] = totals[1:] < running[:-1]
+            source = np.maximum.accumulate(np.where(improved, np.arange(len(totals)), 0))
+            order_for = quantities_np[::-1][source][::-1].tolist()
+            quantities = quantities_np.tolist()
+
+        result = []
+        previous = None
+        for qty, target in zip(quantities, order_for, strict=True):
+            if target != qty and target != previous:
+                result.append(BreakEven(int(qty), int(target)))
+            previous = target if target != qty else None
+        return result
+
+    def __repr__(self) -> str:
+        return f"CostCurve({len(self)} quantities, {self.currency!r})"
+
+
+def landed_cost(
+    ladder: LadderTable,
+    quantities: Iterable[int],
+    freight: FreightRate | Mapping[str, FreightRate] | None = None,
+    *,
+    backend: Backend = "auto",
+) -> CostCurve:
+    """
+    Price every quantity in ``quantities`` at once.
+
+    Args:
+        ladder: Compiled ladder of one SKU
+        quantities: Quantities to evaluate, e.g. ``range(moq, 1001)``
+        freight: One rate, or rates per carrier (each quantity then uses the
+            cheapest carrier, the first given on ties)
+        backend: ``"numpy"``, ``"python"``, or ``"auto"`` to use NumPy when installed
+
+    Returns:
+        CostCurve
+
+    Raises:
+        ValueError: If freight is quoted in a different currency than the ladder
+        ImportError: If ``backend="numpy"`` and NumPy is not installed
+    """
+    if freight is None:
+        rates: list[FreightRate] = []
+    elif isinstance(freight, FreightRate):
+        rates = [freight]
+    else:
+        rates = list(freight.values())
+    for rate in rates:
+        if rate.currency != ladder.currency:
+            raise ValueError(
+                f"Freight for {rate.carrier} is in {rate.currency}, ladder in {ladder.currency}"
+            )
+    carriers = tuple(rate.carrier for rate in rates)
+
+    if backend == "numpy" and not HAS_NUMPY:
+        raise ImportError("backend='numpy' requires NumPy: pip install alibaba-api[numpy]")
+    if backend == "python" or not HAS_NUMPY:
+        return _landed_cost_python(ladder, list(quantities), rates, carriers)
+    return _landed_cost_numpy(ladder, quantities, rates, carriers)
+
+
+def _landed_cost_python(
+    ladder: LadderTable,
+    quantities: list[int],
+    rates: list[FreightRate],
+    carriers: tuple[str | None, ...],
+) -> CostCurve:
+    mins, prices = ladder.min_quantities, ladder.prices
+    indexes = [bisect_right(mins, qty) - 1 for qty in quantities]
+    unit_price = [prices[max(index, 0)] for index in indexes]
+    orderable = [index >= 0 for index in indexes]
+
+    carrier_index: list[int] | None = None
+    if not rates:
+        freight = [0] * len(quantities)
+    elif len(rates) == 1:
+        freight = [rates[0]._fee_minor(qty) for qty in quantities]
+        carrier_index = [0] * len(quantities)
+    else:
+        fees = [[rate._fee_minor(qty) for qty in quantities] for rate in rates]
+        carrier_index = [
+            min(range(len(rates)), key=column.__getitem__) for column in zip(*fees, strict=True)
+        ]
+        freight = [fees[c][i] for i, c in enumerate(carrier_index)]
+    return CostCurve(
+        quantities, unit_price, freight, orderable, carrier_index, carriers, ladder.currency
+    )
+
+
+def _landed_cost_numpy(
+    ladder: LadderTable,
+    quantities: Iterable[int],
+    rates: list[FreightRate],
+    carriers: tuple[str | None, ...],
+) -> CostCurve:
+    if isinstance(quantities, range):
+        qty = np.arange(quantities.start, quantities.stop, quantities.step, dtype=np.int64)
+    elif isinstance(quantities, np.ndarray):
+        qty = quantities.astype(np.int64, copy=False)
+    else:
+        qty = np.fromiter(quantities, dtype=np.int64)
+    mins, prices = ladder.numpy_arrays()
+    index = np.searchsorted(mins, qty, side="right") - 1
+    orderable = index >= 0
+    unit_price = prices[np.maximum(index, 0)]
+
+    carrier_index = None
+    if not rates:
+        freight = np.zeros(len(qty), dtype=np.int64)
+    else:
+        fees = np.stack([rate._fee_numpy(qty) for rate in rates])
+        carrier_index = np.argmin(fees, axis=0)
+        freight = fees[carrier_index, np.arange(len(qty))]
+    return CostCurve(qty, unit_price, freight, orderable, carrier_index, carriers, ladder.currency)
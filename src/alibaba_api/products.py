@@ -3,8 +3,199 @@
 import json
 from typing import Any
 
+from alibaba_api.deadline import Deadline
+from alibaba_api.exceptions import AlibabaDeadlineError, AlibabaError
+from alibaba_api.models.product import InventoryByLocation, ProductDescription
+from alibaba_api.sansio import ApiRequest, AsyncHost, Operation, OperationHost, SyncHost
 
-class ProductMethods:
+
+class ProductOperations(OperationHost):
+    """
+    Sans-IO product operations, shared by the sync and async mixins.
+
+    Each ``*_op`` method returns a generator that yields ``ApiRequest``
+    descriptions and returns the high-level method's result; see
+    ``alibaba_api.sansio``.
+    """
+
+    def list_products_op(
+        self, scene_id: str, page: int = 0, page_size: int = 50
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``list_products``."""
+        query_req = {
+            "scene_id": scene_id,
+            "index": page,
+            "size": min(page_size, 100),
+            "product_type": "common",
+        }
+
+        response = yield ApiRequest(
+            "/eco/buyer/product/check",
+            {"query_req": json.dumps(query_req)},
+        )
+
+        result = response.get("result", {})
+        return {
+            "product_ids": result.get("result_data", []),
+            "total": result.get("result_total"),
+            "page": page,
+            "page_size": page_size,
+            "_raw": response,
+        }
+
+    def get_product_op(self, product_id: str | int, country: str = "US") -> Operation[Any]:
+        """Operation for ``get_product``."""
+        api_path = "/eco/buyer/product/description"
+        self._check_negative_cache(api_path, product_id)
+        query_req = {"product_id": int(product_id), "country": country}
+
+        try:
+            response = yield ApiRequest(api_path, {"query_req": json.dumps(query_req)})
+        except AlibabaError as e:
+            self._remember_failure(e, product_id)
+            raise
+
+        return self._to_model(ProductDescription, response.get("result", {}).get("result_data", {}))
+
+    def get_product_inventory_op(
+        self,
+        product_id: str,
+        sku_id: str | None = None,
+        shipping_from: str | None = None,
+    ) -> Operation[Any]:
+        """Operation for ``get_product_inventory``."""
+        inv_req = {"product_id": product_id}
+        if sku_id:
+            inv_req["sku_id"] = sku_id
+        if shipping_from:
+            inv_req["shipping_from"] = shipping_from
+
+        response = yield ApiRequest(
+            "/eco/buyer/product/inventory",
+            {"inv_req": json.dumps(inv_req)},
+        )
+
+        return self._to_model(
+            list[InventoryByLocation], response.get("result", {}).get("result_data", [])
+        )
+
+    def get_local_products_op(
+        self, country: str, page: int = 0, page_size: int = 50
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``get_local_products``."""
+        req = {
+            "index": page,
+            "size": page_size,
+            "country": country,
+        }
+
+        response = yield ApiRequest(
+            "/eco/buyer/local/product/check",
+            {"req": json.dumps(req)},
+        )
+
+        result = response.get("result", {})
+        return {
+            "product_ids": result.get("result_data", []),
+            "country": country,
+            "_raw": response,
+        }
+
+    def get_crossborder_products_op(
+        self, page: int = 0, page_size: int = 50
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``get_crossborder_products``."""
+        param0 = {
+            "index": page,
+            "size": page_size,
+        }
+
+        response = yield ApiRequest(
+            "/eco/buyer/crossborder/product/check",
+            {"param0": json.dumps(param0)},
+        )
+
+        result = response.get("result", {})
+        return {
+            "product_ids": result.get("result_data", []),
+            "_raw": response,
+        }
+
+    def search_products_op(
+        self,
+        scene_id: str = "906124611",
+        limit: int = 5,
+        *,
+        deadline: Deadline | float | None = None,
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``search_products``."""
+        # Step 1: Get product IDs
+        query_req = {
+            "scene_id": scene_id,
+            "page": 0,
+            "page_size": limit,
+            "size": limit,
+            "index": 0,
+            "product_type": "common",
+        }
+
+        deadline = Deadline.coerce(deadline)
+        response = yield ApiRequest(
+            "/eco/buyer/product/check",
+            {"query_req": json.dumps(query_req)},
+            deadline=deadline,
+        )
+
+        result = response.get("result", {})
+        product_ids = result.get("result_data", [])
+
+        if not product_ids:
+            return {
+                "scene_id": scene_id,
+                "total_found": 0,
+                "successfully_loaded": 0,
+                "deadline_exceeded": False,
+                "products": [],
+            }
+
+        # Step 2: Get details for each product
+        api_path = "/eco/buyer/product/description"
+        products = []
+        deadline_exceeded = False
+        for product_id in product_ids:
+            try:
+                self._check_negative_cache(api_path, product_id)
+            except AlibabaError:
+                continue
+            try:
+                response = yield ApiRequest(
+                    api_path,
+                    {"query_req": json.dumps({"product_id": int(product_id), "country": "US"})},
+                    deadline=deadline,
+                )
+            except AlibabaDeadlineError:
+                deadline_exceeded = True
+                break
+            except AlibabaError as e:
+                # Skip products that fail to load, unless every later call would fail too
+                self._remember_failure(e, product_id)
+                if self.error_policies.for_error(e).error_class in ("auth", "quota"):
+                    raise
+                continue
+            product_data = response.get("result", {}).get("result_data", {})
+            if product_data:
+                products.append(product_data)
+
+        return {
+            "scene_id": scene_id,
+            "total_found": len(product_ids),
+            "successfully_loaded": len(products),
+            "deadline_exceeded": deadline_exceeded,
+            "products": self._to_model(list[ProductDescription], products),
+        }
+
+
+class ProductMethods(ProductOperations, SyncHost):
     """
     Product-related API methods.
 
@@ -12,13 +203,6 @@ class ProductMethods:
     product information from the Alibaba marketplace.
     """
 
-    def _product_request(
-        self,
-        api_path: str,
-        params: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
-        return self.get(api_path, params)
-
     def list_products(
         self,
         scene_id: str,
@@ -47,32 +231,13 @@ class ProductMethods:
         Example:
             products = client.list_products(scene_id="906124611", page=0, page_size=10)
         """
-        query_req = {
-            "scene_id": scene_id,
-            "index": page,
-            "size": min(page_size, 100),
-            "product_type": "common",
-        }
-
-        response = self._product_request(
-            "/eco/buyer/product/check",
-            {"query_req": json.dumps(query_req)},
-        )
-
-        result = response.get("result", {})
-        return {
-            "product_ids": result.get("result_data", []),
-            "total": result.get("result_total"),
-            "page": page,
-            "page_size": page_size,
-            "_raw": response,
-        }
+        return self.run(self.list_products_op(scene_id, page, page_size))
 
     def get_product(
         self,
         product_id: str | int,
         country: str = "US",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | ProductDescription:
         """
         Get detailed product information.
 
@@ -81,26 +246,24 @@ class ProductMethods:
             country: Country code for product details (default: "US")
 
         Returns:
-            Product details dict
+            Product details dict, or ``ProductDescription`` with a typed
+            ``response_mode``
+
+        Raises:
+            AlibabaAPIError: 130106 if the product is offline; repeated from
+                the client's negative cache, without a request, until it expires
 
         Example:
             product = client.get_product(product_id="1601206892606", country="US")
         """
-        query_req = {"product_id": int(product_id), "country": country}
-
-        response = self._product_request(
-            "/eco/buyer/product/description",
-            {"query_req": json.dumps(query_req)},
-        )
-
-        return response.get("result", {}).get("result_data", {})
+        return self.run(self.get_product_op(product_id, country))
 
     def get_product_inventory(
         self,
         product_id: str,
         sku_id: str | None = None,
         shipping_from: str | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> list[dict[str, Any]] | list[InventoryByLocation]:
         """
         Check product inventory levels.
 
@@ -110,7 +273,8 @@ class ProductMethods:
             shipping_from: Origin country code (CN, US, MX)
 
         Returns:
-            List of inventory items
+            List of inventory items grouped by shipping location, as
+            ``InventoryByLocation`` models with a typed ``response_mode``
 
         Example:
             inventory = client.get_product_inventory(
@@ -118,18 +282,7 @@ class ProductMethods:
                 shipping_from="CN"
             )
         """
-        inv_req = {"product_id": product_id}
-        if sku_id:
-            inv_req["sku_id"] = sku_id
-        if shipping_from:
-            inv_req["shipping_from"] = shipping_from
-
-        response = self._product_request(
-            "/eco/buyer/product/inventory",
-            {"inv_req": json.dumps(inv_req)},
-        )
-
-        return response.get("result", {}).get("result_data", [])
+        return self.run(self.get_product_inventory_op(product_id, sku_id, shipping_from))
 
     def get_local_products(
         self,
@@ -151,23 +304,7 @@ class ProductMethods:
         Example:
             products = client.get_local_products(country="US", page=0, page_size=10)
         """
-        req = {
-            "index": page,
-            "size": page_size,
-            "country": country,
-        }
-
-        response = self._product_request(
-            "/eco/buyer/local/product/check",
-            {"req": json.dumps(req)},
-        )
-
-        result = response.get("result", {})
-        return {
-            "product_ids": result.get("result_data", []),
-            "country": country,
-            "_raw": response,
-        }
+        return self.run(self.get_local_products_op(country, page, page_size))
 
     def get_crossborder_products(
         self,
@@ -187,26 +324,14 @@ class ProductMethods:
         Example:
             products = client.get_crossborder_products(page=0, page_size=10)
         """
-        param0 = {
-            "index": page,
-            "size": page_size,
-        }
-
-        response = self._product_request(
-            "/eco/buyer/crossborder/product/check",
-            {"param0": json.dumps(param0)},
-        )
-
-        result = response.get("result", {})
-        return {
-            "product_ids": result.get("result_data", []),
-            "_raw": response,
-        }
+        return self.run(self.get_crossborder_products_op(page, page_size))
 
     def search_products(
         self,
         scene_id: str = "906124611",
         limit: int = 5,
+        *,
+        deadline: Deadline | float | None = None,
     ) -> dict[str, Any]:
         """
         Search for products and get full details.
@@ -217,61 +342,72 @@ class ProductMethods:
         Args:
             scene_id: Scene ID for product list (default: "906124611")
             limit: Number of products to fetch details for (default: 5)
+            deadline: Time budget in seconds (or a ``Deadline``) for the whole
+                search. When it runs out the products loaded so far are returned
 
         Returns:
-            Dict with scene_id, total_found, successfully_loaded, and products list
+            Dict with scene_id, total_found, successfully_loaded,
+            deadline_exceeded, and products list. With a typed
+            ``response_mode`` the products are ``ProductDescription`` models
+
+        Raises:
+            AlibabaError: On auth and quota errors, which would fail every
+                remaining product too; other per-product errors are skipped
+            AlibabaDeadlineError: If the deadline runs out before the product
+                list is fetched
 
         Example:
             results = client.search_products(scene_id="906124611", limit=3)
         """
-        # Step 1: Get product IDs
-        query_req = {
-            "scene_id": scene_id,
-            "page": 0,
-            "page_size": limit,
-            "size": limit,
-            "index": 0,
-            "product_type": "common",
-        }
+        return self.run(self.search_products_op(scene_id, limit, deadline=deadline))
 
-        response = self._product_request(
-            "/eco/buyer/product/check",
-            {"query_req": json.dumps(query_req)},
-        )
 
-        result = response.get("result", {})
-        product_ids = result.get("result_data", [])
+class AsyncProductMethods(ProductOperations, AsyncHost):
+    """Async product methods for ``AsyncAlibabaClient``; see ``ProductMethods``."""
 
-        if not product_ids:
-            return {
-                "scene_id": scene_id,
-                "total_found": 0,
-                "successfully_loaded": 0,
-                "products": [],
-            }
+    async def list_products(
+        self, scene_id: str, page: int = 0, page_size: int = 50
+    ) -> dict[str, Any]:
+        """Get product list by scene ID. See ``ProductMethods.list_products``."""
+        return await self.run(self.list_products_op(scene_id, page, page_size))
 
-        # Step 2: Get details for each product
-        products = []
-        for product_id in product_ids:
-            try:
-                response = self._product_request(
-                    "/eco/buyer/product/description",
-                    {
-                        "query_req": json.dumps(
-                            {"product_id": int(product_id), "country": "US"}
-                        )
-                    },
-                )
-                product_data = response.get("result", {}).get("result_data", {})
-                if product_data:
-                    products.append(product_data)
-            except Exception:
-                # Skip products that fail to load
-                pass
+    async def get_product(
+        self, product_id: str | int, country: str = "US"
+    ) -> dict[str, Any] | ProductDescription:
+        """Get detailed product information. See ``ProductMethods.get_product``."""
+        return await self.run(self.get_product_op(product_id, country))
 
-        return {
-            "scene_id": scene_id,
-            "total_found": len(product_ids),
-            "successfully_loaded": len(products),
-            "products": products,
-        }
+    async def get_product_inventory(
+        self,
+        product_id: str,
+        sku_id: str | None = None,
+        shipping_from: str | None = None,
+    ) -> list[dict[str, Any]] | list[InventoryByLocation]:
+        """Check product inventory levels. See ``ProductMethods.get_product_inventory``."""
+        return await self.run(self.get_product_inventory_op(product_id, sku_id, shipping_from))
+
+    async def get_local_products(
+        self, country: str, page: int = 0, page_size: int = 50
+    ) -> dict[str, Any]:
+        """Get local warehouse products. See ``ProductMethods.get_local_products``."""
+        return await self.run(self.get_local_products_op(country, page, page_size))
+
+    async def get_crossborder_products(self, page: int = 0, page_size: int = 50) -> dict[str, Any]:
+        """Get cross-border products. See ``ProductMethods.get_crossborder_products``."""
+        return await self.run(self.get_crossborder_products_op(page, page_size))
+
+    async def search_products(
+        self,
+        scene_id: str = "906124611",
+        limit: int = 5,
+        *,
+        deadline: Deadline | float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Search for products and get full details. See ``ProductMethods.search_products``.
+
+        The product descriptions are fetched one after another, as in the
+        sync client; use ``asyncio.gather`` over ``get_product`` to fetch
+        them concurrently.
+        """
+        return await self.run(self.search_products_op(scene_id, limit, deadline=deadline))
@@ -0,0 +1,279 @@
+"""
+Sans-IO core: API operations as pure request descriptions and response handlers.
+
+Every high-level method is written once, as an *operation*: a generator that
+yields ``ApiRequest`` descriptions, receives each parsed response (or has the
+request's error thrown into it) and returns the method's result. Operations
+do no I/O. A driver sends the requests: ``drive`` with a blocking callable,
+``adrive`` with an async one. ``AlibabaClient.run`` and
+``AsyncAlibabaClient.run`` drive operations through the clients' retries,
+middleware and hooks, so the sync and async high-level methods share one
+implementation, and a batch runner or another transport only needs a
+driver.
+
+Signing and parsing are pure too: ``prepare_request`` turns an
+``ApiRequest`` into the URL and signed parameters to send, and
+``parse_response`` turns a status code and body into the response dict or
+an ``AlibabaError``. Together they let the CPU-only part of a call be run,
+tested and benchmarked without a transport.
+
+Example:
+    operation = client.get_product_op("1601206892606")
+    request = next(operation)           # ApiRequest for /eco/buyer/product/description
+    prepared = prepare_request(client.config, request)
+    ...                                 # send prepared.url and prepared.params
+    try:
+        operation.send(parse_response(status_code, body))
+    except StopIteration as done:
+        product = done.value
+"""
+
+import json
+from collections.abc import Awaitable, Callable, Generator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+
+from alibaba_api.config import Config, get_error_message
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.signing import build_signed_params
+
+if TYPE_CHECKING:
+    from alibaba_api.deadline import Deadline
+    from alibaba_api.exceptions import AlibabaError
+    from alibaba_api.policy import ErrorPolicies
+
+# A TypeVar rather than PEP 695 syntax, which needs Python 3.12
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class ApiRequest:
+    """
+    One API call an operation needs made, before signing.
+
+    ``timeout`` and ``deadline`` are passed on to the client's ``request``;
+    composite operations use them to share a deadline between their calls.
+    """
+
+    api_path: str
+    params: dict[str, str]
+    method: Literal["GET", "POST"] = "GET"
+    timeout: float | None = None
+    deadline: "Deadline | None" = None
+
+
+# Yields requests, is sent their parsed responses, returns the result
+Operation = Generator[ApiRequest, dict[str, Any], T]
+
+
+class OperationHost:
+    """
+    What the ``*Operations`` mixins use of the client they are mixed into.
+
+    Declared for the type checker only; ``AlibabaClient`` and
+    ``AsyncAlibabaClient`` provide them at runtime.
+    """
+
+    if TYPE_CHECKING:
+        config: Config
+        error_policies: ErrorPolicies
+
+        def _to_model(self, tp: Any, data: Any) -> Any: ...
+
+        def _check_negative_cache(
+            self, api_path: str, product_id: str | int, country: str | None = None
+        ) -> None: ...
+
+        def _remember_failure(
+            self, error: AlibabaError, product_id: str | int, country: str | None = None
+        ) -> None: ...
+
+        def _sub_timeout(
+            self, api_path: str, deadline: Deadline | None, parts: int
+        ) -> float | None: ...
+
+
+class SyncHost(OperationHost):
+    """An ``OperationHost`` whose ``run`` drives operations to completion."""
+
+    if TYPE_CHECKING:
+
+        def run(self, operation: Operation[T]) -> T: ...
+
+
+class AsyncHost(OperationHost):
+    """An ``OperationHost`` whose ``run`` is awaited."""
+
+    if TYPE_CHECKING:
+
+        async def run(self, operation: Operation[T]) -> T: ...
+
+
+@dataclass(slots=True)
+class PreparedRequest:
+    """A signed request ready for a transport: query parameters for GET, form data for POST."""
+
+    method: Literal["GET", "POST"]
+    url: str
+    params: dict[str, str]
+
+
+def sign_params(
+    config: Config, api_path: str, params: dict[str, str], access_token: str | None = None
+) -> dict[str, str]:
+    """``params`` plus the system parameters and signature for ``api_path``."""
+    return build_signed_params(
+        api_path=api_path,
+        params=params,
+        app_key=config.app_key,
+        app_secret=config.app_secret,
+        access_token=access_token or config.access_token,
+    )
+
+
+def prepare_request(
+    config: Config, request: ApiRequest, access_token: str | None = None
+) -> PreparedRequest:
+    """
+    Sign ``request`` for sending to ``config.base_url``.
+
+    Args:
+        config: Credentials and base URL
+        request: Request yielded by an operation
+        access_token: Override ``config.access_token``
+
+    Returns:
+        Method, full URL and signed parameters
+    """
+    return PreparedRequest(
+        request.method,
+        f"{config.base_url}{request.api_path}",
+        sign_params(config, request.api_path, request.params, access_token),
+    )
+
+
+def parse_response(
+    status_code: int, content: bytes, headers: Mapping[str, str] | None = None
+) -> dict[str, Any]:
+    """
+    Parse an API response body and raise for errors.
+
+    Args:
+        status_code: HTTP status code
+        content: Decoded (decompressed) response body
+        headers: Response headers, for the ``x-request-id`` of HTTP errors
+
+    Returns:
+        The response JSON object; other JSON or text is wrapped as ``{"data": ...}``
+
+    Raises:
+        AlibabaNetworkError: For HTTP errors
+        AlibabaAPIError: For API error responses
+    """
+    try:
+        data: dict[str, Any] | str = json.loads(content)
+    except ValueError:
+        data = content.decode("utf-8", errors="replace")
+
+    if status_code >= 400:
+        text = content.decode("utf-8", errors="replace")
+        request_id = headers.get("x-request-id") if headers is not None else None
+        raise http_error(status_code, data, text, request_id)
+    return api_result(data)
+
+
+def http_error(
+    status_code: int, data: Any, text: str, request_id: str | None = None
+) -> AlibabaNetworkError:
+    """The error for an HTTP error status, with the body's ``message`` if it has one."""
+    return AlibabaNetworkError(
+        data.get("message", text) if isinstance(data, dict) else text,
+        status_code=status_code,
+        request_id=request_id,
+    )
+
+
+def api_result(data: Any) -> dict[str, Any]:
+    """
+    The response dict of a successful HTTP response, checking the API's ``code``.
+
+    Args:
+        data: Parsed JSON body, or the body text if it was not JSON
+
+    Returns:
+        ``data`` itself, or ``{"data": data}`` if it is not a JSON object
+
+    Raises:
+        AlibabaAPIError: If ``code`` is not "0"
+    """
+    if not isinstance(data, dict):
+        return {"data": data}
+
+    # Check for API errors (code != "0")
+    code = str(data.get("code", ""))
+    if code != "0":
+        message = data.get("message", "")
+        sub_code = data.get("sub_code")
+
+        if not message:
+            message = get_error_message(sub_code or code)
+
+        raise AlibabaAPIError(
+            code=code,
+            message=message,
+            request_id=data.get("request_id"),
+            sub_code=sub_code,
+        )
+
+    return data
+
+
+def drive(  # noqa: UP047
+    operation: Operation[T], send: Callable[[ApiRequest], dict[str, Any]]
+) -> T:
+    """
+    Run ``operation`` to completion, answering each request with ``send``.
+
+    Exceptions raised by ``send`` are thrown into the operation, which may
+    handle them (e.g. fall back to another dispatch location) or let them
+    propagate.
+
+    Args:
+        operation: Generator from one of the clients' ``*_op`` methods
+        send: Makes one request and returns the parsed response
+
+    Returns:
+        The operation's result
+    """
+    try:
+        request = next(operation)
+        while True:
+            try:
+                response = send(request)
+            except Exception as e:
+                request = operation.throw(e)
+            else:
+                request = operation.send(response)
+    except StopIteration as done:
+        return cast(T, done.value)
+    finally:
+        operation.close()
+
+
+async def adrive(  # noqa: UP047
+    operation: Operation[T], send: Callable[[ApiRequest], Awaitable[dict[str, Any]]]
+) -> T:
+    """Like ``drive``, awaiting each request sent with an async ``send``."""
+    try:
+        request = next(operation)
+        while True:
+            try:
+                response = await send(request)
+            except Exception as e:
+                request = operation.throw(e)
+            else:
+                request = operation.send(response)
+    except StopIteration as done:
+        return cast(T, done.value)
+    finally:
+        operation.close()
@@ -3,25 +3,28 @@
 import json
 from typing import Any
 
+from alibaba_api.deadline import Deadline
+from alibaba_api.exceptions import AlibabaDeadlineError, AlibabaError
+from alibaba_api.models.shipping import ShippingOption
+from alibaba_api.policy import fallback_locations
+from alibaba_api.sansio import ApiRequest, AsyncHost, Operation, OperationHost, SyncHost
 
-class ShippingMethods:
-    """
-    Shipping-related API methods.
+# Dispatch locations tried in turn when a product does not ship from the first
+DISPATCH_LOCATIONS = ("CN", "US", "MX")
 
-    This mixin class provides methods for calculating shipping costs
-    and freight estimates.
+
+class ShippingOperations(OperationHost):
     """
+    Sans-IO shipping operations, shared by the sync and async mixins.
 
-    def _shipping_request(
-        self,
-        api_path: str,
-        params: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
-        return self.get(api_path, params)
+    Each ``*_op`` method returns a generator that yields ``ApiRequest``
+    descriptions and returns the high-level method's result; see
+    ``alibaba_api.sansio``.
+    """
 
     # pylint: disable=too-many-arguments
 
-    def calculate_freight(
+    def calculate_freight_op(
         self,
         product_id: str,
         quantity: int,
@@ -30,43 +33,28 @@ class ShippingMethods:
         dispatch_location: str = "CN",
         *,
         fallback: bool = True,
-    ) -> dict[str, Any]:
-        """
-        Calculate basic shipping cost for a single product.
-
-        Args:
-            product_id: Alibaba product ID
-            quantity: Number of items
-            destination_country: Destination country code (e.g., "US")
-            zip_code: Destination ZIP code
-            dispatch_location: Origin location (CN, US, MX). Default: "CN"
-            fallback: If True, automatically tries fallback dispatch locations
-                (CN → US → MX) when primary returns no results
+        deadline: Deadline | float | None = None,
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``calculate_freight``."""
+        api_path = "/shipping/freight/calculate"
+        self._check_negative_cache(api_path, product_id, destination_country)
 
-        Returns:
-            Dict with product_id, quantity, destination, dispatch_location,
-            fallback_used, and options list
-
-        Example:
-            shipping = client.calculate_freight(
-                product_id="1600124642247",
-                quantity=5,
-                destination_country="US",
-                zip_code="90001",
-            )
-        """
-        fallback_locations = ["CN", "US", "MX"]
-
-        if dispatch_location in fallback_locations:
-            start_index = fallback_locations.index(dispatch_location)
-            locations_to_try = fallback_locations[start_index:]
+        if dispatch_location in DISPATCH_LOCATIONS:
+            start_index = DISPATCH_LOCATIONS.index(dispatch_location)
+            pending = list(DISPATCH_LOCATIONS[start_index:])
         else:
-            locations_to_try = [dispatch_location]
+            pending = [dispatch_location]
+        if not fallback:
+            pending = pending[:1]
+        deadline = Deadline.coerce(deadline)
 
         response = None
         successful_location = None
+        tried: list[str] = []
 
-        for location in locations_to_try:
+        while pending:
+            location = pending.pop(0)
+            tried.append(location)
             params = {
                 "product_id": product_id,
                 "quantity": str(quantity),
@@ -78,19 +66,30 @@ class ShippingMethods:
                 params["zip_code"] = zip_code
 
             try:
-                response = self._shipping_request("/shipping/freight/calculate", params)
-                shipping_options = response.get("value", [])
-
-                if shipping_options:
-                    successful_location = location
-                    break
-                elif location == locations_to_try[0] and not fallback:
-                    break
-            except Exception:
-                if location == locations_to_try[0] and not fallback:
+                response = yield ApiRequest(
+                    api_path,
+                    params,
+                    timeout=self._sub_timeout(api_path, deadline, len(pending) + 1),
+                    deadline=deadline,
+                )
+            except AlibabaDeadlineError:
+                raise
+            except AlibabaError as e:
+                policy = self.error_policies.for_error(e)
+                # Errors no other dispatch location can fix end the search
+                if policy.scope in ("product", "destination"):
+                    self._remember_failure(e, product_id, destination_country)
+                    raise
+                if not fallback or policy.error_class in ("auth", "quota"):
                     raise
+                if policy.error_class == "fallback_dispatch":
+                    pending = fallback_locations(policy, pending, tried)
                 continue
 
+            if response.get("value", []):
+                successful_location = location
+                break
+
         if response is None:
             return {
                 "product_id": product_id,
@@ -107,14 +106,136 @@ class ShippingMethods:
             "product_id": product_id,
             "quantity": quantity,
             "destination": destination_country,
-            "dispatch_location": successful_location or locations_to_try[0],
-            "fallback_used": successful_location != dispatch_location
-            if len(locations_to_try) > 1
-            else False,
-            "options": shipping_options,
+            "dispatch_location": successful_location or tried[0],
+            "fallback_used": successful_location != dispatch_location if len(tried) > 1 else False,
+            "options": self._to_model(list[ShippingOption], shipping_options),
+            "_raw": response,
+        }
+
+    def calculate_freight_advanced_op(
+        self,
+        e_company_id: str,
+        destination_country: str,
+        address: dict[str, Any] | str,
+        logistics_product_list: list[dict[str, Any]] | str,
+        dispatch_location: str = "CN",
+        *,
+        fallback: bool = True,
+    ) -> Operation[dict[str, Any]]:
+        """Operation for ``calculate_freight_advanced``."""
+        address_obj = json.loads(address) if isinstance(address, str) else address
+        products_obj = (
+            json.loads(logistics_product_list)
+            if isinstance(logistics_product_list, str)
+            else logistics_product_list
+        )
+
+        params = {
+            "e_company_id": e_company_id,
+            "destination_country": destination_country,
+            "dispatch_location": dispatch_location,
+            "address": json.dumps(address_obj),
+            "logistics_product_list": json.dumps(products_obj),
+        }
+
+        location = dispatch_location
+        pending = [loc for loc in DISPATCH_LOCATIONS if loc != location]
+        tried = [location]
+        while True:
+            try:
+                response = yield ApiRequest("/order/freight/calculate", dict(params))
+                break
+            except AlibabaError as e:
+                policy = self.error_policies.for_error(e)
+                pending = fallback_locations(policy, pending, tried) if fallback else []
+                if not pending:
+                    raise
+            location = pending.pop(0)
+            tried.append(location)
+            params["dispatch_location"] = location
+
+        return {
+            "supplier": e_company_id,
+            "destination": destination_country,
+            "dispatch_location": location,
+            "fallback_used": location != dispatch_location,
+            "products": products_obj,
+            "options": self._to_model(list[ShippingOption], response.get("value", [])),
             "_raw": response,
         }
 
+
+class ShippingMethods(ShippingOperations, SyncHost):
+    """
+    Shipping-related API methods.
+
+    This mixin class provides methods for calculating shipping costs
+    and freight estimates.
+    """
+
+    # pylint: disable=too-many-arguments
+
+    def calculate_freight(
+        self,
+        product_id: str,
+        quantity: int,
+        destination_country: str,
+        zip_code: str | None = None,
+        dispatch_location: str = "CN",
+        *,
+        fallback: bool = True,
+        deadline: Deadline | float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate basic shipping cost for a single product.
+
+        Args:
+            product_id: Alibaba product ID
+            quantity: Number of items
+            destination_country: Destination country code (e.g., "US")
+            zip_code: Destination ZIP code
+            dispatch_location: Origin location (CN, US, MX). Default: "CN"
+            fallback: If True, automatically tries fallback dispatch locations
+                (CN → US → MX) when primary returns no results. Error policies
+                pick the order (130608 goes straight to MX) and stop the search
+                on errors no location can fix
+            deadline: Time budget in seconds (or a ``Deadline``) for every
+                location tried, shared evenly among those still to try; a
+                location that times out within its share falls back to the next
+
+        Returns:
+            Dict with product_id, quantity, destination, dispatch_location,
+            fallback_used, and options list. With a typed ``response_mode`` the
+            options are ``ShippingOption`` models
+
+        Raises:
+            AlibabaAPIError: If the product is offline or cannot ship to the
+                destination (130106, 120019, 4015), on auth and quota errors,
+                and on any error when ``fallback`` is False. Offline and
+                restricted failures are repeated from the client's negative
+                cache, without a request, until they expire
+            AlibabaDeadlineError: If the deadline runs out
+
+        Example:
+            shipping = client.calculate_freight(
+                product_id="1600124642247",
+                quantity=5,
+                destination_country="US",
+                zip_code="90001",
+            )
+        """
+        return self.run(
+            self.calculate_freight_op(
+                product_id,
+                quantity,
+                destination_country,
+                zip_code,
+                dispatch_location,
+                fallback=fallback,
+                deadline=deadline,
+            )
+        )
+
     def calculate_freight_advanced(
         self,
         e_company_id: str,
@@ -122,6 +243,8 @@ class ShippingMethods:
         address: dict[str, Any] | str,
         logistics_product_list: list[dict[str, Any]] | str,
         dispatch_location: str = "CN",
+        *,
+        fallback: bool = True,
     ) -> dict[str, Any]:
         """
         Calculate shipping for multiple products with full address.
@@ -134,9 +257,13 @@ class ShippingMethods:
             logistics_product_list: Products to ship as list or JSON string.
                 Example: [{"product_id": "1600191825486", "sku_id": "12321", "quantity": "1"}]
             dispatch_location: Origin location (CN, US, MX). Default: "CN"
+            fallback: If True, retries from the other dispatch locations when
+                the error policy says the products do not ship from this one
 
         Returns:
-            Dict with supplier, destination, dispatch_location, products, and options
+            Dict with supplier, destination, dispatch_location, fallback_used,
+            products, and options. With a typed ``response_mode`` the options
+            are ``ShippingOption`` models
 
         Example:
             shipping = client.calculate_freight_advanced(
@@ -150,28 +277,65 @@ class ShippingMethods:
                 }],
             )
         """
-        address_obj = json.loads(address) if isinstance(address, str) else address
-        products_obj = (
-            json.loads(logistics_product_list)
-            if isinstance(logistics_product_list, str)
-            else logistics_product_list
+        return self.run(
+            self.calculate_freight_advanced_op(
+                e_company_id,
+                destination_country,
+                address,
+                logistics_product_list,
+                dispatch_location,
+                fallback=fallback,
+            )
         )
 
-        params = {
-            "e_company_id": e_company_id,
-            "destination_country": destination_country,
-            "dispatch_location": dispatch_location,
-            "address": json.dumps(address_obj),
-            "logistics_product_list": json.dumps(products_obj),
-        }
 
-        response = self._shipping_request("/order/freight/calculate", params)
+class AsyncShippingMethods(ShippingOperations, AsyncHost):
+    """Async shipping methods for ``AsyncAlibabaClient``; see ``ShippingMethods``."""
 
-        return {
-            "supplier": e_company_id,
-            "destination": destination_country,
-            "dispatch_location": dispatch_location,
-            "products": products_obj,
-            "options": response.get("value", []),
-            "_raw": response,
-        }
+    # pylint: disable=too-many-arguments
+
+    async def calculate_freight(
+        self,
+        product_id: str,
+        quantity: int,
+        destination_country: str,
+        zip_code: str | None = None,
+        dispatch_location: str = "CN",
+        *,
+        fallback: bool = True,
+        deadline: Deadline | float | None = None,
+    ) -> dict[str, Any]:
+        """Calculate shipping cost for one product. See ``ShippingMethods.calculate_freight``."""
+        return await self.run(
+            self.calculate_freight_op(
+                product_id,
+                quantity,
+                destination_country,
+                zip_code,
+                dispatch_location,
+                fallback=fallback,
+                deadline=deadline,
+            )
+        )
+
+    async def calculate_freight_advanced(
+        self,
+        e_company_id: str,
+        destination_country: str,
+        address: dict[str, Any] | str,
+        logistics_product_list: list[dict[str, Any]] | str,
+        dispatch_location: str = "CN",
+        *,
+        fallback: bool = True,
+    ) -> dict[str, Any]:
+        """Calculate shipping for several products. See ``ShippingMethods``."""
+        return await self.run(
+            self.calculate_freight_advanced_op(
+                e_company_id,
+                destination_country,
+                address,
+                logistics_product_list,
+                dispatch_location,
+                fallback=fallback,
+            )
+        )
@@ -0,0 +1,189 @@
+"""
+Always-on ring buffer of recent slow or sampled API calls.
+
+Every ``AlibabaClient`` owns a ``SlowCallLog``. After each call the client
+hands it the latency; calls at or above ``threshold`` seconds are always kept,
+and a ``sample_rate`` fraction of the rest are kept as a baseline to compare
+against. Only kept calls pay for building a record, so the per-call cost is a
+comparison and, for faster calls, one random draw.
+
+Records hold the business params with credentials masked, never the signed
+params, so a dump is safe to attach to an incident ticket.
+
+Example:
+    client = AlibabaClient(config, slow_calls=SlowCallLog(threshold=0.5))
+    ...
+    for record in client.slow_calls.dump():
+        print(record["api_path"], record["latency"], record["request_id"])
+"""
+
+import json
+import random
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaError, AlibabaNetworkError
+
+if TYPE_CHECKING:
+    from alibaba_api.backends import Response
+
+MASK = "***"
+
+# Params that are masked outright; any key containing "token" or "secret" is too.
+_SENSITIVE_KEYS = frozenset({"sign", "code"})
+
+
+def mask_params(params: dict[str, str]) -> dict[str, str]:
+    """Copy ``params`` with credentials (tokens, secrets, signatures, auth codes) masked."""
+    return {
+        key: MASK if key in _SENSITIVE_KEYS or "token" in key or "secret" in key else value
+        for key, value in params.items()
+    }
+
+
+@dataclass(slots=True)
+class SlowCall:
+    """
+    One captured API call.
+
+    ``outcome`` is "ok", "api_error", "http_error", "network_error" or "error".
+    ``sampled`` is True if the call was kept by sampling rather than by the
+    latency threshold.
+    """
+
+    timestamp: float
+    api_path: str
+    method: str
+    params: dict[str, str]
+    latency: float
+    response_size: int | None
+    request_id: str | None
+    outcome: str
+    error_code: str | None = None
+    sampled: bool = False
+
+
+class SlowCallLog:
+    """
+    Fixed-size ring buffer of recent call records.
+
+    Appends go to a ``deque`` with ``maxlen``, which is atomic, so one log can
+    be shared between threads and clients without locking.
+
+    Args:
+        capacity: Number of records kept; the oldest are dropped first
+        threshold: Calls taking at least this many seconds are always kept
+        sample_rate: Fraction of faster calls kept, between 0 and 1
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        *,
+        threshold: float = 1.0,
+        sample_rate: float = 0.01,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got: {sample_rate}")
+        self.capacity = capacity
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self._records: deque[SlowCall] = deque(maxlen=capacity)
+        self._random = random.random
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[SlowCall]:
+        return iter(list(self._records))
+
+    def observe(
+        self,
+        api_path: str,
+        method: str,
+        params: dict[str, str],
+        latency: float,
+        response: "Response | None" = None,
+        data: dict[str, Any] | None = None,
+        error: AlibabaError | None = None,
+    ) -> None:
+        """
+        Consider one finished call for capture.
+
+        Args:
+            api_path: API endpoint path
+            method: HTTP method
+            params: Business params, before signing
+            latency: Wall time of the call, in seconds
+            response: HTTP response, if one was received
+            data: Parsed response body, on success
+            error: Raised error, on failure
+        """
+        if latency >= self.threshold:
+            sampled = False
+        elif self.sample_rate and self._random() < self.sample_rate:
+            sampled = True
+        else:
+            return
+
+        request_id: str | None = None
+        if data is not None:
+            request_id = data.get("request_id")
+        elif error is not None:
+            request_id = error.request_id
+        if request_id is None and response is not None:
+            request_id = response.headers.get("x-request-id")
+
+        if error is None:
+            outcome = "ok"
+        elif isinstance(error, AlibabaAPIError):
+            outcome = "api_error"
+        elif isinstance(error, AlibabaNetworkError):
+            outcome = "network_error" if error.status_code is None else "http_error"
+        else:
+            outcome = "error"
+
+        self._records.append(
+            SlowCall(
+                timestamp=time.time(),
+                api_path=api_path,
+                method=method.upper(),
+                params=mask_params(params),
+                latency=latency,
+                response_size=len(response.content) if response is not None else None,
+                request_id=request_id,
+                outcome=outcome,
+                error_code=error.code if error is not None else None,
+                sampled=sampled,
+            )
+        )
+
+    def records(self) -> list[SlowCall]:
+        """Captured calls, oldest first."""
+        return list(self._records)
+
+    def dump(self, *, slowest_first: bool = False) -> list[dict[str, Any]]:
+        """
+        Captured calls as JSON-serialisable dicts.
+
+        Args:
+            slowest_first: Sort by latency, descending, instead of by time
+
+        Returns:
+            List of record dicts
+        """
+        records = self.records()
+        if slowest_first:
+            records.sort(key=lambda record: record.latency, reverse=True)
+        return [asdict(record) for record in records]
+
+    def dump_json(self, *, slowest_first: bool = False, indent: int | None = 2) -> str:
+        """Captured calls as a JSON document, for postmortems."""
+        return json.dumps(self.dump(slowest_first=slowest_first), indent=indent)
+
+    def clear(self) -> None:
+        """Drop all captured calls."""
+        self._records.clear()
@@ -0,0 +1,1128 @@
+"""
+Local stand-in for the Alibaba Open Platform API.
+
+The stand-in implements every endpoint the high-level client methods use,
+backed by a deterministic synthetic catalog, so load tests and benchmarks
+can run without network access or sandbox rate limits.
+
+It can be driven three ways:
+- In-process, sync: ``AlibabaClient(config, transport=server.transport())``
+- In-process, async: ``httpx.AsyncClient(transport=server.async_transport())``
+- Over a socket: ``server.serve(port=8080)`` or ``python -m alibaba_api.standin``,
+  then point ``Config.base_url_override`` at ``http://127.0.0.1:8080/rest``
+
+``StandinServer`` is also a plain ASGI application, so any ASGI server
+(uvicorn, hypercorn) can host it.
+
+Example:
+    from alibaba_api import AlibabaClient, Config
+    from alibaba_api.standin import LatencyModel, StandinServer
+
+    server = StandinServer(
+        app_key="test",
+        app_secret="secret",
+        catalog_size=10_000,
+        latency=LatencyModel.lognormal(median=0.080, p99=0.400),
+        error_rate=0.01,
+    )
+    config = Config(app_key="test", app_secret="secret", access_token="token")
+    with AlibabaClient(config, transport=server.transport()) as client:
+        client.list_products(scene_id="906124611", page_size=50)
+"""
+
+import asyncio
+import itertools
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from collections.abc import Awaitable, Callable, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+from alibaba_api.compression import available_encodings, choose_encoding, compress
+from alibaba_api.config import ERROR_MESSAGES
+from alibaba_api.signing import calculate_signature
+
+# Scene IDs documented for /eco/buyer/product/check, mapped to the origin
+# country whose products they list ("CN" = cross-border).
+SCENES: dict[str, str] = {
+    "906124611": "US",
+    "906168847": "CN",
+    "907135637": "US",
+    "907732810": "MX",
+    "907180667": "US",
+    "907180664": "MX",
+}
+
+# Products are assigned dispatch origins by ``index % 5`` so that any
+# per-origin listing can be paged arithmetically, without materialising it.
+_ORIGINS_BY_RESIDUE: tuple[tuple[str, ...], ...] = (
+    ("CN",),
+    ("CN",),
+    ("CN", "US"),
+    ("MX",),
+    ("US",),
+)
+
+_FIRST_PRODUCT_ID = 1_600_000_000_000
+# Smaller bodies go out uncompressed, as from typical gateways
+_COMPRESS_MIN_SIZE = 256
+_CURRENCY = "USD"
+
+# Gateway-level errors, modelled on the platform's system error responses.
+SIGNATURE_ERROR = "IncompleteSignature"
+TOKEN_ERROR = "IllegalAccessToken"
+
+_CARRIERS: tuple[tuple[str, str, str, str], ...] = (
+    # (vendor_code, vendor_name, shipping_type, delivery_time)
+    ("EX_ASP_Economy_Express_3C", "Alibaba.com Economy Express (3C)", "EXPRESS", "10~15"),
+    ("EX_ASP_JYC_FEDEX", "FedEx IP", "EXPRESS", "5~8"),
+    ("seller_oversea_distributor_usps", "USPS Ground Advantage", "EXPRESS", "3~9"),
+    ("EX_ASP_OCEAN_EXPRESS", "Ocean + Express", "MULTIMODAL_TRANSPORT", "25~35"),
+)
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """
+    Distribution of server-side response latency, in seconds.
+
+    Use the ``constant``, ``uniform`` and ``lognormal`` constructors rather
+    than building instances directly.
+    """
+
+    kind: str
+    a: float
+    b: float = 0.0
+
+    @classmethod
+    def constant(cls, seconds: float) -> "LatencyModel":
+        return cls("constant", seconds)
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "LatencyModel":
+        return cls("uniform", low, high)
+
+    @classmethod
+    def lognormal(cls, median: float, p99: float) -> "LatencyModel":
+        """Long-tailed latency given its median and 99th percentile."""
+        if median <= 0 or p99 < median:
+            raise ValueError("lognormal latency requires 0 < median <= p99")
+        # z-score of the 99th percentile of a standard normal distribution
+        sigma = math.log(p99 / median) / 2.3263
+        return cls("lognormal", math.log(median), sigma)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            return self.a
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return rng.lognormvariate(self.a, self.b)
+        raise ValueError(f"Unknown latency model: {self.kind}")
+
+
+@dataclass
+class StandinResponse:
+    """Response produced by the stand-in, before transport framing."""
+
+    status_code: int
+    body: dict[str, Any]
+    delay: float = 0.0
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def content(self) -> bytes:
+        return json.dumps(self.body, separators=(",", ":")).encode("utf-8")
+
+
+class _OriginListing:
+    """Products whose dispatch origins include one of ``countries``, in catalog order."""
+
+    def __init__(self, countries: Sequence[str], catalog_size: int) -> None:
+        self._residues = [
+            residue
+            for residue, origins in enumerate(_ORIGINS_BY_RESIDUE)
+            if any(country in origins for country in countries)
+        ]
+        period = len(_ORIGINS_BY_RESIDUE)
+        full, rest = divmod(catalog_size, period)
+        self._len = full * len(self._residues) + sum(1 for r in self._residues if r < rest)
+        self._period = period
+
+    def __len__(self) -> int:
+        return self._len
+
+    def page(self, index: int, size: int) -> list[int]:
+        start = max(index, 0) * size
+        stop = min(start + size, self._len)
+        width = len(self._residues)
+        return [
+            _FIRST_PRODUCT_ID + (k // width) * self._period + self._residues[k % width]
+            for k in range(start, stop)
+        ]
+
+
+def _unit_hash(*parts: object) -> float:
+    """Stable pseudo-random value in [0, 1) derived from ``parts``."""
+    return zlib.crc32(repr(parts).encode("utf-8")) / 0x1_0000_0000
+
+
+class _InvalidParameterError(Exception):
+    """A request parameter a handler cannot use; answered with ``InvalidParameter``."""
+
+
+def _int_param(value: object, name: str, minimum: int = 0) -> int:
+    """``value`` as an int no less than ``minimum``; raises ``_InvalidParameterError`` otherwise."""
+    try:
+        number = int(str(value))
+    except ValueError:
+        raise _InvalidParameterError(f"{name} must be an integer, got: {value!r}") from None
+    if number < minimum:
+        raise _InvalidParameterError(f"{name} must be at least {minimum}, got: {number}")
+    return number
+
+
+def _objects(items: list[Any], name: str) -> list[dict[str, Any]]:
+    """``items`` if every entry is a JSON object; raises ``_InvalidParameterError`` otherwise."""
+    if not all(isinstance(item, dict) for item in items):
+        raise _InvalidParameterError(f"{name} entries must be JSON objects")
+    return items
+
+
+def _loads(raw: str | None) -> Any:
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+class StandinServer:
+    """
+    In-memory stand-in for the Alibaba Open Platform API.
+
+    Requests are signature-checked with the same algorithm as
+    ``alibaba_api.signing``. Products, inventory, freight quotes and orders
+    are synthesised deterministically from product IDs, so two servers built
+    with the same arguments return the same catalog.
+
+    Args:
+        app_key: App key callers must present
+        app_secret: Secret used to verify request signatures
+        catalog_size: Number of products in the synthetic catalog
+        access_tokens: Tokens accepted on business endpoints. ``None``
+            accepts any non-empty token
+        verify_signatures: Reject requests whose ``sign`` does not verify
+        latency: Default latency distribution for every endpoint
+        endpoint_latency: Per-endpoint latency overrides, keyed by API path
+        error_rate: Probability of answering with an injected API error
+        error_codes: Codes to inject, drawn uniformly (default: all of
+            ``ERROR_MESSAGES``)
+        http_error_rate: Probability of answering with HTTP 503
+        offline_ratio: Fraction of products reported offline (130106)
+        restricted_ratio: Fraction of (product, country) pairs that cannot
+            ship (120019)
+        unshippable_ratio: Fraction of (product, country) pairs whose seller
+            does not ship there (4015)
+        seed: Seed for latency and error injection
+        path_prefix: URL prefix stripped before routing (matches ``Config.base_url``)
+        compression: Compress bodies of 256 bytes or more with the most
+            compact encoding the request's ``Accept-Encoding`` allows
+    """
+
+    def __init__(
+        self,
+        app_key: str = "test_app_key",
+        app_secret: str = "test_app_secret",
+        *,
+        catalog_size: int = 1000,
+        access_tokens: Sequence[str] | None = None,
+        verify_signatures: bool = True,
+        latency: LatencyModel | None = None,
+        endpoint_latency: Mapping[str, LatencyModel] | None = None,
+        error_rate: float = 0.0,
+        error_codes: Sequence[str] | None = None,
+        http_error_rate: float = 0.0,
+        offline_ratio: float = 0.0,
+        restricted_ratio: float = 0.0,
+        unshippable_ratio: float = 0.0,
+        seed: int = 0,
+        path_prefix: str = "/rest",
+        compression: bool = True,
+    ) -> None:
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.catalog_size = catalog_size
+        self.access_tokens = set(access_tokens) if access_tokens is not None else None
+        self.verify_signatures = verify_signatures
+        self.latency = latency
+        self.endpoint_latency = dict(endpoint_latency or {})
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes or ERROR_MESSAGES)
+        self.http_error_rate = http_error_rate
+        self.offline_ratio = offline_ratio
+        self.restricted_ratio = restricted_ratio
+        self.unshippable_ratio = unshippable_ratio
+        self.path_prefix = path_prefix.rstrip("/")
+        self.compression = compression
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._orders: dict[str, dict[str, Any]] = {}
+        self._order_ids = itertools.count(234193410001000000)
+        self._listings = {
+            country: _OriginListing([country], catalog_size) for country in ("CN", "US", "MX")
+        }
+        self.request_count = 0
+
+        self._routes: dict[str, Callable[[dict[str, str]], StandinResponse]] = {
+            "/auth/token/create": self._token_create,
+            "/auth/token/refresh": self._token_refresh,
+            "/eco/buyer/product/check": self._product_check,
+            "/eco/buyer/local/product/check": self._local_product_check,
+            "/eco/buyer/crossborder/product/check": self._crossborder_product_check,
+            "/eco/buyer/product/description": self._product_description,
+            "/eco/buyer/product/inventory": self._product_inventory,
+            "/shipping/freight/calculate": self._freight_calculate,
+            "/order/freight/calculate": self._order_freight_calculate,
+            "/buynow/order/create": self._order_create,
+            "/alibaba/dropshipping/order/pay": self._order_pay,
+            "/alibaba/order/list": self._order_list,
+            "/alibaba/order/get": self._order_get,
+            "/alibaba/order/fund/query": self._order_fund_query,
+            "/order/logistics/query": self._logistics_query,
+            "/order/logistics/tracking/get": self._logistics_tracking,
+        }
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def handle(self, method: str, path: str, params: dict[str, str]) -> StandinResponse:
+        """
+        Answer one request.
+
+        Args:
+            method: HTTP method
+            path: URL path, including ``path_prefix``
+            params: Query string and form parameters, merged
+
+        Returns:
+            The response, including the latency the transport should apply
+        """
+        with self._lock:
+            self.request_count += 1
+            request_id = f"{next(self._request_ids):025x}"
+            roll_http, roll_api = self._rng.random(), self._rng.random()
+            injected = self._rng.choice(self.error_codes) if self.error_codes else None
+
+        api_path = path
+        if self.path_prefix and api_path.startswith(self.path_prefix):
+            api_path = api_path[len(self.path_prefix) :]
+
+        response = self._dispatch(method, api_path, params, roll_http, roll_api, injected)
+        response.body.setdefault("request_id", request_id)
+        response.headers.setdefault("content-type", "application/json;charset=UTF-8")
+        response.headers.setdefault("x-request-id", request_id)
+        response.delay = self._sample_latency(api_path)
+        return response
+
+    def _dispatch(
+        self,
+        method: str,
+        api_path: str,
+        params: dict[str, str],
+        roll_http: float,
+        roll_api: float,
+        injected: str | None,
+    ) -> StandinResponse:
+        if method not in ("GET", "POST"):
+            return StandinResponse(405, {"code": "MethodNotAllowed", "message": method})
+
+        handler = self._routes.get(api_path)
+        if handler is None:
+            return StandinResponse(
+                404, {"code": "InvalidApiPath", "message": f"Unknown API path: {api_path}"}
+            )
+
+        if roll_http < self.http_error_rate:
+            return StandinResponse(503, {"code": "ServiceUnavailable", "message": "Busy"})
+
+        if params.get("app_key") != self.app_key:
+            return _error("InvalidAppKey", "Invalid app_key")
+
+        if self.verify_signatures:
+            sign = params.get("sign", "")
+            unsigned = {k: v for k, v in params.items() if k != "sign"}
+            if sign != calculate_signature(api_path, unsigned, self.app_secret):
+                return _error(
+                    SIGNATURE_ERROR,
+                    "The request signature does not conform to platform standards",
+                )
+
+        if not api_path.startswith("/auth/"):
+            token = params.get("access_token")
+            if not token or (self.access_tokens is not None and token not in self.access_tokens):
+                return _error(TOKEN_ERROR, "The specified access token is invalid or expired")
+
+        if injected is not None and roll_api < self.error_rate:
+            return _error(injected, ERROR_MESSAGES.get(injected, "Injected error"))
+
+        try:
+            return handler(params)
+        except _InvalidParameterError as e:
+            return _error("InvalidParameter", str(e))
+
+    def _sample_latency(self, api_path: str) -> float:
+        model = self.endpoint_latency.get(api_path, self.latency)
+        if model is None:
+            return 0.0
+        with self._lock:
+            return max(model.sample(self._rng), 0.0)
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+
+    def product_ids(self) -> range:
+        """All product IDs in the synthetic catalog."""
+        return range(_FIRST_PRODUCT_ID, _FIRST_PRODUCT_ID + self.catalog_size)
+
+    def origins(self, product_id: int) -> tuple[str, ...]:
+        """Dispatch locations a product ships from."""
+        return _ORIGINS_BY_RESIDUE[(product_id - _FIRST_PRODUCT_ID) % len(_ORIGINS_BY_RESIDUE)]
+
+    def is_offline(self, product_id: int) -> bool:
+        return _unit_hash("offline", product_id) < self.offline_ratio
+
+    def is_restricted(self, product_id: int, country: str) -> bool:
+        return _unit_hash("restricted", product_id, country) < self.restricted_ratio
+
+    def is_unshippable(self, product_id: int, country: str) -> bool:
+        return _unit_hash("unshippable", product_id, country) < self.unshippable_ratio
+
+    def _known_product(self, raw: object) -> int | None:
+        try:
+            product_id = int(str(raw))
+        except ValueError:
+            return None
+        if _FIRST_PRODUCT_ID <= product_id < _FIRST_PRODUCT_ID + self.catalog_size:
+            return product_id
+        return None
+
+    def product(self, product_id: int) -> dict[str, Any]:
+        """Synthesise the ``result_data`` of /eco/buyer/product/description."""
+        rng = random.Random(product_id)
+        pid = str(product_id)
+        base_price = rng.randint(50, 5000)
+        moq = rng.choice((1, 1, 2, 5, 10, 50))
+        colors = ("Black", "White", "Red", "Blue", "Green", "Silver")
+        sizes = ("S", "M", "L", "XL")
+
+        skus = []
+        for n in range(rng.randint(1, 4)):
+            tiers = []
+            low = moq
+            for tier in range(rng.randint(1, 3)):
+                high = low * 10 - 1
+                price = base_price * (100 - tier * 8) // 100
+                tiers.append(
+                    {
+                        "min_quantity": str(low),
+                        "max_quantity": str(high),
+                        "price": f"{price // 100}.{price % 100:02d}",
+                        "currency": _CURRENCY,
+                    }
+                )
+                low = high + 1
+            sku_id = str(100_000_000_000 + (product_id % 1_000_000) * 10 + n)
+            skus.append(
+                {
+                    "sku_id": sku_id,
+                    "product_id": pid,
+                    "seller_sku_id": f"{pid}_{sku_id}",
+                    "status": "NORMAL",
+                    "unit": "Piece",
+                    "image": f"https://sc04.alicdn.com/kf/{pid}_{n}.jpg",
+                    "sku_attr_list": [
+                        {
+                            "attr_name_id": "1111",
+                            "attr_name_desc": "Color",
+                            "attr_value_id": str(-(n + 1)),
+                            "attr_value_desc": colors[n % len(colors)],
+                            "attr_value_image": f"https://sc04.alicdn.com/kf/{pid}_c{n}.jpg",
+                        },
+                        {
+                            "attr_name_id": "2222",
+                            "attr_name_desc": "Size",
+                            "attr_value_id": str(-(n + 100)),
+                            "attr_value_desc": sizes[n % len(sizes)],
+                        },
+                    ],
+                    "ladder_price": tiers,
+                }
+            )
+
+        return {
+            "product_id": pid,
+            "title": f"Synthetic product {pid}",
+            "description": f"<html>Description of product {pid}</html>",
+            "detail_url": f"https://www.alibaba.com/product-detail/{pid}.html",
+            "main_image": f"https://sc04.alicdn.com/kf/{pid}.jpg",
+            "images": [f"https://sc04.alicdn.com/kf/{pid}_{i}.jpg" for i in range(3)],
+            "category_id": str(100003000 + product_id % 300),
+            "category": "Synthetic Category",
+            "supplier": f"Supplier {product_id % 997}",
+            "eCompanyId": f"company-{product_id % 997}",
+            "currency": _CURRENCY,
+            "min_order_quantity": str(moq),
+            "status": "PRODUCT_ONLINE",
+            "mode_id": "AV.YW.DEP.103.L",
+            "wholesale_trade": {
+                "min_order_quantity": str(moq),
+                "unit_type": "Piece",
+                "handling_time": str(rng.randint(1, 7)),
+                "price": f"{base_price // 100}.{base_price % 100:02d}",
+                "deliver_periods": [{"quantity": str(moq * 10), "process_period": "3"}],
+            },
+            "skus": skus,
+        }
+
+    def _listing_response(self, listing: _OriginListing, raw: str | None) -> StandinResponse:
+        req = _loads(raw)
+        if not isinstance(req, dict):
+            return _error("InvalidParameter", "Request object must be a JSON object")
+        index = _int_param(req.get("index", 0), "index")
+        size = min(_int_param(req.get("size", 20), "size", 1), 100)
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "result": {
+                    "result_code": "200",
+                    "result_msg": "request success",
+                    "result_data": listing.page(index, size),
+                    "result_total": str(len(listing)),
+                },
+            },
+        )
+
+    def _product_check(self, params: dict[str, str]) -> StandinResponse:
+        req = _loads(params.get("query_req"))
+        scene_id = str(req.get("scene_id", "")) if isinstance(req, dict) else ""
+        if scene_id not in SCENES:
+            return _error("InvalidParameter", f"Unknown scene_id: {scene_id}")
+        return self._listing_response(self._listings[SCENES[scene_id]], params.get("query_req"))
+
+    def _local_product_check(self, params: dict[str, str]) -> StandinResponse:
+        req = _loads(params.get("req"))
+        country = str(req.get("country", "US")) if isinstance(req, dict) else ""
+        if country not in ("US", "MX"):
+            return _error("InvalidParameter", f"No local warehouses in: {country}")
+        return self._listing_response(self._listings[country], params.get("req"))
+
+    def _crossborder_product_check(self, params: dict[str, str]) -> StandinResponse:
+        return self._listing_response(self._listings["CN"], params.get("param0"))
+
+    def _product_description(self, params: dict[str, str]) -> StandinResponse:
+        req = _loads(params.get("query_req"))
+        product_id = self._known_product(req.get("product_id") if isinstance(req, dict) else None)
+        if product_id is None or self.is_offline(product_id):
+            return _error("130106")
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "result": {
+                    "result_code": "200",
+                    "result_msg": "request success",
+                    "result_data": self.product(product_id),
+                },
+            },
+        )
+
+    def _product_inventory(self, params: dict[str, str]) -> StandinResponse:
+        req = _loads(params.get("inv_req"))
+        product_id = self._known_product(req.get("product_id") if isinstance(req, dict) else None)
+        if product_id is None or self.is_offline(product_id):
+            return _error("130106")
+        assert isinstance(req, dict)
+
+        skus = self.product(product_id)["skus"]
+        if req.get("sku_id"):
+            skus = [sku for sku in skus if sku["sku_id"] == str(req["sku_id"])]
+            if not skus:
+                return _error("10005")
+
+        locations = self.origins(product_id)
+        if req.get("shipping_from"):
+            locations = tuple(loc for loc in locations if loc == req["shipping_from"])
+
+        data = [
+            {
+                "shipping_from": location,
+                "inventory_list": [
+                    {
+                        "product_id": str(product_id),
+                        "sku_id": sku["sku_id"],
+                        "inventory_count": str(
+                            int(_unit_hash("stock", sku["sku_id"], location) * 2000)
+                        ),
+                        "inventory_unit": sku["unit"],
+                    }
+                    for sku in skus
+                ],
+            }
+            for location in locations
+        ]
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "result": {
+                    "result_code": "200",
+                    "result_msg": "request success",
+                    "result_data": data,
+                },
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Shipping
+    # ------------------------------------------------------------------
+
+    def _check_route(
+        self, product_id: int | None, destination: str, dispatch_location: str
+    ) -> StandinResponse | None:
+        if product_id is None or self.is_offline(product_id):
+            return _error("130106")
+        if dispatch_location not in ("CN", "US", "MX"):
+            return _error("10012")
+        origins = self.origins(product_id)
+        if dispatch_location not in origins:
+            return _error("130608" if origins == ("MX",) else "10010")
+        if self.is_restricted(product_id, destination):
+            return _error("120019")
+        if self.is_unshippable(product_id, destination):
+            return _error("4015")
+        return None
+
+    def _freight_options(
+        self, product_id: int, quantity: int, destination: str, dispatch_location: str
+    ) -> list[dict[str, Any]]:
+        rng = random.Random(f"{product_id}:{destination}:{dispatch_location}")
+        options = []
+        for vendor_code, vendor_name, shipping_type, delivery_time in rng.sample(
+            _CARRIERS, rng.randint(1, len(_CARRIERS))
+        ):
+            cents = rng.randint(300, 3000) + quantity * rng.randint(10, 200)
+            options.append(
+                {
+                    "shipping_type": shipping_type,
+                    "vendor_code": vendor_code,
+                    "vendor_name": vendor_name,
+                    "trade_term": "DAP",
+                    "dispatch_country": dispatch_location,
+                    "destination_country": destination,
+                    "delivery_time": delivery_time,
+                    "solution_biz_type": "distributionWaybill",
+                    "fee": {"amount": f"{cents // 100}.{cents % 100:02d}", "currency": _CURRENCY},
+                }
+            )
+        return options
+
+    def _freight_calculate(self, params: dict[str, str]) -> StandinResponse:
+        product_id = self._known_product(params.get("product_id"))
+        destination = params.get("destination_country", "")
+        location = params.get("dispatch_location", "CN")
+        failure = self._check_route(product_id, destination, location)
+        if failure is not None:
+            return failure
+        assert product_id is not None
+        quantity = _int_param(params.get("quantity", "1"), "quantity", 1)
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "value": self._freight_options(product_id, quantity, destination, location),
+            },
+        )
+
+    def _order_freight_calculate(self, params: dict[str, str]) -> StandinResponse:
+        products = _loads(params.get("logistics_product_list"))
+        if not isinstance(products, list) or not products:
+            return _error("InvalidParameter", "logistics_product_list is required")
+        destination = params.get("destination_country", "")
+        location = params.get("dispatch_location", "CN")
+
+        # Quote each carrier for the whole shipment by summing per-product fees.
+        options: dict[str, dict[str, Any]] = {}
+        fees: dict[str, int] = {}
+        for item in _objects(products, "logistics_product_list"):
+            product_id = self._known_product(item.get("product_id"))
+            failure = self._check_route(product_id, destination, location)
+            if failure is not None:
+                return failure
+            assert product_id is not None
+            quantity = _int_param(item.get("quantity", 1), "quantity", 1)
+            for option in self._freight_options(product_id, quantity, destination, location):
+                code = option["vendor_code"]
+                options.setdefault(code, option)
+                fees[code] = fees.get(code, 0) + _cents(option["fee"]["amount"])
+
+        value = [
+            {
+                **option,
+                "store_type": "CERTIFIED",
+                "fee": {"amount": _amount(fees[code]), "currency": _CURRENCY},
+            }
+            for code, option in options.items()
+        ]
+        return StandinResponse(200, {"code": "0", "value": value})
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    def _order_create(self, params: dict[str, str]) -> StandinResponse:
+        products = _loads(params.get("product_list"))
+        logistics = _loads(params.get("logistics_detail"))
+        if not params.get("channel_refer_id") or not isinstance(products, list) or not products:
+            return _error("InvalidParameter", "channel_refer_id and product_list are required")
+        if not isinstance(logistics, dict):
+            return _error("InvalidParameter", "logistics_detail must be a JSON object")
+
+        order_products = []
+        product_total = 0
+        for item in _objects(products, "product_list"):
+            product_id = self._known_product(item.get("product_id"))
+            if product_id is None or self.is_offline(product_id):
+                return _error("130106")
+            product = self.product(product_id)
+            sku = next(
+                (s for s in product["skus"] if s["sku_id"] == str(item.get("sku_id"))),
+                product["skus"][0] if not item.get("sku_id") else None,
+            )
+            if sku is None:
+                return _error("10005")
+            quantity = _int_param(item.get("quantity", 1), "quantity", 1)
+            tier = _tier_for(sku["ladder_price"], quantity)
+            if tier is None:
+                return _error("410006")
+            unit_cents = _cents(tier["price"])
+            product_total += unit_cents * quantity
+            order_products.append(
+                {
+                    "product_id": str(product_id),
+                    "sku_id": sku["sku_id"],
+                    "name": product["title"],
+                    "quantity": f"{quantity}.0000",
+                    "unit": sku["unit"],
+                    "unit_price": {"amount": tier["price"], "currency": _CURRENCY},
+                    "product_image": product["main_image"],
+                    "sku_attributes": [
+                        {"key": a["attr_name_desc"], "value": a["attr_value_desc"]}
+                        for a in sku["sku_attr_list"]
+                    ],
+                }
+            )
+
+        if product_total > 500_000:
+            return _error("480006")
+        if product_total < 30:
+            return _error("430013")
+
+        shipping_cents = 467
+        now = int(time.time() * 1000)
+        with self._lock:
+            trade_id = str(next(self._order_ids))
+            self._orders[trade_id] = {
+                "trade_id": trade_id,
+                "trade_status": "unpay",
+                "pay_step": "ADVANCE",
+                "fulfillment_channel": "TAD",
+                "dropshipping": "true",
+                "create_date": _date(now),
+                "modify_date": _date(now),
+                "shipping_address": logistics.get("shipment_address", {}),
+                "order_products": order_products,
+                "product_total_amount": {"amount": _amount(product_total), "currency": _CURRENCY},
+                "shipment_fee": {"amount": _amount(shipping_cents), "currency": _CURRENCY},
+                "total_amount": {
+                    "amount": _amount(product_total + shipping_cents),
+                    "currency": _CURRENCY,
+                },
+                "carrier": {"code": logistics.get("carrier_code", ""), "name": "Standard"},
+                "buyer": {"immutable_eid": "standin-buyer", "full_name": "Stand-in Buyer"},
+                "seller": {"immutable_eid": "standin-seller", "full_name": "Stand-in Seller"},
+            }
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "value": {
+                    "trade_id": trade_id,
+                    "pay_url": f"https://biz.alibaba.com/ta/detail.htm?orderId={trade_id}",
+                },
+            },
+        )
+
+    def _order_pay(self, params: dict[str, str]) -> StandinResponse:
+        req = _loads(params.get("param_order_pay_request"))
+        order_ids = req.get("order_id_list") if isinstance(req, dict) else None
+        if not order_ids:
+            return _error("InvalidParameter", "order_id_list is required")
+        with self._lock:
+            orders = [self._orders.get(str(trade_id)) for trade_id in order_ids]
+            if any(order is None for order in orders):
+                return _error("InvalidParameter", "Unknown order in order_id_list")
+            for order in orders:
+                assert order is not None
+                order["trade_status"] = "paid"
+                order["modify_date"] = _date(int(time.time() * 1000))
+        return StandinResponse(200, {"code": "0", "value": {"status": "PAY_SUCCESS"}})
+
+    def _order_list(self, params: dict[str, str]) -> StandinResponse:
+        start_page = _int_param(params.get("start_page", "0"), "start_page")
+        page_size = _int_param(params.get("page_size", "10"), "page_size", 1)
+        status = params.get("status")
+        with self._lock:
+            orders = [
+                {
+                    key: order[key]
+                    for key in ("trade_id", "trade_status", "create_date", "modify_date")
+                }
+                for order in self._orders.values()
+                if not status or order["trade_status"] == status
+            ]
+        start = start_page * page_size
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "value": {
+                    "total_count": str(len(orders)),
+                    "order_list": orders[start : start + page_size],
+                },
+            },
+        )
+
+    def _find_order(self, trade_id: str | None) -> dict[str, Any] | None:
+        with self._lock:
+            order = self._orders.get(trade_id or "")
+            return json.loads(json.dumps(order)) if order is not None else None
+
+    def _order_get(self, params: dict[str, str]) -> StandinResponse:
+        order = self._find_order(params.get("e_trade_id"))
+        if order is None:
+            return _error("InvalidParameter", "Order not found")
+        return StandinResponse(200, {"code": "0", "value": order})
+
+    def _order_fund_query(self, params: dict[str, str]) -> StandinResponse:
+        order = self._find_order(params.get("e_trade_id"))
+        if order is None:
+            return _error("InvalidParameter", "Order not found")
+        fee = _cents(order["total_amount"]["amount"]) * 3 // 100
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "value": {
+                    "payment_transaction_fee": {"amount": _amount(fee), "currency": _CURRENCY}
+                },
+            },
+        )
+
+    def _logistics_query(self, params: dict[str, str]) -> StandinResponse:
+        order = self._find_order(params.get("trade_id"))
+        if order is None:
+            return _error("InvalidParameter", "Order not found")
+        return StandinResponse(
+            200,
+            {
+                "code": "0",
+                "value": {
+                    "logistic_status": "WAIT_SELLER_SEND"
+                    if order["trade_status"] == "paid"
+                    else "NO_LOGISTICS",
+                    "shipment_date": order["modify_date"],
+                    "shipping_order_list": [],
+                },
+            },
+        )
+
+    def _logistics_tracking(self, params: dict[str, str]) -> StandinResponse:
+        if self._find_order(params.get("trade_id")) is None:
+            return _error("InvalidParameter", "Order not found")
+        return StandinResponse(200, {"code": "0", "tracking_list": []})
+
+    # ------------------------------------------------------------------
+    # Auth
+    # ------------------------------------------------------------------
+
+    def _issue_tokens(self) -> dict[str, Any]:
+        with self._lock:
+            serial = next(self._request_ids)
+            access_token = f"standin-access-{serial}"
+            if self.access_tokens is not None:
+                self.access_tokens.add(access_token)
+        return {
+            "code": "0",
+            "access_token": access_token,
+            "refresh_token": f"standin-refresh-{serial}",
+            "expires_in": "864000",
+            "refresh_expires_in": "5184000",
+            "account_platform": "buyApp",
+            "user_info": {"country": "US", "loginId": "standin", "user_id": "200042362"},
+        }
+
+    def _token_create(self, params: dict[str, str]) -> StandinResponse:
+        if not params.get("code"):
+            return _error("InvalidCode", "Authorization code is required")
+        return StandinResponse(200, self._issue_tokens())
+
+    def _token_refresh(self, params: dict[str, str]) -> StandinResponse:
+        if not params.get("refresh_token", "").startswith("standin-refresh-"):
+            return _error("IllegalRefreshToken", "The specified refresh token is invalid")
+        return StandinResponse(200, self._issue_tokens())
+
+    # ------------------------------------------------------------------
+    # Transports
+    # ------------------------------------------------------------------
+
+    def encode(
+        self, response: StandinResponse, accept_encoding: str | None
+    ) -> tuple[bytes, dict[str, str]]:
+        """
+        Body bytes and headers for ``response``, compressed if the request allows.
+
+        Args:
+            response: Response from ``handle``
+            accept_encoding: The request's ``Accept-Encoding`` header, if any
+        """
+        content = response.content()
+        headers = dict(response.headers)
+        if self.compression and len(content) >= _COMPRESS_MIN_SIZE:
+            encoding = choose_encoding(accept_encoding, available_encodings())
+            if encoding is not None:
+                content = compress(content, encoding)
+                headers["content-encoding"] = encoding
+                headers["vary"] = "Accept-Encoding"
+        headers["content-length"] = str(len(content))
+        return content, headers
+
+    def _handle_httpx(self, request: httpx.Request, body: bytes) -> StandinResponse:
+        params = dict(request.url.params)
+        if body:
+            params.update(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
+        return self.handle(request.method, request.url.path, params)
+
+    def transport(self, *, sleep: bool = True) -> httpx.BaseTransport:
+        """
+        Sync httpx transport that answers requests in-process.
+
+        Args:
+            sleep: Apply sampled latency with ``time.sleep`` (default: True).
+                Latency beyond the request's read timeout sleeps for the
+                timeout and raises ``httpx.ReadTimeout``
+        """
+        return _SyncTransport(self, sleep=sleep)
+
+    def async_transport(self) -> httpx.AsyncBaseTransport:
+        """Async httpx transport that drives the ASGI interface in-process."""
+        return httpx.ASGITransport(app=self)
+
+    async def __call__(
+        self,
+        scope: MutableMapping[str, Any],
+        receive: Callable[[], Awaitable[MutableMapping[str, Any]]],
+        send: Callable[[MutableMapping[str, Any]], Awaitable[None]],
+    ) -> None:
+        """ASGI entry point."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        chunks = []
+        more = True
+        while more:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more = message.get("more_body", False)
+
+        params = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        body = b"".join(chunks)
+        if body:
+            params.update(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
+
+        response = self.handle(scope["method"], scope["path"], params)
+        if response.delay:
+            await asyncio.sleep(response.delay)
+        accept = dict(scope.get("headers", ())).get(b"accept-encoding", b"").decode("latin-1")
+        content, headers = self.encode(response, accept)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+        """
+        Create a threaded HTTP server for this stand-in.
+
+        Call ``serve_forever()`` on the result (optionally in a thread) and
+        ``shutdown()`` to stop it. Pass ``port=0`` to pick a free port; the
+        bound address is ``server.server_address``.
+        """
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle's algorithm
+            # the body waits for the client's delayed ACK (~40ms) on every call
+            disable_nagle_algorithm = True
+
+            def _respond(self) -> None:
+                url = urlsplit(self.path)
+                params = dict(parse_qsl(url.query, keep_blank_values=True))
+                length = int(self.headers.get("content-length") or 0)
+                if length:
+                    body = self.rfile.read(length).decode("utf-8")
+                    params.update(parse_qsl(body, keep_blank_values=True))
+                response = standin.handle(self.command, url.path, params)
+                if response.delay:
+                    time.sleep(response.delay)
+                content, headers = standin.encode(response, self.headers.get("accept-encoding"))
+                self.send_response(response.status_code)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = _respond  # noqa: N815
+            do_POST = _respond  # noqa: N815
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+class _SyncTransport(httpx.BaseTransport):
+    def __init__(self, server: StandinServer, *, sleep: bool) -> None:
+        self._server = server
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._server._handle_httpx(request, request.read())
+        if self._sleep and response.delay:
+            # Honour the client's read timeout like a real socket would
+            read_timeout = request.extensions.get("timeout", {}).get("read")
+            if read_timeout is not None and response.delay > read_timeout:
+                time.sleep(read_timeout)
+                raise httpx.ReadTimeout("timed out", request=request)
+            time.sleep(response.delay)
+        content, headers = self._server.encode(response, request.headers.get("accept-encoding"))
+        # A stream rather than content=, so the client reads and decodes it as off a socket
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            stream=httpx.ByteStream(content),
+            request=request,
+        )
+
+
+def _error(code: str, message: str | None = None) -> StandinResponse:
+    return StandinResponse(
+        200,
+        {"code": code, "message": message or ERROR_MESSAGES.get(code, f"API error code: {code}")},
+    )
+
+
+def _cents(amount: str) -> int:
+    whole, _, frac = amount.partition(".")
+    return int(whole) * 100 + int((frac + "00")[:2])
+
+
+def _amount(cents: int) -> str:
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def _date(timestamp_ms: int) -> dict[str, str]:
+    formatted = time.strftime("%b. %d, %Y, %H:%M:%S UTC.", time.gmtime(timestamp_ms / 1000))
+    return {"format_date": formatted, "timestamp": str(timestamp_ms)}
+
+
+def _tier_for(tiers: list[dict[str, str]], quantity: int) -> dict[str, str] | None:
+    for tier in tiers:
+        if int(tier["min_quantity"]) <= quantity <= int(tier["max_quantity"]):
+            return tier
+    if tiers and quantity > int(tiers[-1]["max_quantity"]):
+        return tiers[-1]
+    return None
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the stand-in on a local socket."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local Alibaba Open Platform stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--app-key", default="test_app_key")
+    parser.add_argument("--app-secret", default="test_app_secret")
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    parser.add_argument("--latency-median", type=float, default=0.0, help="seconds")
+    parser.add_argument("--latency-p99", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--http-error-rate", type=float, default=0.0)
+    parser.add_argument("--no-compression", action="store_true")
+    args = parser.parse_args(argv)
+
+    latency = None
+    if args.latency_median > 0:
+        latency = LatencyModel.lognormal(
+            args.latency_median, max(args.latency_p99, args.latency_median)
+        )
+
+    server = StandinServer(
+        args.app_key,
+        args.app_secret,
+        catalog_size=args.catalog_size,
+        latency=latency,
+        error_rate=args.error_rate,
+        http_error_rate=args.http_error_rate,
+        compression=not args.no_compression,
+    ).serve(args.host, args.port)
+    print(f"Stand-in listening on http://{args.host}:{server.server_address[1]}/rest")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+"""
+Benchmark harness and fixtures.
+
+Benchmarks are skipped unless pytest runs with ``--run-benchmarks``. Each
+benchmark drives a callable for a fixed wall-clock duration on one or more
+threads, records per-operation latency, and compares requests/sec and p50
+against ``baselines.json`` (tail percentiles are reported but too noisy
+under thread contention to gate on). A regression beyond ``--benchmark-threshold``
+fails the test; ``--update-baselines`` rewrites the stored numbers instead.
+
+Memory benchmarks use ``BenchmarkRunner.measure_memory`` and gate on bytes
+retained per item, measured with ``tracemalloc``; they also report the peak
+traced memory while building, the process's peak RSS and, on request, the
+source lines that allocated the most retained memory. Crawl benchmarks take
+their size from ``--crawl-size``.
+
+Import benchmarks use ``BenchmarkRunner.measure_import``, which runs a
+statement in fresh interpreters under ``python -X importtime`` and gates on
+a fixed budget rather than a baseline.
+
+    pytest tests/benchmarks --run-benchmarks
+    pytest tests/benchmarks --run-benchmarks --update-baselines
+    pytest tests/benchmarks/test_crawl_memory.py --run-benchmarks --crawl-size 20000
+"""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.standin import StandinServer
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+_RESULTS: list["BenchmarkResult"] = []
+_MEMORY_RESULTS: list["MemoryResult"] = []
+_IMPORT_RESULTS: list["ImportResult"] = []
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Throughput and latency of one benchmark.
+
+    ``rps`` and ``p50`` are best-of-rounds figures, which are far more stable
+    on shared machines than whole-run averages; ``p95``/``p99`` are taken
+    over every sample.
+    """
+
+    name: str
+    threads: int
+    rounds: list[tuple[int, float, float]] = field(repr=False)  # (ops, seconds, p50)
+    latencies: list[float] = field(repr=False)
+    extra: dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.latencies.sort()
+
+    @property
+    def operations(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def rps(self) -> float:
+        return max((ops / elapsed for ops, elapsed, _ in self.rounds if elapsed), default=0.0)
+
+    @property
+    def p50(self) -> float:
+        return min((p50 for _, _, p50 in self.rounds), default=0.0)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.latencies, 95)
+
+    @property
+    def p99(self) -> float:
+        return percentile(self.latencies, 99)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "rps": round(self.rps, 1),
+            "p50_us": round(self.p50 * 1e6, 2),
+            "p95_us": round(self.p95 * 1e6, 2),
+            "p99_us": round(self.p99 * 1e6, 2),
+            **self.extra,
+        }
+
+
+@dataclass
+class MemoryResult:
+    """
+    Bytes retained by a structure built from ``items`` items.
+
+    ``peak`` is the most traced memory in use while building; ``rss`` is the
+    process's peak resident set size afterwards (0 where unavailable), so
+    it only grows across a session. ``top`` lists the source lines that
+    allocated the most of ``retained``, largest first.
+    """
+
+    name: str
+    items: int
+    retained: int
+    peak: int = 0
+    rss: int = 0
+    top: list[tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def bytes_per_item(self) -> float:
+        return self.retained / self.items if self.items else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {"bytes_per_item": round(self.bytes_per_item, 1)}
+
+
+def _peak_rss() -> int:
+    """Peak resident set size of this process in bytes, or 0 where unknown."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _top_allocators(snapshot: tracemalloc.Snapshot, limit: int) -> list[tuple[str, int]]:
+    """The ``limit`` source lines holding the most memory in ``snapshot``."""
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    top = []
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        filename = frame.filename
+        for root in sys.path:
+            if root and filename.startswith(root + os.sep):
+                filename = filename[len(root) + 1 :]
+                break
+        top.append((f"{filename}:{frame.lineno}", stat.size))
+    return top
+
+
+@dataclass
+class ImportResult:
+    """
+    Cold-start cost of one import statement.
+
+    ``microseconds`` is the best-of-runs sum of the cumulative ``-X importtime``
+    figures of the top-level modules the statement imported; ``modules`` is
+    every module it imported that interpreter startup had not.
+    """
+
+    name: str
+    statement: str
+    microseconds: int
+    modules: set[str] = field(repr=False)
+
+
+def _importtime(statement: str) -> dict[str, tuple[int, bool]]:
+    """Module -> (cumulative us, top-level) from ``python -X importtime -c statement``."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = (int(cumulative), not name[1:].startswith(" "))
+    return modules
+
+
+class BenchmarkRunner:
+    """Runs benchmarks and checks them against stored baselines."""
+
+    def __init__(self, baselines: dict[str, dict[str, float]], threshold: float, update: bool):
+        self.baselines = baselines
+        self.threshold = threshold
+        self.update = update
+
+    def run(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        *,
+        threads: int = 1,
+        duration: float = 0.5,
+        rounds: int = 5,
+        warmup: int = 20,
+    ) -> BenchmarkResult:
+        """
+        Call ``fn`` repeatedly on ``threads`` threads for ``duration`` seconds.
+
+        Args:
+            name: Benchmark name, used as the baseline key
+            fn: Operation under test
+            threads: Number of concurrent threads
+            duration: Total measurement time in seconds, split across rounds
+            rounds: Number of measurement rounds
+            warmup: Untimed calls per thread before measuring
+
+        Returns:
+            The result, after it has been checked against the baseline
+        """
+        for _ in range(warmup):
+            fn()
+
+        measured = []
+        latencies: list[float] = []
+        for _ in range(rounds):
+            samples, elapsed = self._round(fn, threads, duration / rounds)
+            samples.sort()
+            measured.append((len(samples), elapsed, percentile(samples, 50)))
+            latencies.extend(samples)
+
+        result = BenchmarkResult(name, threads, measured, latencies)
+        self.check(result)
+        return result
+
+    @staticmethod
+    def _round(fn: Callable[[], Any], threads: int, duration: float) -> tuple[list[float], float]:
+        per_thread: list[list[float]] = [[] for _ in range(threads)]
+        start_barrier = threading.Barrier(threads + 1)
+        stop_at = [float("inf")]  # lowered once every thread is ready
+
+        def worker(samples: list[float]) -> None:
+            clock = time.perf_counter
+            start_barrier.wait()
+            while True:
+                t0 = clock()
+                fn()
+                t1 = clock()
+                samples.append(t1 - t0)
+                if t1 >= stop_at[0]:
+                    break
+
+        workers = [threading.Thread(target=worker, args=(s,)) for s in per_thread]
+        for thread in workers:
+            thread.start()
+        start_barrier.wait()
+        began = time.perf_counter()
+        stop_at[0] = began + duration
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - began
+        return [sample for samples in per_thread for sample in samples], elapsed
+
+    def measure_memory(
+        self, name: str, build: Callable[[], Any], items: int | None = None, *, top: int = 0
+    ) -> MemoryResult:
+        """
+        Measure the memory retained by the result of ``build()``.
+
+        Args:
+            name: Benchmark name, used as the baseline key
+            build: Builds and returns the structure under test
+            items: Number of items in the structure, for bytes per item.
+                Default: ``len()`` of the result
+            top: Source lines to report as the largest allocators of what is retained
+
+        Returns:
+            The result, after it has been checked against the baseline
+        """
+        gc.collect()
+        tracemalloc.start(1)
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            retained = build()
+            gc.collect()
+            after, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot() if top else None
+        finally:
+            tracemalloc.stop()
+        count = len(retained) if items is None else items
+        del retained
+
+        result = MemoryResult(name, count, after - before, peak - before, _peak_rss())
+        if snapshot is not None:
+            result.top = _top_allocators(snapshot, top)
+        _MEMORY_RESULTS.append(result)
+        if self.update:
+            self.baselines[name] = result.as_dict()
+            return result
+
+        baseline = self.baselines.get(name, {}).get("bytes_per_item")
+        if baseline and result.bytes_per_item > baseline * (1 + self.threshold):
+            pytest.fail(
+                f"{name} regressed by more than {self.threshold:.0%}: "
+                f"{result.bytes_per_item:.0f} bytes/item > baseline {baseline:.0f}"
+            )
+        return result
+
+    def measure_import(
+        self, name: str, statement: str, *, budget: float, runs: int = 5
+    ) -> ImportResult:
+        """
+        Measure the import time of ``statement`` in fresh interpreters.
+
+        Args:
+            name: Benchmark name
+            statement: Python source to run, e.g. ``"import alibaba_api"``
+            budget: Seconds the best run may take before the test fails
+            runs: Interpreters to start; the fastest run is reported
+
+        Returns:
+            The result, after it has been checked against the budget
+        """
+        startup = set(_importtime("pass"))
+        _importtime(statement)  # write any missing .pyc files first
+        best = None
+        modules: set[str] = set()
+        for _ in range(runs):
+            timings = _importtime(statement)
+            modules = set(timings) - startup
+            total = sum(us for module, (us, top) in timings.items() if top and module in modules)
+            best = total if best is None else min(best, total)
+
+        result = ImportResult(name, statement, best or 0, modules)
+        _IMPORT_RESULTS.append(result)
+        if result.microseconds > budget * 1e6:
+            pytest.fail(
+                f"{name} took {result.microseconds / 1000:.1f}ms, "
+                f"over its {budget * 1000:.0f}ms budget"
+            )
+        return result
+
+    def check(self, result: BenchmarkResult) -> None:
+        """Record ``result`` and fail if it regressed past the threshold."""
+        _RESULTS.append(result)
+        if self.update:
+            self.baselines[result.name] = result.as_dict()
+            return
+
+        baseline = self.baselines.get(result.name)
+        if not baseline:
+            return
+
+        problems = []
+        current = result.as_dict()
+        if "rps" in baseline and current["rps"] < baseline["rps"] * (1 - self.threshold):
+            problems.append(f"rps {current['rps']:.0f} < baseline {baseline['rps']:.0f}")
+        if "p50_us" in baseline and current["p50_us"] > baseline["p50_us"] * (1 + self.threshold):
+            problems.append(f"p50 {current['p50_us']:.1f}us > baseline {baseline['p50_us']:.1f}us")
+        if problems:
+            pytest.fail(
+                f"{result.name} regressed by more than {self.threshold:.0%}: " + "; ".join(problems)
+            )
+
+
+class CannedTransport(httpx.BaseTransport):
+    """
+    Zero-latency transport replaying one stand-in response per API path.
+
+    The first request to each path is answered by the stand-in; later requests
+    get the same bytes back, so benchmarks measure client-side cost only.
+    """
+
+    def __init__(self, server: StandinServer) -> None:
+        self._server = server
+        self._upstream = server.transport(sleep=False)
+        self._cache: dict[str, tuple[int, dict[str, str], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        cached = self._cache.get(path)
+        if cached is None:
+            with self._lock:
+                response = self._upstream.handle_request(request)
+                # Raw bytes, still compressed if they were, so replays decode them again
+                cached = (
+                    response.status_code,
+                    dict(response.headers),
+                    b"".join(response.iter_raw()),
+                )
+                self._cache[path] = cached
+        status_code, headers, content = cached
+        return httpx.Response(
+            status_code, headers=headers, stream=httpx.ByteStream(content), request=request
+        )
+
+
+@pytest.fixture(scope="session")
+def bench(request: pytest.FixtureRequest) -> Generator[BenchmarkRunner, None, None]:
+    """Benchmark runner bound to the stored baselines."""
+    update = request.config.getoption("--update-baselines")
+    baselines = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    runner = BenchmarkRunner(baselines, request.config.getoption("--benchmark-threshold"), update)
+    yield runner
+    if update:
+        BASELINES_PATH.write_text(
+            json.dumps(dict(sorted(runner.baselines.items())), indent=2) + "\n"
+        )
+
+
+@pytest.fixture(scope="session")
+def crawl_size(request: pytest.FixtureRequest) -> int:
+    """Items fetched by the crawl memory benchmarks (``--crawl-size``)."""
+    return int(request.config.getoption("--crawl-size"))
+
+
+@pytest.fixture(scope="session")
+def standin() -> StandinServer:
+    """Stand-in server with a mid-sized synthetic catalog."""
+    return StandinServer("bench_app_key", "bench_app_secret", catalog_size=10_000)
+
+
+@pytest.fixture(scope="session")
+def bench_config() -> Config:
+    """
+    Configuration matching the benchmark stand-in.
+
+    Responses are uncompressed so the pipeline numbers stay comparable;
+    ``test_compression.py`` measures decoding separately.
+    """
+    return Config(
+        app_key="bench_app_key",
+        app_secret="bench_app_secret",
+        access_token="bench_access_token",
+        compression=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_client(
+    standin: StandinServer, bench_config: Config
+) -> Generator[AlibabaClient, None, None]:
+    """Client wired to a canned, zero-latency transport."""
+    client = AlibabaClient(bench_config, transport=CannedTransport(standin))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def canned_transport(standin: StandinServer) -> CannedTransport:
+    """A fresh canned transport, for benchmarks that build their own client."""
+    return CannedTransport(standin)
+
+
+@pytest.fixture(scope="session")
+def bench_ids(standin: StandinServer, bench_config: Config) -> dict[str, str]:
+    """A product, SKU and order that exist on the stand-in."""
+    with AlibabaClient(bench_config, transport=standin.transport(sleep=False)) as client:
+        product = client.get_product(standin.product_ids()[0])
+        sku = product["skus"][0]
+        order = client.create_order(
+            channel_refer_id="BENCH-001",
+            product_list=[
+                {
+                    "product_id": product["product_id"],
+                    "sku_id": sku["sku_id"],
+                    "quantity": sku["ladder_price"][0]["min_quantity"],
+                }
+            ],
+            logistics_detail={"shipment_address": {}, "dispatch_location": "CN"},
+        )
+    return {
+        "product_id": product["product_id"],
+        "sku_id": sku["sku_id"],
+        "trade_id": order["trade_id"],
+    }
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Print tables of benchmark results."""
+    if _IMPORT_RESULTS:
+        terminalreporter.section("import benchmark results")
+        terminalreporter.write_line(f"{'benchmark':<48} {'ms':>8} {'modules':>8}")
+        for imported in _IMPORT_RESULTS:
+            terminalreporter.write_line(
+                f"{imported.name:<48} {imported.microseconds / 1000:>8.1f} "
+                f"{len(imported.modules):>8}"
+            )
+    if _MEMORY_RESULTS:
+        terminalreporter.section("memory benchmark results")
+        terminalreporter.write_line(
+            f"{'benchmark':<48} {'items':>8} {'KiB':>10} {'bytes/item':>11} "
+            f"{'peak KiB':>10} {'RSS MiB':>8}"
+        )
+        for memory in _MEMORY_RESULTS:
+            terminalreporter.write_line(
+                f"{memory.name:<48} {memory.items:>8} {memory.retained / 1024:>10.1f} "
+                f"{memory.bytes_per_item:>11.1f} {memory.peak / 1024:>10.1f} "
+                f"{memory.rss / 2**20:>8.1f}"
+            )
+        for memory in _MEMORY_RESULTS:
+            if not memory.top:
+                continue
+            terminalreporter.write_line(f"\ntop allocators retained by {memory.name}:")
+            for location, size in memory.top:
+                terminalreporter.write_line(f"  {size / 1024:>10.1f} KiB  {location}")
+    if not _RESULTS:
+        return
+    terminalreporter.section("benchmark results")
+    terminalreporter.write_line(
+        f"{'benchmark':<48} {'thr':>3} {'req/s':>10} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}"
+    )
+    for result in _RESULTS:
+        terminalreporter.write_line(
+            f"{result.name:<48} {result.threads:>3} {result.rps:>10.0f} "
+            f"{result.p50 * 1e6:>9.1f} {result.p95 * 1e6:>9.1f} {result.p99 * 1e6:>9.1f}"
+        )
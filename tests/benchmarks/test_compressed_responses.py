@@ -0,0 +1,47 @@
+"""
+Client-side cost of compressed responses.
+
+The same high-level calls run over the canned transport with and without
+``Config.compression``; the compressed case pays for decoding the most
+compact encoding httpx can read here (gzip without the optional extras).
+Bandwidth savings do not show up in-process; these numbers bound what
+decompression adds per call.
+"""
+
+import dataclasses
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.compression import available_encodings
+from alibaba_api.config import Config
+from alibaba_api.metrics import MetricsRegistry
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("compressed", [False, True], ids=["identity", "compressed"])
+@pytest.mark.parametrize("method", ["get_product", "list_products"])
+def test_compressed_responses(
+    bench: Any,
+    canned_transport: Any,
+    bench_config: Config,
+    bench_ids: dict[str, str],
+    method: str,
+    compressed: bool,
+) -> None:
+    """One high-level method with identity or compressed bodies."""
+    calls = {
+        "get_product": lambda c: c.get_product(bench_ids["product_id"]),
+        "list_products": lambda c: c.list_products(scene_id="906124611", page_size=50),
+    }
+    call = calls[method]
+    config = dataclasses.replace(bench_config, compression=compressed)
+    encoding = available_encodings()[0] if compressed else "identity"
+    metrics = MetricsRegistry()
+    with AlibabaClient(config, transport=canned_transport, metrics=metrics) as client:
+        result = bench.run(f"compression.{method}[{encoding}]", lambda: call(client))
+    assert result.operations > 0
+    (row,) = metrics.transfer()
+    assert (row["ratio"] < 1) is compressed
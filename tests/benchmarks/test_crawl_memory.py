@@ -0,0 +1,180 @@
+"""
+Memory held by the results of a catalog or order crawl.
+
+A crawl of ``--crawl-size`` products (``list_products`` pages, then
+``get_product`` for each ID) or orders (``list_orders`` pages, then
+``get_order``) is recorded from the stand-in once, then replayed at zero
+latency through a fresh client while everything it returns is kept, as a
+crawler that accumulates results does. The numbers are bytes retained per
+product or order in each response mode, plus the response envelopes that
+``_parse_response`` produces, so growth in either shows up here before it
+shows up as an OOM. The top allocators are printed with the results.
+
+Each crawl is replayed once before it is measured, so the client's
+connection, caches and the cassette's replay cursors are already in place.
+Objects CPython recycles from its free lists keep the line that first
+allocated them, so part of what the results hold is listed under httpx,
+signing and ``contextlib`` lines even though nothing from the request path
+is kept.
+"""
+
+import dataclasses
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from alibaba_api.cassette import Cassette, RecordingTransport, ReplayTransport
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError
+from alibaba_api.standin import StandinServer
+
+pytestmark = pytest.mark.benchmark
+
+SCENE_ID = "906124611"
+LIST_PAGE_SIZE = 100
+ORDER_PAGE_SIZE = 50
+TOP_ALLOCATORS = 8
+
+Crawl = Callable[[AlibabaClient], list[Any]]
+
+
+def _crawl_products(limit: int) -> Crawl:
+    """Crawl that keeps up to ``limit`` products, skipping offline ones."""
+
+    def crawl(client: AlibabaClient) -> list[Any]:
+        products: list[Any] = []
+        page = 0
+        while len(products) < limit:
+            listing = client.list_products(SCENE_ID, page=page, page_size=LIST_PAGE_SIZE)
+            if not listing["product_ids"]:
+                break
+            for product_id in listing["product_ids"]:
+                try:
+                    products.append(client.get_product(product_id))
+                except AlibabaAPIError:
+                    continue
+                if len(products) == limit:
+                    break
+            page += 1
+        return products
+
+    return crawl
+
+
+def _crawl_orders(client: AlibabaClient) -> list[Any]:
+    """Crawl that keeps every order's details."""
+    orders: list[Any] = []
+    page = 0
+    while True:
+        listing = client.list_orders(start_page=page, page_size=ORDER_PAGE_SIZE)
+        trade_ids = [
+            item["trade_id"] if isinstance(item, dict) else item.trade_id
+            for item in listing["orders"]
+        ]
+        if not trade_ids:
+            return orders
+        orders.extend(client.get_order(trade_id) for trade_id in trade_ids)
+        page += 1
+
+
+def _record(server: StandinServer, config: Config, crawl: Crawl) -> tuple[Cassette, int]:
+    """Record ``crawl`` against ``server``; returns the cassette and items crawled."""
+    cassette = Cassette()
+    with AlibabaClient(
+        config, transport=RecordingTransport(cassette, server.transport(sleep=False))
+    ) as client:
+        items = len(crawl(client))
+    return cassette, items
+
+
+def _measure(
+    bench: Any, name: str, config: Config, cassette: Cassette, crawl: Crawl, items: int
+) -> None:
+    with AlibabaClient(config, transport=ReplayTransport(cassette, latency_scale=0)) as client:
+        assert len(crawl(client)) == items
+        result = bench.measure_memory(name, lambda: crawl(client), top=TOP_ALLOCATORS)
+    assert result.items == items
+    assert result.retained > 0
+
+
+@pytest.fixture(scope="module")
+def product_crawl(
+    standin: StandinServer, bench_config: Config, crawl_size: int
+) -> tuple[Cassette, int]:
+    """Cassette of a crawl of ``crawl_size`` products."""
+    return _record(standin, bench_config, _crawl_products(crawl_size))
+
+
+@pytest.fixture(scope="module")
+def order_crawl(
+    standin: StandinServer, bench_config: Config, crawl_size: int
+) -> tuple[Cassette, int]:
+    """Cassette of a crawl of ``crawl_size`` orders, placed on a stand-in of their own."""
+    server = StandinServer(
+        bench_config.app_key, bench_config.app_secret, catalog_size=len(standin.product_ids())
+    )
+    with AlibabaClient(bench_config, transport=server.transport(sleep=False)) as client:
+        product = client.get_product(standin.product_ids()[0])
+        sku = product["skus"][0]
+        line = {
+            "product_id": product["product_id"],
+            "sku_id": sku["sku_id"],
+            "quantity": sku["ladder_price"][0]["min_quantity"],
+        }
+        for number in range(crawl_size):
+            client.create_order(
+                channel_refer_id=f"CRAWL-{number:06d}",
+                product_list=[line],
+                logistics_detail={"shipment_address": {}, "dispatch_location": "CN"},
+            )
+    return _record(server, bench_config, _crawl_orders)
+
+
+@pytest.mark.parametrize("mode", ["dict", "trusted"])
+def test_product_crawl(
+    bench: Any, bench_config: Config, product_crawl: tuple[Cassette, int], mode: str
+) -> None:
+    """Products kept from a crawl, as dicts or unvalidated models."""
+    cassette, items = product_crawl
+    config = dataclasses.replace(bench_config, response_mode=mode)
+    _measure(
+        bench, f"memory.crawl.product[{mode}]", config, cassette, _crawl_products(items), items
+    )
+
+
+@pytest.mark.parametrize("mode", ["dict", "trusted"])
+def test_order_crawl(
+    bench: Any, bench_config: Config, order_crawl: tuple[Cassette, int], mode: str
+) -> None:
+    """Order details kept from a crawl, as dicts or unvalidated models."""
+    cassette, items = order_crawl
+    config = dataclasses.replace(bench_config, response_mode=mode)
+    _measure(bench, f"memory.crawl.order[{mode}]", config, cassette, _crawl_orders, items)
+
+
+def test_product_responses(
+    bench: Any, bench_config: Config, product_crawl: tuple[Cassette, int]
+) -> None:
+    """Whole ``get_product`` responses as returned by ``_parse_response``."""
+    cassette, items = product_crawl
+    product_ids = [
+        json.loads(interaction.params["query_req"])["product_id"]
+        for interaction in cassette
+        if interaction.path.endswith("/eco/buyer/product/description")
+        and json.loads(interaction.body).get("code") == "0"
+    ]
+    assert len(product_ids) == items
+
+    def crawl(client: AlibabaClient) -> list[Any]:
+        return [
+            client.request(
+                "/eco/buyer/product/description",
+                {"query_req": json.dumps({"product_id": product_id, "country": "US"})},
+            )
+            for product_id in product_ids
+        ]
+
+    _measure(bench, "memory.crawl.response", bench_config, cassette, crawl, items)
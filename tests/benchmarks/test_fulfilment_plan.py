@@ -0,0 +1,42 @@
+"""
+Landed-cost plans against a stand-in with 20 ms server latency.
+
+Each operation plans one order from cold (a fresh optimizer, so no cached
+quotes). "sequential" makes the product, inventory and freight calls one
+at a time; "concurrent" overlaps them as ``LandedCostOptimizer`` does by
+default. The product ships from two of the three dispatch locations.
+"""
+
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.optimizer import LandedCostOptimizer
+from alibaba_api.standin import LatencyModel, StandinServer
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def slow_client(bench_config: Config) -> Generator[tuple[AlibabaClient, str], None, None]:
+    """Client whose calls each take 20 ms, and a product shipping from CN and US."""
+    server = StandinServer(
+        "bench_app_key", "bench_app_secret", catalog_size=20, latency=LatencyModel.constant(0.02)
+    )
+    with AlibabaClient(bench_config, transport=server.transport(sleep=True)) as client:
+        yield client, str(server.product_ids()[2])
+
+
+@pytest.mark.parametrize(("label", "workers"), [("sequential", 1), ("concurrent", 8)])
+def test_plan(bench: Any, slow_client: tuple[AlibabaClient, str], label: str, workers: int) -> None:
+    """One cold plan per operation."""
+    client, product_id = slow_client
+    bench.run(
+        f"optimizer.plan[{label}]",
+        lambda: LandedCostOptimizer(client, max_workers=workers).plan(product_id, 100, "US"),
+        duration=2.0,
+        warmup=2,
+    )
@@ -0,0 +1,59 @@
+"""
+The httpx and stdlib backends over a real localhost socket.
+
+Both run against the stand-in served by ``http.server`` on 127.0.0.1, so
+each call pays for the TCP round trip and the server's own parsing; the
+difference between the two is the client-side HTTP stack. The pool is
+warmed first so no connection is opened inside the measured rounds.
+"""
+
+import dataclasses
+import threading
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.standin import StandinServer
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def base_url(standin: StandinServer) -> Generator[str, None, None]:
+    """Serve the benchmark stand-in on a local socket."""
+    http = standin.serve(port=0)
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{http.server_address[1]}/rest"
+    http.shutdown()
+    http.server_close()
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+@pytest.mark.parametrize("method", ["get_product", "list_orders"])
+@pytest.mark.parametrize("backend", ["httpx", "stdlib"])
+def test_backend(
+    bench: Any,
+    base_url: str,
+    bench_config: Config,
+    bench_ids: dict[str, str],
+    backend: str,
+    method: str,
+    threads: int,
+) -> None:
+    """One high-level method over each backend."""
+    calls = {
+        "get_product": lambda c: c.get_product(bench_ids["product_id"]),
+        "list_orders": lambda c: c.list_orders(page_size=20),
+    }
+    call = calls[method]
+    config = dataclasses.replace(bench_config, base_url_override=base_url, http_backend=backend)
+    with AlibabaClient(config) as client:
+        client.warmup(connections=threads)
+        result = bench.run(
+            f"backend.{backend}.{method}[{threads}]", lambda: call(client), threads=threads
+        )
+    assert result.operations > 0
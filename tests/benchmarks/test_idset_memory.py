@@ -0,0 +1,84 @@
+"""
+Memory and speed of product ID sets.
+
+Keeps the IDs of a scene listing as the ``set[str]`` a crawler would build
+from ``product_ids`` and as a ``ProductIdSet``, then times membership and
+the difference between two crawl runs for both. IDs are 13-digit numbers
+like the API's, drawn at random so the sets don't share structure.
+"""
+
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from alibaba_api.idset import ProductIdSet, SceneIndex
+
+pytestmark = pytest.mark.benchmark
+
+IDS = 200_000
+LOOKUPS = 1000
+
+
+@pytest.fixture(scope="module")
+def listing() -> list[str]:
+    """IDS product IDs as the listings return them."""
+    rng = random.Random(0)
+    return [str(rng.randrange(1_600_000_000_000, 1_700_000_000_000)) for _ in range(IDS)]
+
+
+@pytest.fixture(scope="module")
+def next_run(listing: list[str]) -> list[str]:
+    """A later crawl: a tenth of the IDs dropped and as many new ones listed."""
+    rng = random.Random(1)
+    kept = listing[IDS // 10 :]
+    return kept + [
+        str(rng.randrange(1_700_000_000_000, 1_800_000_000_000)) for _ in listing[: IDS // 10]
+    ]
+
+
+def test_memory_str_set(bench: Any, listing: list[str]) -> None:
+    """IDs as a set of strings."""
+    bench.measure_memory("memory.idset[set_str]", lambda: set(map(str, map(int, listing))))
+
+
+def test_memory_id_set(bench: Any, listing: list[str]) -> None:
+    """IDs as a ProductIdSet."""
+    bench.measure_memory("memory.idset[compact]", lambda: ProductIdSet(listing))
+
+
+def test_lookup_str_set(bench: Any, listing: list[str]) -> None:
+    """Membership in a set of strings."""
+    ids = set(listing)
+    probes = listing[:LOOKUPS]
+    bench.run("idset.contains[set_str]", lambda: sum(probe in ids for probe in probes))
+
+
+def test_lookup_id_set(bench: Any, listing: list[str]) -> None:
+    """Membership in a ProductIdSet."""
+    ids = ProductIdSet(listing)
+    probes = listing[:LOOKUPS]
+    bench.run("idset.contains[compact]", lambda: sum(probe in ids for probe in probes))
+
+
+def test_difference_str_set(bench: Any, listing: list[str], next_run: list[str]) -> None:
+    """IDs new in the later run, from two sets of strings."""
+    before, after = set(listing), set(next_run)
+    bench.run("idset.difference[set_str]", lambda: after - before, rounds=3, warmup=1)
+
+
+def test_difference_id_set(bench: Any, listing: list[str], next_run: list[str]) -> None:
+    """IDs new in the later run, from two ProductIdSets."""
+    before, after = ProductIdSet(listing), ProductIdSet(next_run)
+    assert len(after - before) == IDS // 10
+    bench.run("idset.difference[compact]", lambda: after - before, rounds=3, warmup=1)
+
+
+def test_index_load(bench: Any, listing: list[str], tmp_path_factory: Any) -> None:
+    """Reloading a saved six-scene index."""
+    path: Path = tmp_path_factory.mktemp("idset") / "scenes.idx"
+    index = SceneIndex({f"scene{n}": listing[n::6] for n in range(6)})
+    index.save(path)
+    assert SceneIndex.load(path) == index
+    bench.run("idset.index_load", lambda: SceneIndex.load(path), rounds=3, warmup=1)
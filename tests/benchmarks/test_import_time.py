@@ -0,0 +1,40 @@
+"""
+Cold-start cost of importing the package.
+
+Each statement runs in fresh interpreters under ``python -X importtime``.
+Importing the package or the signing helpers must not pull in httpx or
+pydantic; those load only with ``AlibabaClient`` or the models. Budgets are
+several times the figures on a developer laptop, so only a heavy import
+slipping back into the package ``__init__`` trips them.
+"""
+
+from typing import Any
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+HEAVY = ("httpx", "pydantic")
+
+
+@pytest.mark.parametrize(
+    ("label", "statement", "budget"),
+    [
+        ("package", "import alibaba_api", 0.015),
+        ("signing", "from alibaba_api import calculate_signature", 0.015),
+        ("config", "from alibaba_api import Config, AlibabaAPIError", 0.040),
+        ("money", "from alibaba_api.models.money import Money", 0.030),
+    ],
+)
+def test_light_import(bench: Any, label: str, statement: str, budget: float) -> None:
+    """Light entry points should stay within budget and skip httpx and pydantic."""
+    result = bench.measure_import(f"import.{label}", statement, budget=budget)
+    assert not {module.partition(".")[0] for module in result.modules} & set(HEAVY)
+
+
+def test_client_import(bench: Any) -> None:
+    """The full client, with httpx and pydantic, for comparison."""
+    result = bench.measure_import(
+        "import.client", "from alibaba_api import AlibabaClient", budget=0.600
+    )
+    assert {"httpx", "pydantic"} <= result.modules
@@ -0,0 +1,76 @@
+"""
+Pricing every SKU of a catalog slice over a range of quantities.
+
+"loop" is the per-quantity scan over ``Sku.ladder_price`` tiers that pricing
+jobs used before ``alibaba_api.pricing``. "python" and "numpy" evaluate
+compiled ``LadderTable``s with ``landed_cost`` on each backend, adding
+freight from a two-quote ``FreightRate``. One operation prices every SKU at
+every quantity.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from alibaba_api.pricing import HAS_NUMPY, FreightRate, LadderTable, landed_cost
+from alibaba_api.standin import StandinServer
+
+pytestmark = pytest.mark.benchmark
+
+PRODUCTS = 10
+QUANTITIES = range(1, 501)
+
+
+@pytest.fixture(scope="module")
+def skus(standin: StandinServer) -> list[dict[str, Any]]:
+    """Every SKU of the first PRODUCTS stand-in products."""
+    return [sku for pid in standin.product_ids()[:PRODUCTS] for sku in standin.product(pid)["skus"]]
+
+
+@pytest.fixture(scope="module")
+def freight() -> FreightRate:
+    """A carrier quoted at two quantities."""
+    return FreightRate([(1, 1200), (1000, 48_000)], "USD", "BENCH")
+
+
+def test_landed_cost_loop(bench: Any, skus: list[dict[str, Any]], freight: FreightRate) -> None:
+    """Scan the tiers for every quantity, Decimal arithmetic."""
+
+    def price_all() -> list[list[Decimal]]:
+        curves = []
+        for sku in skus:
+            tiers = sku["ladder_price"]
+            curve = []
+            for qty in QUANTITIES:
+                unit = None
+                for tier in tiers:
+                    if int(tier["min_quantity"]) <= qty:
+                        unit = Decimal(tier["price"])
+                if unit is not None:
+                    curve.append(unit * qty + freight.fee(qty).to_decimal())
+            curves.append(curve)
+        return curves
+
+    bench.run("pricing.landed_cost[loop]", price_all, duration=2.0, rounds=5, warmup=2)
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "python",
+        pytest.param(
+            "numpy", marks=pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+        ),
+    ],
+)
+def test_landed_cost_engine(
+    bench: Any, skus: list[dict[str, Any]], freight: FreightRate, backend: str
+) -> None:
+    """Compiled ladders evaluated over the whole quantity range at once."""
+    tables = [LadderTable.from_sku(sku) for sku in skus]
+    bench.run(
+        f"pricing.landed_cost[{backend}]",
+        lambda: [landed_cost(table, QUANTITIES, freight, backend=backend) for table in tables],  # type: ignore[arg-type]
+        duration=2.0,
+    )
@@ -0,0 +1,55 @@
+"""
+Memory retained by cached product descriptions.
+
+Compares bytes per product for the same catalog held as plain dicts (what
+``get_product`` returns), ``ProductDescription`` models, and
+``CompactProduct`` records sharing one ``StringPool``.
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+from alibaba_api.models import CompactProduct, ProductDescription, StringPool
+from alibaba_api.standin import StandinServer
+
+pytestmark = pytest.mark.benchmark
+
+PRODUCTS = 2000
+
+
+@pytest.fixture(scope="module")
+def product_payloads(standin: StandinServer) -> list[bytes]:
+    """Response bodies for PRODUCTS distinct products."""
+    return [json.dumps(standin.product(pid)).encode() for pid in standin.product_ids()[:PRODUCTS]]
+
+
+def test_products_as_dicts(bench: Any, product_payloads: list[bytes]) -> None:
+    """Products as decoded JSON dicts."""
+    bench.measure_memory(
+        "memory.product[dict]",
+        lambda: [json.loads(payload) for payload in product_payloads],
+        len(product_payloads),
+    )
+
+
+def test_products_as_models(bench: Any, product_payloads: list[bytes]) -> None:
+    """Products as validated ProductDescription models."""
+    bench.measure_memory(
+        "memory.product[pydantic]",
+        lambda: [ProductDescription.model_validate_json(payload) for payload in product_payloads],
+        len(product_payloads),
+    )
+
+
+def test_products_as_compact(bench: Any, product_payloads: list[bytes]) -> None:
+    """Products as CompactProduct records with a shared string pool."""
+
+    def build() -> tuple[StringPool, list[CompactProduct]]:
+        pool = StringPool()
+        return pool, [
+            CompactProduct.from_dict(json.loads(payload), pool) for payload in product_payloads
+        ]
+
+    bench.measure_memory("memory.product[compact]", build, len(product_payloads))
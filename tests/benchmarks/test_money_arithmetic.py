@@ -0,0 +1,76 @@
+"""
+Batch price arithmetic.
+
+Computes the total margin over a batch of ladder tiers: (sell - cost) * qty,
+summed. "decimal" and "float" re-parse the API strings on every pass, as
+pricing jobs did before ``Money``. "money" and "money_vector" parse once up
+front and then work in integer minor units; per-item ``Money`` objects pay
+for an allocation per operation, so batch jobs should use ``MoneyVector``.
+"""
+
+import random
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from alibaba_api.models import Money, MoneyVector
+
+pytestmark = pytest.mark.benchmark
+
+TIERS = 1000
+
+
+@pytest.fixture(scope="module")
+def tiers() -> list[tuple[str, str, int]]:
+    """(cost, sell, quantity) strings as the API sends them."""
+    rng = random.Random(0)
+    rows = []
+    for _ in range(TIERS):
+        cost = rng.randint(50, 50_000)
+        sell = cost + rng.randint(0, 5_000)
+        rows.append((f"{cost / 100:.2f}", f"{sell / 100:.2f}", rng.randint(1, 1000)))
+    return rows
+
+
+def test_margin_float(bench: Any, tiers: list[tuple[str, str, int]]) -> None:
+    """Float arithmetic from strings (inexact)."""
+    bench.run(
+        "pricing.margin[float]",
+        lambda: sum((float(sell) - float(cost)) * qty for cost, sell, qty in tiers),
+    )
+
+
+def test_margin_decimal(bench: Any, tiers: list[tuple[str, str, int]]) -> None:
+    """Decimal arithmetic from strings."""
+    bench.run(
+        "pricing.margin[decimal]",
+        lambda: sum((Decimal(sell) - Decimal(cost)) * qty for cost, sell, qty in tiers),
+    )
+
+
+def test_margin_money(bench: Any, tiers: list[tuple[str, str, int]]) -> None:
+    """Money parsed once, then integer arithmetic."""
+    parsed = [
+        (Money.parse(cost, "USD"), Money.parse(sell, "USD"), qty) for cost, sell, qty in tiers
+    ]
+    bench.run(
+        "pricing.margin[money]",
+        lambda: Money.sum(((sell - cost) * qty for cost, sell, qty in parsed), "USD"),
+    )
+
+
+def test_margin_money_vector(bench: Any, tiers: list[tuple[str, str, int]]) -> None:
+    """MoneyVector parsed once, then integer arithmetic over whole columns."""
+    cost = MoneyVector.parse((cost for cost, _, _ in tiers), "USD")
+    sell = MoneyVector.parse((sell for _, sell, _ in tiers), "USD")
+    quantities = [qty for _, _, qty in tiers]
+    bench.run("pricing.margin[money_vector]", lambda: ((sell - cost) * quantities).total())
+
+
+def test_parse_money(bench: Any, tiers: list[tuple[str, str, int]]) -> None:
+    """One-off cost of parsing every price into Money."""
+    bench.run(
+        "pricing.parse[money]",
+        lambda: [Money.parse(sell, "USD") for _, sell, _ in tiers],
+    )
@@ -0,0 +1,93 @@
+"""
+CPU-only cost of each high-level method, with no transport.
+
+Every operation is driven with replies recorded from the stand-in: each
+request it yields is signed with ``prepare_request`` and answered by
+``parse_response`` over the recorded body, so the numbers cover building
+the request, signing, JSON decoding and result shaping, and nothing else.
+Set against ``method.*[1]`` in ``test_pipeline.py``, the difference is what
+httpx, retries and the per-request bookkeeping cost.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.sansio import ApiRequest, Operation, drive, parse_response, prepare_request
+from alibaba_api.standin import StandinServer
+
+pytestmark = pytest.mark.benchmark
+
+OperationFactory = Callable[[AlibabaClient], Operation[Any]]
+
+METHODS = [
+    "list_products",
+    "get_product",
+    "get_product_inventory",
+    "calculate_freight",
+    "list_orders",
+    "get_order",
+    "search_products",
+]
+
+
+def _operations(ids: dict[str, str]) -> dict[str, OperationFactory]:
+    return {
+        "list_products": lambda c: c.list_products_op(scene_id="906124611", page_size=50),
+        "get_product": lambda c: c.get_product_op(ids["product_id"]),
+        "get_product_inventory": lambda c: c.get_product_inventory_op(ids["product_id"]),
+        "calculate_freight": lambda c: c.calculate_freight_op(
+            ids["product_id"], 10, "US", fallback=False
+        ),
+        "list_orders": lambda c: c.list_orders_op(page_size=20),
+        "get_order": lambda c: c.get_order_op(ids["trade_id"]),
+        "search_products": lambda c: c.search_products_op(limit=5),
+    }
+
+
+def _record(client: AlibabaClient, standin: StandinServer, make: OperationFactory) -> list[bytes]:
+    """Drive one operation against the stand-in and keep every response body."""
+    transport = standin.transport(sleep=False)
+    bodies: list[bytes] = []
+
+    def send(request: ApiRequest) -> dict[str, Any]:
+        prepared = prepare_request(client.config, request)
+        if prepared.method == "GET":
+            http_request = httpx.Request("GET", prepared.url, params=prepared.params)
+        else:
+            http_request = httpx.Request("POST", prepared.url, data=prepared.params)
+        response = transport.handle_request(http_request)
+        bodies.append(response.read())
+        return parse_response(response.status_code, response.content)
+
+    drive(make(client), send)
+    return bodies
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_operation_cpu(
+    bench: Any,
+    bench_client: AlibabaClient,
+    standin: StandinServer,
+    bench_ids: dict[str, str],
+    method: str,
+) -> None:
+    """Operations/sec for one high-level method without I/O."""
+    make = _operations(bench_ids)[method]
+    bodies = _record(bench_client, standin, make)
+    config = bench_client.config
+
+    def run() -> Any:
+        replies = iter(bodies)
+
+        def send(request: ApiRequest) -> dict[str, Any]:
+            prepare_request(config, request)
+            return parse_response(200, next(replies))
+
+        return drive(make(bench_client), send)
+
+    result = bench.run(f"sansio.{method}", run)
+    assert result.operations > 0
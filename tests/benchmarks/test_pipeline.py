@@ -0,0 +1,156 @@
+"""
+Throughput and latency benchmarks for the request pipeline.
+
+Phase benchmarks isolate the CPU cost of each step of ``AlibabaClient.request``
+(signing, JSON decoding, response parsing, the full round-trip through an
+in-process transport, middleware, slow-call capture). Method benchmarks drive
+each high-level method on 1, 4 and 8 threads to show how throughput scales.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.signing import build_signed_params
+from alibaba_api.slowlog import SlowCallLog
+
+pytestmark = pytest.mark.benchmark
+
+THREADS = [1, 4, 8]
+
+
+@pytest.fixture(scope="module")
+def product_payload(bench_client: AlibabaClient, bench_ids: dict[str, str]) -> bytes:
+    """Raw body of a product description response."""
+    response = bench_client.get(
+        "/eco/buyer/product/description",
+        {"query_req": json.dumps({"product_id": int(bench_ids["product_id"]), "country": "US"})},
+    )
+    return json.dumps(response).encode("utf-8")
+
+
+class TestPhases:
+    """Per-phase cost of a single request."""
+
+    def test_sign(self, bench: Any) -> None:
+        """build_signed_params for a typical query."""
+        params = {"query_req": json.dumps({"product_id": 1601206892606, "country": "US"})}
+        bench.run(
+            "phase.sign",
+            lambda: build_signed_params(
+                "/eco/buyer/product/description", params, "app_key", "app_secret", "token"
+            ),
+        )
+
+    def test_json_decode(self, bench: Any, product_payload: bytes) -> None:
+        """json.loads of a product description body."""
+        bench.run("phase.json_decode", lambda: json.loads(product_payload))
+
+    def test_parse_response(
+        self, bench: Any, bench_client: AlibabaClient, product_payload: bytes
+    ) -> None:
+        """_parse_response, including JSON decoding, of a product description."""
+        request = httpx.Request("GET", "https://example.invalid/")
+
+        def parse() -> None:
+            response = httpx.Response(200, content=product_payload, request=request)
+            bench_client._parse_response(response)
+
+        bench.run("phase.parse_response", parse)
+
+    def test_request_round_trip(self, bench: Any, bench_client: AlibabaClient) -> None:
+        """AlibabaClient.request through the in-process transport."""
+        bench.run(
+            "phase.request",
+            lambda: bench_client.get("/alibaba/order/list", {"role": "buyer"}),
+        )
+
+    def test_request_with_hooks(self, bench: Any, bench_client: AlibabaClient) -> None:
+        """AlibabaClient.request with a hook on every phase."""
+
+        def hook(event: Any) -> None:
+            pass
+
+        for phase in ("before_sign", "before_send", "after_response", "on_error"):
+            bench_client.add_hook(phase, hook)
+        try:
+            bench.run(
+                "phase.request_hooks",
+                lambda: bench_client.get("/alibaba/order/list", {"role": "buyer"}),
+            )
+        finally:
+            for phase in ("before_sign", "before_send", "after_response", "on_error"):
+                bench_client.remove_hook(phase, hook)
+
+    def test_request_with_middleware(self, bench: Any, bench_client: AlibabaClient) -> None:
+        """AlibabaClient.request through one pass-through middleware."""
+        middleware = bench_client.add_middleware(lambda call, call_next: call_next(call))
+        try:
+            bench.run(
+                "phase.request_middleware",
+                lambda: bench_client.get("/alibaba/order/list", {"role": "buyer"}),
+            )
+        finally:
+            bench_client.remove_middleware(middleware)
+
+    def test_slow_log_skip(self, bench: Any) -> None:
+        """SlowCallLog.observe for a fast call that is not kept (the common case)."""
+        log = SlowCallLog(sample_rate=0.01)
+        params = {"role": "buyer"}
+        bench.run(
+            "phase.slow_log_skip", lambda: log.observe("/alibaba/order/list", "GET", params, 0.001)
+        )
+
+    def test_request_capture_all(self, bench: Any, bench_client: AlibabaClient) -> None:
+        """AlibabaClient.request with every call captured into the slow-call log."""
+        default = bench_client.slow_calls
+        bench_client.slow_calls = SlowCallLog(threshold=0.0)
+        try:
+            bench.run(
+                "phase.request_capture_all",
+                lambda: bench_client.get("/alibaba/order/list", {"role": "buyer"}),
+            )
+        finally:
+            bench_client.slow_calls = default
+
+
+def _methods(ids: dict[str, str]) -> dict[str, Callable[[AlibabaClient], Any]]:
+    return {
+        "list_products": lambda c: c.list_products(scene_id="906124611", page_size=50),
+        "get_product": lambda c: c.get_product(ids["product_id"]),
+        "get_product_inventory": lambda c: c.get_product_inventory(ids["product_id"]),
+        "calculate_freight": lambda c: c.calculate_freight(
+            ids["product_id"], 10, "US", fallback=False
+        ),
+        "list_orders": lambda c: c.list_orders(page_size=20),
+        "get_order": lambda c: c.get_order(ids["trade_id"]),
+    }
+
+
+@pytest.mark.parametrize("threads", THREADS)
+@pytest.mark.parametrize(
+    "method",
+    [
+        "list_products",
+        "get_product",
+        "get_product_inventory",
+        "calculate_freight",
+        "list_orders",
+        "get_order",
+    ],
+)
+def test_method_throughput(
+    bench: Any,
+    bench_client: AlibabaClient,
+    bench_ids: dict[str, str],
+    method: str,
+    threads: int,
+) -> None:
+    """Requests/sec and latency percentiles for one high-level method."""
+    call = _methods(bench_ids)[method]
+    result = bench.run(f"method.{method}[{threads}]", lambda: call(bench_client), threads=threads)
+    assert result.operations > 0
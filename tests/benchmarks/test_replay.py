@@ -0,0 +1,61 @@
+"""
+Client-side cost on recorded payloads.
+
+A cassette of varied product and freight responses, recorded from the
+stand-in, is replayed at zero latency, so the numbers cover signing,
+replay lookup, parsing and the high-level methods' own work on
+production-shaped data rather than one canned body per path.
+"""
+
+import itertools
+from typing import Any
+
+import pytest
+
+from alibaba_api.cassette import Cassette, RecordingTransport, ReplayTransport
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError
+from alibaba_api.standin import StandinServer
+
+pytestmark = pytest.mark.benchmark
+
+PRODUCTS = 200
+
+
+@pytest.fixture(scope="module")
+def recorded(standin: StandinServer, bench_config: Config) -> tuple[Cassette, list[str]]:
+    """Cassette of product details and US freight quotes for a slice of the catalog."""
+    cassette = Cassette()
+    product_ids = []
+    transport = RecordingTransport(cassette, standin.transport(sleep=False))
+    with AlibabaClient(bench_config, transport=transport) as client:
+        for product_id in map(str, standin.product_ids()):
+            try:
+                client.get_product(product_id)
+                client.calculate_freight(product_id, 10, "US", fallback=False)
+            except AlibabaAPIError:
+                continue
+            product_ids.append(product_id)
+            if len(product_ids) == PRODUCTS:
+                break
+    return cassette, product_ids
+
+
+@pytest.mark.parametrize("method", ["get_product", "calculate_freight"])
+def test_replayed_method(
+    bench: Any, bench_config: Config, recorded: tuple[Cassette, list[str]], method: str
+) -> None:
+    """One high-level method cycling through the recorded products."""
+    cassette, product_ids = recorded
+    ids = itertools.cycle(product_ids)
+    calls = {
+        "get_product": lambda c: c.get_product(next(ids)),
+        "calculate_freight": lambda c: c.calculate_freight(next(ids), 10, "US", fallback=False),
+    }
+    call = calls[method]
+    with AlibabaClient(
+        bench_config, transport=ReplayTransport(cassette, latency_scale=0)
+    ) as client:
+        result = bench.run(f"replay.{method}", lambda: call(client))
+    assert result.operations > 0
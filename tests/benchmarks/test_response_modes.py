@@ -0,0 +1,96 @@
+"""
+Cost of each response mode on large order lists.
+
+Compares returning the parsed JSON as-is ("dict"), validating it into
+pydantic models ("validated"), trusted mode, and the pure-Python
+``construct`` that trusted mode falls back to for malformed data. One
+operation converts a whole list, so req/s here is lists per second.
+"""
+
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config, ResponseMode
+from alibaba_api.models import OrderDetails, OrderListItem
+from alibaba_api.standin import StandinServer
+from alibaba_api.typed import construct, convert
+
+pytestmark = pytest.mark.benchmark
+
+MODES: list[ResponseMode] = ["dict", "validated", "trusted"]
+
+LIST_SIZE = 1000
+DETAILS_SIZE = 200
+
+ADDRESS = {
+    "zip": "10012",
+    "country": "United States of America",
+    "country_code": "US",
+    "province": "New York",
+    "province_code": "NY",
+    "city": "New York",
+    "address": "123 Main Street",
+    "contact_person": "Jane Doe",
+    "telephone": {"country": "+1", "number": "5555555555"},
+}
+
+
+@pytest.fixture(scope="module")
+def order_details(standin: StandinServer, bench_config: Config) -> dict[str, Any]:
+    """One complete order as returned by get_order in dict mode."""
+    with AlibabaClient(bench_config, transport=standin.transport(sleep=False)) as client:
+        product: Any = client.get_product(standin.product_ids()[0])
+        sku = product["skus"][0]
+        order = client.create_order(
+            channel_refer_id="BENCH-TYPED",
+            product_list=[
+                {
+                    "product_id": product["product_id"],
+                    "sku_id": sku["sku_id"],
+                    "quantity": sku["ladder_price"][0]["min_quantity"],
+                }
+            ],
+            logistics_detail={"shipment_address": ADDRESS, "dispatch_location": "CN"},
+        )
+        details: dict[str, Any] = client.get_order(order["trade_id"])  # type: ignore[assignment]
+    OrderDetails.model_validate(details)
+    return details
+
+
+@pytest.fixture(scope="module")
+def order_list(order_details: dict[str, Any]) -> list[dict[str, Any]]:
+    """A page of LIST_SIZE order list items."""
+    item = {key: order_details[key] for key in OrderListItem.model_fields}
+    return [{**item, "trade_id": str(i)} for i in range(LIST_SIZE)]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_order_list(bench: Any, order_list: list[dict[str, Any]], mode: ResponseMode) -> None:
+    """Convert a page of LIST_SIZE order list items."""
+    bench.run(
+        f"typed.order_list[{mode}]",
+        lambda: convert(list[OrderListItem], order_list, mode),
+        warmup=2,
+    )
+
+
+def test_order_list_construct(bench: Any, order_list: list[dict[str, Any]]) -> None:
+    """Build the same page with the pure-Python construct fallback."""
+    bench.run(
+        "typed.order_list[construct]",
+        lambda: construct(list[OrderListItem], order_list),
+        warmup=2,
+    )
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_order_details(bench: Any, order_details: dict[str, Any], mode: ResponseMode) -> None:
+    """Convert DETAILS_SIZE full orders with addresses, products and amounts."""
+    orders = [{**order_details, "trade_id": str(i)} for i in range(DETAILS_SIZE)]
+    bench.run(
+        f"typed.order_details[{mode}]",
+        lambda: convert(list[OrderDetails], orders, mode),
+        warmup=2,
+    )
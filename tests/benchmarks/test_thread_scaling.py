@@ -0,0 +1,58 @@
+"""
+Throughput of one shared client from 1 to 64 threads.
+
+Every thread drives the same ``AlibabaClient`` through a mix of high-level
+methods over the canned, zero-latency transport, so the numbers show how
+much of the client's own work serialises: on a standard build the GIL caps
+throughput near the single-thread figure, while on a free-threaded build
+(``python3.13t``) it should keep climbing until the locks on the shared
+caches and metrics start to bite. Free-threaded runs store their baselines
+under separate ``scaling.ft.*`` keys, since the two builds are not
+comparable.
+"""
+
+import sysconfig
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+
+pytestmark = pytest.mark.benchmark
+
+THREADS = [1, 2, 4, 8, 16, 32, 64]
+
+BUILD = "scaling.ft" if sysconfig.get_config_var("Py_GIL_DISABLED") else "scaling"
+
+
+def _mixed(client: AlibabaClient, ids: dict[str, str]) -> Callable[[], Any]:
+    """One call per invocation, each thread cycling through its own copy of the mix."""
+    calls: list[Callable[[], Any]] = [
+        lambda: client.list_products(scene_id="906124611"),
+        lambda: client.get_product(ids["product_id"]),
+        lambda: client.get_product_inventory(ids["product_id"]),
+        lambda: client.calculate_freight(ids["product_id"], 10, "US", fallback=False),
+        lambda: client.list_orders(page_size=20),
+        lambda: client.get_order(ids["trade_id"]),
+    ]
+    local = threading.local()
+
+    def call() -> Any:
+        turn = getattr(local, "turn", 0)
+        local.turn = turn + 1
+        return calls[turn % len(calls)]()
+
+    return call
+
+
+@pytest.mark.parametrize("threads", THREADS)
+def test_mixed_workload(
+    bench: Any, bench_client: AlibabaClient, bench_ids: dict[str, str], threads: int
+) -> None:
+    """Requests/sec for the mixed workload on a shared client."""
+    result = bench.run(
+        f"{BUILD}.mixed[{threads}]", _mixed(bench_client, bench_ids), threads=threads
+    )
+    assert result.operations > 0
@@ -1,11 +1,21 @@
 """Pytest configuration and fixtures."""
 
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from typing import Any
 
+import httpx
 import pytest
 
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.standin import StandinServer
+
+# Credentials of the stand-in servers the unit tests create
+STANDIN_APP_KEY = "test_app_key"
+STANDIN_APP_SECRET = "test_app_secret"
+STANDIN_ACCESS_TOKEN = "test_access_token"
+
 
 @pytest.fixture
 def test_credentials() -> dict[str, str]:
@@ -40,6 +50,51 @@ def test_trade_ids() -> dict[str, str]:
     }
 
 
+@pytest.fixture(scope="session")
+def make_config() -> Callable[..., Config]:
+    """Factory for a Config with the stand-in's credentials; keyword arguments override fields."""
+
+    def make(**kwargs: Any) -> Config:
+        fields = {
+            "app_key": STANDIN_APP_KEY,
+            "app_secret": STANDIN_APP_SECRET,
+            "access_token": STANDIN_ACCESS_TOKEN,
+            **kwargs,
+        }
+        return Config(**fields)
+
+    return make
+
+
+@pytest.fixture
+def config(make_config: Callable[..., Config]) -> Config:
+    """Configuration matching the stand-in."""
+    return make_config()
+
+
+@pytest.fixture(scope="session")
+def standin_client(make_config: Callable[..., Config]) -> Callable[..., AlibabaClient]:
+    """
+    Factory for an AlibabaClient talking to a stand-in.
+
+    Takes a ``StandinServer`` (served through its in-process transport,
+    without latency unless ``sleep=True``) or any httpx transport. ``config``
+    defaults to ``make_config()``; other keyword arguments go to the client.
+    """
+
+    def make(
+        target: StandinServer | httpx.BaseTransport,
+        *,
+        sleep: bool = False,
+        config: Config | None = None,
+        **kwargs: Any,
+    ) -> AlibabaClient:
+        transport = target.transport(sleep=sleep) if isinstance(target, StandinServer) else target
+        return AlibabaClient(config or make_config(), transport=transport, **kwargs)
+
+    return make
+
+
 @pytest.fixture
 def mock_alibaba_response() -> dict[str, Any]:
     """Mock successful API response structure."""
@@ -53,6 +108,45 @@ def mock_alibaba_response() -> dict[str, Any]:
     }
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add benchmark command-line options."""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="run benchmark tests (skipped by default)",
+    )
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="write benchmark results to tests/benchmarks/baselines.json",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=float(os.getenv("ALIBABA_BENCHMARK_THRESHOLD", "0.50")),
+        help="fail when a benchmark regresses by more than this fraction (default 0.50)",
+    )
+    group.addoption(
+        "--crawl-size",
+        type=int,
+        default=int(os.getenv("ALIBABA_CRAWL_SIZE", "500")),
+        help="products and orders fetched by the crawl memory benchmarks (default 500)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip benchmark tests unless --run-benchmarks is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Configure custom pytest markers."""
     config.addinivalue_line(
@@ -63,3 +157,7 @@ def pytest_configure(config: pytest.Config) -> None:
         "markers",
         "unit: marks tests as unit tests (no external calls)",
     )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: marks performance benchmarks (run with --run-benchmarks)",
+    )
@@ -0,0 +1,229 @@
+"""Unit tests for the HTTP backends."""
+
+import gzip
+import socket
+import threading
+from collections.abc import Callable, Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+from alibaba_api.backends import HttpxBackend, StdlibBackend
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.connections import DNSCache, WarmupReport
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.metrics import MetricsRegistry
+from alibaba_api.standin import StandinServer
+
+
+@pytest.fixture(scope="module")
+def standin() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+@pytest.fixture
+def base_url(standin: StandinServer) -> Generator[str, None, None]:
+    """Serve the stand-in on a local socket, addressed by name so it is resolved."""
+    http = standin.serve(port=0)
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{http.server_address[1]}/rest"
+    http.shutdown()
+    http.server_close()
+
+
+def _serve(handler: type[BaseHTTPRequestHandler]) -> Generator[str, None, None]:
+    http = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{http.server_address[1]}/rest"
+    http.shutdown()
+    http.server_close()
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Answers every request with its method, target, body and Accept-Encoding."""
+
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+
+    def _respond(self) -> None:
+        EchoHandler.connections.add(id(self.connection))
+        length = int(self.headers.get("content-length") or 0)
+        body = self.rfile.read(length).decode() if length else ""
+        text = f"{self.command} {self.path} {body} {self.headers.get('accept-encoding')}"
+        content = text.encode()
+        gzipped = "gzip" in (self.headers.get("accept-encoding") or "")
+        if gzipped:
+            content = gzip.compress(content)
+        self.send_response(200)
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _respond  # noqa: N815
+    do_POST = _respond  # noqa: N815
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def echo_url() -> Generator[str, None, None]:
+    """Serve EchoHandler on a local socket."""
+    EchoHandler.connections = set()
+    yield from _serve(EchoHandler)
+
+
+class TestStdlibBackend:
+    """Tests for the pooled http.client backend."""
+
+    def test_get_and_post(self, echo_url: str) -> None:
+        """GET should send a query string, POST a form body."""
+        backend = StdlibBackend({"Accept-Encoding": "identity"})
+        response = backend.send("GET", f"{echo_url}/a", {"x": "1 2"}, None)
+        assert response.status_code == 200
+        assert response.text == "GET /rest/a?x=1+2  identity"
+        response = backend.send("POST", f"{echo_url}/b", {"y": "3"}, None)
+        assert response.text == "POST /rest/b y=3 identity"
+        backend.close()
+
+    def test_gzip(self, echo_url: str) -> None:
+        """Gzipped bodies should be decoded, counting the bytes on the wire."""
+        backend = StdlibBackend()
+        response = backend.send("GET", f"{echo_url}/a", {}, None)
+        assert response.text == "GET /rest/a?  gzip, deflate"
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.num_bytes_downloaded < len(response.content) + 30
+        assert response.num_bytes_downloaded != len(response.content)
+        backend.close()
+
+    def test_keepalive(self, echo_url: str) -> None:
+        """Sequential requests should reuse one pooled connection."""
+        backend = StdlibBackend()
+        for _ in range(5):
+            backend.send("GET", f"{echo_url}/a", {}, None)
+        assert len(EchoHandler.connections) == 1
+        backend.close()
+
+    def test_expired_connection_replaced(self, echo_url: str) -> None:
+        """Idle connections older than keepalive_expiry should not be reused."""
+        backend = StdlibBackend(keepalive_expiry=0)
+        backend.send("GET", f"{echo_url}/a", {}, None)
+        backend.send("GET", f"{echo_url}/a", {}, None)
+        assert len(EchoHandler.connections) == 2
+        backend.close()
+
+    def test_stale_connection_retried(self, echo_url: str) -> None:
+        """A pooled connection the server closed should be replaced transparently."""
+        backend = StdlibBackend()
+        backend.send("GET", f"{echo_url}/a", {}, None)
+        for idle in backend._idle.values():
+            for connection in idle:
+                assert connection.sock is not None
+                connection.sock.shutdown(socket.SHUT_RDWR)
+        assert backend.send("GET", f"{echo_url}/a", {}, None).status_code == 200
+        backend.close()
+
+    def test_timeout(self) -> None:
+        """A server that never answers should time out as AlibabaNetworkError."""
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            url = f"http://127.0.0.1:{listener.getsockname()[1]}/rest"
+            backend = StdlibBackend()
+            with pytest.raises(AlibabaNetworkError, match="timed out after 0.2s"):
+                backend.send("GET", url, {}, 0.2)
+
+    def test_connection_refused(self) -> None:
+        """An unreachable server should raise AlibabaNetworkError."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with pytest.raises(AlibabaNetworkError, match="Network error"):
+            StdlibBackend().send("GET", f"http://127.0.0.1:{port}/rest", {}, 2)
+
+    def test_unsupported_url(self) -> None:
+        """Only http and https URLs should be accepted."""
+        with pytest.raises(AlibabaNetworkError, match="Unsupported URL"):
+            StdlibBackend().send("GET", "ftp://example.com/rest", {}, None)
+
+    def test_dns_cache(self, echo_url: str) -> None:
+        """Hosts should be resolved through the DNS cache once."""
+        calls: list[str] = []
+
+        def resolver(host: str, port: int) -> list[Any]:
+            calls.append(host)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+        backend = StdlibBackend(pool_connections=0, dns_cache=DNSCache(60, resolver=resolver))
+        url = echo_url.replace("127.0.0.1", "api.example")
+        for _ in range(3):
+            assert backend.send("GET", f"{url}/a", {}, None).status_code == 200
+        assert calls == ["api.example"]
+
+    def test_warmup(self, echo_url: str) -> None:
+        """Warm-up should fill the pool, then open nothing while it is fresh."""
+        backend = StdlibBackend()
+        report = WarmupReport(3)
+        backend.warmup(f"{echo_url}/", report, 2)
+        assert report.opened == 3
+        assert report.errors == []
+        again = WarmupReport(3)
+        backend.warmup(f"{echo_url}/", again, 2)
+        assert again.opened == 0
+        backend.send("GET", f"{echo_url}/a", {}, None)
+        assert len(EchoHandler.connections) == 1
+        backend.close()
+
+
+class TestClientBackend:
+    """The client sends through the configured backend."""
+
+    def test_stdlib_client(
+        self, base_url: str, standin: StandinServer, make_config: Callable[..., Config]
+    ) -> None:
+        """The stdlib backend should give the same results as httpx."""
+        product_id = str(standin.product_ids()[0])
+        results = []
+        for backend in ("httpx", "stdlib"):
+            config = make_config(base_url_override=base_url, http_backend=backend)
+            with AlibabaClient(config) as client:
+                results.append(client.get_product(product_id))
+                with pytest.raises(AlibabaAPIError):
+                    client.get_product("1")
+                assert client.warmup(connections=2).errors == []
+        assert results[0] == results[1]
+
+    def test_stdlib_transfer_bytes(self, base_url: str, make_config: Callable[..., Config]) -> None:
+        """Compressed transfer sizes should be counted with the stdlib backend too."""
+        config = make_config(base_url_override=base_url, http_backend="stdlib")
+        metrics = MetricsRegistry()
+        with AlibabaClient(config, metrics=metrics) as client:
+            client.list_products(scene_id="906124611", page_size=50)
+            assert isinstance(client._backend, StdlibBackend)
+        (row,) = metrics.transfer()
+        assert 0 < row["wire_bytes"] < row["decoded_bytes"]
+
+    def test_transport_uses_httpx(
+        self, standin: StandinServer, make_config: Callable[..., Config]
+    ) -> None:
+        """An explicit httpx transport should keep the httpx backend."""
+        config = make_config(http_backend="stdlib")
+        with AlibabaClient(config, transport=standin.transport(sleep=False)) as client:
+            client.list_orders(page_size=1)
+            assert isinstance(client._backend, HttpxBackend)
+            assert isinstance(client._backend.client, httpx.Client)
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """ALIBABA_HTTP_BACKEND should select the backend."""
+        monkeypatch.setenv("ALIBABA_APP_KEY", "k")
+        monkeypatch.setenv("ALIBABA_APP_SECRET", "s")
+        monkeypatch.setenv("ALIBABA_HTTP_BACKEND", "stdlib")
+        assert Config.from_env().http_backend == "stdlib"
@@ -0,0 +1,195 @@
+"""Unit tests for the record/replay transports."""
+
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from alibaba_api.async_client import AsyncAlibabaClient
+from alibaba_api.cassette import (
+    SCRUBBED,
+    Cassette,
+    CassetteMissError,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+    canonical_params,
+)
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError
+from alibaba_api.standin import LatencyModel, StandinServer
+
+DESCRIPTION = "/eco/buyer/product/description"
+ORDERS = "/alibaba/order/list"
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+def _record(
+    standin_client: Callable[..., AlibabaClient], server: StandinServer, product_ids: list[int]
+) -> tuple[Cassette, list[Any]]:
+    cassette = Cassette()
+    results = []
+    with standin_client(RecordingTransport(cassette, server.transport())) as client:
+        for product_id in product_ids:
+            results.append(client.get_product(str(product_id)))
+    return cassette, results
+
+
+class TestCassette:
+    """Tests for recording, scrubbing and persistence."""
+
+    def test_canonical_params(self) -> None:
+        """Signing parameters and JSON key order should not affect the match key."""
+        signed = {"timestamp": "1", "sign": "ABC", "query_req": '{"a": 1, "b": 2}'}
+        assert canonical_params(signed) == canonical_params({"query_req": '{"b":2,"a":1}'})
+        assert canonical_params({"q": "1"}) != canonical_params({"q": "2"})
+
+    def test_scrubs_secrets(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Signatures and tokens should not be stored."""
+        cassette = Cassette()
+        with standin_client(RecordingTransport(cassette, server.transport())) as client:
+            tokens = client.refresh_token("standin-refresh-abc")
+        interaction = next(iter(cassette))
+        assert interaction.params == {"refresh_token": SCRUBBED}
+        body = json.loads(interaction.body)
+        assert body["access_token"] == SCRUBBED
+        assert tokens["access_token"] != SCRUBBED
+
+    def test_scrubs_authorization_code(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """The OAuth code should be scrubbed from requests but the status code kept."""
+        cassette = Cassette()
+        with standin_client(RecordingTransport(cassette, server.transport())) as client:
+            client.create_token("3_500102_secret")
+        interaction = next(iter(cassette))
+        assert interaction.params == {"code": SCRUBBED}
+        assert json.loads(interaction.body)["code"] == "0"
+        with standin_client(ReplayTransport(cassette, latency_scale=0)) as client:
+            assert client.create_token("3_500102_other")["access_token"] == SCRUBBED
+
+    @pytest.mark.parametrize("name", ["calls.jsonl", "calls.jsonl.gz"])
+    def test_save_and_load(
+        self,
+        server: StandinServer,
+        tmp_path: Path,
+        name: str,
+        standin_client: Callable[..., AlibabaClient],
+    ) -> None:
+        """A saved cassette should load back unchanged, gzip or not."""
+        cassette, _ = _record(standin_client, server, server.product_ids()[:3])
+        path = tmp_path / name
+        cassette.save(path)
+        text = path.read_bytes()
+        assert b"test_access_token" not in text and b'"sign"' not in text
+        loaded = Cassette.load(path)
+        assert list(loaded) == list(cassette)
+
+
+class TestReplay:
+    """Tests for serving recordings back."""
+
+    def test_replays_responses(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Replayed calls should return what was recorded, without the server."""
+        product_ids = server.product_ids()[:3]
+        cassette, recorded = _record(standin_client, server, product_ids)
+        with standin_client(ReplayTransport(cassette)) as client:
+            replayed = [client.get_product(str(product_id)) for product_id in product_ids]
+        assert replayed == recorded
+
+    def test_replays_errors(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Recorded API errors should be raised again on replay."""
+        cassette = Cassette()
+        with (
+            standin_client(RecordingTransport(cassette, server.transport())) as client,
+            pytest.raises(AlibabaAPIError),
+        ):
+            client.get(DESCRIPTION, {"query_req": json.dumps({"product_id": 1})})
+        replay = ReplayTransport(cassette)
+        with (
+            standin_client(replay) as client,
+            pytest.raises(AlibabaAPIError) as exc_info,
+        ):
+            client.get(DESCRIPTION, {"query_req": json.dumps({"product_id": 1})})
+        assert exc_info.value.code == "130106"
+
+    def test_miss(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """A request that was never recorded should raise CassetteMissError."""
+        cassette, _ = _record(standin_client, server, server.product_ids()[:1])
+        replay = ReplayTransport(cassette)
+        with (
+            standin_client(replay) as client,
+            pytest.raises(CassetteMissError),
+        ):
+            client.get_product(str(server.product_ids()[1]))
+
+    def test_repeated_recordings_cycle(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """Several recordings of one request should be served in turn."""
+        cassette = Cassette()
+        for seq in range(2):
+            body = json.dumps({"code": "0", "seq": seq})
+            cassette.add(Interaction("GET", f"/rest{ORDERS}", {"role": "buyer"}, 200, body))
+        with standin_client(ReplayTransport(cassette)) as client:
+            seqs = [client.get(ORDERS, {"role": "buyer"})["seq"] for _ in range(3)]
+        assert seqs == [0, 1, 0]
+        cassette.rewind()
+        first = cassette.find("GET", f"/rest{ORDERS}", {"role": "buyer"})
+        assert json.loads(first.body)["seq"] == 0
+
+    def test_latency_scale(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """Recorded latency should be replayed as recorded, scaled or not at all."""
+        server = StandinServer(
+            "test_app_key", "test_app_secret", catalog_size=5, latency=LatencyModel.constant(0.05)
+        )
+        cassette, _ = _record(standin_client, server, server.product_ids()[:1])
+        product_id = str(server.product_ids()[0])
+
+        def timed(scale: float) -> float:
+            transport = ReplayTransport(cassette, latency_scale=scale)
+            with standin_client(transport) as client:
+                started = time.perf_counter()
+                client.get_product(product_id)
+                return time.perf_counter() - started
+
+        assert timed(1.0) >= 0.05
+        assert 0.1 <= timed(2.0) < 0.2
+        assert timed(0) < 0.04
+
+    def test_async_replay(
+        self,
+        server: StandinServer,
+        standin_client: Callable[..., AlibabaClient],
+        make_config: Callable[..., Config],
+    ) -> None:
+        """The replay transport should serve AsyncAlibabaClient too."""
+        product_id = server.product_ids()[0]
+        params = {"query_req": json.dumps({"product_id": product_id, "country": "US"})}
+        cassette = Cassette()
+        with standin_client(RecordingTransport(cassette, server.transport())) as client:
+            recorded = client.get(DESCRIPTION, params)
+
+        async def run() -> dict[str, Any]:
+            async with AsyncAlibabaClient(
+                make_config(), transport=ReplayTransport(cassette, latency_scale=0)
+            ) as client:
+                return await client.get(DESCRIPTION, params)
+
+        assert asyncio.run(run()) == recorded
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import httpx
 import pytest
 
-from alibaba_api.client import AlibabaClient
+from alibaba_api.client import AlibabaClient, _BaseClient
 from alibaba_api.config import Config
 from alibaba_api.exceptions import (
     AlibabaAPIError,
@@ -42,6 +42,18 @@ class TestAlibabaClient:
         assert client._client.timeout == httpx.Timeout(config.timeout)
         client.close()
 
+    def test_http_client_created_lazily(self, config: Config) -> None:
+        """The httpx client should be built on first use, once."""
+        client = AlibabaClient(config)
+        assert client._http is None
+        client.close()
+        assert client._http is None
+
+        client = AlibabaClient(config)
+        assert client._client is client._client
+        client.close()
+        assert client._http is not None and client._http.is_closed
+
     def test_base_url_production(self, config: Config) -> None:
         """Production base URL should be correct."""
         assert not config.use_sandbox
@@ -159,6 +171,15 @@ class TestAlibabaClient:
             assert client is not None
         # Client should be closed after exiting context
 
+    def test_base_client_requires_call_handler(self, config: Config) -> None:
+        """A client that does not implement the call handler should not instantiate."""
+
+        class Incomplete(_BaseClient):
+            pass
+
+        with pytest.raises(TypeError, match="_handle_call"):
+            Incomplete(config)  # type: ignore[abstract]
+
     @patch("httpx.Client.get")
     def test_access_token_included(self, mock_get: MagicMock, client: AlibabaClient) -> None:
         """Access token should be included in signed params."""
@@ -0,0 +1,102 @@
+"""Unit tests for compact product records."""
+
+import copy
+
+import pytest
+
+from alibaba_api.models import (
+    CompactLadderPrice,
+    CompactProduct,
+    CompactWholesaleTrade,
+    ProductDescription,
+    StringPool,
+)
+from alibaba_api.standin import StandinServer
+
+
+@pytest.fixture(scope="module")
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=50)
+
+
+class TestStringPool:
+    """Tests for the string pool."""
+
+    def test_shares_equal_strings(self) -> None:
+        """Equal strings should come back as the same object."""
+        pool = StringPool()
+        first = pool("".join(["US", "D"]))
+        second = pool("".join(["U", "SD"]))
+        assert first is second
+        assert len(pool) == 1
+
+    def test_non_strings_pass_through(self) -> None:
+        """Non-string values should be returned unchanged and not pooled."""
+        pool = StringPool()
+        assert pool(None) is None
+        assert pool(5) == 5
+        assert len(pool) == 0
+
+
+class TestCompactProduct:
+    """Tests for conversion to and from product descriptions."""
+
+    def test_round_trip_catalog(self, server: StandinServer) -> None:
+        """Every stand-in product should round-trip exactly."""
+        pool = StringPool()
+        for product_id in server.product_ids():
+            data = server.product(product_id)
+            assert CompactProduct.from_dict(data, pool).to_dict() == data
+
+    def test_nested_records(self, server: StandinServer) -> None:
+        """Nested structures should become tuples of records."""
+        data = server.product(server.product_ids()[3])
+        product = CompactProduct.from_dict(data)
+
+        assert isinstance(product.skus, tuple)
+        assert isinstance(product.wholesale_trade, CompactWholesaleTrade)
+        assert isinstance(product.skus[0].ladder_price[0], CompactLadderPrice)
+        assert product.skus[0].ladder_price[0].price == data["skus"][0]["ladder_price"][0]["price"]
+        assert product.e_company_id == data["eCompanyId"]
+        assert product.images == tuple(data["images"])
+
+    def test_repeated_strings_shared(self, server: StandinServer) -> None:
+        """Repeated values should share one object across products."""
+        pool = StringPool()
+        first, second = (
+            CompactProduct.from_dict(copy.deepcopy(server.product(pid)), pool)
+            for pid in server.product_ids()[:2]
+        )
+        assert first.currency is second.currency
+        assert first.skus[0].unit is second.skus[0].unit
+
+    def test_absent_null_and_extra_keys(self) -> None:
+        """Absent keys, explicit nulls and unknown keys should all survive."""
+        data = {
+            "product_id": "1",
+            "description": None,
+            "skus": [{"sku_id": "2", "ladder_price": [], "new_field": {"a": [1]}}],
+            "unknown": [1, 2],
+        }
+        product = CompactProduct.from_dict(data)
+        assert product.title is None
+        assert product.description is None
+        assert product.extra == (("unknown", [1, 2]),)
+        assert product.to_dict() == data
+        assert "title" not in product.to_dict()
+
+    def test_read_only(self, server: StandinServer) -> None:
+        """Records should be immutable."""
+        product = CompactProduct.from_dict(server.product(server.product_ids()[0]))
+        with pytest.raises(AttributeError):
+            product.title = "changed"  # type: ignore[misc]
+
+    def test_model_conversion(self, server: StandinServer) -> None:
+        """Records should convert to and from ProductDescription."""
+        data = server.product(server.product_ids()[0])
+        model = ProductDescription.model_validate(data)
+        product = CompactProduct.from_model(model)
+
+        assert product.to_model() == model
+        assert CompactProduct.from_dict(data).to_model() == model
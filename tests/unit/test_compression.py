@@ -0,0 +1,167 @@
+"""Unit tests for response compression and transfer accounting."""
+
+import asyncio
+import gzip
+import json
+import threading
+from collections.abc import Callable, Generator
+
+import httpx
+import pytest
+
+from alibaba_api.async_client import AsyncAlibabaClient
+from alibaba_api.client import AlibabaClient
+from alibaba_api.compression import (
+    accept_encoding,
+    available_encodings,
+    choose_encoding,
+    compress,
+)
+from alibaba_api.config import Config
+from alibaba_api.metrics import MetricsRegistry
+from alibaba_api.standin import StandinServer
+
+LIST = "/eco/buyer/product/check"
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=200)
+
+
+class TestNegotiation:
+    """Tests for choosing encodings."""
+
+    def test_available_encodings(self) -> None:
+        """gzip should always be available, in preference order after br and zstd."""
+        encodings = available_encodings()
+        assert encodings[-1] == "gzip"
+        assert accept_encoding() == ", ".join(encodings)
+        assert accept_encoding(False) == "identity"
+
+    @pytest.mark.parametrize(
+        ("accept", "expected"),
+        [
+            (None, None),
+            ("identity", None),
+            ("gzip, deflate", "gzip"),
+            ("gzip, br", "br"),
+            ("br;q=0, gzip;q=0.5", "gzip"),
+            ("*", "zstd"),
+            ("*, zstd;q=0", "br"),
+            ("GZIP; q=bad", None),
+        ],
+    )
+    def test_choose_encoding(self, accept: str | None, expected: str | None) -> None:
+        """Server preference order should win among encodings the header allows."""
+        assert choose_encoding(accept, ("zstd", "br", "gzip")) == expected
+
+    def test_compress(self) -> None:
+        """gzip output should round-trip; unknown encodings should raise."""
+        assert gzip.decompress(compress(b"x" * 1000, "gzip")) == b"x" * 1000
+        with pytest.raises(ValueError):
+            compress(b"x", "lzma")
+
+
+class TestClientCompression:
+    """Tests for compressed responses through the clients."""
+
+    def test_request_header(
+        self, server: StandinServer, make_config: Callable[..., Config]
+    ) -> None:
+        """The client should ask for compression unless it is disabled."""
+        sent: list[str] = []
+        inner = server.transport(sleep=False)
+
+        class Recording(httpx.BaseTransport):
+            def handle_request(self, request: httpx.Request) -> httpx.Response:
+                sent.append(request.headers["accept-encoding"])
+                return inner.handle_request(request)
+
+        for compression in (True, False):
+            with AlibabaClient(
+                make_config(compression=compression), transport=Recording()
+            ) as client:
+                client.list_products(scene_id="906124611")
+        assert sent == [accept_encoding(), "identity"]
+
+    @pytest.mark.parametrize("compression", [True, False])
+    def test_transfer_accounting(
+        self, server: StandinServer, compression: bool, make_config: Callable[..., Config]
+    ) -> None:
+        """Metrics should record fewer wire bytes than decoded bytes when compressed."""
+        metrics = MetricsRegistry()
+        with AlibabaClient(
+            make_config(compression=compression),
+            transport=server.transport(sleep=False),
+            metrics=metrics,
+        ) as client:
+            result = client.list_products(scene_id="906124611", page_size=50)
+        assert len(result["product_ids"]) == 50
+
+        (row,) = metrics.transfer()
+        assert row["endpoint"] == LIST
+        if compression:
+            assert row["wire_bytes"] < row["decoded_bytes"] / 2
+        else:
+            assert row["wire_bytes"] == row["decoded_bytes"]
+
+    def test_small_bodies_uncompressed(self, server: StandinServer) -> None:
+        """Bodies under the threshold should go out as they are."""
+        response = server.handle("GET", "/rest/unknown", {})
+        content, headers = server.encode(response, "gzip")
+        assert "content-encoding" not in headers
+        assert headers["content-length"] == str(len(content))
+        assert (
+            StandinServer(compression=False)
+            .encode(server.handle("GET", f"/rest{LIST}", {}), "gzip")[1]
+            .get("content-encoding")
+            is None
+        )
+
+    def test_async_client(self, server: StandinServer, make_config: Callable[..., Config]) -> None:
+        """The async client should negotiate and account for compression too."""
+        metrics = MetricsRegistry()
+
+        async def run() -> None:
+            async with AsyncAlibabaClient(
+                make_config(), transport=server.async_transport(), metrics=metrics
+            ) as client:
+                await client.get(
+                    LIST, {"query_req": json.dumps({"scene_id": "906124611", "size": 50})}
+                )
+
+        asyncio.run(run())
+        (row,) = metrics.transfer()
+        assert row["wire_bytes"] < row["decoded_bytes"]
+
+
+@pytest.fixture
+def base_url(server: StandinServer) -> Generator[str, None, None]:
+    """Serve the stand-in on a local socket."""
+    http = server.serve(port=0)
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{http.server_address[1]}/rest"
+    http.shutdown()
+    http.server_close()
+
+
+def test_socket_decodes_in_chunks(
+    server: StandinServer, base_url: str, make_config: Callable[..., Config]
+) -> None:
+    """A large compressed body read off a socket should decode chunk by chunk."""
+    config = make_config(base_url_override=base_url)
+    with AlibabaClient(config) as client:
+        params = {"query_req": json.dumps({"scene_id": "906124611", "index": 0, "size": 100})}
+        url = f"{base_url}{LIST}"
+        with client._client.stream("GET", url, params=client._sign(LIST, params, None)) as response:
+            assert response.headers["content-encoding"] == available_encodings()[0]
+            chunks = list(response.iter_bytes(chunk_size=256))
+            wire = response.num_bytes_downloaded
+    body = b"".join(chunks)
+    assert len(chunks) > 1
+    assert wire < len(body)
+    result = json.loads(body)["result"]
+    assert len(result["result_data"]) == int(result["result_total"])
@@ -0,0 +1,247 @@
+"""Unit tests for DNS caching and connection warm-up."""
+
+import asyncio
+import socket
+import threading
+from collections.abc import Callable, Generator
+from typing import Any
+
+import httpx
+import pytest
+
+from alibaba_api.async_client import AsyncAlibabaClient
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.connections import DNSCache, HandshakeTrace, ResolvingTransport, WarmupReport
+from alibaba_api.exceptions import AlibabaNetworkError
+from alibaba_api.standin import StandinServer
+
+
+class FakeResolver:
+    """getaddrinfo stand-in answering every host with one address."""
+
+    def __init__(self, address: str = "203.0.113.7") -> None:
+        self.address = address
+        self.calls: list[tuple[str, int]] = []
+
+    def __call__(self, host: str, port: int) -> list[Any]:
+        self.calls.append((host, port))
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (self.address, port))]
+
+
+class TestDNSCache:
+    """Tests for caching resolved addresses."""
+
+    def test_caches_until_forgotten(self) -> None:
+        """Repeat lookups should be served from the cache."""
+        resolver = FakeResolver()
+        cache = DNSCache(60, resolver=resolver)
+        assert cache.resolve("api.example", 443) == "203.0.113.7"
+        assert cache.resolve("api.example", 443) == "203.0.113.7"
+        assert resolver.calls == [("api.example", 443)]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+        cache.forget("api.example", 443)
+        cache.resolve("api.example", 443)
+        assert len(resolver.calls) == 2
+
+    def test_zero_ttl(self) -> None:
+        """A TTL of 0 should resolve every time and cache nothing."""
+        resolver = FakeResolver()
+        cache = DNSCache(0, resolver=resolver)
+        cache.resolve("api.example", 443)
+        cache.resolve("api.example", 443)
+        assert len(resolver.calls) == 2
+        assert len(cache) == 0
+
+    def test_empty_answer(self) -> None:
+        """A lookup without addresses should raise OSError."""
+        cache = DNSCache(resolver=lambda host, port: [])
+        with pytest.raises(OSError):
+            cache.resolve("api.example", 443)
+
+    def test_async_resolve(self) -> None:
+        """aresolve should share the cache with resolve."""
+        resolver = FakeResolver()
+        cache = DNSCache(resolver=resolver)
+        assert asyncio.run(cache.aresolve("api.example", 80)) == "203.0.113.7"
+        assert cache.resolve("api.example", 80) == "203.0.113.7"
+        assert len(resolver.calls) == 1
+
+
+class TestResolvingTransport:
+    """Tests for connecting to cached addresses."""
+
+    def _transport(self, sent: list[httpx.Request], cache: DNSCache) -> ResolvingTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"url": str(request.url)})
+
+        return ResolvingTransport(cache, httpx.MockTransport(handler))
+
+    def test_rewrites_host(self) -> None:
+        """The address should be dialled while the name stays in Host and SNI."""
+        sent: list[httpx.Request] = []
+        cache = DNSCache(resolver=FakeResolver())
+        with httpx.Client(transport=self._transport(sent, cache)) as http:
+            response = http.get("https://api.example/rest/path")
+        (request,) = sent
+        assert response.json()["url"] == "https://203.0.113.7/rest/path"
+        assert request.headers["host"] == "api.example"
+        assert request.extensions["sni_hostname"] == "api.example"
+        assert response.request.url.host == "api.example"
+
+    def test_ip_address_untouched(self) -> None:
+        """Requests to an IP address should not be resolved."""
+        sent: list[httpx.Request] = []
+        resolver = FakeResolver()
+        with httpx.Client(transport=self._transport(sent, DNSCache(resolver=resolver))) as http:
+            http.get("http://127.0.0.1:8080/rest")
+        assert resolver.calls == []
+        assert "sni_hostname" not in sent[0].extensions
+
+    def test_connect_error_forgets_address(self) -> None:
+        """A refused connection should drop the cached address."""
+
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        cache = DNSCache(resolver=FakeResolver())
+        transport = ResolvingTransport(cache, httpx.MockTransport(refuse))
+        with httpx.Client(transport=transport) as http, pytest.raises(httpx.ConnectError):
+            http.get("https://api.example/rest")
+        assert len(cache) == 0
+
+    def test_dns_failure(self) -> None:
+        """A failed lookup should surface as ConnectError."""
+
+        def fail(host: str, port: int) -> list[Any]:
+            raise socket.gaierror("no such host")
+
+        transport = ResolvingTransport(DNSCache(resolver=fail), httpx.MockTransport(lambda r: r))
+        with httpx.Client(transport=transport) as http, pytest.raises(httpx.ConnectError):
+            http.get("https://api.example/rest")
+
+
+def test_handshake_trace() -> None:
+    """Trace events should be turned into connect and TLS timings."""
+    report = WarmupReport(1)
+    trace = HandshakeTrace(report)
+    for name in (
+        "connection.connect_tcp.started",
+        "connection.connect_tcp.complete",
+        "connection.start_tls.started",
+        "connection.start_tls.complete",
+        "http11.send_request_headers.started",
+    ):
+        trace(name, {})
+    assert report.opened == 1
+    assert len(report.tls) == 1
+    assert "tls avg" in report.format()
+
+
+@pytest.fixture
+def base_url() -> Generator[str, None, None]:
+    """Serve a stand-in on a local socket, addressed by name so it is resolved."""
+    http = StandinServer("test_app_key", "test_app_secret", catalog_size=20).serve(port=0)
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{http.server_address[1]}/rest"
+    http.shutdown()
+    http.server_close()
+
+
+class TestWarmup:
+    """Tests for opening pooled connections ahead of traffic."""
+
+    def test_opens_connections(self, base_url: str, make_config: Callable[..., Config]) -> None:
+        """Warm-up should open one connection each, then reuse them."""
+        with AlibabaClient(make_config(base_url_override=base_url)) as client:
+            report = client.warmup(connections=4)
+            assert report.opened == 4
+            assert report.errors == []
+            assert client.dns_cache.stats()["misses"] == 1
+
+            again = client.warmup(connections=4)
+            assert again.opened == 0
+            assert again.dns == 0
+            client.list_orders(page_size=1)
+            assert client.dns_cache.stats()["misses"] == 1
+
+    def test_async_opens_connections(
+        self, base_url: str, make_config: Callable[..., Config]
+    ) -> None:
+        """The async client should warm its own pool the same way."""
+
+        async def run() -> tuple[WarmupReport, WarmupReport]:
+            async with AsyncAlibabaClient(make_config(base_url_override=base_url)) as client:
+                return await client.warmup(connections=3), await client.warmup(connections=3)
+
+        first, second = asyncio.run(run())
+        assert first.opened == 3
+        assert second.opened == 0
+
+    def test_in_process_transport(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """With an in-process transport there is nothing to open or resolve."""
+        server = StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+        with standin_client(server.transport(sleep=False)) as client:
+            report = client.warmup(connections=2)
+        assert report.opened == 0
+        assert report.errors == []
+        assert len(client.dns_cache) == 0
+
+    def test_unreachable(self, make_config: Callable[..., Config]) -> None:
+        """Warm-up should raise when no connection can be opened."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        config = make_config(base_url_override=f"http://127.0.0.1:{port}/rest")
+        with AlibabaClient(config) as client, pytest.raises(AlibabaNetworkError):
+            client.warmup(connections=2, timeout=2)
+
+    def test_async_connect_hangs(self, make_config: Callable[..., Config]) -> None:
+        """A connection that never opens should be reported without failing the others."""
+
+        class HangingTransport(httpx.AsyncBaseTransport):
+            """Answers the first request; later connects hang until they time out."""
+
+            def __init__(self) -> None:
+                self.requests = 0
+
+            async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+                self.requests += 1
+                if self.requests > 1:
+                    await asyncio.sleep(4 * request.extensions["timeout"]["connect"])
+                    raise httpx.ConnectTimeout("connect timed out", request=request)
+                return httpx.Response(200, json={})
+
+        async def run() -> WarmupReport:
+            async with AsyncAlibabaClient(make_config(), transport=HangingTransport()) as client:
+                return await client.warmup(connections=2, timeout=0.05)
+
+        report = asyncio.run(run())
+        assert report.errors == ["ConnectTimeout: connect timed out"]
+
+    def test_rejects_bad_count(self, make_config: Callable[..., Config]) -> None:
+        """Fewer than one connection should raise ValueError."""
+        with pytest.raises(ValueError):
+            AlibabaClient(make_config()).warmup(connections=0)
+
+    def test_pool_limits(self, make_config: Callable[..., Config]) -> None:
+        """The pool should keep as many idle connections as configured."""
+        client = AlibabaClient(make_config(pool_connections=64, keepalive_expiry=120))
+        limits = client._pool_limits()
+        assert limits.max_keepalive_connections == 64
+        assert limits.keepalive_expiry == 120
+        assert limits.max_connections == 100
+
+    def test_pool_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """from_env should read the pool settings, and let overrides win."""
+        monkeypatch.setenv("ALIBABA_APP_KEY", "k")
+        monkeypatch.setenv("ALIBABA_APP_SECRET", "s")
+        monkeypatch.setenv("ALIBABA_POOL_CONNECTIONS", "32")
+        monkeypatch.setenv("ALIBABA_KEEPALIVE_EXPIRY", "30")
+        config = Config.from_env()
+        assert (config.pool_connections, config.keepalive_expiry) == (32, 30)
+        assert Config.from_env(pool_connections=16).pool_connections == 16  # type: ignore[arg-type]
@@ -0,0 +1,318 @@
+"""Unit tests for the checkpointed catalog crawler."""
+
+import itertools
+import json
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.crawler import (
+    CatalogCrawler,
+    CrawlCheckpoint,
+    Source,
+    default_sources,
+    main,
+)
+from alibaba_api.standin import StandinServer
+
+PAGE_SIZE = 20
+
+
+class CrashError(Exception):
+    """Stands in for the process dying mid-crawl."""
+
+
+class HookedTransport(httpx.BaseTransport):
+    """
+    Stand-in transport counting requests and calling ``hook`` before each;
+    a response the hook returns is sent instead of the stand-in's.
+    """
+
+    def __init__(
+        self,
+        server: StandinServer,
+        hook: Callable[[httpx.Request], httpx.Response | None] | None = None,
+    ) -> None:
+        self._inner = server.transport(sleep=False)
+        self._hook = hook
+        self._lock = threading.Lock()
+        self.paths: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.paths.append(request.url.path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self._hook is not None and (response := self._hook(request)) is not None:
+                return response
+            return self._inner.handle_request(request)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def listing_calls(self) -> int:
+        return sum(1 for path in self.paths if path.endswith("/check"))
+
+
+@pytest.fixture(scope="module")
+def server() -> StandinServer:
+    """A stand-in whose listings span a few pages each."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=200)
+
+
+@pytest.fixture
+def crawl(
+    standin_client: Callable[..., AlibabaClient],
+) -> Callable[..., tuple[Any, list[dict[str, Any]]]]:
+    """Run a crawl into ``tmp_path`` through ``transport``; returns the report and products."""
+
+    def run(
+        tmp_path: Path, transport: httpx.BaseTransport, **kwargs: Any
+    ) -> tuple[Any, list[dict[str, Any]]]:
+        kwargs.setdefault("page_size", PAGE_SIZE)
+        kwargs.setdefault("concurrency", 4)
+        with standin_client(transport) as client:
+            report = CatalogCrawler(
+                client, tmp_path / "crawl.ckpt", tmp_path / "products.jsonl", **kwargs
+            ).run()
+        return report, _products(tmp_path / "products.jsonl")
+
+    return run
+
+
+def _products(path: Path) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _listed_ids(client: AlibabaClient) -> set[int]:
+    """Every product ID on every default source, paged directly."""
+    ids: set[int] = set()
+    with client:
+        for source in default_sources():
+            page = 0
+            while True:
+                listed = source.fetch(client, page, PAGE_SIZE)
+                ids.update(map(int, listed))
+                if len(listed) < PAGE_SIZE:
+                    break
+                page += 1
+    return ids
+
+
+class TestCrawl:
+    """Tests for a crawl that runs to completion."""
+
+    def test_every_source_once(
+        self,
+        server: StandinServer,
+        tmp_path: Path,
+        standin_client: Callable[..., AlibabaClient],
+        crawl: Callable[..., Any],
+    ) -> None:
+        """Each product listed by any source should be fetched exactly once."""
+        report, products = crawl(tmp_path, HookedTransport(server))
+        listed = _listed_ids(standin_client(server))
+        written = [int(product["product_id"]) for product in products]
+
+        assert report.complete
+        assert report.unique == len(listed)
+        assert len(written) == len(set(written)) == report.written
+        offline = {pid for pid in listed if server.is_offline(pid)}
+        assert set(written) == listed - offline
+        assert sum(report.failed.values()) == len(offline)
+        assert report.duplicates == report.listed - report.unique > 0
+
+    def test_rerun_does_nothing(
+        self, server: StandinServer, tmp_path: Path, crawl: Callable[..., Any]
+    ) -> None:
+        """A finished crawl should resume with nothing left to fetch."""
+        _, first = crawl(tmp_path, HookedTransport(server))
+        transport = HookedTransport(server)
+        report, again = crawl(tmp_path, transport)
+        assert report.resumed
+        assert report.complete
+        assert transport.paths == []
+        assert again == first
+
+    def test_bounded_concurrency(
+        self, server: StandinServer, tmp_path: Path, crawl: Callable[..., Any]
+    ) -> None:
+        """No more than ``concurrency`` requests should be in flight."""
+        transport = HookedTransport(server, lambda request: time.sleep(0.001))
+        report, _ = crawl(tmp_path, transport, concurrency=3)
+        assert report.complete
+        assert 1 < transport.max_in_flight <= 3
+
+    def test_source_error(
+        self, server: StandinServer, tmp_path: Path, crawl: Callable[..., Any]
+    ) -> None:
+        """A source that fails should be reported and leave the crawl incomplete."""
+        sources = [Source("scene", "906124611"), Source("scene", "123")]
+        report, products = crawl(tmp_path, HookedTransport(server), sources=sources)
+        assert list(report.source_errors) == ["scene:123"]
+        assert "InvalidParameter" in report.source_errors["scene:123"]
+        assert not report.complete
+        assert products
+
+    def test_typed_products(
+        self,
+        server: StandinServer,
+        tmp_path: Path,
+        standin_client: Callable[..., AlibabaClient],
+        make_config: Callable[..., Config],
+    ) -> None:
+        """Typed responses should be written as plain JSON."""
+        config = make_config(response_mode="trusted")
+        with standin_client(server, config=config) as client:
+            CatalogCrawler(
+                client,
+                tmp_path / "crawl.ckpt",
+                tmp_path / "products.jsonl",
+                sources=[Source("local", "MX")],
+                page_size=PAGE_SIZE,
+            ).run()
+        assert all("product_id" in product for product in _products(tmp_path / "products.jsonl"))
+
+    def test_bad_arguments(
+        self, server: StandinServer, tmp_path: Path, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Concurrency and page size should be validated."""
+        with standin_client(HookedTransport(server)) as client:
+            with pytest.raises(ValueError):
+                CatalogCrawler(client, tmp_path / "c", tmp_path / "o", concurrency=0)
+            with pytest.raises(ValueError):
+                CatalogCrawler(client, tmp_path / "c", tmp_path / "o", page_size=101)
+
+
+class TestResume:
+    """Tests for picking a crawl up after it stopped."""
+
+    def test_resume_after_crash(
+        self, server: StandinServer, tmp_path: Path, crawl: Callable[..., Any]
+    ) -> None:
+        """A crashed crawl should resume without redoing pages or products."""
+        reference = tmp_path / "reference"
+        reference.mkdir()
+        complete, expected = crawl(reference, HookedTransport(server))
+        calls = itertools.count(1)
+
+        def crash_later(request: httpx.Request) -> None:
+            if next(calls) == 120:
+                raise CrashError
+
+        with pytest.raises(CrashError):
+            crawl(tmp_path, HookedTransport(server, crash_later))
+        partial = _products(tmp_path / "products.jsonl")
+        assert 0 < len(partial) < len(expected)
+
+        transport = HookedTransport(server)
+        report, products = crawl(tmp_path, transport)
+        assert report.resumed
+        assert report.complete
+        assert transport.listing_calls() == report.pages < complete.pages
+        assert products[: len(partial)] == partial
+        ids = [product["product_id"] for product in products]
+        assert len(ids) == len(set(ids))
+        assert sorted(ids) == sorted(product["product_id"] for product in expected)
+
+    @pytest.mark.parametrize("failure", ["network", "ApiCallLimit", "ServiceUnavailable"])
+    def test_transient_error_left_pending(
+        self,
+        server: StandinServer,
+        tmp_path: Path,
+        failure: str,
+        standin_client: Callable[..., AlibabaClient],
+        crawl: Callable[..., Any],
+    ) -> None:
+        """A product lost to a network, quota or retryable error should be fetched next run."""
+        source = Source("scene", "906124611")
+        with standin_client(server) as client:
+            listed = map(int, source.fetch(client, 0, PAGE_SIZE))
+            target = next(pid for pid in listed if not server.is_offline(pid))
+
+        def fail_target(request: httpx.Request) -> httpx.Response | None:
+            if str(target) not in request.url.params.get("query_req", ""):
+                return None
+            if failure == "network":
+                raise httpx.ConnectError("unreachable")
+            return httpx.Response(200, json={"code": failure, "message": "try later"})
+
+        sources = [source]
+        report, _ = crawl(tmp_path, HookedTransport(server, fail_target), sources=sources)
+        assert report.pending == 1
+        assert not report.failed
+        assert not report.complete
+
+        report, products = crawl(tmp_path, HookedTransport(server), sources=sources)
+        assert report.complete
+        assert report.written == 1
+        assert products[-1]["product_id"] == str(target)
+
+    def test_torn_writes_dropped(
+        self, server: StandinServer, tmp_path: Path, crawl: Callable[..., Any]
+    ) -> None:
+        """Partial last lines in the journal and the output should be cut off."""
+        sources = [Source("local", "US")]
+        _, expected = crawl(tmp_path, HookedTransport(server), sources=sources)
+        with open(tmp_path / "crawl.ckpt", "ab") as checkpoint:
+            checkpoint.write(b'{"t":"product","id":1')
+        with open(tmp_path / "products.jsonl", "ab") as output:
+            output.write(b'{"product_id": "16')
+
+        report, products = crawl(tmp_path, HookedTransport(server), sources=sources)
+        assert report.complete
+        assert products == expected
+        assert (tmp_path / "crawl.ckpt").read_bytes().endswith(b"\n")
+
+    def test_output_shorter_than_checkpoint(
+        self, server: StandinServer, tmp_path: Path, crawl: Callable[..., Any]
+    ) -> None:
+        """Resuming onto an output shorter than the journal records should be refused."""
+        sources = [Source("local", "US")]
+        crawl(tmp_path, HookedTransport(server), sources=sources)
+        output = tmp_path / "products.jsonl"
+        output.write_bytes(output.read_bytes()[:10])
+        with pytest.raises(ValueError, match="cannot resume"):
+            crawl(tmp_path, HookedTransport(server), sources=sources)
+        assert len(output.read_bytes()) == 10
+
+    def test_corrupt_checkpoint(self, tmp_path: Path) -> None:
+        """A bad complete line should be refused rather than skipped."""
+        path = tmp_path / "crawl.ckpt"
+        path.write_bytes(b'{"t":"finished","source":"crossborder"}\nnot json\n')
+        with pytest.raises(ValueError, match="line 2"):
+            CrawlCheckpoint(path).load()
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """The command line should crawl a stand-in and print the report."""
+    args = [
+        "--standin",
+        "--catalog-size",
+        "100",
+        "--scene",
+        "906124611",
+        "--local-country",
+        "MX",
+        "--no-crossborder",
+        "--checkpoint",
+        str(tmp_path / "crawl.ckpt"),
+        "--output",
+        str(tmp_path / "products.jsonl"),
+        "--json",
+    ]
+    main(args)
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["sources"] == 2
+    assert summary["complete"]
+    assert summary["written"] == len(_products(tmp_path / "products.jsonl"))
@@ -0,0 +1,153 @@
+"""Unit tests for per-endpoint timeouts and deadlines."""
+
+import json
+import time
+from collections.abc import Callable
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.deadline import Deadline
+from alibaba_api.exceptions import AlibabaDeadlineError, AlibabaNetworkError
+from alibaba_api.standin import LatencyModel, StandinServer
+
+FREIGHT = "/shipping/freight/calculate"
+DESCRIPTION = "/eco/buyer/product/description"
+
+
+def _slow(path: str, seconds: float) -> StandinServer:
+    """A catalog where ``path`` answers after ``seconds`` and everything else at once."""
+    return StandinServer(
+        "test_app_key",
+        "test_app_secret",
+        catalog_size=20,
+        endpoint_latency={path: LatencyModel.constant(seconds)},
+    )
+
+
+def _sent(client: AlibabaClient) -> list[dict[str, str]]:
+    sent: list[dict[str, str]] = []
+    client.add_hook("before_send", lambda event: sent.append(event.params))
+    return sent
+
+
+class TestDeadline:
+    """Tests for the Deadline value."""
+
+    def test_coerce(self) -> None:
+        """Seconds should become a Deadline; Deadlines and None pass through."""
+        deadline = Deadline(1.0)
+        assert Deadline.coerce(deadline) is deadline
+        assert Deadline.coerce(None) is None
+        coerced = Deadline.coerce(2.0)
+        assert coerced is not None and 1.9 < coerced.remaining() <= 2.0
+
+    def test_share_and_expiry(self) -> None:
+        """Shares should split what is left; an expired deadline has nothing left."""
+        deadline = Deadline(0.3)
+        assert 0.09 < deadline.share(3) <= 0.1
+        assert not deadline.expired
+        assert Deadline(0).expired
+        assert Deadline(-1).remaining() == 0.0
+
+
+class TestTimeouts:
+    """Tests for per-endpoint and per-call timeouts."""
+
+    def test_endpoint_timeout(
+        self, standin_client: Callable[..., AlibabaClient], make_config: Callable[..., Config]
+    ) -> None:
+        """An endpoint override should apply to that path only."""
+        server = _slow(FREIGHT, 0.2)
+        product_id = str(server.product_ids()[0])
+        with standin_client(
+            server, sleep=True, config=make_config(endpoint_timeouts={FREIGHT: 0.05})
+        ) as client:
+            started = time.monotonic()
+            with pytest.raises(AlibabaNetworkError, match=r"0\.05s"):
+                client.calculate_freight(product_id, 10, "US", fallback=False)
+            assert time.monotonic() - started < 0.15
+            client.get_product(product_id)
+
+    def test_call_timeout_overrides_endpoint(
+        self, standin_client: Callable[..., AlibabaClient], make_config: Callable[..., Config]
+    ) -> None:
+        """A timeout passed to request should win over the endpoint override."""
+        server = _slow(DESCRIPTION, 0.05)
+        params = {"query_req": json.dumps({"product_id": server.product_ids()[0]})}
+        with standin_client(
+            server, sleep=True, config=make_config(endpoint_timeouts={DESCRIPTION: 0.01})
+        ) as client:
+            with pytest.raises(AlibabaNetworkError):
+                client.get(DESCRIPTION, params)
+            assert client.get(DESCRIPTION, params, timeout=1.0)["code"] == "0"
+
+
+class TestDeadlines:
+    """Tests for deadlines on single and composite calls."""
+
+    def test_expired_deadline_sends_nothing(
+        self, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """A call whose deadline has passed should fail without a request."""
+        server = _slow(FREIGHT, 0.0)
+        with standin_client(server, sleep=True) as client:
+            sent = _sent(client)
+            with pytest.raises(AlibabaDeadlineError) as exc_info:
+                client.calculate_freight(str(server.product_ids()[0]), 10, "US", deadline=0)
+        assert sent == []
+        assert exc_info.value.error_class == "permanent"
+
+    def test_freight_splits_deadline(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """Each dispatch location should get a share, and the call end at the deadline."""
+        server = _slow(FREIGHT, 0.5)
+        with standin_client(server, sleep=True) as client:
+            sent = _sent(client)
+            started = time.monotonic()
+            with pytest.raises(AlibabaDeadlineError):
+                client.calculate_freight(str(server.product_ids()[0]), 10, "US", deadline=0.3)
+            elapsed = time.monotonic() - started
+        assert [params["dispatch_location"] for params in sent] == ["CN", "US", "MX"]
+        assert 0.25 < elapsed < 0.45
+
+    def test_freight_within_deadline(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """A deadline that leaves enough time should not change the result."""
+        server = _slow(FREIGHT, 0.01)
+        with standin_client(server, sleep=True) as client:
+            result = client.calculate_freight(str(server.product_ids()[0]), 10, "US", deadline=1)
+        assert result["options"]
+
+    def test_retries_stop_at_deadline(
+        self, standin_client: Callable[..., AlibabaClient], make_config: Callable[..., Config]
+    ) -> None:
+        """Retries should not wait past the deadline."""
+        server = StandinServer("test_app_key", "test_app_secret", http_error_rate=1.0)
+        with standin_client(
+            server, sleep=True, config=make_config(max_retries=5, retry_backoff=0.1)
+        ) as client:
+            sent = _sent(client)
+            started = time.monotonic()
+            with pytest.raises(AlibabaNetworkError) as exc_info:
+                client.get(DESCRIPTION, {"query_req": "{}"}, deadline=0.25)
+        assert exc_info.value.status_code == 503
+        assert len(sent) == 2
+        assert time.monotonic() - started < 0.25
+
+    def test_search_returns_partial_results(
+        self, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """search_products should return what it loaded when the deadline runs out."""
+        server = _slow(DESCRIPTION, 0.05)
+        with standin_client(server, sleep=True) as client:
+            started = time.monotonic()
+            result = client.search_products(limit=5, deadline=0.13)
+            elapsed = time.monotonic() - started
+        assert result["deadline_exceeded"] is True
+        assert result["successfully_loaded"] == 2
+        assert elapsed < 0.2
+
+        with standin_client(server, sleep=True) as client:
+            result = client.search_products(limit=2, deadline=1)
+        assert result["deadline_exceeded"] is False
+        assert result["successfully_loaded"] == 2
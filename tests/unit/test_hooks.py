@@ -0,0 +1,114 @@
+"""Unit tests for request lifecycle hooks."""
+
+from collections.abc import Callable
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.hooks import RequestEvent, RequestHooks
+from alibaba_api.standin import StandinServer
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=50)
+
+
+@pytest.fixture
+def client(server: StandinServer, standin_client: Callable[..., AlibabaClient]) -> AlibabaClient:
+    """Create a client wired to the stand-in."""
+    return standin_client(server, sleep=True)
+
+
+def _record(client: AlibabaClient) -> list[tuple[str, RequestEvent]]:
+    seen: list[tuple[str, RequestEvent]] = []
+    for phase in ("before_sign", "before_send", "after_response", "on_error"):
+        client.add_hook(phase, lambda event, phase=phase: seen.append((phase, event)))  # type: ignore[misc]
+    return seen
+
+
+class TestRequestHooks:
+    """Tests for the hook registry."""
+
+    def test_empty_registry_is_falsy(self) -> None:
+        """An empty registry should be falsy so the client can skip it."""
+        hooks = RequestHooks()
+        assert not hooks
+
+        def hook(event: RequestEvent) -> None:
+            pass
+
+        hooks.add("after_response", hook)
+        assert hooks
+        hooks.remove("after_response", hook)
+        assert not hooks
+
+    def test_unknown_phase(self) -> None:
+        """Registering for an unknown phase should raise."""
+        with pytest.raises(ValueError):
+            RequestHooks().add("after_sign", lambda event: None)  # type: ignore[arg-type]
+
+
+class TestClientHooks:
+    """Tests for hooks fired by AlibabaClient.request."""
+
+    def test_success_phases(self, client: AlibabaClient) -> None:
+        """A successful call should fire before_sign, before_send and after_response."""
+        seen = _record(client)
+        client.list_products(scene_id="906124611", page_size=5)
+
+        assert [phase for phase, _ in seen] == ["before_sign", "before_send", "after_response"]
+        event = seen[-1][1]
+        assert event.api_path == "/eco/buyer/product/check"
+        assert event.method == "GET"
+        assert event.attempt == 1
+        assert event.status_code == 200
+        assert event.response_size and event.response_size > 0
+        assert event.request_id
+        assert event.timings.sign > 0
+        assert event.timings.network > 0
+        assert event.timings.parse > 0
+        assert event.timings.total == pytest.approx(
+            event.timings.sign + event.timings.network + event.timings.parse
+        )
+
+    def test_api_error(self, client: AlibabaClient) -> None:
+        """API errors should fire on_error with code and request_id."""
+        seen = _record(client)
+        with pytest.raises(AlibabaAPIError):
+            client.get_product("1")
+
+        assert [phase for phase, _ in seen] == ["before_sign", "before_send", "on_error"]
+        event = seen[-1][1]
+        assert event.error_code == "130106"
+        assert event.request_id
+        assert isinstance(event.error, AlibabaAPIError)
+
+    def test_http_error(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """HTTP errors should fire on_error with the status code."""
+        server = StandinServer("test_app_key", "test_app_secret", http_error_rate=1.0)
+        client = standin_client(server, sleep=True)
+        seen = _record(client)
+        with pytest.raises(AlibabaNetworkError):
+            client.get("/alibaba/order/list", {"role": "buyer"})
+        assert seen[-1][0] == "on_error"
+        assert seen[-1][1].status_code == 503
+
+    def test_before_sign_can_add_params(self, client: AlibabaClient) -> None:
+        """Params added before signing should be signed and sent."""
+        client.add_hook("before_sign", lambda event: event.params.update({"trace_id": "abc"}))
+        # The stand-in verifies signatures, so success proves the param was signed
+        result = client.get("/alibaba/order/list", {"role": "buyer"})
+        assert result["code"] == "0"
+
+    def test_remove_hook(self, client: AlibabaClient) -> None:
+        """Removed hooks should no longer fire."""
+        calls: list[RequestEvent] = []
+        hook = client.add_hook("after_response", calls.append)
+        client.get("/alibaba/order/list", {"role": "buyer"})
+        client.remove_hook("after_response", hook)
+        client.get("/alibaba/order/list", {"role": "buyer"})
+        assert len(calls) == 1
+        assert not client.hooks
@@ -0,0 +1,136 @@
+"""Unit tests for compact product ID sets and the scene index."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from alibaba_api import ProductIdSet, SceneIndex
+
+
+class TestProductIdSet:
+    """Tests for the sorted-array ID set."""
+
+    def test_ints_and_strings(self) -> None:
+        """String and int IDs should be stored once, sorted, as ints."""
+        ids = ProductIdSet(["1600", 20, "20", 1600, 3])
+        assert list(ids) == [3, 20, 1600]
+        assert len(ids) == 3
+        assert ids.nbytes == 24
+
+    def test_membership(self) -> None:
+        """Membership should accept either form and reject anything else."""
+        ids = ProductIdSet(["1600124642247", 42])
+        assert 1600124642247 in ids
+        assert "42" in ids
+        assert 43 not in ids
+        assert -1 not in ids
+        assert 2**64 not in ids
+        assert "abc" not in ids
+        assert None not in ids
+        assert 0 not in ProductIdSet()
+
+    def test_bad_ids(self) -> None:
+        """Negative, oversized, non-numeric and non-ID values should raise ValueError."""
+        for bad in [-1, 2**64, "x1", 1.5, True]:
+            with pytest.raises(ValueError):
+                ProductIdSet([bad])
+        assert list(ProductIdSet([2**64 - 1])) == [2**64 - 1]
+
+    def test_set_operations(self) -> None:
+        """Union, intersection and difference should match Python sets."""
+        rng = random.Random(7)
+        for _ in range(50):
+            a = {rng.randrange(200) for _ in range(rng.randrange(60))}
+            b = {rng.randrange(200) for _ in range(rng.randrange(60))}
+            left, right = ProductIdSet(a), ProductIdSet(map(str, b))
+            assert list(left | right) == sorted(a | b)
+            assert list(left & right) == sorted(a & b)
+            assert list(left - right) == sorted(a - b)
+            assert list(right - left) == sorted(b - a)
+
+    def test_operations_accept_iterables(self) -> None:
+        """The named methods should take plain iterables of IDs."""
+        ids = ProductIdSet([1, 2, 3])
+        assert list(ids.union(["4"])) == [1, 2, 3, 4]
+        assert list(ids.difference([2])) == [1, 3]
+        assert list(ids.intersection(["3", "9"])) == [3]
+
+    def test_equality(self) -> None:
+        """Sets with the same IDs should be equal and unhashable."""
+        assert ProductIdSet([2, 1]) == ProductIdSet(["1", "2"])
+        assert ProductIdSet([1]) != ProductIdSet([2])
+        with pytest.raises(TypeError):
+            hash(ProductIdSet())
+
+    def test_bytes_round_trip(self) -> None:
+        """to_bytes and from_bytes should round-trip, refusing anything else."""
+        ids = ProductIdSet(range(0, 10_000, 7))
+        data = ids.to_bytes()
+        assert ProductIdSet.from_bytes(data) == ids
+        assert ProductIdSet.from_bytes(ProductIdSet().to_bytes()) == ProductIdSet()
+        with pytest.raises(ValueError, match="Not a product ID set"):
+            ProductIdSet.from_bytes(b"nonsense" + data[8:])
+        with pytest.raises(ValueError, match="Truncated"):
+            ProductIdSet.from_bytes(data[:-1])
+        with pytest.raises(ValueError, match="Trailing"):
+            ProductIdSet.from_bytes(data + b"\0")
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """A saved set should load back equal."""
+        ids = ProductIdSet(["1600124642247", "1601206892606"])
+        ids.save(tmp_path / "ids.bin")
+        assert ProductIdSet.load(tmp_path / "ids.bin") == ids
+
+
+class TestSceneIndex:
+    """Tests for the scene membership index."""
+
+    @pytest.fixture
+    def index(self) -> SceneIndex:
+        return SceneIndex({"906124611": [1, 2, 3], "906168847": ["3", "4"], "local:US": []})
+
+    def test_lookups(self, index: SceneIndex) -> None:
+        """Scenes should map to IDs and IDs back to scenes."""
+        assert list(index) == ["906124611", "906168847", "local:US"]
+        assert list(index["906168847"]) == [3, 4]
+        assert index.scenes_of("3") == ["906124611", "906168847"]
+        assert index.scenes_of(1) == ["906124611"]
+        assert index.scenes_of(9) == []
+        assert list(index.ids()) == [1, 2, 3, 4]
+        assert "local:US" in index
+        with pytest.raises(KeyError):
+            index["missing"]
+
+    def test_add_and_replace(self, index: SceneIndex) -> None:
+        """add should merge into a scene, assignment should replace it."""
+        index.add("906124611", ["5", 1])
+        index.add("new", [7])
+        assert list(index["906124611"]) == [1, 2, 3, 5]
+        assert list(index["new"]) == [7]
+        index["906124611"] = [6]
+        assert index.scenes_of(1) == []
+        del index["new"]
+        assert len(index) == 3
+        assert index.nbytes == 3 * 8
+
+    def test_diff_between_runs(self, index: SceneIndex) -> None:
+        """Per-scene differences should show what a later run added and dropped."""
+        later = SceneIndex({"906124611": [2, 3, 8], "906168847": [3, 4]})
+        assert list(later["906124611"] - index["906124611"]) == [8]
+        assert list(index["906124611"] - later["906124611"]) == [1]
+        assert list(later.ids() - index.ids()) == [8]
+
+    def test_save_and_load(self, index: SceneIndex, tmp_path: Path) -> None:
+        """A saved index should load back equal, refusing corrupt files."""
+        index["场景"] = [10]
+        index.save(tmp_path / "scenes.idx")
+        assert SceneIndex.load(tmp_path / "scenes.idx") == index
+
+        data = (tmp_path / "scenes.idx").read_bytes()
+        (tmp_path / "bad.idx").write_bytes(data[:-3])
+        with pytest.raises(ValueError, match="Truncated"):
+            SceneIndex.load(tmp_path / "bad.idx")
+        (tmp_path / "bad.idx").write_bytes(b"PIDSET1\n" + data[8:])
+        with pytest.raises(ValueError, match="Not a scene index"):
+            SceneIndex.load(tmp_path / "bad.idx")
@@ -0,0 +1,137 @@
+"""Unit tests for the load generator."""
+
+import threading
+from collections.abc import Callable, Generator
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.loadgen import STEPS, LoadGenerator
+from alibaba_api.standin import StandinServer
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=50)
+
+
+@pytest.fixture
+def base_url(server: StandinServer) -> Generator[str, None, None]:
+    """Serve the stand-in on a local socket."""
+    http = server.serve(port=0)
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{http.server_address[1]}/rest"
+    http.shutdown()
+    http.server_close()
+
+
+class TestLoadGenerator:
+    """Tests for running checkout flows."""
+
+    def test_sync_flows(
+        self,
+        server: StandinServer,
+        standin_client: Callable[..., AlibabaClient],
+        make_config: Callable[..., Config],
+    ) -> None:
+        """Every flow should run all four steps and place a paid order."""
+        report = LoadGenerator(
+            make_config(),
+            server.product_ids()[:10],
+            users=3,
+            max_flows=12,
+            transport=server.transport(sleep=False),
+            seed=1,
+        ).run()
+        assert report.completed == 12
+        assert report.failed == 0
+        assert all(len(report.latencies[step]) == 12 for step in STEPS)
+        assert report.throughput > 0
+        assert report.pool_wait() is None
+        with standin_client(server.transport(sleep=False)) as client:
+            orders = client.get("/alibaba/order/list", {"role": "buyer", "page_size": "50"})
+        statuses = {order["trade_status"] for order in orders["value"]["order_list"]}
+        assert statuses == {"paid"}
+
+    def test_async_flows(self, server: StandinServer, make_config: Callable[..., Config]) -> None:
+        """Async users should run the same flow."""
+        report = LoadGenerator(
+            make_config(),
+            server.product_ids()[:10],
+            users=4,
+            mode="async",
+            max_flows=8,
+            transport=server.async_transport(),
+        ).run()
+        assert report.completed == 8
+        assert all(len(report.latencies[step]) == 8 for step in STEPS)
+
+    def test_error_breakdown(
+        self, server: StandinServer, make_config: Callable[..., Config]
+    ) -> None:
+        """Failed steps should end the flow and be counted by code."""
+        report = LoadGenerator(
+            make_config(), ["1"], users=2, max_flows=5, transport=server.transport(sleep=False)
+        ).run()
+        assert report.completed == 0
+        assert report.failed == 5
+        assert report.errors["get_product"] == {"130106": 5}
+        assert report.summary()["steps"]["get_product"]["errors"] == {"130106": 5}
+        assert "130106: 5" in report.format()
+
+    @pytest.mark.parametrize("mode", ["sync", "async"])
+    def test_product_without_skus(
+        self,
+        server: StandinServer,
+        mode: str,
+        make_config: Callable[..., Config],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A product that cannot be ordered should fail the flow, not the user."""
+        product = server.product
+        monkeypatch.setattr(server, "product", lambda pid: {**product(pid), "skus": []})
+        report = LoadGenerator(
+            make_config(),
+            server.product_ids()[:3],
+            users=2,
+            mode=mode,  # type: ignore[arg-type]
+            max_flows=4,
+            transport=server.transport(sleep=False) if mode == "sync" else server.async_transport(),
+        ).run()
+        assert report.completed == 0
+        assert report.failed == 4
+        assert report.errors["get_product"] == {"IndexError": 4}
+
+    @pytest.mark.parametrize(("mode", "connections"), [("sync", 4), ("async", 2)])
+    def test_pool_wait_over_socket(
+        self,
+        server: StandinServer,
+        base_url: str,
+        mode: str,
+        connections: int,
+        make_config: Callable[..., Config],
+    ) -> None:
+        """Requests through httpx's pool should report how long they waited."""
+        report = LoadGenerator(
+            make_config(base_url_override=base_url),
+            server.product_ids()[:10],
+            users=4,
+            mode=mode,  # type: ignore[arg-type]
+            max_flows=6,
+            connections=connections,
+        ).run()
+        assert report.completed == 6
+        wait = report.pool_wait()
+        assert wait is not None
+        assert len(report.pool_waits) >= 6 * len(STEPS)
+        assert "pool wait" in report.format()
+
+    def test_rejects_bad_arguments(self, make_config: Callable[..., Config]) -> None:
+        """An empty product list or unknown mode should raise."""
+        with pytest.raises(ValueError):
+            LoadGenerator(make_config(), [])
+        with pytest.raises(ValueError):
+            LoadGenerator(make_config(), ["1"], mode="threads")  # type: ignore[arg-type]
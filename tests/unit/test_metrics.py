@@ -0,0 +1,142 @@
+"""Unit tests for the metrics registry."""
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError
+from alibaba_api.hooks import RequestEvent, RequestTimings
+from alibaba_api.metrics import OVERFLOW_LABEL, LatencyHistogram, MetricsRegistry
+from alibaba_api.standin import StandinServer
+
+
+def _event(api_path: str, total: float = 0.1, **fields: object) -> RequestEvent:
+    event = RequestEvent("after_response", api_path, "GET", {})
+    event.timings = RequestTimings(sign=total * 0.1, network=total * 0.8, parse=total * 0.1)
+    event.status_code = 200
+    for key, value in fields.items():
+        setattr(event, key, value)
+    return event
+
+
+class TestLatencyHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_cumulative_buckets(self) -> None:
+        """Buckets should be cumulative and end with +Inf."""
+        histogram = LatencyHistogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(5.65)
+
+    def test_quantile_interpolates(self) -> None:
+        """Quantiles should interpolate within the bucket holding the rank."""
+        histogram = LatencyHistogram((1.0, 2.0))
+        for _ in range(50):
+            histogram.observe(0.5)
+        for _ in range(50):
+            histogram.observe(1.5)
+
+        assert histogram.quantile(0.5) == pytest.approx(1.0)
+        assert histogram.quantile(0.75) == pytest.approx(1.5)
+        assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+class TestMetricsRegistry:
+    """Tests for recording and rendering."""
+
+    def test_observe_breakdowns(self) -> None:
+        """Events should be counted by status and error code."""
+        registry = MetricsRegistry()
+        registry.observe(_event("/shipping/freight/calculate"))
+        registry.observe(
+            _event("/shipping/freight/calculate", error_code="120019", error_sub_code=None)
+        )
+        registry.observe(_event("/shipping/freight/calculate", status_code=503))
+        registry.record_cache_hit("/shipping/freight/calculate")
+        registry.record_retry("/shipping/freight/calculate")
+
+        snapshot = registry.snapshot()["/shipping/freight/calculate"]
+        assert snapshot["requests"] == 3
+        assert snapshot["statuses"] == {"200": 2, "503": 1}
+        assert snapshot["errors"] == {"120019": 1}
+        assert snapshot["cache_hits"] == 1
+        assert snapshot["retries"] == 1
+        assert snapshot["latency"]["count"] == 3
+        assert snapshot["phase_seconds"]["network"] == pytest.approx(0.24)
+
+    def test_bounded_endpoints(self) -> None:
+        """Endpoints beyond the cap should fold into the overflow label."""
+        registry = MetricsRegistry(max_endpoints=2, max_error_codes=1)
+        for path in ("/a", "/b", "/c", "/d"):
+            registry.observe(_event(path, error_code=path))
+
+        snapshot = registry.snapshot()
+        assert set(snapshot) == {"/a", "/b", OVERFLOW_LABEL}
+        assert snapshot[OVERFLOW_LABEL]["requests"] == 2
+        assert snapshot[OVERFLOW_LABEL]["errors"] == {"/c": 1, OVERFLOW_LABEL: 1}
+
+    def test_render_prometheus(self) -> None:
+        """The exposition should contain typed families and escaped labels."""
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.observe(_event('/path/"quoted"', total=0.5, error_code="4015"))
+
+        text = registry.render_prometheus()
+        assert "# TYPE alibaba_api_requests_total counter" in text
+        assert "# TYPE alibaba_api_request_duration_seconds histogram" in text
+        assert 'alibaba_api_requests_total{endpoint="/path/\\"quoted\\"",status="200"} 1' in text
+        assert (
+            'alibaba_api_request_duration_seconds_bucket{endpoint="/path/\\"quoted\\"",le="1.0"} 1'
+            in text
+        )
+        assert 'code="4015",sub_code=""} 1' in text
+        assert text.endswith("\n")
+
+    def test_transfer_bytes(self) -> None:
+        """Wire and decoded bytes should be summed and ranked by wire share."""
+        registry = MetricsRegistry()
+        registry.observe(_event("/big", response_size=10_000, wire_size=2_000))
+        registry.observe(_event("/big", response_size=10_000, wire_size=2_000))
+        registry.observe(_event("/small", response_size=1_000))
+        registry.observe(_event("/failed", status_code=None))
+
+        assert registry.snapshot()["/big"]["bytes"] == {"wire": 4_000, "decoded": 20_000}
+        big, small = registry.transfer()
+        assert big == {
+            "endpoint": "/big",
+            "wire_bytes": 4_000,
+            "decoded_bytes": 20_000,
+            "ratio": 0.2,
+            "share": 0.8,
+        }
+        assert small["ratio"] == 1.0
+        text = registry.render_prometheus()
+        assert 'alibaba_api_response_bytes_total{endpoint="/big",stage="wire"} 4000' in text
+
+
+class TestClientMetrics:
+    """Tests for metrics recorded through AlibabaClient."""
+
+    def test_client_records_requests(self, config: Config) -> None:
+        """Client calls should be recorded per endpoint."""
+        server = StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+        registry = MetricsRegistry()
+        with AlibabaClient(config, transport=server.transport(), metrics=registry) as client:
+            client.list_products(scene_id="906124611")
+            with pytest.raises(AlibabaAPIError):
+                client.get_product("1")
+
+        snapshot = registry.snapshot()
+        assert snapshot["/eco/buyer/product/check"]["statuses"] == {"200": 1}
+        assert snapshot["/eco/buyer/product/description"]["errors"] == {"130106": 1}
+        assert client.metrics is registry
+
+    def test_uninstall(self, config: Config) -> None:
+        """Uninstalling should stop recording and leave no hooks behind."""
+        registry = MetricsRegistry()
+        client = AlibabaClient(config, metrics=registry)
+        registry.uninstall(client)
+        assert not client.hooks
@@ -0,0 +1,225 @@
+"""Unit tests for the middleware stack and the async client."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from alibaba_api.async_client import AsyncAlibabaClient
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.hooks import RequestEvent
+from alibaba_api.middleware import Call, Handler, MiddlewareStack
+from alibaba_api.standin import StandinServer
+
+ORDERS = "/alibaba/order/list"
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+@pytest.fixture
+def client(server: StandinServer, standin_client: Callable[..., AlibabaClient]) -> AlibabaClient:
+    """Create a client wired to the stand-in."""
+    return standin_client(server.transport())
+
+
+def _tracer(name: str, log: list[str]) -> Any:
+    def middleware(call: Call, call_next: Handler) -> dict[str, Any]:
+        log.append(f"{name}>")
+        try:
+            return call_next(call)
+        finally:
+            log.append(f"<{name}")
+
+    return middleware
+
+
+class TestMiddlewareStack:
+    """Tests for composing middleware."""
+
+    def test_empty_stack_is_falsy(self) -> None:
+        """An empty stack should be falsy and hand calls straight to the handler."""
+        stack = MiddlewareStack(lambda call: {"path": call.api_path})
+        assert not stack
+        assert stack.handler(Call("/x", "GET", {})) == {"path": "/x"}
+
+    def test_order(self) -> None:
+        """The first middleware added should run outermost; first=True prepends."""
+        log: list[str] = []
+        stack = MiddlewareStack(lambda call: log.append("handler") or {})
+        stack.add(_tracer("a", log))
+        stack.add(_tracer("b", log))
+        stack.add(_tracer("c", log), first=True)
+        stack.handler(Call("/x", "GET", {}))
+        assert log == ["c>", "a>", "b>", "handler", "<b", "<a", "<c"]
+        assert len(stack) == 3
+
+    def test_remove(self) -> None:
+        """Removed middleware should no longer run; unknown ones are ignored."""
+        log: list[str] = []
+        stack = MiddlewareStack(lambda call: {})
+        middleware = stack.add(_tracer("a", log))
+        stack.remove(middleware)
+        stack.remove(middleware)
+        stack.handler(Call("/x", "GET", {}))
+        assert log == []
+        assert not stack
+
+
+class TestClientMiddleware:
+    """Tests for middleware around AlibabaClient.request."""
+
+    def test_short_circuit(self, client: AlibabaClient) -> None:
+        """A middleware that answers itself should send nothing."""
+        sent: list[RequestEvent] = []
+        client.add_hook("before_send", sent.append)
+        client.add_middleware(lambda call, call_next: {"code": "0", "cached": True})
+        assert client.get(ORDERS, {"role": "buyer"}) == {"code": "0", "cached": True}
+        assert sent == []
+
+    def test_retry_resigns(self, client: AlibabaClient) -> None:
+        """Calling call_next again should sign the request afresh."""
+        signed: list[dict[str, str]] = []
+        client.add_hook("before_send", lambda event: signed.append(dict(event.params)))
+        original = client._sign
+
+        def spy(api_path: str, params: dict[str, str], token: str | None) -> dict[str, str]:
+            result = original(api_path, params, token)
+            signed.append(result)
+            return result
+
+        client._sign = spy  # type: ignore[method-assign]
+
+        def twice(call: Call, call_next: Handler) -> dict[str, Any]:
+            call_next(call)
+            time.sleep(0.002)
+            call.attempt += 1
+            return call_next(call)
+
+        attempts: list[int] = []
+        client.add_hook("after_response", lambda event: attempts.append(event.attempt))
+        client.add_middleware(twice)
+        assert client.get(ORDERS, {"role": "buyer"})["code"] == "0"
+
+        signatures = [params for params in signed if "sign" in params]
+        assert len(signatures) == 2
+        assert signatures[0]["timestamp"] != signatures[1]["timestamp"]
+        assert signatures[0]["sign"] != signatures[1]["sign"]
+        assert attempts == [1, 2]
+
+    def test_annotations_reach_hooks(self, client: AlibabaClient) -> None:
+        """Values recorded on call.annotations should appear on the hook event."""
+        events: list[RequestEvent] = []
+        client.add_hook("after_response", events.append)
+
+        def tag(call: Call, call_next: Handler) -> dict[str, Any]:
+            call.annotations["tenant"] = "acme"
+            return call_next(call)
+
+        client.add_middleware(tag)
+        client.get(ORDERS, {"role": "buyer"})
+        assert events[0].annotations == {"tenant": "acme"}
+
+    def test_errors_propagate_to_policy_retries(self, make_config: Callable[..., Config]) -> None:
+        """Errors raised through middleware should still be retried by the client."""
+        server = StandinServer("test_app_key", "test_app_secret", http_error_rate=1.0)
+        log: list[str] = []
+        client = AlibabaClient(
+            make_config(max_retries=2, retry_backoff=0.001),
+            transport=server.transport(),
+            middleware=[_tracer("a", log)],
+        )
+        with pytest.raises(AlibabaNetworkError):
+            client.get(ORDERS, {"role": "buyer"})
+        assert log == ["a>", "<a"] * 3
+
+    def test_middleware_can_catch_errors(self, client: AlibabaClient) -> None:
+        """A middleware should see API errors before the caller does."""
+        seen: list[str] = []
+
+        def catch(call: Call, call_next: Handler) -> dict[str, Any]:
+            try:
+                return call_next(call)
+            except AlibabaAPIError as e:
+                seen.append(e.code)
+                raise
+
+        client.add_middleware(catch)
+        with pytest.raises(AlibabaAPIError):
+            client.get_product("1")
+        assert seen == ["130106"]
+
+
+class TestAsyncClient:
+    """Tests for AsyncAlibabaClient."""
+
+    def test_request(self, server: StandinServer, make_config: Callable[..., Config]) -> None:
+        """The async client should sign, send and parse like the sync one."""
+
+        async def run() -> dict[str, Any]:
+            async with AsyncAlibabaClient(
+                make_config(), transport=server.async_transport()
+            ) as client:
+                return await client.get(ORDERS, {"role": "buyer"})
+
+        assert asyncio.run(run())["code"] == "0"
+
+    def test_async_middleware_and_hooks(
+        self, server: StandinServer, make_config: Callable[..., Config]
+    ) -> None:
+        """Async middleware should wrap each request and annotate hook events."""
+        log: list[str] = []
+        events: list[RequestEvent] = []
+
+        async def tag(call: Call, call_next: Any) -> dict[str, Any]:
+            log.append(call.api_path)
+            call.annotations["async"] = True
+            return await call_next(call)
+
+        async def cached(call: Call, call_next: Any) -> dict[str, Any]:
+            if call.params.get("role") == "seller":
+                return {"code": "0", "cached": True}
+            return await call_next(call)
+
+        async def run() -> tuple[dict[str, Any], dict[str, Any]]:
+            client = AsyncAlibabaClient(
+                make_config(), transport=server.async_transport(), middleware=[tag]
+            )
+            client.add_hook("after_response", events.append)
+            client.add_middleware(cached)
+            try:
+                return (
+                    await client.get(ORDERS, {"role": "buyer"}),
+                    await client.get(ORDERS, {"role": "seller"}),
+                )
+            finally:
+                await client.aclose()
+
+        buyer, seller = asyncio.run(run())
+        assert buyer["code"] == "0"
+        assert seller == {"code": "0", "cached": True}
+        assert log == [ORDERS, ORDERS]
+        assert [event.annotations for event in events] == [{"async": True}]
+
+    def test_api_error(self, server: StandinServer, make_config: Callable[..., Config]) -> None:
+        """API errors should be raised and classified."""
+
+        async def run() -> None:
+            async with AsyncAlibabaClient(
+                make_config(), transport=server.async_transport()
+            ) as client:
+                await client.get(
+                    "/eco/buyer/product/description", {"query_req": '{"product_id": 1}'}
+                )
+
+        with pytest.raises(AlibabaAPIError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.code == "130106"
+        assert exc_info.value.error_class == "permanent"
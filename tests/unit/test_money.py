@@ -0,0 +1,204 @@
+"""Unit tests for fixed-point money."""
+
+import pickle
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from alibaba_api.models import (
+    Amount,
+    Fee,
+    LadderPrice,
+    Money,
+    MoneyVector,
+    ProductDescription,
+    currency_exponent,
+    parse_minor,
+)
+from alibaba_api.standin import StandinServer
+
+
+class TestParseMinor:
+    """Tests for decimal string parsing."""
+
+    @pytest.mark.parametrize(
+        ("text", "exponent", "expected"),
+        [
+            ("45.44", 2, 4544),
+            ("45.4", 2, 4540),
+            ("45", 2, 4500),
+            (".5", 2, 50),
+            ("-3.10", 2, -310),
+            ("+1", 2, 100),
+            (" 1,299.50 ", 2, 129950),
+            ("1200", 0, 1200),
+            ("1.234", 3, 1234),
+            ("0.125", 2, 12),
+            ("0.135", 2, 14),
+            ("0.1251", 2, 13),
+            ("0.12500", 2, 12),
+        ],
+    )
+    def test_parse(self, text: str, exponent: int, expected: int) -> None:
+        """Decimal strings should parse exactly, rounding extra digits half to even."""
+        assert parse_minor(text, exponent) == expected
+
+    @pytest.mark.parametrize("text", ["", "-", ".", "abc", "1.2.3", "1e5"])
+    def test_invalid(self, text: str) -> None:
+        """Non-decimal strings should raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_minor(text)
+
+    def test_currency_exponents(self) -> None:
+        """Known currencies should use their ISO 4217 exponent."""
+        assert currency_exponent("USD") == 2
+        assert currency_exponent("JPY") == 0
+        assert currency_exponent("KWD") == 3
+
+
+class TestMoney:
+    """Tests for Money arithmetic and formatting."""
+
+    def test_arithmetic(self) -> None:
+        """Sums, differences and multiples should be exact."""
+        cost = Money.parse("41.80", "USD")
+        sell = Money.parse("59.99", "USD")
+        margin = sell - cost
+
+        assert margin == Money(1819, "USD")
+        assert margin * 250 == Money(454750, "USD")
+        assert 3 * Money.parse("0.10", "USD") == Money.parse("0.30", "USD")
+        assert margin.ratio(sell) == Fraction(1819, 5999)
+        assert -margin + margin == Money.zero("USD")
+        assert not Money.zero("USD")
+        assert abs(Money(-5, "USD")) == Money(5, "USD")
+
+    def test_sum(self) -> None:
+        """Money.sum should total same-currency amounts."""
+        amounts = [Money.parse("0.10", "USD")] * 10
+        assert Money.sum(amounts, "USD") == Money.parse("1.00", "USD")
+        with pytest.raises(ValueError):
+            Money.sum([Money(1, "EUR")], "USD")
+
+    def test_scale_rounds_half_even(self) -> None:
+        """Scaling by a fraction should round half to even."""
+        assert Money(125, "USD").scale("0.1") == Money(12, "USD")
+        assert Money(135, "USD").scale(Decimal("0.1")) == Money(14, "USD")
+        assert Money(1000, "USD").scale(Fraction(23, 20)) == Money(1150, "USD")
+
+    def test_comparison(self) -> None:
+        """Amounts should compare within a currency and refuse across currencies."""
+        assert Money(1, "USD") < Money(2, "USD") <= Money(2, "USD")
+        assert max(Money(3, "USD"), Money(7, "USD")) == Money(7, "USD")
+        assert Money(1, "USD") != Money(1, "EUR")
+        with pytest.raises(ValueError):
+            _ = Money(1, "USD") < Money(2, "EUR")
+        with pytest.raises(ValueError):
+            _ = Money(1, "USD") + Money(2, "EUR")
+
+    def test_comparison_with_non_money(self) -> None:
+        """Ordering against a plain number should be a TypeError, not a crash."""
+        for compare in (
+            lambda: Money(1, "USD") < 1,
+            lambda: Money(1, "USD") <= 1,
+            lambda: Money(1, "USD") > 1,
+            lambda: Money(1, "USD") >= 1,
+        ):
+            with pytest.raises(TypeError):
+                compare()
+
+    def test_ratio(self) -> None:
+        """Ratios should be exact and refuse a zero denominator."""
+        assert Money(25, "USD").ratio(Money(100, "USD")) == Fraction(1, 4)
+        with pytest.raises(ValueError, match="zero"):
+            Money(100, "USD").ratio(Money(0, "USD"))
+
+    def test_multiply_requires_int(self) -> None:
+        """Multiplying by a float should be refused to avoid drift."""
+        with pytest.raises(TypeError):
+            _ = Money(1, "USD") * 1.5  # type: ignore[operator]
+
+    def test_formatting(self) -> None:
+        """Amounts should format like the API."""
+        assert Money.parse("45.4", "USD").amount == "45.40"
+        assert Money(-5, "USD").amount == "-0.05"
+        assert Money(1200, "JPY").amount == "1200"
+        assert str(Money(1234, "KWD")) == "1.234 KWD"
+        assert Money.parse("19.99", "USD").to_decimal() == Decimal("19.99")
+
+    def test_immutable_and_hashable(self) -> None:
+        """Money should be immutable, hashable and picklable."""
+        money = Money(100, "USD")
+        with pytest.raises(AttributeError):
+            money.minor = 5  # type: ignore[misc]
+        assert {money, Money(100, "USD")} == {money}
+        assert pickle.loads(pickle.dumps(money)) == money
+
+
+class TestMoneyVector:
+    """Tests for batch arithmetic."""
+
+    def test_batch_margin(self) -> None:
+        """Vector arithmetic should match per-item Money arithmetic."""
+        cost = MoneyVector.parse(["41.80", "1.05", "9.99"], "USD")
+        sell = MoneyVector.parse(["59.99", "1.10", "12.00"], "USD")
+        quantities = [250, 3, 10]
+
+        margins = (sell - cost) * quantities
+        assert list(margins) == [
+            (s - c) * q for c, s, q in zip(cost, sell, quantities, strict=True)
+        ]
+        assert margins.total() == Money(454750 + 15 + 2010, "USD")
+        assert margins.min() == Money(15, "USD")
+        assert margins[0] == Money(454750, "USD")
+
+    def test_scalar_operands(self) -> None:
+        """Money and int operands should broadcast."""
+        prices = MoneyVector.parse(["1.00", "2.00"], "USD")
+        assert (prices + Money(50, "USD")).minors == [150, 250]
+        assert (2 * prices).minors == [200, 400]
+
+    def test_mismatches(self) -> None:
+        """Currency and length mismatches should raise ValueError."""
+        usd = MoneyVector([1, 2], "USD")
+        with pytest.raises(ValueError):
+            _ = usd - MoneyVector([1, 2], "EUR")
+        with pytest.raises(ValueError):
+            _ = usd + MoneyVector([1], "USD")
+        with pytest.raises(ValueError):
+            _ = usd * [1, 2, 3]
+        with pytest.raises(ValueError):
+            MoneyVector.of([Money(1, "EUR")], "USD")
+        assert MoneyVector.of([Money(1, "USD")], "USD") == MoneyVector([1], "USD")
+
+
+class TestModelMoney:
+    """Tests for money and integer quantities on the pydantic models."""
+
+    def test_ladder_price(self) -> None:
+        """Ladder tiers should expose integer bounds and a parsed unit price."""
+        tier = LadderPrice.model_validate(
+            {"min_quantity": "10", "max_quantity": "99", "price": "41.80", "currency": "USD"}
+        )
+        assert tier.min_quantity == 10
+        assert tier.max_quantity == 99
+        assert tier.unit_price == Money(4180, "USD")
+        assert tier.unit_price is tier.unit_price
+        assert tier.model_dump()["price"] == "41.80"
+
+    def test_amounts(self) -> None:
+        """Amount and Fee should expose parsed money."""
+        assert Amount(amount="12.50", currency="USD").money == Money(1250, "USD")
+        assert Fee(amount="3.1", currency="USD").money == Money(310, "USD")
+
+    def test_product(self) -> None:
+        """Products should expose an integer MOQ and the wholesale price."""
+        server = StandinServer(catalog_size=5)
+        data = server.product(server.product_ids()[0])
+        product = ProductDescription.model_validate(data)
+
+        assert product.min_order_quantity == int(data["min_order_quantity"])
+        assert product.wholesale_trade is not None
+        assert product.wholesale_trade.min_order_quantity == product.min_order_quantity
+        assert product.wholesale_price == Money.parse(data["wholesale_trade"]["price"], "USD")
@@ -0,0 +1,180 @@
+"""Unit tests for the negative cache."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.metrics import MetricsRegistry
+from alibaba_api.negcache import NegativeCache
+from alibaba_api.standin import StandinServer
+
+OFFLINE = "1"  # not in the stand-in catalog, so it answers 130106
+
+
+def _sent(client: AlibabaClient) -> list[str]:
+    sent: list[str] = []
+    client.add_hook("before_send", lambda event: sent.append(event.api_path))
+    return sent
+
+
+@pytest.fixture(scope="module")
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+@pytest.fixture(scope="module")
+def restricted() -> StandinServer:
+    """Create a catalog where no product ships anywhere."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=5, restricted_ratio=1.0)
+
+
+class TestClient:
+    """Tests for short-circuiting client calls."""
+
+    def test_offline_product(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """A second get_product for an offline product should not be sent."""
+        metrics = MetricsRegistry()
+        with standin_client(server, metrics=metrics) as client:
+            sent = _sent(client)
+            with pytest.raises(AlibabaAPIError) as first:
+                client.get_product(OFFLINE)
+            with pytest.raises(AlibabaAPIError) as second:
+                client.get_product(OFFLINE)
+            with pytest.raises(AlibabaAPIError):
+                client.calculate_freight(OFFLINE, 10, "US")
+
+        assert second.value is first.value
+        assert second.value.code == "130106"
+        assert sent == ["/eco/buyer/product/description"]
+        assert client.negative_cache.stats()["hits"] == {"product": 2, "destination": 0}
+        snapshot = metrics.snapshot()
+        assert snapshot["/eco/buyer/product/description"]["cache_hits"] == 1
+        assert snapshot["/shipping/freight/calculate"]["cache_hits"] == 1
+
+    def test_restricted_destination(
+        self, restricted: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Freight quotes should be skipped per (product, country) pair only."""
+        product_id = str(restricted.product_ids()[0])
+        with standin_client(restricted) as client:
+            sent = _sent(client)
+            for _ in range(3):
+                with pytest.raises(AlibabaAPIError) as exc_info:
+                    client.calculate_freight(product_id, 10, "US")
+            assert exc_info.value.code == "120019"
+            assert len(sent) == 1
+
+            with pytest.raises(AlibabaAPIError):
+                client.calculate_freight(product_id, 10, "DE")
+            assert len(sent) == 2
+            client.get_product(product_id)
+
+        stats = client.negative_cache.stats()
+        assert stats["hits"] == {"product": 0, "destination": 2}
+        assert stats["entries"] == 2
+
+    def test_disabled_by_ttl(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """A TTL of 0 should disable caching for that scope."""
+        with standin_client(server, negative_cache=NegativeCache(product_ttl=0)) as client:
+            sent = _sent(client)
+            for _ in range(2):
+                with pytest.raises(AlibabaAPIError):
+                    client.get_product(OFFLINE)
+        assert len(sent) == 2
+
+    def test_shared_between_clients(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """A shared cache should short-circuit calls on every client."""
+        cache = NegativeCache()
+        with standin_client(server, negative_cache=cache) as first, pytest.raises(AlibabaAPIError):
+            first.get_product(OFFLINE)
+        with standin_client(server, negative_cache=cache) as second:
+            sent = _sent(second)
+            with pytest.raises(AlibabaAPIError):
+                second.get_product(OFFLINE)
+        assert sent == []
+
+    def test_search_shares_cache(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """search_products should skip and record products get_product would skip."""
+        server = StandinServer(
+            "test_app_key", "test_app_secret", catalog_size=100, offline_ratio=0.5
+        )
+        with standin_client(server) as client:
+            listed = client.list_products("906124611", page_size=20)["product_ids"]
+        offline = [pid for pid in listed if server.is_offline(int(pid))]
+        assert offline
+
+        with standin_client(server) as client:
+            sent = _sent(client)
+            first = client.search_products(limit=20)
+            assert len(sent) == 1 + len(listed)
+
+            sent.clear()
+            second = client.search_products(limit=20)
+            assert len(sent) == 1 + len(listed) - len(offline)
+            assert second["successfully_loaded"] == first["successfully_loaded"]
+
+            sent.clear()
+            with pytest.raises(AlibabaAPIError):
+                client.get_product(offline[0])
+            assert sent == []
+
+
+class TestNegativeCache:
+    """Tests for the cache itself."""
+
+    def test_only_scoped_api_errors(self) -> None:
+        """Errors without a product or destination scope should not be cached."""
+        cache = NegativeCache()
+        assert not cache.record(AlibabaAPIError("10010", "no route"), "dispatch_location", "1")
+        assert not cache.record(AlibabaAPIError("4015", "restricted"), "destination", "1")
+        assert not cache.record(AlibabaNetworkError("down", status_code=503), "product", "1")
+        assert cache.record(AlibabaAPIError("4015", "restricted"), "destination", "1", "US")
+        assert cache.check("1") is None
+        assert cache.check(1, "US") is not None
+
+    def test_expiry(self) -> None:
+        """Entries should be dropped once their TTL passes."""
+        cache = NegativeCache(product_ttl=0.01)
+        cache.record(AlibabaAPIError("130106", "offline"), "product", "1")
+        assert cache.check("1") is not None
+        time.sleep(0.02)
+        assert cache.check("1") is None
+        assert len(cache) == 0
+
+    def test_bounded(self) -> None:
+        """The oldest entries should be evicted beyond max_entries."""
+        cache = NegativeCache(max_entries=2)
+        for product_id in ("1", "2", "3"):
+            cache.record(AlibabaAPIError("130106", "offline"), "product", product_id)
+        assert len(cache) == 2
+        assert cache.check("1") is None
+        assert cache.check("3") is not None
+
+    def test_invalidate_and_clear(self) -> None:
+        """invalidate should forget one product; clear should reset everything."""
+        cache = NegativeCache()
+        cache.record(AlibabaAPIError("130106", "offline"), "product", "1")
+        cache.record(AlibabaAPIError("4015", "restricted"), "destination", "1", "US")
+        cache.record(AlibabaAPIError("130106", "offline"), "product", "2")
+        cache.invalidate("1")
+        assert cache.check("1", "US") is None
+        assert cache.check("2") is not None
+        assert cache.stats()["hit_rate"] == 0.5
+
+        cache.clear()
+        assert cache.stats() == {
+            "lookups": 0,
+            "hits": {"product": 0, "destination": 0},
+            "hit_rate": 0.0,
+            "entries": 0,
+        }
@@ -0,0 +1,158 @@
+"""Unit tests for the landed-cost optimizer."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.exceptions import AlibabaAPIError
+from alibaba_api.optimizer import LandedCostOptimizer, delivery_days
+from alibaba_api.standin import StandinServer
+
+
+def _count_freight_calls(monkeypatch: pytest.MonkeyPatch, client: AlibabaClient) -> list[str]:
+    calls: list[str] = []
+    original = client.calculate_freight
+
+    def counting(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args[4])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(client, "calculate_freight", counting)
+    return calls
+
+
+@pytest.fixture(scope="module")
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+class TestPlan:
+    """Tests for building plans."""
+
+    def test_ranked_by_cost(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Options should be priced from the ladder and freight, cheapest first."""
+        product_id = server.product_ids()[2]  # ships from CN and US
+        with standin_client(server) as client:
+            plan = LandedCostOptimizer(client).plan(product_id, 100, "US")
+
+        assert plan.options
+        assert [o.total for o in plan.options] == sorted(o.total for o in plan.options)
+        assert {o.dispatch_location for o in plan.options} <= set(server.origins(product_id))
+        best = plan.best
+        assert best is not None
+        assert best.goods == best.unit_price * 100
+        assert best.total == best.goods + best.freight
+        assert all(p.reason == "no_stock" for p in plan.pruned)
+        assert not plan.errors
+
+    def test_ranked_by_delivery(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Delivery ranking should order by the latest estimated day."""
+        with standin_client(server) as client:
+            plan = LandedCostOptimizer(client).plan(
+                server.product_ids()[2], 100, "US", rank_by="delivery"
+            )
+        latest = [o.delivery_days[1] for o in plan.options if o.delivery_days]
+        assert latest == sorted(latest)
+
+    def test_prunes_before_quoting(
+        self,
+        server: StandinServer,
+        monkeypatch: pytest.MonkeyPatch,
+        standin_client: Callable[..., AlibabaClient],
+    ) -> None:
+        """Locations without stock should never be quoted."""
+        product_id = server.product_ids()[0]  # ships from CN only
+        with standin_client(server) as client:
+            calls = _count_freight_calls(monkeypatch, client)
+            plan = LandedCostOptimizer(client).plan(product_id, 100, "US")
+        assert calls == ["CN"]
+        assert {p.dispatch_location for p in plan.pruned} == {"US", "MX"}
+
+    def test_below_moq(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Quantities below every SKU's MOQ should leave nothing to quote."""
+        with standin_client(server) as client:
+            plan = LandedCostOptimizer(client).plan(server.product_ids()[0], 0, "US")
+        assert plan.options == []
+        assert {p.reason for p in plan.pruned} == {"below_moq"}
+
+    def test_quotes_cached(
+        self,
+        server: StandinServer,
+        monkeypatch: pytest.MonkeyPatch,
+        standin_client: Callable[..., AlibabaClient],
+    ) -> None:
+        """A second plan for the same order should reuse the freight quotes."""
+        with standin_client(server) as client:
+            optimizer = LandedCostOptimizer(client)
+            first = optimizer.plan(server.product_ids()[2], 100, "US")
+            calls = _count_freight_calls(monkeypatch, client)
+            second = optimizer.plan(server.product_ids()[2], 100, "US")
+        assert calls == []
+        assert optimizer.quotes.hits == 2
+        assert [o.total for o in second.options] == [o.total for o in first.options]
+
+
+class TestRestrictions:
+    """Tests for learning and applying route restrictions."""
+
+    def test_restricted_destination(
+        self, monkeypatch: pytest.MonkeyPatch, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """A 120019 quote should prune the product for that destination afterwards."""
+        server = StandinServer(catalog_size=5, restricted_ratio=1.0)
+        product_id = server.product_ids()[0]
+        with standin_client(server) as client:
+            optimizer = LandedCostOptimizer(client)
+            first = optimizer.plan(product_id, 100, "US")
+            calls = _count_freight_calls(monkeypatch, client)
+            second = optimizer.plan(product_id, 100, "US")
+
+        assert isinstance(first.errors["CN"], AlibabaAPIError)
+        assert first.errors["CN"].code == "120019"
+        assert calls == []
+        assert second.options == []
+        assert "restricted" in {p.reason for p in second.pruned}
+
+    def test_inventory_failure(
+        self,
+        server: StandinServer,
+        monkeypatch: pytest.MonkeyPatch,
+        standin_client: Callable[..., AlibabaClient],
+    ) -> None:
+        """Without inventory every location is tried and bad routes are learned."""
+        product_id = server.product_ids()[0]  # ships from CN only
+        with standin_client(server) as client:
+
+            def unavailable(*args: Any, **kwargs: Any) -> Any:
+                raise AlibabaAPIError("InternalError", "inventory unavailable")
+
+            monkeypatch.setattr(client, "get_product_inventory", unavailable)
+            optimizer = LandedCostOptimizer(client)
+            first = optimizer.plan(product_id, 100, "US")
+            second = optimizer.plan(product_id, 100, "US")
+
+        assert set(first.errors) == {"inventory", "US", "MX"}
+        assert {o.dispatch_location for o in first.options} == {"CN"}
+        assert {(p.dispatch_location, p.reason) for p in second.pruned} == {
+            ("US", "no_route"),
+            ("MX", "no_route"),
+        }
+        assert first.best is not None and second.best is not None
+        assert second.best.total == first.best.total
+        assert second.best.stock is None
+
+
+def test_delivery_days() -> None:
+    """Delivery estimates should parse to (min, max) days."""
+    assert delivery_days("10~15") == (10, 15)
+    assert delivery_days("7") == (7, 7)
+    assert delivery_days(None) is None
@@ -0,0 +1,54 @@
+"""Unit tests for the package's lazy exports."""
+
+import importlib
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+import alibaba_api
+import alibaba_api.models
+
+
+def _loaded_after(statement: str) -> set[str]:
+    """Top-level packages imported by ``statement`` in a fresh interpreter."""
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return {name.partition(".")[0] for name in output.split()}
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import alibaba_api",
+        "from alibaba_api import calculate_signature, Config, AlibabaAPIError",
+        "from alibaba_api.models.money import Money",
+    ],
+)
+def test_light_imports_skip_heavy_dependencies(statement: str) -> None:
+    """Importing the package or light names should not load httpx or pydantic."""
+    assert not _loaded_after(statement) & {"httpx", "pydantic"}
+
+
+def test_client_import_loads_dependencies() -> None:
+    """AlibabaClient itself still needs httpx and pydantic."""
+    assert {"httpx", "pydantic"} <= _loaded_after("from alibaba_api import AlibabaClient")
+
+
+@pytest.mark.parametrize("package", [alibaba_api, alibaba_api.models])
+def test_every_export_resolves(package: ModuleType) -> None:
+    """Every name in __all__ should load from the module that defines it."""
+    lazy = package._LAZY_IMPORTS
+    assert set(lazy) == set(package.__all__)
+    for name, module in lazy.items():
+        assert getattr(package, name) is getattr(importlib.import_module(module), name)
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_attribute() -> None:
+    """Unknown names should raise AttributeError."""
+    with pytest.raises(AttributeError, match="no_such_name"):
+        alibaba_api.no_such_name  # noqa: B018
@@ -0,0 +1,235 @@
+"""Unit tests for error-code policies."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.hooks import RequestEvent
+from alibaba_api.policy import ErrorPolicies, ErrorPolicy, error_key, fallback_locations
+from alibaba_api.standin import StandinServer
+
+ADDRESS = {"zip": "10012", "country_code": "US"}
+
+
+def _freight_locations(client: AlibabaClient) -> list[str]:
+    """Record the dispatch location of every freight request the client sends."""
+    seen: list[str] = []
+
+    def record(event: RequestEvent) -> None:
+        if "freight" in event.api_path:
+            seen.append(event.params["dispatch_location"])
+
+    client.add_hook("before_send", record)
+    return seen
+
+
+@pytest.fixture(scope="module")
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+class TestErrorPolicies:
+    """Tests for the policy registry."""
+
+    @pytest.mark.parametrize(
+        ("code", "error_class", "scope"),
+        [
+            ("10010", "fallback_dispatch", "dispatch_location"),
+            ("130608", "fallback_dispatch", "dispatch_location"),
+            ("10012", "fallback_dispatch", "dispatch_location"),
+            ("130106", "permanent", "product"),
+            ("120019", "permanent", "destination"),
+            ("4015", "permanent", "destination"),
+            ("IllegalAccessToken", "auth", None),
+            ("ApiCallLimit", "quota", None),
+            ("ServiceUnavailable", "retryable", None),
+            ("never-seen", "permanent", None),
+        ],
+    )
+    def test_default_table(self, code: str, error_class: str, scope: str | None) -> None:
+        """Known codes should map to their class; unknown codes are permanent."""
+        policy = ErrorPolicies().classify(code)
+        assert policy.error_class == error_class
+        assert policy.scope == scope
+
+    def test_sub_code_and_register(self) -> None:
+        """A registered sub_code should win over the code."""
+        policies = ErrorPolicies()
+        policies.register("isp.busy", ErrorPolicy("retryable"))
+        assert policies.classify("15", "isp.busy").error_class == "retryable"
+        assert policies.classify("4015", "isp.unknown").scope == "destination"
+
+    @pytest.mark.parametrize(
+        ("status", "error_class"),
+        [
+            (None, "retryable"),
+            (503, "retryable"),
+            (429, "quota"),
+            (401, "auth"),
+            (404, "permanent"),
+        ],
+    )
+    def test_network_errors(self, status: int | None, error_class: str) -> None:
+        """HTTP failures should be classified from the status code."""
+        error = AlibabaNetworkError("failed", status_code=status)
+        assert ErrorPolicies().for_error(error).error_class == error_class
+
+    def test_fallback_locations(self) -> None:
+        """Locations named by the policy should be tried first."""
+        policies = ErrorPolicies()
+        assert fallback_locations(policies["130608"], ["US", "MX"], ["CN"]) == ["MX", "US"]
+        assert fallback_locations(policies["10010"], ["US", "MX"], ["CN"]) == ["US", "MX"]
+        assert fallback_locations(policies["120019"], ["US", "MX"], ["CN"]) == []
+
+
+class TestClient:
+    """Tests for classification and retries in the client."""
+
+    def test_errors_are_classified(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Raised errors should carry their error class."""
+        with standin_client(server) as client, pytest.raises(AlibabaAPIError) as exc_info:
+            client.get_product("1")
+        assert exc_info.value.code == "130106"
+        assert exc_info.value.error_class == "permanent"
+
+    def test_retryable_get_is_retried(
+        self, standin_client: Callable[..., AlibabaClient], make_config: Callable[..., Config]
+    ) -> None:
+        """Retryable GET errors should be retried up to max_retries times."""
+        failing = StandinServer("test_app_key", "test_app_secret", http_error_rate=1.0)
+        attempts: list[int] = []
+        with standin_client(failing, config=make_config(max_retries=2, retry_backoff=0)) as client:
+            client.add_hook("before_send", lambda event: attempts.append(event.attempt))
+            with pytest.raises(AlibabaNetworkError) as exc_info:
+                client.get("/eco/buyer/product/description", {"query_req": "{}"})
+            assert exc_info.value.error_class == "retryable"
+            assert attempts == [1, 2, 3]
+
+            attempts.clear()
+            with pytest.raises(AlibabaNetworkError):
+                client.post("/eco/buyer/product/description", {"query_req": "{}"})
+            assert attempts == [1]
+
+    def test_no_retries_by_default(self, standin_client: Callable[..., AlibabaClient]) -> None:
+        """Without max_retries a failure should be raised at once."""
+        failing = StandinServer("test_app_key", "test_app_secret", http_error_rate=1.0)
+        attempts: list[int] = []
+        with standin_client(failing) as client:
+            client.add_hook("before_send", lambda event: attempts.append(event.attempt))
+            with pytest.raises(AlibabaNetworkError):
+                client.get("/eco/buyer/product/description", {"query_req": "{}"})
+        assert attempts == [1]
+
+
+class TestFreightFallback:
+    """Tests for policy-driven dispatch fallback."""
+
+    def test_jumps_to_named_location(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """130608 should go straight to MX without trying US."""
+        product_id = str(server.product_ids()[3])  # ships from MX only
+        with standin_client(server) as client:
+            seen = _freight_locations(client)
+            result = client.calculate_freight(product_id, 100, "US")
+        assert seen == ["CN", "MX"]
+        assert result["dispatch_location"] == "MX"
+        assert result["fallback_used"] is True
+
+    def test_tries_next_location(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """10010 should fall back to the next location in order."""
+        product_id = str(server.product_ids()[4])  # ships from US only
+        with standin_client(server) as client:
+            seen = _freight_locations(client)
+            result = client.calculate_freight(product_id, 100, "US")
+        assert seen == ["CN", "US"]
+        assert result["dispatch_location"] == "US"
+
+    def test_stops_on_destination_restriction(
+        self, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """120019 applies to every location, so no fallback should be tried."""
+        restricted = StandinServer("test_app_key", "test_app_secret", restricted_ratio=1.0)
+        with standin_client(restricted) as client:
+            seen = _freight_locations(client)
+            with pytest.raises(AlibabaAPIError) as exc_info:
+                client.calculate_freight(str(restricted.product_ids()[0]), 100, "US")
+        assert exc_info.value.code == "120019"
+        assert seen == ["CN"]
+
+    def test_advanced_fallback(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """calculate_freight_advanced should follow the same policies."""
+        product_id = str(server.product_ids()[3])
+        product = server.product(int(product_id))
+        with standin_client(server) as client:
+            seen = _freight_locations(client)
+            result = client.calculate_freight_advanced(
+                e_company_id=product["eCompanyId"],
+                destination_country="US",
+                address=ADDRESS,
+                logistics_product_list=[
+                    {
+                        "product_id": product_id,
+                        "sku_id": product["skus"][0]["sku_id"],
+                        "quantity": "100",
+                    }
+                ],
+            )
+            assert seen == ["CN", "MX"]
+            assert result["dispatch_location"] == "MX"
+            assert result["fallback_used"] is True
+
+            seen.clear()
+            with pytest.raises(AlibabaAPIError):
+                client.calculate_freight_advanced(
+                    product["eCompanyId"],
+                    "US",
+                    ADDRESS,
+                    [{"product_id": product_id}],
+                    fallback=False,
+                )
+            assert seen == ["CN"]
+
+
+def test_search_stops_on_quota(
+    server: StandinServer,
+    monkeypatch: pytest.MonkeyPatch,
+    standin_client: Callable[..., AlibabaClient],
+) -> None:
+    """search_products should skip offline products but stop on quota errors."""
+    ids = [str(pid) for pid in server.product_ids()[:4]]
+    calls: list[str] = []
+
+    def fake_request(api_path: str, params: Any = None, **kwargs: Any) -> dict[str, Any]:
+        calls.append(api_path)
+        if api_path == "/eco/buyer/product/check":
+            return {"result": {"result_data": ids}}
+        if len(calls) == 2:
+            raise AlibabaAPIError("130106", "offline")
+        raise AlibabaAPIError("ApiCallLimit", "slow down")
+
+    with standin_client(server) as client:
+        monkeypatch.setattr(client, "request", fake_request)
+        with pytest.raises(AlibabaAPIError) as exc_info:
+            client.search_products(limit=4)
+    assert exc_info.value.code == "ApiCallLimit"
+    assert len(calls) == 3
+
+
+def test_error_key() -> None:
+    """Errors should be labelled by API code, else HTTP status, else class."""
+    assert error_key(AlibabaAPIError("130106", "offline")) == "130106"
+    assert error_key(AlibabaNetworkError("busy", status_code=503)) == "HTTP 503"
+    assert error_key(AlibabaNetworkError("timed out")) == "AlibabaNetworkError"
+    assert error_key(KeyError("skus")) == "KeyError"
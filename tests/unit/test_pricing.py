@@ -0,0 +1,151 @@
+"""Unit tests for the landed-cost engine."""
+
+import pytest
+
+from alibaba_api.models import Money, Sku
+from alibaba_api.pricing import (
+    HAS_NUMPY,
+    BreakEven,
+    FreightRate,
+    LadderTable,
+    freight_rates,
+    landed_cost,
+)
+from alibaba_api.standin import StandinServer
+
+BACKENDS = [
+    "python",
+    pytest.param("numpy", marks=pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")),
+]
+
+TIERS = [
+    {"min_quantity": "100", "max_quantity": "999", "price": "9.20", "currency": "USD"},
+    {"min_quantity": "10", "max_quantity": "99", "price": "10.00", "currency": "USD"},
+    {"min_quantity": "1000", "max_quantity": "9999", "price": "8.00", "currency": "USD"},
+]
+
+
+@pytest.fixture
+def ladder() -> LadderTable:
+    """Three tiers given out of order, MOQ 10."""
+    return LadderTable.from_tiers(TIERS)
+
+
+class TestLadderTable:
+    """Tests for compiling ladder tiers."""
+
+    def test_from_tiers(self, ladder: LadderTable) -> None:
+        """Tiers should be sorted and prices parsed to minor units."""
+        assert ladder.min_quantities == (10, 100, 1000)
+        assert ladder.prices == (1000, 920, 800)
+        assert ladder.moq == 10
+        assert ladder.unit_price(150) == Money(920, "USD")
+        assert ladder.unit_price(50_000) == Money(800, "USD")
+        with pytest.raises(ValueError):
+            ladder.unit_price(9)
+
+    def test_from_models(self) -> None:
+        """Sku models and dicts should compile to the same table."""
+        server = StandinServer(catalog_size=3)
+        product = server.product(server.product_ids()[0])
+        tables = LadderTable.from_product(product)
+        sku = Sku.model_validate(product["skus"][0])
+
+        assert set(tables) == {s["sku_id"] for s in product["skus"]}
+        assert LadderTable.from_sku(sku).prices == tables[sku.sku_id].prices
+
+    def test_invalid(self) -> None:
+        """Empty ladders and mixed currencies should raise ValueError."""
+        with pytest.raises(ValueError):
+            LadderTable.from_tiers([])
+        with pytest.raises(ValueError):
+            LadderTable.from_tiers([TIERS[0], {**TIERS[1], "currency": "EUR"}])
+
+
+class TestFreightRate:
+    """Tests for freight interpolation."""
+
+    def test_interpolation(self) -> None:
+        """Fees should interpolate between quotes and extend past them."""
+        rate = FreightRate([(10, 1000), (110, 3000)], "USD")
+        assert rate.fee(10) == Money(1000, "USD")
+        assert rate.fee(60) == Money(2000, "USD")
+        assert rate.fee(210) == Money(5000, "USD")
+        assert rate.fee(0) == Money(800, "USD")
+        assert FreightRate.flat(Money(500, "USD")).fee(1000) == Money(500, "USD")
+
+    def test_freight_rates_from_options(self) -> None:
+        """Options quoted at several quantities should group by carrier."""
+        quotes = {
+            10: [
+                {"vendor_code": "DHL", "fee": {"amount": "10.00", "currency": "USD"}},
+                {"vendor_code": "SEA", "fee": {"amount": "30.00", "currency": "USD"}},
+                {"vendor_code": "NOFEE"},
+            ],
+            110: [{"vendor_code": "DHL", "fee": {"amount": "30.00", "currency": "USD"}}],
+        }
+        rates = freight_rates(quotes)
+        assert set(rates) == {"DHL", "SEA"}
+        assert rates["DHL"].quantities == (10, 110)
+        assert rates["SEA"].fee(500) == Money(3000, "USD")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestLandedCost:
+    """Tests for curve evaluation on each backend."""
+
+    def test_goods_only(self, ladder: LadderTable, backend: str) -> None:
+        """Without freight the total is unit price times quantity."""
+        curve = landed_cost(ladder, [5, 10, 99, 100, 1500], backend=backend)  # type: ignore[arg-type]
+        assert list(curve.unit_price) == [1000, 1000, 1000, 920, 800]
+        assert list(curve.total) == [5000, 10000, 99000, 92000, 1_200_000]
+        assert list(curve.orderable) == [False, True, True, True, True]
+        assert curve.row(3)["total"] == Money(92000, "USD")
+
+    def test_cheapest_carrier(self, ladder: LadderTable, backend: str) -> None:
+        """Each quantity should use the cheapest carrier."""
+        rates = {
+            "EXPRESS": FreightRate([(10, 500), (110, 10500)], "USD", "EXPRESS"),
+            "SEA": FreightRate.flat(Money(5000, "USD"), "SEA"),
+        }
+        curve = landed_cost(ladder, [10, 100], freight=rates, backend=backend)  # type: ignore[arg-type]
+        assert [row["carrier"] for row in curve.rows()] == ["EXPRESS", "SEA"]
+        assert list(curve.freight) == [500, 5000]
+
+    def test_break_evens(self, ladder: LadderTable, backend: str) -> None:
+        """Just below a cheaper tier, ordering up to it should cost no more."""
+        curve = landed_cost(ladder, range(1, 1200), backend=backend)  # type: ignore[arg-type]
+        # 92 * 10.00 = 100 * 9.20 = 920.00; 870 * 9.20 = 8004.00 > 1000 * 8.00
+        assert curve.break_evens() == [BreakEven(92, 100), BreakEven(870, 1000)]
+        assert curve.break_even(Money.parse("9.50", "USD")) == 100
+        assert curve.break_even(Money.parse("1.00", "USD")) is None
+
+    def test_currency_mismatch(self, ladder: LadderTable, backend: str) -> None:
+        """Freight in another currency should be refused."""
+        with pytest.raises(ValueError):
+            landed_cost(
+                ladder,
+                [10],
+                freight=FreightRate.flat(Money(1, "EUR")),
+                backend=backend,  # type: ignore[arg-type]
+            )
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+def test_backends_agree() -> None:
+    """Both backends should give identical curves on the stand-in catalog."""
+    server = StandinServer(catalog_size=20)
+    rates = {
+        "A": FreightRate([(1, 999), (37, 4321), (500, 20_000)], "USD", "A"),
+        "B": FreightRate([(1, 3000), (300, 9000)], "USD", "B"),
+    }
+    for product_id in server.product_ids():
+        for ladder in LadderTable.from_product(server.product(product_id)).values():
+            curves = [
+                landed_cost(ladder, range(1, 700), freight=rates, backend=backend)
+                for backend in ("python", "numpy")
+            ]
+            python, numpy = curves
+            assert python.total == numpy.total.tolist()
+            assert python.carrier_index == numpy.carrier_index.tolist()
+            assert python.break_evens() == numpy.break_evens()
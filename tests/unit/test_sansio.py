@@ -0,0 +1,183 @@
+"""Unit tests for the sans-IO operations, signing, parsing and drivers."""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from alibaba_api.async_client import AsyncAlibabaClient
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.sansio import ApiRequest, adrive, drive, parse_response, prepare_request
+from alibaba_api.signing import calculate_signature
+from alibaba_api.standin import StandinServer
+
+
+@pytest.fixture
+def client(config: Config) -> AlibabaClient:
+    """A client that never sends anything itself."""
+    return AlibabaClient(config)
+
+
+@pytest.fixture(scope="module")
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+def _answer(responses: dict[str, Any], sent: list[ApiRequest]) -> Any:
+    """``send`` answering by API path; exceptions in ``responses`` are raised."""
+
+    def send(request: ApiRequest) -> dict[str, Any]:
+        sent.append(request)
+        reply = responses[request.api_path]
+        if isinstance(reply, list):
+            reply = reply.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply  # type: ignore[no-any-return]
+
+    return send
+
+
+class TestOperations:
+    """Operations describe requests and shape responses without I/O."""
+
+    def test_request_description(self, client: AlibabaClient) -> None:
+        """The first step should yield the request, the last return the result."""
+        operation = client.list_products_op("906124611", page=2, page_size=500)
+        request = next(operation)
+        assert request.api_path == "/eco/buyer/product/check"
+        assert request.method == "GET"
+        assert json.loads(request.params["query_req"]) == {
+            "scene_id": "906124611",
+            "index": 2,
+            "size": 100,
+            "product_type": "common",
+        }
+        with pytest.raises(StopIteration) as done:
+            operation.send({"result": {"result_data": ["1", "2"], "result_total": 2}})
+        assert done.value.value["product_ids"] == ["1", "2"]
+        assert done.value.value["total"] == 2
+
+    def test_post_request(self, client: AlibabaClient) -> None:
+        """Order creation should be described as a POST."""
+        request = next(client.create_order_op("REF-1", [{"product_id": "1"}], {}))
+        assert request.method == "POST"
+        assert request.api_path == "/buynow/order/create"
+
+    def test_freight_fallback(self, client: AlibabaClient) -> None:
+        """Errors thrown into calculate_freight should move on to the next location."""
+        sent: list[ApiRequest] = []
+        send = _answer(
+            {
+                "/shipping/freight/calculate": [
+                    AlibabaAPIError("10010", "not from CN"),
+                    {"value": [{"vendor_code": "UPS"}]},
+                ]
+            },
+            sent,
+        )
+        result = drive(client.calculate_freight_op("42", 5, "US"), send)
+        assert [r.params["dispatch_location"] for r in sent] == ["CN", "US"]
+        assert result["dispatch_location"] == "US"
+        assert result["fallback_used"] is True
+
+    def test_unhandled_error_propagates(self, client: AlibabaClient) -> None:
+        """An error the operation does not handle should reach the caller."""
+        send = _answer({"/alibaba/order/get": AlibabaAPIError("9999", "boom")}, [])
+        with pytest.raises(AlibabaAPIError, match="boom"):
+            drive(client.get_order_op("123"), send)
+
+    def test_refresh_without_token(self, client: AlibabaClient) -> None:
+        """Argument errors should be raised before any request is yielded."""
+        with pytest.raises(ValueError):
+            drive(client.refresh_token_op(), _answer({}, []))
+
+
+class TestPureHelpers:
+    """Signing and parsing without a transport."""
+
+    def test_prepare_request(self, config: Config) -> None:
+        """Prepared requests should carry the URL and a valid signature."""
+        prepared = prepare_request(config, ApiRequest("/alibaba/order/list", {"role": "buyer"}))
+        assert prepared.url == f"{config.base_url}/alibaba/order/list"
+        params = dict(prepared.params)
+        sign = params.pop("sign")
+        assert params["access_token"] == "test_access_token"
+        assert sign == calculate_signature("/alibaba/order/list", params, "test_app_secret")
+
+    def test_parse_success(self) -> None:
+        """A zero code should return the body."""
+        assert parse_response(200, b'{"code": "0", "value": 1}')["value"] == 1
+        assert parse_response(200, b"[1, 2]") == {"data": [1, 2]}
+
+    def test_parse_api_error(self) -> None:
+        """A non-zero code should raise AlibabaAPIError."""
+        with pytest.raises(AlibabaAPIError) as exc_info:
+            parse_response(200, b'{"code": "130106", "request_id": "r1"}')
+        assert exc_info.value.code == "130106"
+        assert exc_info.value.request_id == "r1"
+
+    def test_parse_http_error(self) -> None:
+        """HTTP errors should raise with the status code and request ID."""
+        with pytest.raises(AlibabaNetworkError) as exc_info:
+            parse_response(503, b"unavailable", {"x-request-id": "r2"})
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.request_id == "r2"
+        assert "unavailable" in str(exc_info.value)
+
+
+class TestClientDrivers:
+    """The sync and async clients drive the same operations."""
+
+    def test_sync_run(self, server: StandinServer, config: Config) -> None:
+        """run(operation) should match the high-level method."""
+        with AlibabaClient(config, transport=server.transport(sleep=False)) as client:
+            product_id = str(server.product_ids()[0])
+            via_run = client.run(client.get_product_op(product_id))
+            assert via_run == client.get_product(product_id)
+
+    def test_async_methods(self, server: StandinServer, config: Config) -> None:
+        """The async client should offer the high-level methods as coroutines."""
+        product_id = str(server.product_ids()[0])
+
+        async def run() -> tuple[Any, ...]:
+            async with AsyncAlibabaClient(config, transport=server.async_transport()) as client:
+                return await asyncio.gather(
+                    client.get_product(product_id),
+                    client.list_orders(page_size=1),
+                    client.search_products(limit=2),
+                )
+
+        product, orders, search = asyncio.run(run())
+        with AlibabaClient(config, transport=server.transport(sleep=False)) as client:
+            assert product == client.get_product(product_id)
+        assert "total_count" in orders
+        assert search["total_found"] == 2
+
+    def test_async_negative_cache(self, server: StandinServer, config: Config) -> None:
+        """Offline products should be remembered by the async client too."""
+
+        async def run() -> AsyncAlibabaClient:
+            async with AsyncAlibabaClient(config, transport=server.async_transport()) as client:
+                for _ in range(2):
+                    with pytest.raises(AlibabaAPIError):
+                        await client.get_product("1")
+                return client
+
+        client = asyncio.run(run())
+        assert client.negative_cache.stats()["hits"]["product"] == 1
+
+    def test_adrive(self, client: AlibabaClient) -> None:
+        """adrive should throw errors into the operation like drive."""
+
+        async def send(request: ApiRequest) -> dict[str, Any]:
+            if request.params["dispatch_location"] == "CN":
+                raise AlibabaAPIError("10010", "not from CN")
+            return {"value": [{"vendor_code": "UPS"}]}
+
+        result = asyncio.run(adrive(client.calculate_freight_op("42", 5, "US"), send))
+        assert result["dispatch_location"] == "US"
@@ -0,0 +1,146 @@
+"""Unit tests for the slow-call ring buffer."""
+
+import json
+from collections.abc import Callable
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.slowlog import MASK, SlowCallLog, mask_params
+from alibaba_api.standin import StandinServer
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+class TestMaskParams:
+    """Tests for credential masking."""
+
+    def test_masks_credentials(self) -> None:
+        """Tokens, secrets, signatures and auth codes should be masked."""
+        masked = mask_params(
+            {
+                "access_token": "a",
+                "refresh_token": "b",
+                "app_secret": "c",
+                "sign": "d",
+                "code": "e",
+                "role": "buyer",
+            }
+        )
+        assert masked == {
+            "access_token": MASK,
+            "refresh_token": MASK,
+            "app_secret": MASK,
+            "sign": MASK,
+            "code": MASK,
+            "role": "buyer",
+        }
+
+
+class TestSlowCallLog:
+    """Tests for capture rules and dumping."""
+
+    def test_threshold(self) -> None:
+        """Calls at or above the threshold should always be kept."""
+        log = SlowCallLog(threshold=0.5, sample_rate=0.0)
+        log.observe("/fast", "GET", {}, 0.1)
+        log.observe("/slow", "GET", {}, 0.5)
+
+        [record] = log.records()
+        assert record.api_path == "/slow"
+        assert record.sampled is False
+
+    def test_sampling(self) -> None:
+        """Faster calls should be kept at the sample rate."""
+        log = SlowCallLog(threshold=10.0, sample_rate=1.0)
+        log.observe("/fast", "get", {}, 0.1)
+        [record] = log.records()
+        assert record.sampled is True
+        assert record.method == "GET"
+
+        with pytest.raises(ValueError):
+            SlowCallLog(sample_rate=1.5)
+
+    def test_capacity(self) -> None:
+        """The oldest records should be dropped once the buffer is full."""
+        log = SlowCallLog(3, threshold=0.0)
+        for i in range(5):
+            log.observe(f"/{i}", "GET", {}, float(i))
+        assert [record.api_path for record in log] == ["/2", "/3", "/4"]
+        assert len(log) == 3
+
+    def test_dump(self) -> None:
+        """Dumps should be JSON-serialisable and optionally sorted by latency."""
+        log = SlowCallLog(threshold=0.0)
+        log.observe("/a", "GET", {"access_token": "secret"}, 0.2)
+        log.observe("/b", "GET", {}, 0.9)
+
+        dump = log.dump(slowest_first=True)
+        assert [record["api_path"] for record in dump] == ["/b", "/a"]
+        assert json.loads(log.dump_json())[0]["params"] == {"access_token": MASK}
+
+        log.clear()
+        assert log.dump() == []
+
+
+class TestClientSlowCalls:
+    """Tests for records captured by AlibabaClient.request."""
+
+    def test_default_log(self) -> None:
+        """Every client should have a slow-call log by default."""
+        client = AlibabaClient(Config(app_key="k", app_secret="s"))
+        assert isinstance(client.slow_calls, SlowCallLog)
+
+    def test_success_record(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Successful calls should record size and request_id."""
+        log = SlowCallLog(threshold=0.0)
+        client = standin_client(server, sleep=True, slow_calls=log)
+        client.get("/alibaba/order/list", {"role": "buyer"})
+
+        [record] = log.records()
+        assert record.api_path == "/alibaba/order/list"
+        assert record.params == {"role": "buyer"}
+        assert record.outcome == "ok"
+        assert record.response_size and record.response_size > 0
+        assert record.request_id
+        assert record.latency > 0
+
+    def test_error_records(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """API and HTTP errors should be recorded with their outcome."""
+        log = SlowCallLog(threshold=0.0)
+        client = standin_client(server, sleep=True, slow_calls=log)
+        with pytest.raises(AlibabaAPIError):
+            client.get_product("1")
+        [record] = log.records()
+        assert record.outcome == "api_error"
+        assert record.error_code == "130106"
+        assert record.request_id
+
+        failing = StandinServer("test_app_key", "test_app_secret", http_error_rate=1.0)
+        client = standin_client(failing, sleep=True, slow_calls=log)
+        with pytest.raises(AlibabaNetworkError):
+            client.get("/alibaba/order/list", {"role": "buyer"})
+        assert log.records()[-1].outcome == "http_error"
+
+    def test_records_with_hooks(
+        self, server: StandinServer, standin_client: Callable[..., AlibabaClient]
+    ) -> None:
+        """Calls through the instrumented path should be recorded too."""
+        log = SlowCallLog(threshold=0.0)
+        client = standin_client(server, sleep=True, slow_calls=log)
+        client.add_hook("before_sign", lambda event: event.params.update({"trace_id": "abc"}))
+        client.get("/alibaba/order/list", {"role": "buyer"})
+
+        [record] = log.records()
+        assert record.params == {"role": "buyer", "trace_id": "abc"}
+        assert record.outcome == "ok"
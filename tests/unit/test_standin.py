@@ -0,0 +1,279 @@
+"""Unit tests for the local API stand-in."""
+
+import random
+import threading
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaNetworkError
+from alibaba_api.standin import SIGNATURE_ERROR, TOKEN_ERROR, LatencyModel, StandinServer
+
+ADDRESS = {
+    "zip": "10012",
+    "country": "United States of America",
+    "country_code": "US",
+    "province": "New York",
+    "province_code": "NY",
+    "city": "New York",
+    "address": "123 Main Street",
+    "contact_person": "John Doe",
+    "telephone": {"country": "+1", "number": "5551234567"},
+}
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=103)
+
+
+@pytest.fixture
+def client(server: StandinServer, config: Config) -> AlibabaClient:
+    """Create a client wired to the stand-in in-process."""
+    return AlibabaClient(config, transport=server.transport())
+
+
+class TestCatalog:
+    """Tests for product listing and details."""
+
+    def test_scene_paging_covers_listing(self, client: AlibabaClient) -> None:
+        """Pages should tile the scene listing without gaps or repeats."""
+        first = client.list_products(scene_id="906168847", page=0, page_size=25)
+        total = int(first["total"])
+        seen = list(first["product_ids"])
+        page = 1
+        while len(seen) < total:
+            seen.extend(client.list_products("906168847", page=page, page_size=25)["product_ids"])
+            page += 1
+
+        assert len(seen) == len(set(seen)) == total
+        assert client.list_products("906168847", page=page, page_size=25)["product_ids"] == []
+
+    def test_listings_follow_origins(self, server: StandinServer, client: AlibabaClient) -> None:
+        """Local and cross-border listings should only include matching origins."""
+        us = client.get_local_products(country="US", page_size=100)["product_ids"]
+        cn = client.get_crossborder_products(page_size=100)["product_ids"]
+
+        assert us and all("US" in server.origins(pid) for pid in us)
+        assert cn and all("CN" in server.origins(pid) for pid in cn)
+
+    def test_get_product_is_deterministic(self, server: StandinServer, config: Config) -> None:
+        """Two servers with the same arguments should serve the same product."""
+        product_id = next(iter(server.product_ids()))
+        other = StandinServer("test_app_key", "test_app_secret", catalog_size=103)
+
+        with AlibabaClient(config, transport=server.transport()) as one:
+            first = one.get_product(product_id)
+        with AlibabaClient(config, transport=other.transport()) as two:
+            second = two.get_product(product_id)
+
+        assert first == second
+        assert first["skus"][0]["ladder_price"]
+
+    def test_unknown_product_is_offline(self, client: AlibabaClient) -> None:
+        """Products outside the catalog should fail with 130106."""
+        with pytest.raises(AlibabaAPIError) as exc_info:
+            client.get_product("1")
+        assert exc_info.value.code == "130106"
+
+    def test_inventory_by_location(self, server: StandinServer, client: AlibabaClient) -> None:
+        """Inventory should be reported for each dispatch origin."""
+        product_id = str(next(iter(server.product_ids())) + 2)
+        inventory = client.get_product_inventory(product_id)
+        assert {entry["shipping_from"] for entry in inventory} == {"CN", "US"}
+
+
+class TestShipping:
+    """Tests for freight endpoints."""
+
+    def test_freight_from_valid_origin(self, server: StandinServer, client: AlibabaClient) -> None:
+        """Freight should be quoted from a product's origin."""
+        product_id = str(next(iter(server.product_ids())) + 4)  # US only
+        result = client.calculate_freight(product_id, 2, "US", dispatch_location="US")
+        assert result["options"]
+        assert result["options"][0]["fee"]["currency"] == "USD"
+
+    def test_freight_wrong_origin(self, server: StandinServer, client: AlibabaClient) -> None:
+        """Quoting from the wrong dispatch location should return a logistics error."""
+        product_id = str(next(iter(server.product_ids())) + 3)  # MX only
+        with pytest.raises(AlibabaAPIError) as exc_info:
+            client.calculate_freight(product_id, 1, "US", dispatch_location="CN", fallback=False)
+        assert exc_info.value.code == "130608"
+
+    def test_restricted_destination(self, config: Config) -> None:
+        """Restricted (product, country) pairs should fail with 120019."""
+        server = StandinServer("test_app_key", "test_app_secret", restricted_ratio=1.0)
+        product_id = str(next(iter(server.product_ids())))
+        with (
+            AlibabaClient(config, transport=server.transport()) as client,
+            pytest.raises(AlibabaAPIError) as exc_info,
+        ):
+            client.calculate_freight(product_id, 1, "US", fallback=False)
+        assert exc_info.value.code == "120019"
+
+    def test_advanced_freight(self, server: StandinServer, client: AlibabaClient) -> None:
+        """Advanced freight should quote the whole shipment."""
+        product_id = str(next(iter(server.product_ids())))
+        result = client.calculate_freight_advanced(
+            e_company_id="company-1",
+            destination_country="US",
+            address=ADDRESS,
+            logistics_product_list=[
+                {"product_id": product_id, "quantity": "1"},
+                {"product_id": product_id, "quantity": "3"},
+            ],
+        )
+        assert result["options"]
+        assert all(option["store_type"] == "CERTIFIED" for option in result["options"])
+
+
+class TestOrders:
+    """Tests for the order lifecycle."""
+
+    def test_checkout_flow(self, server: StandinServer, client: AlibabaClient) -> None:
+        """Orders should be created, paid, listed and queried."""
+        product = client.get_product(next(iter(server.product_ids())))
+        sku = product["skus"][0]
+        quantity = int(sku["ladder_price"][0]["min_quantity"])
+
+        created = client.create_order(
+            channel_refer_id="ORDER-001",
+            product_list=[
+                {
+                    "product_id": product["product_id"],
+                    "sku_id": sku["sku_id"],
+                    "quantity": str(quantity),
+                }
+            ],
+            logistics_detail={
+                "shipment_address": ADDRESS,
+                "dispatch_location": "CN",
+                "carrier_code": "EX_ASP_JYC_FEDEX",
+            },
+        )
+        trade_id = created["trade_id"]
+        assert trade_id
+
+        assert client.pay_orders([trade_id])["status"] == "PAY_SUCCESS"
+        assert client.get_order(trade_id)["trade_status"] == "paid"
+        orders = client.list_orders(status="paid")
+        assert [order["trade_id"] for order in orders["orders"]] == [trade_id]
+        assert client.get_order_funds(trade_id)["payment_transaction_fee"]["currency"] == "USD"
+        assert client.get_order_tracking(trade_id)["tracking"] == []
+
+
+class TestGateway:
+    """Tests for signature checks, auth and fault injection."""
+
+    def test_bad_signature_rejected(self, server: StandinServer) -> None:
+        """Requests signed with the wrong secret should be rejected."""
+        config = Config(app_key="test_app_key", app_secret="wrong", access_token="token")
+        with (
+            AlibabaClient(config, transport=server.transport()) as client,
+            pytest.raises(AlibabaAPIError) as exc_info,
+        ):
+            client.list_products(scene_id="906124611")
+        assert exc_info.value.code == SIGNATURE_ERROR
+
+    def test_unknown_token_rejected(self, config: Config) -> None:
+        """Only issued tokens should be accepted when a token list is given."""
+        server = StandinServer("test_app_key", "test_app_secret", access_tokens=["other"])
+        with AlibabaClient(config, transport=server.transport()) as client:
+            with pytest.raises(AlibabaAPIError) as exc_info:
+                client.list_products(scene_id="906124611")
+            assert exc_info.value.code == TOKEN_ERROR
+
+            tokens = client.create_token(code="auth-code")
+            client.config.access_token = tokens["access_token"]
+            result = client.list_products(scene_id="906124611")
+        assert result["product_ids"]
+
+    @pytest.mark.parametrize(
+        ("api_path", "params"),
+        [
+            ("/shipping/freight/calculate", {"quantity": "abc", "destination_country": "US"}),
+            ("/order/freight/calculate", {"logistics_product_list": '["not an object"]'}),
+            ("/buynow/order/create", {"channel_refer_id": "R1", "product_list": "[1]"}),
+            ("/alibaba/order/list", {"page_size": "-1"}),
+            ("/eco/buyer/product/check", {"query_req": '{"scene_id": "906124611", "size": "x"}'}),
+        ],
+    )
+    def test_invalid_parameters(
+        self, server: StandinServer, client: AlibabaClient, api_path: str, params: dict[str, str]
+    ) -> None:
+        """Malformed parameters should get an InvalidParameter error, not a traceback."""
+        if "quantity" in params:
+            params["product_id"] = str(server.product_ids()[0])
+        with pytest.raises(AlibabaAPIError) as exc_info:
+            client.post(api_path, params)
+        assert exc_info.value.code == "InvalidParameter"
+
+    def test_error_injection(self, config: Config) -> None:
+        """Injected errors should use the configured codes and messages."""
+        server = StandinServer(
+            "test_app_key", "test_app_secret", error_rate=1.0, error_codes=["130703"]
+        )
+        with (
+            AlibabaClient(config, transport=server.transport()) as client,
+            pytest.raises(AlibabaAPIError) as exc_info,
+        ):
+            client.list_products(scene_id="906124611")
+        assert exc_info.value.code == "130703"
+        assert "inventory" in exc_info.value.message.lower()
+
+    def test_http_error_injection(self, config: Config) -> None:
+        """Injected HTTP errors should surface as network errors."""
+        server = StandinServer("test_app_key", "test_app_secret", http_error_rate=1.0)
+        with (
+            AlibabaClient(config, transport=server.transport()) as client,
+            pytest.raises(AlibabaNetworkError) as exc_info,
+        ):
+            client.list_products(scene_id="906124611")
+        assert exc_info.value.status_code == 503
+
+    def test_latency_models(self) -> None:
+        """Latency models should sample within their bounds."""
+        rng = random.Random(1)
+        assert LatencyModel.constant(0.5).sample(rng) == 0.5
+        assert 0.1 <= LatencyModel.uniform(0.1, 0.2).sample(rng) <= 0.2
+        samples = sorted(LatencyModel.lognormal(0.05, 0.5).sample(rng) for _ in range(2000))
+        assert 0.04 < samples[1000] < 0.06
+
+    async def test_async_transport(self, server: StandinServer, config: Config) -> None:
+        """The ASGI interface should serve signed requests."""
+        from alibaba_api.signing import build_signed_params
+
+        params = build_signed_params(
+            "/eco/buyer/product/check",
+            {"query_req": '{"scene_id": "906124611", "index": 0, "size": 5}'},
+            config.app_key,
+            config.app_secret,
+            access_token=config.access_token,
+        )
+        async with httpx.AsyncClient(transport=server.async_transport()) as http:
+            response = await http.get(f"{config.base_url}/eco/buyer/product/check", params=params)
+        assert response.json()["result"]["result_data"]
+
+    def test_socket_server(self, server: StandinServer, make_config: Callable[..., Config]) -> None:
+        """The stand-in should serve the client over a real socket."""
+        http_server = server.serve(port=0)
+        thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            config = make_config(
+                base_url_override=f"http://127.0.0.1:{http_server.server_address[1]}/rest"
+            )
+            with AlibabaClient(config) as client:
+                result = client.list_products(scene_id="906124611", page_size=5)
+                posted = client.post(
+                    "/alibaba/order/list", {"role": "buyer", "start_page": "0", "page_size": "5"}
+                )
+            assert len(result["product_ids"]) == 5
+            assert posted["value"]["total_count"] == "0"
+        finally:
+            http_server.shutdown()
+            http_server.server_close()
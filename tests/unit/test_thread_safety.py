@@ -0,0 +1,319 @@
+"""
+Stress tests for sharing one AlibabaClient between threads.
+
+Every test starts its threads together on a barrier and, while it runs,
+switches threads as often as the interpreter allows, so races that need an
+unlucky interleaving show up in a few hundred calls. On free-threaded
+builds the threads run truly in parallel.
+"""
+
+import dataclasses
+import sys
+import threading
+from collections.abc import Callable, Generator
+from typing import Any
+
+import httpx
+import pytest
+
+import alibaba_api.client as client_module
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config
+from alibaba_api.exceptions import AlibabaAPIError, AlibabaError
+from alibaba_api.hooks import RequestEvent
+from alibaba_api.metrics import MetricsRegistry
+from alibaba_api.middleware import Call, Handler
+from alibaba_api.standin import StandinServer
+
+THREADS = 16
+ROUNDS = 5
+
+ADDRESS = {"zip": "10012", "country_code": "US", "city": "New York"}
+
+
+@pytest.fixture(autouse=True)
+def contention() -> Generator[None, None, None]:
+    """Switch threads as often as possible."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.fixture
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=50)
+
+
+@pytest.fixture
+def config(make_config: Callable[..., Config]) -> Config:
+    """Configuration matching the stand-in, with a refresh token it accepts."""
+    return make_config(refresh_token="standin-refresh-initial")
+
+
+def _hammer(worker: Callable[[int], Any], threads: int = THREADS) -> list[Any]:
+    """Run ``worker(index)`` on ``threads`` threads at once; re-raise the first failure."""
+    barrier = threading.Barrier(threads)
+    results: list[Any] = [None] * threads
+    failures: list[BaseException] = []
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = worker(index)
+        except BaseException as e:
+            failures.append(e)
+
+    pool = [threading.Thread(target=run, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    if failures:
+        raise failures[0]
+    return results
+
+
+def _orderable(client: AlibabaClient, server: StandinServer) -> dict[str, Any]:
+    """A product that can be described, quoted to the US and ordered."""
+    for product_id in map(str, server.product_ids()):
+        try:
+            product = client.get_product(product_id)
+            client.calculate_freight(product_id, 10, "US")
+        except AlibabaAPIError:
+            continue
+        assert isinstance(product, dict)
+        return product
+    raise AssertionError("no orderable product in the stand-in catalog")
+
+
+def _every_method(client: AlibabaClient, product: dict[str, Any], tag: str) -> dict[str, Any]:
+    """Call each high-level method once; return the deterministic results."""
+    product_id = str(product["product_id"])
+    sku = product["skus"][0]
+    quantity = str(sku["ladder_price"][0]["min_quantity"])
+    item = {"product_id": product_id, "sku_id": str(sku["sku_id"]), "quantity": quantity}
+
+    order = client.create_order(
+        f"STRESS-{tag}", [item], {"shipment_address": ADDRESS, "dispatch_location": "CN"}
+    )
+    trade_id = order["trade_id"]
+    paid = client.pay_orders([trade_id])
+    client.get_order(trade_id)
+    client.get_order_logistics(trade_id)
+    client.get_order_tracking(trade_id)
+    client.get_order_funds(trade_id)
+    client.list_orders(page_size=5)
+    client.refresh_token()
+    assert client.auth_status["has_access_token"]
+    assert paid["status"] == "PAY_SUCCESS"
+
+    return {
+        "product": client.get_product(product_id),
+        "inventory": client.get_product_inventory(product_id),
+        "list": client.list_products(scene_id="906124611", page_size=10),
+        "local": client.get_local_products("US", page_size=5),
+        "crossborder": client.get_crossborder_products(page_size=5),
+        "search": client.search_products(limit=2),
+        "freight": client.calculate_freight(product_id, 10, "US"),
+        "freight_advanced": client.calculate_freight_advanced(
+            product["eCompanyId"], "US", ADDRESS, [item]
+        ),
+    }
+
+
+def _strip(value: Any) -> Any:
+    """Drop per-response fields (request IDs) that differ between identical calls."""
+    if isinstance(value, dict):
+        return {k: _strip(v) for k, v in value.items() if k not in ("_raw", "request_id")}
+    if isinstance(value, list):
+        return [_strip(v) for v in value]
+    return value
+
+
+class TestSharedClient:
+    """All high-level methods from many threads through one client."""
+
+    def test_every_method_concurrently(self, server: StandinServer, config: Config) -> None:
+        """Concurrent calls should succeed and match a single-threaded run."""
+        metrics = MetricsRegistry()
+        events: list[RequestEvent] = []
+        client = AlibabaClient(config, transport=server.transport(sleep=False), metrics=metrics)
+        product = _orderable(client, server)
+        expected = _strip(_every_method(client, product, "reference"))
+        client.add_hook("after_response", events.append)
+        before = server.request_count
+
+        def worker(index: int) -> list[Any]:
+            return [_strip(_every_method(client, product, f"{index}-{n}")) for n in range(ROUNDS)]
+
+        for results in _hammer(worker):
+            assert results == [expected] * ROUNDS
+
+        sent = server.request_count - before
+        assert len(events) == sent
+        recorded = sum(
+            sum(endpoint["statuses"].values()) for endpoint in metrics.snapshot().values()
+        )
+        assert recorded == server.request_count
+        orders = client.list_orders(page_size=1)
+        assert int(orders["total_count"]) == THREADS * ROUNDS + 1
+
+    def test_http_client_created_once(
+        self, server: StandinServer, config: Config, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Racing first requests should build a single httpx client."""
+        created: list[httpx.Client] = []
+
+        class CountingClient(httpx.Client):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(client_module.httpx, "Client", CountingClient)
+        client = AlibabaClient(config, transport=server.transport(sleep=False))
+        _hammer(lambda index: client.list_orders(page_size=1), threads=32)
+        assert len(created) == 1
+
+    def test_negative_cache(self, server: StandinServer, config: Config) -> None:
+        """Concurrent lookups should count exactly and stop requests once cached."""
+        client = AlibabaClient(config, transport=server.transport(sleep=False))
+
+        def worker(index: int) -> int:
+            failures = 0
+            for _ in range(20):
+                try:
+                    client.get_product("1")
+                except AlibabaAPIError as e:
+                    assert e.code == "130106"
+                    failures += 1
+            return failures
+
+        assert sum(_hammer(worker)) == THREADS * 20
+        stats = client.negative_cache.stats()
+        assert stats["lookups"] == THREADS * 20
+        # Only calls that raced the first failure reach the stand-in
+        assert THREADS * 20 - stats["hits"]["product"] <= THREADS
+        assert server.request_count <= THREADS
+
+
+class TestConcurrentConfiguration:
+    """Changing hooks, middleware and tokens while requests run."""
+
+    def test_hook_registration(self, config: Config) -> None:
+        """Concurrent add and remove should not lose hooks."""
+        client = AlibabaClient(config)
+        per_thread = 200
+        hooks = [[lambda event: None for _ in range(per_thread)] for _ in range(THREADS)]
+
+        def add(index: int) -> None:
+            for hook in hooks[index]:
+                client.add_hook("after_response", hook)
+
+        _hammer(add)
+        assert len(client.hooks._hooks["after_response"]) == THREADS * per_thread
+        assert client.hooks._count == THREADS * per_thread
+
+        def remove(index: int) -> None:
+            for hook in hooks[index]:
+                client.remove_hook("after_response", hook)
+
+        _hammer(remove)
+        assert not client.hooks
+        assert client.hooks._hooks["after_response"] == ()
+
+    def test_middleware_registration(self, config: Config) -> None:
+        """Concurrent add and remove should not lose middleware."""
+        client = AlibabaClient(config)
+        per_thread = 50
+        middleware = [
+            [lambda call, call_next: call_next(call) for _ in range(per_thread)]
+            for _ in range(THREADS)
+        ]
+
+        _hammer(lambda index: [client.add_middleware(m) for m in middleware[index]])
+        assert len(client.middleware) == THREADS * per_thread
+        _hammer(lambda index: [client.remove_middleware(m) for m in middleware[index]])
+        assert not client.middleware
+
+    def test_churn_during_requests(self, server: StandinServer, config: Config) -> None:
+        """Requests should keep working while hooks and middleware come and go."""
+        client = AlibabaClient(config, transport=server.transport(sleep=False))
+        seen: list[str] = []
+
+        def tag(call: Call, call_next: Handler) -> dict[str, Any]:
+            call.annotations["tagged"] = True
+            return call_next(call)
+
+        def hook(event: RequestEvent) -> None:
+            seen.append(event.api_path)
+
+        def worker(index: int) -> None:
+            if index == 0:
+                for _ in range(200):
+                    client.add_hook("after_response", hook)
+                    client.add_middleware(tag)
+                    client.remove_hook("after_response", hook)
+                    client.remove_middleware(tag)
+                return
+            for _ in range(20):
+                assert client.list_orders(page_size=1)["total_count"] is not None
+
+        _hammer(worker)
+        assert not client.hooks and not client.middleware
+        assert all(path == "/alibaba/order/list" for path in seen)
+
+    def test_token_updates(self, server: StandinServer, config: Config) -> None:
+        """Each request should be signed with one complete set of tokens."""
+        sent: list[str] = []
+        inner = server.transport(sleep=False)
+
+        class Recording(httpx.BaseTransport):
+            def handle_request(self, request: httpx.Request) -> httpx.Response:
+                sent.append(request.url.params["access_token"])
+                return inner.handle_request(request)
+
+        client = AlibabaClient(config, transport=Recording())
+        tokens = [f"token-{n}" for n in range(100)]
+
+        def worker(index: int) -> None:
+            if index == 0:
+                for token in tokens:
+                    client.update_tokens(token, f"standin-refresh-{token}")
+                return
+            for _ in range(20):
+                client.list_orders(page_size=1)
+
+        _hammer(worker)
+        assert set(sent) <= {config.access_token, *tokens}
+        assert client.config.access_token == tokens[-1]
+        assert client.config.refresh_token == f"standin-refresh-{tokens[-1]}"
+        assert config.access_token == "test_access_token"
+
+    def test_errors_stay_with_their_thread(self, config: Config) -> None:
+        """An error raised for one thread's call should not leak into another's."""
+        server = StandinServer(
+            "test_app_key", "test_app_secret", catalog_size=50, http_error_rate=0.5
+        )
+        client = AlibabaClient(
+            dataclasses.replace(config, max_retries=0),
+            transport=server.transport(sleep=False),
+        )
+
+        def worker(index: int) -> tuple[int, int]:
+            ok = failed = 0
+            for _ in range(30):
+                try:
+                    result = client.list_orders(page_size=1)
+                except AlibabaError as e:
+                    assert getattr(e, "status_code", None) == 503
+                    failed += 1
+                else:
+                    assert "orders" in result or "total_count" in result
+                    ok += 1
+            return ok, failed
+
+        outcomes = _hammer(worker)
+        assert sum(ok + failed for ok, failed in outcomes) == THREADS * 30
+        assert server.request_count == THREADS * 30
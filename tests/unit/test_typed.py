@@ -0,0 +1,156 @@
+"""Unit tests for typed responses."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from alibaba_api.client import AlibabaClient
+from alibaba_api.config import Config, ResponseMode
+from alibaba_api.exceptions import AlibabaValidationError
+from alibaba_api.models import (
+    FormattedDate,
+    InventoryByLocation,
+    OrderDetails,
+    OrderListItem,
+    ProductDescription,
+    ShippingOption,
+    TrackingInfo,
+)
+from alibaba_api.standin import StandinServer
+from alibaba_api.typed import construct, convert, type_adapter
+
+ADDRESS = {
+    "zip": "10012",
+    "country": "United States of America",
+    "country_code": "US",
+    "province": "New York",
+    "province_code": "NY",
+    "city": "New York",
+    "address": "123 Main Street",
+    "contact_person": "Jane Doe",
+    "telephone": {"country": "+1", "number": "5555555555"},
+}
+
+ORDER_ITEM = {
+    "trade_id": "234193410001028893",
+    "trade_status": "unpay",
+    "create_date": {"format_date": "Oct. 19, 2026", "timestamp": "1792376614494"},
+    "modify_date": {"format_date": "Oct. 19, 2026", "timestamp": "1792376614494"},
+}
+
+
+@pytest.fixture(scope="module")
+def server() -> StandinServer:
+    """Create a small stand-in catalog."""
+    return StandinServer("test_app_key", "test_app_secret", catalog_size=20)
+
+
+class TestConvert:
+    """Tests for the conversion functions."""
+
+    def test_dict_mode_passthrough(self) -> None:
+        """Dict mode should return the data unchanged."""
+        assert convert(OrderListItem, ORDER_ITEM, "dict") is ORDER_ITEM
+
+    def test_construct_nested(self) -> None:
+        """construct should build nested models and lists without validation."""
+        [item] = construct(list[OrderListItem], [ORDER_ITEM])
+        assert isinstance(item, OrderListItem)
+        assert isinstance(item.create_date, FormattedDate)
+        assert item.create_date.timestamp == "1792376614494"
+
+    def test_construct_aliases_and_defaults(self) -> None:
+        """construct should read aliased keys and fill defaults."""
+        product = construct(ProductDescription, {"product_id": "1", "eCompanyId": "abc"})
+        assert product.e_company_id == "abc"
+        assert product.skus == []
+        assert product.wholesale_trade is None
+
+    def test_construct_skips_validation(self) -> None:
+        """construct should keep raw values as-is."""
+        item = construct(OrderListItem, {**ORDER_ITEM, "trade_id": 123})
+        assert item.trade_id == 123
+
+    def test_trusted_mode_never_raises(self) -> None:
+        """Trusted mode should fall back to construct for data that fails validation."""
+        item = convert(OrderListItem, {"trade_id": 123}, "trusted")
+        assert isinstance(item, OrderListItem)
+        assert item.trade_id == 123
+
+    def test_validated_matches_trusted(self) -> None:
+        """Validated and trusted models should be equal for well-formed data."""
+        assert convert(list[OrderListItem], [ORDER_ITEM], "validated") == convert(
+            list[OrderListItem], [ORDER_ITEM], "trusted"
+        )
+
+    def test_validated_rejects_bad_data(self) -> None:
+        """Validated mode should raise AlibabaValidationError."""
+        with pytest.raises(AlibabaValidationError, match="OrderListItem"):
+            convert(OrderListItem, {"trade_id": "1"}, "validated")
+
+    def test_unknown_mode(self) -> None:
+        """Unknown modes should raise ValueError."""
+        with pytest.raises(ValueError):
+            convert(OrderListItem, ORDER_ITEM, "strict")  # type: ignore[arg-type]
+
+    def test_type_adapter_cached(self) -> None:
+        """TypeAdapters should be built once per type."""
+        assert type_adapter(list[OrderListItem]) is type_adapter(list[OrderListItem])
+
+
+class TestClientTypedResponses:
+    """Tests for high-level methods in each response mode."""
+
+    def test_dict_mode_default(
+        self,
+        server: StandinServer,
+        standin_client: Callable[..., AlibabaClient],
+        make_config: Callable[..., Config],
+    ) -> None:
+        """Methods should return dicts by default."""
+        client = standin_client(server, config=make_config(response_mode="dict"))
+        assert isinstance(client.get_product(server.product_ids()[0]), dict)
+
+    @pytest.mark.parametrize("mode", ["validated", "trusted"])
+    def test_typed_methods(
+        self,
+        server: StandinServer,
+        mode: ResponseMode,
+        standin_client: Callable[..., AlibabaClient],
+        make_config: Callable[..., Config],
+    ) -> None:
+        """Typed modes should return models from high-level methods."""
+        client = standin_client(server, config=make_config(response_mode=mode))
+        product_id = str(server.product_ids()[0])
+
+        product: Any = client.get_product(product_id)
+        assert isinstance(product, ProductDescription)
+        assert product.skus[0].sku_id
+
+        inventory = client.get_product_inventory(product_id)
+        assert all(isinstance(location, InventoryByLocation) for location in inventory)
+
+        freight = client.calculate_freight(product_id, 100, "US", fallback=False)
+        assert all(isinstance(option, ShippingOption) for option in freight["options"])
+
+        order = client.create_order(
+            channel_refer_id="typed",
+            product_list=[
+                {"product_id": product_id, "sku_id": product.skus[0].sku_id, "quantity": "100"}
+            ],
+            logistics_detail={
+                "shipment_address": ADDRESS,
+                "dispatch_location": "CN",
+                "carrier_code": "EX_ASP_OCEAN_EXPRESS",
+            },
+        )
+        details: Any = client.get_order(order["trade_id"])
+        assert isinstance(details, OrderDetails)
+        assert details.shipping_address.telephone.number == "5555555555"
+
+        orders = client.list_orders()["orders"]
+        assert all(isinstance(item, OrderListItem) for item in orders)
+
+        tracking = client.get_order_tracking(order["trade_id"])["tracking"]
+        assert all(isinstance(info, TrackingInfo) for info in tracking)